@@ -163,6 +163,12 @@ def get_arguments() -> argparse.Namespace:
     parser.add_argument(
         "--log-no-color", action="store_true", help="Disable color logs"
     )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Record the time spent setting up each integration and write a "
+        "report to CONFIG/startup_profile.json",
+    )
     parser.add_argument(
         "--runner",
         action="store_true",
@@ -288,6 +294,7 @@ async def setup_and_run_hass(config_dir: str, args: argparse.Namespace) -> int:
             log_rotate_days=args.log_rotate_days,
             log_file=args.log_file,
             log_no_color=args.log_no_color,
+            profile_startup=args.profile_startup,
         )
     else:
         config_file = await ensure_config_file(hass, config_dir)
@@ -300,6 +307,7 @@ async def setup_and_run_hass(config_dir: str, args: argparse.Namespace) -> int:
             log_rotate_days=args.log_rotate_days,
             log_file=args.log_file,
             log_no_color=args.log_no_color,
+            profile_startup=args.profile_startup,
         )
 
     if args.open_ui and hass.config.api is not None:
@@ -3,7 +3,7 @@ import asyncio
 import logging
 from collections import OrderedDict
 from datetime import timedelta
-from typing import Any, Dict, List, Optional, Tuple, cast
+from typing import Any, Callable, Dict, List, Optional, Tuple, cast
 
 import jwt
 
@@ -20,6 +20,11 @@ from .providers import auth_provider_from_config, AuthProvider, LoginFlow
 EVENT_USER_ADDED = "user_added"
 EVENT_USER_REMOVED = "user_removed"
 
+# Number of validated access tokens to remember
+ACCESS_TOKEN_CACHE_SIZE = 1024
+# Seconds an access token is accepted after it expired
+ACCESS_TOKEN_LEEWAY = 10
+
 _LOGGER = logging.getLogger(__name__)
 _MfaModuleDict = Dict[str, MultiFactorAuthModule]
 _ProviderKey = Tuple[str, Optional[str]]
@@ -85,6 +90,11 @@ class AuthManager:
         self.login_flow = data_entry_flow.FlowManager(
             hass, self._async_create_login_flow, self._async_finish_login_flow
         )
+        # Validated access tokens mapped to their refresh token and the
+        # timestamp until which they are accepted, least recently used first
+        self._access_tokens: "OrderedDict[str, Tuple[models.RefreshToken, float]]" = (
+            OrderedDict()
+        )
 
     @property
     def auth_providers(self) -> List[AuthProvider]:
@@ -216,6 +226,9 @@ class AuthManager:
             await asyncio.wait(tasks)
 
         await self._store.async_remove_user(user)
+        self._async_invalidate_access_tokens(
+            lambda refresh_token: refresh_token.user.id == user.id
+        )
 
         self.hass.bus.async_fire(EVENT_USER_REMOVED, {"user_id": user.id})
 
@@ -242,6 +255,9 @@ class AuthManager:
         if user.is_owner:
             raise ValueError("Unable to deactive the owner")
         await self._store.async_deactivate_user(user)
+        self._async_invalidate_access_tokens(
+            lambda refresh_token: refresh_token.user.id == user.id
+        )
 
     async def async_remove_credentials(self, credentials: models.Credentials) -> None:
         """Remove credentials."""
@@ -368,6 +384,9 @@ class AuthManager:
     ) -> None:
         """Delete a refresh token."""
         await self._store.async_remove_refresh_token(refresh_token)
+        self._async_invalidate_access_tokens(
+            lambda cached: cached.id == refresh_token.id
+        )
 
     @callback
     def async_create_access_token(
@@ -391,6 +410,20 @@ class AuthManager:
         self, token: str
     ) -> Optional[models.RefreshToken]:
         """Return refresh token if an access token is valid."""
+        cached = self._access_tokens.get(token)
+
+        if cached is not None:
+            refresh_token, valid_until = cached
+
+            if (
+                refresh_token.user.is_active
+                and dt_util.utcnow().timestamp() < valid_until
+            ):
+                self._access_tokens.move_to_end(token)
+                return refresh_token
+
+            del self._access_tokens[token]
+
         try:
             unverif_claims = jwt.decode(token, verify=False)
         except jwt.InvalidTokenError:
@@ -408,15 +441,40 @@ class AuthManager:
             issuer = refresh_token.id
 
         try:
-            jwt.decode(token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"])
+            jwt.decode(
+                token,
+                jwt_key,
+                leeway=ACCESS_TOKEN_LEEWAY,
+                issuer=issuer,
+                algorithms=["HS256"],
+            )
         except jwt.InvalidTokenError:
             return None
 
         if refresh_token is None or not refresh_token.user.is_active:
             return None
 
+        expiration = unverif_claims.get("exp")
+
+        if expiration is not None:
+            self._access_tokens[token] = (
+                refresh_token,
+                expiration + ACCESS_TOKEN_LEEWAY,
+            )
+            if len(self._access_tokens) > ACCESS_TOKEN_CACHE_SIZE:
+                self._access_tokens.popitem(last=False)
+
         return refresh_token
 
+    @callback
+    def _async_invalidate_access_tokens(
+        self, matches: Callable[[models.RefreshToken], bool]
+    ) -> None:
+        """Forget the validated access tokens of matching refresh tokens."""
+        for token, (refresh_token, _) in list(self._access_tokens.items()):
+            if matches(refresh_token):
+                del self._access_tokens[token]
+
     async def _async_create_login_flow(
         self, handler: _ProviderKey, *, context: Optional[Dict], data: Optional[Any]
     ) -> data_entry_flow.FlowHandler:
@@ -12,7 +12,14 @@ import voluptuous as vol
 
 from homeassistant import core, config as conf_util, config_entries, loader
 from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
-from homeassistant.setup import async_setup_component
+from homeassistant.setup import (
+    DATA_STARTUP_PROFILE,
+    DATA_STARTUP_REPORT,
+    StartupProfile,
+    async_profile_phase,
+    async_setup_component,
+)
+from homeassistant.util.json import save_json
 from homeassistant.util.logging import AsyncHandler
 from homeassistant.util.package import async_get_user_site, is_virtual_env
 from homeassistant.util.yaml import clear_secret_cache
@@ -21,6 +28,7 @@ from homeassistant.exceptions import HomeAssistantError
 _LOGGER = logging.getLogger(__name__)
 
 ERROR_LOG_FILENAME = "home-assistant.log"
+STARTUP_REPORT_FILENAME = "startup_profile.json"
 
 # hass.data key for logging information.
 DATA_LOGGING = "logging"
@@ -46,6 +54,7 @@ async def async_from_config_dict(
     log_rotate_days: Any = None,
     log_file: Any = None,
     log_no_color: bool = False,
+    profile_startup: bool = False,
 ) -> Optional[core.HomeAssistant]:
     """Try to configure Home Assistant from a configuration dictionary.
 
@@ -54,6 +63,9 @@ async def async_from_config_dict(
     """
     start = time()
 
+    if profile_startup:
+        hass.data.setdefault(DATA_STARTUP_PROFILE, StartupProfile())
+
     if enable_log:
         async_enable_logging(hass, verbose, log_rotate_days, log_file, log_no_color)
 
@@ -66,7 +78,8 @@ async def async_from_config_dict(
     core_config = config.get(core.DOMAIN, {})
 
     try:
-        await conf_util.async_process_ha_core_config(hass, core_config)
+        with async_profile_phase(hass, None, "core_config"):
+            await conf_util.async_process_ha_core_config(hass, core_config)
     except vol.Invalid as config_err:
         conf_util.async_log_exception(config_err, "homeassistant", core_config, hass)
         return None
@@ -86,13 +99,18 @@ async def async_from_config_dict(
     )
 
     hass.config_entries = config_entries.ConfigEntries(hass, config)
-    await hass.config_entries.async_initialize()
+    with async_profile_phase(hass, None, "config_entries"):
+        await hass.config_entries.async_initialize()
 
     await _async_set_up_integrations(hass, config)
 
     stop = time()
     _LOGGER.info("Home Assistant initialized in %.2fs", stop - start)
 
+    profile = hass.data.pop(DATA_STARTUP_PROFILE, None)
+    if profile is not None:
+        await _async_save_startup_report(hass, profile)
+
     if sys.version_info[:3] < (3, 7, 0):
         msg = (
             "Python 3.6 support is deprecated and will "
@@ -115,6 +133,7 @@ async def async_from_config_file(
     log_rotate_days: Any = None,
     log_file: Any = None,
     log_no_color: bool = False,
+    profile_startup: bool = False,
 ) -> Optional[core.HomeAssistant]:
     """Read the configuration file and try to start all the functionality.
 
@@ -130,12 +149,16 @@ async def async_from_config_file(
 
     async_enable_logging(hass, verbose, log_rotate_days, log_file, log_no_color)
 
+    if profile_startup:
+        hass.data[DATA_STARTUP_PROFILE] = StartupProfile()
+
     await hass.async_add_executor_job(conf_util.process_ha_config_upgrade, hass)
 
     try:
-        config_dict = await hass.async_add_executor_job(
-            conf_util.load_yaml_config_file, config_path
-        )
+        with async_profile_phase(hass, None, "load_configuration"):
+            config_dict = await hass.async_add_executor_job(
+                conf_util.load_yaml_config_file, config_path
+            )
     except HomeAssistantError as err:
         _LOGGER.error("Error loading %s: %s", config_path, err)
         return None
@@ -143,7 +166,35 @@ async def async_from_config_file(
         clear_secret_cache()
 
     return await async_from_config_dict(
-        config_dict, hass, enable_log=False, skip_pip=skip_pip
+        config_dict,
+        hass,
+        enable_log=False,
+        skip_pip=skip_pip,
+        profile_startup=profile_startup,
+    )
+
+
+async def _async_save_startup_report(
+    hass: core.HomeAssistant, profile: StartupProfile
+) -> None:
+    """Store the startup report and write it to the config dir."""
+    report = hass.data[DATA_STARTUP_REPORT] = profile.async_report()
+
+    if hass.config.config_dir is None:
+        return
+
+    report_path = hass.config.path(STARTUP_REPORT_FILENAME)
+
+    try:
+        await hass.async_add_executor_job(save_json, report_path, report)
+    except HomeAssistantError:
+        # Already logged by save_json
+        return
+
+    _LOGGER.info(
+        "Startup report written to %s. Critical path: %s",
+        report_path,
+        " -> ".join(report["critical_path"]),
     )
 
 
@@ -385,4 +436,5 @@ async def _async_set_up_integrations(
         )
 
     # Wrap up startup
-    await hass.async_block_till_done()
+    with async_profile_phase(hass, None, "block_till_done"):
+        await hass.async_block_till_done()
@@ -7,6 +7,8 @@ import aiohttp
 import async_timeout
 
 from homeassistant.const import MATCH_ALL
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_call_later
 
 from .const import API_CHANGE, Cause
 from .entities import ENTITY_ADAPTERS
@@ -15,17 +17,61 @@ from .messages import AlexaResponse
 _LOGGER = logging.getLogger(__name__)
 DEFAULT_TIMEOUT = 10
 
+# Time to collect state changes before reporting them
+REPORT_STATE_WINDOW = 1
 
-async def async_enable_proactive_mode(hass, smart_home_config):
+
+async def async_enable_proactive_mode(
+    hass, smart_home_config, report_window=REPORT_STATE_WINDOW
+):
     """Enable the proactive mode.
 
     Proactive mode makes this component report state changes to Alexa.
+    State changes are collected for report_window seconds and only the last
+    state of each entity is reported, if its properties changed.
     """
     # Validate we can get access token.
     await smart_home_config.async_get_access_token()
 
-    async def async_entity_state_listener(changed_entity, old_state, new_state):
+    # Last properties reported per entity, without time of sample
+    reported = {}
+    pending = {}
+    unsub_pending = None
+
+    async def async_report_pending(_now):
+        """Report the collected entities with changed properties."""
+        nonlocal unsub_pending
+        unsub_pending = None
+        alexa_entities = list(pending.values())
+        pending.clear()
+        reports = []
+
+        for alexa_entity in alexa_entities:
+            properties = list(alexa_entity.serialize_properties())
+            values = [
+                (prop["namespace"], prop["name"], prop["value"]) for prop in properties
+            ]
+            if reported.get(alexa_entity.entity_id) == values:
+                continue
+
+            reported[alexa_entity.entity_id] = values
+            reports.append(
+                async_send_changereport_message(
+                    hass, smart_home_config, alexa_entity, properties=properties
+                )
+            )
+
+        # A slow response should not delay the reports of other entities
+        if reports:
+            await asyncio.gather(*reports)
+
+    @callback
+    def async_entity_state_listener(changed_entity, old_state, new_state):
+        nonlocal unsub_pending
+
         if not new_state:
+            reported.pop(changed_entity, None)
+            pending.pop(changed_entity, None)
             return
 
         if new_state.domain not in ENTITY_ADAPTERS:
@@ -39,23 +85,38 @@ async def async_enable_proactive_mode(hass, smart_home_config):
             hass, smart_home_config, new_state
         )
 
-        for interface in alexa_changed_entity.interfaces():
-            if interface.properties_proactively_reported():
-                await async_send_changereport_message(
-                    hass, smart_home_config, alexa_changed_entity
-                )
-                return
+        if not any(
+            interface.properties_proactively_reported()
+            for interface in alexa_changed_entity.interfaces()
+        ):
+            return
+
+        pending[changed_entity] = alexa_changed_entity
+
+        if unsub_pending is None:
+            unsub_pending = async_call_later(hass, report_window, async_report_pending)
 
-    return hass.helpers.event.async_track_state_change(
+    unsub_state_change = hass.helpers.event.async_track_state_change(
         MATCH_ALL, async_entity_state_listener
     )
 
+    @callback
+    def async_disable_proactive_mode():
+        """Stop reporting state changes."""
+        unsub_state_change()
+        if unsub_pending is not None:
+            unsub_pending()
+
+    return async_disable_proactive_mode
+
 
 async def async_send_changereport_message(
-    hass, config, alexa_entity, *, invalidate_access_token=True
+    hass, config, alexa_entity, *, invalidate_access_token=True, properties=None
 ):
     """Send a ChangeReport message for an Alexa entity.
 
+    Pass properties when they were already serialized.
+
     https://developer.amazon.com/docs/smarthome/state-reporting-for-a-smart-home-skill.html#report-state-with-changereport-events
     """
     token = await config.async_get_access_token()
@@ -67,7 +128,8 @@ async def async_send_changereport_message(
     # this sends all the properties of the Alexa Entity, whether they have
     # changed or not. this should be improved, and properties that have not
     # changed should be moved to the 'context' object
-    properties = list(alexa_entity.serialize_properties())
+    if properties is None:
+        properties = list(alexa_entity.serialize_properties())
 
     payload = {
         API_CHANGE: {"cause": {"type": Cause.APP_INTERACTION}, "properties": properties}
@@ -108,7 +170,11 @@ async def async_send_changereport_message(
     ):
         config.async_invalidate_access_token()
         return await async_send_changereport_message(
-            hass, config, alexa_entity, invalidate_access_token=False
+            hass,
+            config,
+            alexa_entity,
+            invalidate_access_token=False,
+            properties=properties,
         )
 
     _LOGGER.error(
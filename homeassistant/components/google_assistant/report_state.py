@@ -12,16 +12,44 @@ from .error import SmartHomeError
 # https://github.com/actions-on-google/smart-home-nodejs/issues/196#issuecomment-439156639
 INITIAL_REPORT_DELAY = 60
 
+# Time to collect state changes before reporting them together
+REPORT_STATE_WINDOW = 1
+
 
 _LOGGER = logging.getLogger(__name__)
 
 
 @callback
-def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig):
-    """Enable state reporting."""
+def async_enable_report_state(
+    hass: HomeAssistant,
+    google_config: AbstractConfig,
+    report_window: float = REPORT_STATE_WINDOW,
+):
+    """Enable state reporting.
+
+    State changes are collected for report_window seconds and reported in one
+    message, with only the last state of each entity.
+    """
+    # Last serialized state reported, or about to be, per entity
+    reported = {}
+    pending = {}
+    unsub_pending = None
+
+    async def async_report_pending(_now):
+        """Report the collected states."""
+        nonlocal unsub_pending
+        unsub_pending = None
+        states = dict(pending)
+        pending.clear()
+        await google_config.async_report_state({"devices": {"states": states}})
+
+    @callback
+    def async_entity_state_listener(changed_entity, old_state, new_state):
+        nonlocal unsub_pending
 
-    async def async_entity_state_listener(changed_entity, old_state, new_state):
         if not new_state:
+            reported.pop(changed_entity, None)
+            pending.pop(changed_entity, None)
             return
 
         if not google_config.should_expose(new_state):
@@ -38,16 +66,23 @@ def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig
             _LOGGER.debug("Not reporting state for %s: %s", changed_entity, err.code)
             return
 
-        if old_state:
-            old_entity = GoogleEntity(hass, google_config, old_state)
+        old_data = reported.get(changed_entity)
+        if old_data is None and old_state:
+            try:
+                old_data = GoogleEntity(
+                    hass, google_config, old_state
+                ).query_serialize()
+            except SmartHomeError:
+                pass
 
-            # Only report to Google if data that Google cares about has changed
-            if entity_data == old_entity.query_serialize():
-                return
+        # Only report to Google if data that Google cares about has changed
+        if entity_data == old_data:
+            return
 
-        await google_config.async_report_state(
-            {"devices": {"states": {changed_entity: entity_data}}}
-        )
+        reported[changed_entity] = pending[changed_entity] = entity_data
+
+        if unsub_pending is None:
+            unsub_pending = async_call_later(hass, report_window, async_report_pending)
 
     async def inital_report(_now):
         """Report initially all states."""
@@ -62,10 +97,20 @@ def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig
             except SmartHomeError:
                 continue
 
+        reported.update(entities)
         await google_config.async_report_state({"devices": {"states": entities}})
 
     async_call_later(hass, INITIAL_REPORT_DELAY, inital_report)
 
-    return hass.helpers.event.async_track_state_change(
+    unsub_state_change = hass.helpers.event.async_track_state_change(
         MATCH_ALL, async_entity_state_listener
     )
+
+    @callback
+    def async_disable_report_state():
+        """Stop reporting state changes."""
+        unsub_state_change()
+        if unsub_pending is not None:
+            unsub_pending()
+
+    return async_disable_report_state
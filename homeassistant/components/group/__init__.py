@@ -1,7 +1,7 @@
 """Provide the functionality to group entities."""
 import asyncio
 import logging
-from typing import Any, Iterable, List, Optional, cast
+from typing import Any, Dict, Iterable, List, Optional, cast
 
 import voluptuous as vol
 
@@ -40,6 +40,8 @@ from homeassistant.helpers.typing import HomeAssistantType
 
 DOMAIN = "group"
 
+DATA_EXPANDED = "group_expanded"
+
 ENTITY_ID_FORMAT = DOMAIN + ".{}"
 
 CONF_ENTITIES = "entities"
@@ -151,7 +153,17 @@ def expand_entity_ids(hass: HomeAssistantType, entity_ids: Iterable[Any]) -> Lis
 
     Async friendly.
     """
+    return _expand_entity_ids(hass, entity_ids, {})
+
+
+def _expand_entity_ids(
+    hass: HomeAssistantType,
+    entity_ids: Iterable[Any],
+    groups: Dict[str, Optional[ha.State]],
+) -> List[str]:
+    """Return entity_ids with groups expanded, adding the groups used to groups."""
     found_ids: List[str] = []
+    found = set()
     for entity_id in entity_ids:
         if not isinstance(entity_id, str):
             continue
@@ -163,27 +175,74 @@ def expand_entity_ids(hass: HomeAssistantType, entity_ids: Iterable[Any]) -> Lis
             domain, _ = ha.split_entity_id(entity_id)
 
             if domain == DOMAIN:
-                child_entities = get_entity_ids(hass, entity_id)
-                if entity_id in child_entities:
-                    child_entities = list(child_entities)
-                    child_entities.remove(entity_id)
-                found_ids.extend(
-                    ent_id
-                    for ent_id in expand_entity_ids(hass, child_entities)
-                    if ent_id not in found_ids
-                )
-
+                child_ids = _expand_group(hass, entity_id, groups)
             else:
-                if entity_id not in found_ids:
-                    found_ids.append(entity_id)
+                child_ids = [entity_id]
 
         except AttributeError:
             # Raised by split_entity_id if entity_id is not a string
-            pass
+            continue
+
+        for child_id in child_ids:
+            if child_id not in found:
+                found.add(child_id)
+                found_ids.append(child_id)
 
     return found_ids
 
 
+def _expand_group(
+    hass: HomeAssistantType, entity_id: str, groups: Dict[str, Optional[ha.State]]
+) -> List[str]:
+    """Return the members of a group with nested groups expanded.
+
+    The states of the group and its nested groups are added to groups.
+    Expansions are cached with these states while the group component is set
+    up, and used as long as the members of these groups are unchanged.
+    """
+    expanded_groups = hass.data.get(DATA_EXPANDED)
+    if expanded_groups is not None:
+        cached = expanded_groups.get(entity_id)
+        if cached is not None and _members_unchanged(hass, cached[1]):
+            groups.update(cached[1])
+            return cast(List[str], cached[0])
+
+    used_groups = {entity_id: hass.states.get(entity_id)}
+    child_entities = get_entity_ids(hass, entity_id)
+    if entity_id in child_entities:
+        child_entities = list(child_entities)
+        child_entities.remove(entity_id)
+    expanded = _expand_entity_ids(hass, child_entities, used_groups)
+
+    if expanded_groups is not None:
+        expanded_groups[entity_id] = (expanded, used_groups)
+    groups.update(used_groups)
+    return expanded
+
+
+def _members_unchanged(
+    hass: HomeAssistantType, groups: Dict[str, Optional[ha.State]]
+) -> bool:
+    """Return if groups still have the members of their states in groups.
+
+    States that changed without changing the members are updated, so the
+    next check finds them unchanged again.
+    """
+    for entity_id, state in groups.items():
+        current = hass.states.get(entity_id)
+        if current is state:
+            continue
+        if (
+            current is None
+            or state is None
+            or current.attributes.get(ATTR_ENTITY_ID)
+            != state.attributes.get(ATTR_ENTITY_ID)
+        ):
+            return False
+        groups[entity_id] = current
+    return True
+
+
 @bind_hass
 def get_entity_ids(
     hass: HomeAssistantType, entity_id: str, domain_filter: Optional[str] = None
@@ -213,6 +272,8 @@ async def async_setup(hass, config):
     if component is None:
         component = hass.data[DOMAIN] = EntityComponent(_LOGGER, DOMAIN, hass)
 
+    hass.data[DATA_EXPANDED] = {}
+
     await _async_process_config(hass, config, component)
 
     async def reload_service_handler(service):
@@ -414,6 +475,10 @@ class Group(Entity):
         self._order = order
         self._assumed_state = False
         self._async_unsub_state_changed = None
+        # Ids of the members with a state, and of those that are on or assumed
+        self._members = set()
+        self._on_members = set()
+        self._assumed_members = set()
 
     @staticmethod
     def create_group(
@@ -606,7 +671,12 @@ class Group(Entity):
         if self._async_unsub_state_changed is None:
             return
 
-        self._async_update_group_state(new_state)
+        if new_state is not None:
+            self._async_update_group_state(new_state)
+        elif self.group_on is not None:
+            self._async_count_member(entity_id, None)
+            self._async_apply_member_counts()
+
         await self.async_update_ha_state()
 
     @property
@@ -627,63 +697,75 @@ class Group(Entity):
         """Update group state.
 
         Optionally you can provide the only state changed since last update
-        allowing this method to take shortcuts.
+        allowing this method to only recount that member.
 
         This method must be run in the event loop.
         """
-        # To store current states of group entities. Might not be needed.
-        states = None
-        gr_state = self._state
-        gr_on = self.group_on
-        gr_off = self.group_off
-
         # We have not determined type of group yet
-        if gr_on is None:
-            if tr_state is None:
-                states = self._tracking_states
-
-                for state in states:
-                    gr_on, gr_off = _get_group_on_off(state.state)
-                    if gr_on is not None:
-                        break
+        if self.group_on is None:
+            states = self._tracking_states if tr_state is None else [tr_state]
+
+            for state in states:
+                gr_on, gr_off = _get_group_on_off(state.state)
+                if gr_on is not None:
+                    break
             else:
-                gr_on, gr_off = _get_group_on_off(tr_state.state)
+                # We cannot determine state of the group
+                return
+
+            self.group_on, self.group_off = gr_on, gr_off
+            # Members are only counted once the type of group is known
+            tr_state = None
+
+        if tr_state is None:
+            self._members.clear()
+            self._on_members.clear()
+            self._assumed_members.clear()
 
-            if gr_on is not None:
-                self.group_on, self.group_off = gr_on, gr_off
+            for state in self._tracking_states:
+                self._async_count_member(state.entity_id, state)
+        else:
+            self._async_count_member(tr_state.entity_id, tr_state)
+
+        self._async_apply_member_counts()
 
-        # We cannot determine state of the group
-        if gr_on is None:
+    @callback
+    def _async_count_member(self, entity_id, state):
+        """Update the member counts with the current state of a member.
+
+        This method must be run in the event loop.
+        """
+        if state is None:
+            self._members.discard(entity_id)
+            self._on_members.discard(entity_id)
+            self._assumed_members.discard(entity_id)
             return
 
-        # pylint: disable=too-many-boolean-expressions
-        if tr_state is None or (
-            (gr_state == gr_on and tr_state.state == gr_off)
-            or (gr_state == gr_off and tr_state.state == gr_on)
-            or tr_state.state not in (gr_on, gr_off)
-        ):
-            if states is None:
-                states = self._tracking_states
+        self._members.add(entity_id)
 
-            if self.mode(state.state == gr_on for state in states):
-                self._state = gr_on
-            else:
-                self._state = gr_off
+        if state.state == self.group_on:
+            self._on_members.add(entity_id)
+        else:
+            self._on_members.discard(entity_id)
 
-        elif tr_state.state in (gr_on, gr_off):
-            self._state = tr_state.state
+        if state.attributes.get(ATTR_ASSUMED_STATE):
+            self._assumed_members.add(entity_id)
+        else:
+            self._assumed_members.discard(entity_id)
 
-        if (
-            tr_state is None
-            or self._assumed_state
-            and not tr_state.attributes.get(ATTR_ASSUMED_STATE)
-        ):
-            if states is None:
-                states = self._tracking_states
+    @callback
+    def _async_apply_member_counts(self):
+        """Set the group state from the member counts.
 
-            self._assumed_state = self.mode(
-                state.attributes.get(ATTR_ASSUMED_STATE) for state in states
-            )
+        This method must be run in the event loop.
+        """
+        members = len(self._members)
+
+        if self.mode is all:
+            is_on = len(self._on_members) == members
+            self._assumed_state = len(self._assumed_members) == members
+        else:
+            is_on = bool(self._on_members)
+            self._assumed_state = bool(self._assumed_members)
 
-        elif tr_state.attributes.get(ATTR_ASSUMED_STATE):
-            self._assumed_state = True
+        self._state = self.group_on if is_on else self.group_off
@@ -2,6 +2,7 @@
 from collections import defaultdict
 from datetime import timedelta
 from itertools import groupby
+import json
 import logging
 import time
 
@@ -18,8 +19,14 @@ import homeassistant.util.dt as dt_util
 from homeassistant.components import recorder, script
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.const import ATTR_HIDDEN
-from homeassistant.components.recorder.util import session_scope, execute
+from homeassistant.components.recorder.util import (
+    after,
+    async_stream_json,
+    execute,
+    session_scope,
+)
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.json import JSONEncoder
 
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
@@ -41,6 +48,9 @@ CONFIG_SCHEMA = vol.Schema(
 SIGNIFICANT_DOMAINS = ("thermostat", "climate", "water_heater")
 IGNORE_DOMAINS = ("zone", "scene")
 
+# Number of rows serialized per chunk of a streamed response
+STREAM_BATCH_SIZE = 1000
+
 
 def get_significant_states(
     hass,
@@ -259,6 +269,235 @@ def states_to_json(
     return {key: val for key, val in result.items() if val}
 
 
+class HistoryStream:
+    """Serialize significant states to JSON in chunks.
+
+    Rows are read in batches of STREAM_BATCH_SIZE and written straight to
+    JSON without creating State objects. The result is a list of state lists
+    like the history period view returns, ordered by entity id. With a
+    limit, only that many rows are read, starting after the cursor (the
+    state_id of the last row of the previous page).
+    """
+
+    def __init__(
+        self,
+        hass,
+        start_time,
+        end_time=None,
+        entity_ids=None,
+        filters=None,
+        include_start_time_state=True,
+        cursor=None,
+        limit=None,
+    ):
+        """Initialize the stream."""
+        self.hass = hass
+        self.start_time = start_time
+        self.end_time = end_time
+        self.entity_ids = entity_ids
+        self.filters = filters
+        self.include_start_time_state = include_start_time_state
+        self.cursor = cursor
+        self.limit = limit
+        # Sort keys (entity_id, last_updated, state_id) of the last row read
+        # and of the last row of this page
+        self._key = None
+        self._end = None
+        self._initial = []
+        self._entity_id = None
+        self._started = False
+        self._finished = False
+
+    def prepare(self):
+        """Find the bounds of the page and the states at the start time.
+
+        Returns the cursor of the next page, or None if this is the last page.
+        Raises ValueError if the cursor does not exist.
+        """
+        from homeassistant.components.recorder.models import States
+
+        with session_scope(hass=self.hass) as session:
+            if self.cursor is not None:
+                row = (
+                    session.query(*_sort_columns())
+                    .filter(States.state_id == self.cursor)
+                    .first()
+                )
+                if row is not None:
+                    self._key = tuple(row)
+
+            if self.limit is not None:
+                rows = (
+                    self._query(session.query(*_sort_columns()))
+                    .offset(self.limit - 1)
+                    .limit(2)
+                    .all()
+                )
+                if len(rows) == 2:
+                    self._end = tuple(rows[0])
+
+        if self.cursor is not None and self._key is None:
+            raise ValueError("Unknown cursor {}".format(self.cursor))
+
+        if self.include_start_time_state:
+            for state in get_states(
+                self.hass, self.start_time, self.entity_ids, filters=self.filters
+            ):
+                if self._key is not None and state.entity_id <= self._key[0]:
+                    continue
+                if self._end is not None and state.entity_id > self._end[0]:
+                    continue
+                state.last_changed = self.start_time
+                state.last_updated = self.start_time
+                self._initial.append(
+                    (state.entity_id, json.dumps(state.as_dict(), cls=JSONEncoder))
+                )
+            self._initial.sort(reverse=True)
+
+        return self._end[2] if self._end is not None else None
+
+    def next_chunk(self):
+        """Return the next chunk of the JSON document, None when done."""
+        from homeassistant.components.recorder.models import StateAttributes, States
+
+        if self._finished:
+            return None
+
+        parts = []
+        if not self._started:
+            parts.append("[")
+            self._started = True
+
+        read = 0
+        with session_scope(hass=self.hass) as session:
+            query = self._query(
+                session.query(
+                    States.entity_id,
+                    States.last_updated,
+                    States.state_id,
+                    States.domain,
+                    States.state,
+                    States.attributes,
+                    States.last_changed,
+                    States.context_id,
+                    States.context_user_id,
+                    StateAttributes.shared_attrs,
+                ).outerjoin(
+                    StateAttributes,
+                    States.attributes_id == StateAttributes.attributes_id,
+                )
+            )
+            for row in query.limit(STREAM_BATCH_SIZE).yield_per(STREAM_BATCH_SIZE):
+                read += 1
+                self._key = tuple(row[:3])
+                if _is_row_significant(row):
+                    self._append(parts, row.entity_id, _row_to_json(row))
+
+        if read < STREAM_BATCH_SIZE or self._key == self._end:
+            while self._initial:
+                self._start_list(parts, *self._initial.pop())
+            parts.append("]]" if self._entity_id is not None else "]")
+            self._finished = True
+
+        return "".join(parts).encode("UTF-8")
+
+    def _query(self, query):
+        """Filter and order a query for the rows of this page."""
+        from homeassistant.components.recorder.models import States
+
+        query = query.filter(
+            (
+                States.domain.in_(SIGNIFICANT_DOMAINS)
+                | (States.last_changed == States.last_updated)
+            )
+            & (States.last_updated > self.start_time)
+        )
+
+        if self.filters:
+            query = self.filters.apply(query, self.entity_ids)
+
+        if self.end_time is not None:
+            query = query.filter(States.last_updated < self.end_time)
+
+        if self._key is not None:
+            query = query.filter(after(_sort_columns(), self._key))
+
+        if self._end is not None:
+            query = query.filter(~after(_sort_columns(), self._end))
+
+        return query.order_by(*_sort_columns())
+
+    def _append(self, parts, entity_id, state_json):
+        """Append a state to the list of its entity."""
+        if entity_id == self._entity_id:
+            parts.append(",")
+            parts.append(state_json)
+            return
+
+        # Entities without changes only have their state at the start time
+        while self._initial and self._initial[-1][0] < entity_id:
+            self._start_list(parts, *self._initial.pop())
+
+        if self._initial and self._initial[-1][0] == entity_id:
+            self._start_list(parts, *self._initial.pop())
+            parts.append(",")
+            parts.append(state_json)
+        else:
+            self._start_list(parts, entity_id, state_json)
+
+    def _start_list(self, parts, entity_id, state_json):
+        """Close the current list and start the list of an entity."""
+        parts.append("[" if self._entity_id is None else "],[")
+        parts.append(state_json)
+        self._entity_id = entity_id
+
+
+def _sort_columns():
+    """Return the columns a history stream is ordered by."""
+    from homeassistant.components.recorder.models import States
+
+    return States.entity_id, States.last_updated, States.state_id
+
+
+def _row_attributes(row):
+    """Return the attributes JSON of a state row, shared or not."""
+    return row.shared_attrs or row.attributes or "{}"
+
+
+def _is_row_significant(row):
+    """Test if a state row is significant without parsing most attributes."""
+    if row.domain != "script" and '"hidden"' not in _row_attributes(row):
+        return True
+    attributes = json.loads(_row_attributes(row))
+    if attributes.get(ATTR_HIDDEN, False):
+        return False
+    return row.domain != "script" or attributes.get(script.ATTR_CAN_CANCEL)
+
+
+def _row_to_json(row):
+    """Serialize a state row like State.as_dict, reusing its attributes JSON."""
+    return (
+        '{{"entity_id": {}, "state": {}, "attributes": {}, '
+        '"last_changed": "{}", "last_updated": "{}", '
+        '"context": {{"id": {}, "parent_id": null, "user_id": {}}}}}'
+    ).format(
+        json.dumps(row.entity_id),
+        json.dumps(row.state),
+        _row_attributes(row),
+        _timestamp_to_iso(row.last_changed),
+        _timestamp_to_iso(row.last_updated),
+        json.dumps(row.context_id),
+        json.dumps(row.context_user_id),
+    )
+
+
+def _timestamp_to_iso(timestamp):
+    """Format a database timestamp as ISO 8601."""
+    from homeassistant.components.recorder.models import process_timestamp
+
+    return process_timestamp(timestamp).isoformat()
+
+
 def get_state(hass, utc_point_in_time, entity_id, run=None):
     """Return a state at a specific point in time."""
     states = list(get_states(hass, utc_point_in_time, (entity_id,), run))
@@ -335,6 +574,20 @@ class HistoryPeriodView(HomeAssistantView):
 
         hass = request.app["hass"]
 
+        if "stream" in request.query:
+            return await async_stream_json(
+                self,
+                request,
+                HistoryStream(
+                    hass,
+                    start_time,
+                    end_time,
+                    entity_ids,
+                    self.filters,
+                    include_start_time_state,
+                ),
+            )
+
         result = await hass.async_add_job(
             get_significant_states,
             hass,
@@ -1,4 +1,5 @@
 """Component to make instant statistics about your history."""
+from bisect import bisect_right
 import datetime
 import logging
 import math
@@ -112,6 +113,17 @@ class HistoryStatsSensor(Entity):
         self.value = None
         self.count = None
 
+        # Changes of the entity as (timestamp, state matches) since
+        # _history_start, the first being the state at _history_start.
+        # Filled from state changes once tracking starts, and from the
+        # database for the part of the period before that.
+        self._history = []
+        self._history_start = None
+        # Time on and times turned on for the first _processed changes
+        self._processed = 0
+        self._on_seconds = 0
+        self._on_count = 0
+
         @callback
         def start_refresh(*args):
             """Register state tracking."""
@@ -121,8 +133,30 @@ class HistoryStatsSensor(Entity):
                 """Force the component to refresh."""
                 self.async_schedule_update_ha_state(True)
 
+            @callback
+            def state_changed(entity_id, old_state, new_state):
+                """Record the state change and refresh."""
+                if new_state is not None and (
+                    old_state is None or old_state.state != new_state.state
+                ):
+                    timestamp = new_state.last_changed.timestamp()
+                    if self._history:
+                        # Keep the history sorted if the start passed now
+                        timestamp = max(timestamp, self._history[-1][0])
+                    self._history.append(
+                        (timestamp, new_state.state == self._entity_state)
+                    )
+                force_refresh()
+
+            state = self.hass.states.get(self._entity_id)
+            self._history_start = dt_util.utcnow().timestamp()
+            if state is not None:
+                self._history.append(
+                    (self._history_start, state.state == self._entity_state)
+                )
+
             force_refresh()
-            async_track_state_change(self.hass, self._entity_id, force_refresh)
+            async_track_state_change(self.hass, self._entity_id, state_changed)
 
         # Delay first refresh to keep startup fast
         hass.bus.listen_once(EVENT_HOMEASSISTANT_START, start_refresh)
@@ -171,7 +205,7 @@ class HistoryStatsSensor(Entity):
         """Return the icon to use in the frontend, if any."""
         return ICON
 
-    def update(self):
+    async def async_update(self):
         """Get the latest data and updates the states."""
         # Get previous values of start and end
         p_start, p_end = self._period
@@ -194,47 +228,37 @@ class HistoryStatsSensor(Entity):
         p_end_timestamp = math.floor(dt_util.as_timestamp(p_end))
         now_timestamp = math.floor(dt_util.as_timestamp(now))
 
-        # If period has not changed and current time after the period end...
+        # If not tracking changes, period has not changed and current time
+        # after the period end...
         if (
-            start_timestamp == p_start_timestamp
+            self._history_start is None
+            and start_timestamp == p_start_timestamp
             and end_timestamp == p_end_timestamp
             and end_timestamp <= now_timestamp
         ):
             # Don't compute anything as the value cannot have changed
             return
 
-        # Get history between start and end
-        history_list = history.state_changes_during_period(
-            self.hass, start, end, str(self._entity_id)
-        )
-
-        if self._entity_id not in history_list.keys():
-            return
-
-        # Get the first state
-        last_state = history.get_state(self.hass, start, self._entity_id)
-        last_state = last_state is not None and last_state == self._entity_state
-        last_time = start_timestamp
-        elapsed = 0
-        count = 0
-
-        # Make calculations
-        for item in history_list.get(self._entity_id):
-            current_state = item.state == self._entity_state
-            current_time = item.last_changed.timestamp()
+        if self._history_start is None:
+            # Not tracking state changes yet, get the period from the database
+            changes = await self.hass.async_add_executor_job(
+                self._query_history, start, end
+            )
+            if not changes:
+                return
 
-            if last_state:
-                elapsed += current_time - last_time
-            if current_state and not last_state:
-                count += 1
+            elapsed, count = HistoryStatsHelper.measure(
+                changes, start_timestamp, min(end_timestamp, now_timestamp)
+            )
 
-            last_state = current_state
-            last_time = current_time
+        else:
+            await self._async_update_history(start)
+            if not self._processed:
+                return
 
-        # Count time elapsed between last history state and end of measure
-        if last_state:
-            measure_end = min(end_timestamp, now_timestamp)
-            elapsed += measure_end - last_time
+            elapsed, count = self._measure_history(
+                min(end.timestamp(), now.timestamp())
+            )
 
         # Save value in hours
         self.value = elapsed / 3600
@@ -242,15 +266,109 @@ class HistoryStatsSensor(Entity):
         # Save counter
         self.count = count
 
+    def _query_history(self, start, end):
+        """Return the changes between start and end from the database."""
+        history_list = history.state_changes_during_period(
+            self.hass, start, end, str(self._entity_id)
+        )
+
+        return [
+            (item.last_changed.timestamp(), item.state == self._entity_state)
+            for item in history_list.get(self._entity_id, [])
+        ]
+
+    async def _async_update_history(self, start):
+        """Make the tracked history start at start.
+
+        The database is only queried if start is before the tracked history.
+        """
+        start_timestamp = start.timestamp()
+        history_start = self._history_start
+
+        if start_timestamp < history_start:
+            changes = await self.hass.async_add_executor_job(
+                self._query_history, start, dt_util.utc_from_timestamp(history_start)
+            )
+            # Another update might have moved the history while querying
+            if self._history_start != history_start:
+                return
+            self._history[:0] = changes
+            self._history_start = start_timestamp
+            self._processed = self._on_seconds = self._on_count = 0
+
+        self._process_history()
+        self._trim_history(start_timestamp)
+
+    def _process_history(self):
+        """Add the changes recorded since the last update to the aggregates."""
+        history = self._history
+        end = len(history)
+
+        for idx in range(self._processed, end):
+            timestamp, matches = history[idx]
+            if idx == 0:
+                self._on_count += matches
+                continue
+
+            last_timestamp, last_matches = history[idx - 1]
+            if last_matches:
+                self._on_seconds += max(timestamp - last_timestamp, 0)
+            elif matches:
+                self._on_count += 1
+
+        self._processed = end
+
+    def _trim_history(self, start_timestamp):
+        """Replace the changes before start by the state at start."""
+        history = self._history
+        idx = min(bisect_right(history, (start_timestamp, True)), self._processed)
+
+        if idx:
+            # Take what is dropped out of the aggregates. The time after the
+            # last processed change is not in the aggregates yet.
+            if idx < self._processed:
+                dropped_end = start_timestamp
+            else:
+                dropped_end = history[idx - 1][0]
+            dropped_on_seconds, dropped_on_count = HistoryStatsHelper.measure(
+                history[:idx], history[0][0], dropped_end
+            )
+            matches = history[idx - 1][1]
+            self._on_seconds -= dropped_on_seconds
+            self._on_count -= dropped_on_count - matches
+            history[:idx] = [(start_timestamp, matches)]
+            self._processed -= idx - 1
+
+        self._history_start = start_timestamp
+
+    def _measure_history(self, end_timestamp):
+        """Return time on and times turned on from the tracked history."""
+        last_timestamp, last_matches = self._history[self._processed - 1]
+
+        if last_timestamp > end_timestamp:
+            # Period ended before the last change
+            return HistoryStatsHelper.measure(
+                self._history[: self._processed], self._history_start, end_timestamp
+            )
+
+        elapsed = self._on_seconds
+        if last_matches:
+            elapsed += end_timestamp - last_timestamp
+        return elapsed, self._on_count
+
+    @callback
     def update_period(self):
-        """Parse the templates and store a datetime tuple in _period."""
+        """Parse the templates and store a datetime tuple in _period.
+
+        This method must be run in the event loop.
+        """
         start = None
         end = None
 
         # Parse start
         if self._start is not None:
             try:
-                start_rendered = self._start.render()
+                start_rendered = self._start.async_render()
             except (TemplateError, TypeError) as ex:
                 HistoryStatsHelper.handle_template_exception(ex, "start")
                 return
@@ -269,7 +387,7 @@ class HistoryStatsSensor(Entity):
         # Parse end
         if self._end is not None:
             try:
-                end_rendered = self._end.render()
+                end_rendered = self._end.async_render()
             except (TemplateError, TypeError) as ex:
                 HistoryStatsHelper.handle_template_exception(ex, "end")
                 return
@@ -304,6 +422,36 @@ class HistoryStatsSensor(Entity):
 class HistoryStatsHelper:
     """Static methods to make the HistoryStatsSensor code lighter."""
 
+    @staticmethod
+    def measure(changes, start, end):
+        """Return time on and times turned on between start and end.
+
+        changes is a list of (timestamp, state matches) ordered by time.
+        """
+        last_state = False
+        last_time = start
+        elapsed = 0
+        count = 0
+
+        for current_time, current_state in changes:
+            if current_time > end:
+                break
+            current_time = max(current_time, last_time)
+
+            if last_state:
+                elapsed += current_time - last_time
+            if current_state and not last_state:
+                count += 1
+
+            last_state = current_state
+            last_time = current_time
+
+        # Count time elapsed between last history state and end of measure
+        if last_state:
+            elapsed += end - last_time
+
+        return elapsed, count
+
     @staticmethod
     def pretty_duration(hours):
         """Format a duration in days, hours, minutes, seconds."""
@@ -14,7 +14,12 @@ import voluptuous as vol
 
 from homeassistant import exceptions
 from homeassistant.const import CONTENT_TYPE_JSON
-from homeassistant.core import Context, is_callback
+from homeassistant.core import (
+    Context,
+    current_integration,
+    is_callback,
+    module_integration,
+)
 from homeassistant.helpers.json import JSONEncoder
 
 from .const import KEY_AUTHENTICATED, KEY_HASS, KEY_REAL_IP
@@ -98,6 +103,10 @@ def request_handler_factory(view, handler):
         handler
     ), "Handler should be a coroutine or a callback."
 
+    # The request task is created by the server of the http integration,
+    # attribute the jobs of the view to the integration defining it
+    integration = module_integration(type(view).__module__)
+
     async def handle(request):
         """Handle incoming request."""
         if not request.app[KEY_HASS].is_running:
@@ -115,6 +124,7 @@ def request_handler_factory(view, handler):
             authenticated,
         )
 
+        token = current_integration.set(integration)
         try:
             result = handler(request, **request.match_info)
 
@@ -126,6 +136,8 @@ def request_handler_factory(view, handler):
             raise HTTPInternalServerError()
         except exceptions.Unauthorized:
             raise HTTPUnauthorized()
+        finally:
+            current_integration.reset(token)
 
         if isinstance(result, web.StreamResponse):
             # The method handler returned a ready-made Response, how nice of it
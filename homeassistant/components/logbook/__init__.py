@@ -1,6 +1,8 @@
 """Event parser and human readable log generator."""
 from datetime import timedelta
+from functools import partial
 from itertools import groupby
+import json
 import logging
 
 import voluptuous as vol
@@ -8,6 +10,12 @@ import voluptuous as vol
 from homeassistant.loader import bind_hass
 from homeassistant.components import sun
 from homeassistant.components.http import HomeAssistantView
+from homeassistant.components.recorder.const import DATA_INSTANCE
+from homeassistant.components.recorder.util import (
+    after,
+    async_stream_json,
+    session_scope,
+)
 from homeassistant.const import (
     ATTR_DOMAIN,
     ATTR_ENTITY_ID,
@@ -27,7 +35,15 @@ from homeassistant.const import (
     STATE_OFF,
     STATE_ON,
 )
-from homeassistant.core import DOMAIN as HA_DOMAIN, State, callback, split_entity_id
+from homeassistant.core import (
+    DOMAIN as HA_DOMAIN,
+    Context,
+    Event,
+    EventOrigin,
+    State,
+    callback,
+    split_entity_id,
+)
 from homeassistant.components.alexa.smart_home import EVENT_ALEXA_SMART_HOME
 from homeassistant.components.homekit.const import (
     ATTR_DISPLAY_NAME,
@@ -36,6 +52,7 @@ from homeassistant.components.homekit.const import (
     EVENT_HOMEKIT_CHANGED,
 )
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.json import JSONEncoder
 import homeassistant.util.dt as dt_util
 
 _LOGGER = logging.getLogger(__name__)
@@ -50,6 +67,9 @@ DOMAIN = "logbook"
 
 GROUP_BY_MINUTES = 15
 
+# Number of entries serialized per chunk of a streamed response
+STREAM_BATCH_SIZE = 1000
+
 CONFIG_SCHEMA = vol.Schema(
     {
         DOMAIN: vol.Schema(
@@ -130,6 +150,8 @@ async def async_setup(hass, config):
         message = message.async_render()
         async_log_entry(hass, name, message, domain, entity_id)
 
+    hass.data[DATA_INSTANCE].async_add_writer(partial(_write_entries, hass))
+
     hass.http.register_view(LogbookView(config.get(DOMAIN, {})))
 
     hass.components.frontend.async_register_built_in_panel(
@@ -150,9 +172,15 @@ class LogbookView(HomeAssistantView):
     def __init__(self, config):
         """Initialize the logbook view."""
         self.config = config
+        self._index_start = None
 
     async def get(self, request, datetime=None):
-        """Retrieve logbook entries."""
+        """Retrieve logbook entries.
+
+        Periods covered by the logbook_entries table are streamed from it,
+        the optional limit and cursor parameters page through them and the
+        URL of the next page is returned in the Link header.
+        """
         if datetime:
             datetime = dt_util.parse_datetime(datetime)
 
@@ -168,17 +196,335 @@ class LogbookView(HomeAssistantView):
             period = int(period)
 
         entity_id = request.query.get("entity")
+        if entity_id is not None:
+            entity_id = entity_id.lower()
         start_day = dt_util.as_utc(datetime) - timedelta(days=period - 1)
         end_day = start_day + timedelta(days=period)
         hass = request.app["hass"]
 
-        def json_events():
-            """Fetch events and generate JSON."""
-            return self.json(
-                _get_events(hass, self.config, start_day, end_day, entity_id)
+        if self._index_start is None:
+            self._index_start = await hass.async_add_executor_job(
+                _get_index_start, hass
+            )
+
+        if self._index_start is None or start_day < self._index_start:
+
+            def json_events():
+                """Fetch events and generate JSON."""
+                return self.json(
+                    _get_events(hass, self.config, start_day, end_day, entity_id)
+                )
+
+            return await hass.async_add_job(json_events)
+
+        stream = LogbookStream(hass, self.config, start_day, end_day, entity_id)
+
+        return await async_stream_json(self, request, stream)
+
+
+class LogbookStream:
+    """Serialize logbook entries to JSON in chunks.
+
+    Entries are read from the logbook_entries table in batches of
+    STREAM_BATCH_SIZE, ordered by time. With a limit, only that many entries
+    are written, starting after the cursor (the entry_id of the last entry
+    of the previous page).
+    """
+
+    def __init__(
+        self, hass, config, start_day, end_day, entity_id=None, cursor=None, limit=None
+    ):
+        """Initialize the stream."""
+        self.hass = hass
+        self.entities_filter = _generate_filter_from_config(config)
+        self.start_day = start_day
+        self.end_day = end_day
+        self.entity_id = entity_id
+        self.cursor = cursor
+        self.limit = limit
+        # Sort keys (time_fired, entry_id) of the last entry read and of the
+        # last entry of this page
+        self._key = None
+        self._end = None
+        self._written = False
+        self._started = False
+        self._finished = False
+
+    def prepare(self):
+        """Find the end of the page.
+
+        Returns the cursor of the next page, or None if this is the last page.
+        Raises ValueError if the cursor does not exist.
+        """
+        from homeassistant.components.recorder.models import LogbookEntries
+
+        next_cursor = None
+        with session_scope(hass=self.hass) as session:
+            if self.cursor is not None:
+                row = (
+                    session.query(*_sort_columns())
+                    .filter(LogbookEntries.entry_id == self.cursor)
+                    .first()
+                )
+                if row is not None:
+                    self._key = tuple(row)
+
+            if self.limit is not None:
+                kept = 0
+                query = self._query(
+                    session.query(
+                        LogbookEntries.time_fired,
+                        LogbookEntries.entry_id,
+                        LogbookEntries.domain,
+                        LogbookEntries.entity_id,
+                    )
+                )
+                for row in query.yield_per(STREAM_BATCH_SIZE):
+                    if not self._keep(row):
+                        continue
+                    if kept == self.limit:
+                        next_cursor = self._end[1]
+                        break
+                    kept += 1
+                    self._end = (row.time_fired, row.entry_id)
+
+        if self.cursor is not None and self._key is None:
+            raise ValueError("Unknown cursor {}".format(self.cursor))
+
+        return next_cursor
+
+    def next_chunk(self):
+        """Return the next chunk of the JSON document, None when done."""
+        from homeassistant.components.recorder.models import LogbookEntries
+
+        if self._finished:
+            return None
+
+        parts = []
+        if not self._started:
+            parts.append("[")
+            self._started = True
+
+        read = 0
+        with session_scope(hass=self.hass) as session:
+            query = self._query(session.query(LogbookEntries))
+            for entry in query.limit(STREAM_BATCH_SIZE).yield_per(STREAM_BATCH_SIZE):
+                read += 1
+                self._key = (entry.time_fired, entry.entry_id)
+                if not self._keep(entry):
+                    continue
+                if self._written:
+                    parts.append(",")
+                parts.append(
+                    json.dumps(entry.to_native(), sort_keys=True, cls=JSONEncoder)
+                )
+                self._written = True
+
+        if read < STREAM_BATCH_SIZE or self._key == self._end:
+            parts.append("]")
+            self._finished = True
+
+        return "".join(parts).encode("UTF-8")
+
+    def _keep(self, row):
+        """Return if an entry passes the configured filter."""
+        filter_id = _entry_filter_id(row.domain, row.entity_id)
+        return filter_id is None or self.entities_filter(filter_id)
+
+    def _query(self, query):
+        """Filter and order a query for the entries of this page."""
+        from homeassistant.components.recorder.models import LogbookEntries
+
+        query = query.filter(
+            (LogbookEntries.time_fired > self.start_day)
+            & (LogbookEntries.time_fired < self.end_day)
+        )
+
+        if self.entity_id is not None:
+            query = query.filter(LogbookEntries.entity_id == self.entity_id)
+
+        if self._key is not None:
+            query = query.filter(after(_sort_columns(), self._key))
+
+        if self._end is not None:
+            query = query.filter(~after(_sort_columns(), self._end))
+
+        return query.order_by(*_sort_columns())
+
+
+def _sort_columns():
+    """Return the columns a logbook stream is ordered by."""
+    from homeassistant.components.recorder.models import LogbookEntries
+
+    return LogbookEntries.time_fired, LogbookEntries.entry_id
+
+
+def _entry_filter_id(domain, entity_id):
+    """Return the id an entry is filtered by, None if it is always shown.
+
+    Mirrors _keep_event: Alexa and HomeKit entries are filtered by their
+    domain, Home Assistant starts and stops are never filtered.
+    """
+    if domain in ("alexa", DOMAIN_HOMEKIT):
+        return f"{domain}."
+    if entity_id:
+        return entity_id
+    if domain and domain != HA_DOMAIN:
+        return f"{domain}."
+    return None
+
+
+def _get_index_start(hass):
+    """Return when the logbook_entries table started to be written."""
+    from homeassistant.components.recorder.models import (
+        LOGBOOK_SCHEMA_VERSION,
+        SchemaChanges,
+        process_timestamp,
+    )
+
+    with session_scope(hass=hass) as session:
+        changed = (
+            session.query(SchemaChanges.changed)
+            .filter(SchemaChanges.schema_version >= LOGBOOK_SCHEMA_VERSION)
+            .order_by(SchemaChanges.change_id)
+            .limit(1)
+            .scalar()
+        )
+
+    return process_timestamp(changed)
+
+
+def _write_entries(hass, session, events):
+    """Add the logbook entries of recorded events to the session.
+
+    Runs in the recorder thread. Like humanify, only the last change of a
+    continuous sensor in every GROUP_BY_MINUTES is kept and a stop followed
+    by a start in the same minute becomes a restart.
+    """
+    from homeassistant.components.recorder.models import LogbookEntries
+
+    entries = []
+    # Index in entries of the last change of continuous sensors
+    sensor_entries = {}
+    # Start of the group of the first change of continuous sensors
+    group_starts = {}
+
+    for event in events:
+        if event.event_type == EVENT_STATE_CHANGED:
+            event = _recorded_state_change(event)
+
+        try:
+            if not _keep_event(event, _keep_all):
+                continue
+            entry = _entry_from_event(hass, event)
+        except (KeyError, TypeError, ValueError):
+            _LOGGER.exception("Error creating logbook entry: %s", event)
+            continue
+
+        if entry is None:
+            continue
+
+        when = entry["when"]
+
+        if (
+            event.event_type == EVENT_STATE_CHANGED
+            and entry["domain"] in CONTINUOUS_DOMAINS
+        ):
+            group_start = when.replace(
+                minute=when.minute - when.minute % GROUP_BY_MINUTES,
+                second=0,
+                microsecond=0,
+            )
+            idx = sensor_entries.get(entry["entity_id"])
+            if idx is not None and entries[idx]["when"] >= group_start:
+                entries[idx] = entry
+                continue
+
+            group_starts.setdefault(entry["entity_id"], group_start)
+            sensor_entries[entry["entity_id"]] = len(entries)
+
+        elif event.event_type == EVENT_HOMEASSISTANT_START:
+            stop = (
+                session.query(LogbookEntries)
+                .filter(LogbookEntries.domain == HA_DOMAIN)
+                .filter(LogbookEntries.message == "stopped")
+                .filter(
+                    LogbookEntries.time_fired >= when.replace(second=0, microsecond=0)
+                )
+                .first()
+            )
+            if stop is not None:
+                stop.message = "restarted"
+                continue
+
+        entries.append(entry)
+
+    if group_starts:
+        _delete_replaced_entries(session, group_starts)
+
+    session.bulk_save_objects([LogbookEntries.from_entry(entry) for entry in entries])
+
+
+def _delete_replaced_entries(session, group_starts):
+    """Delete the entries of continuous sensors that new entries replace.
+
+    group_starts maps entity ids to the start of the group of their first new
+    entry. Recorded entries of a sensor in that group are replaced.
+    """
+    from homeassistant.components.recorder.models import (
+        LogbookEntries,
+        process_timestamp,
+    )
+
+    entity_ids = list(group_starts)
+    # Stay below the bound parameter limit of SQLite
+    for idx in range(0, len(entity_ids), 500):
+        chunk = entity_ids[idx : idx + 500]
+        query = (
+            session.query(
+                LogbookEntries.entry_id,
+                LogbookEntries.entity_id,
+                LogbookEntries.time_fired,
             )
+            .filter(LogbookEntries.entity_id.in_(chunk))
+            .filter(
+                LogbookEntries.time_fired
+                >= min(group_starts[entity_id] for entity_id in chunk)
+            )
+        )
+        replaced = [
+            entry_id
+            for entry_id, entity_id, time_fired in query
+            if process_timestamp(time_fired) >= group_starts[entity_id]
+        ]
+
+        if replaced:
+            session.query(LogbookEntries).filter(
+                LogbookEntries.entry_id.in_(replaced)
+            ).delete(synchronize_session=False)
+
+
+def _recorded_state_change(event):
+    """Return a state change with its states as dicts, as read from the database."""
+    old_state = event.data.get("old_state")
+    new_state = event.data.get("new_state")
+
+    return Event(
+        EVENT_STATE_CHANGED,
+        {
+            "entity_id": event.data.get("entity_id"),
+            "old_state": None if old_state is None else {},
+            "new_state": None if new_state is None else new_state.as_dict(),
+        },
+        event.origin,
+        event.time_fired,
+        context=event.context,
+    )
 
-        return await hass.async_add_job(json_events)
+
+def _keep_all(entity_id):
+    """Entity filter keeping all entities."""
+    return True
 
 
 def humanify(hass, events):
@@ -227,147 +573,163 @@ def humanify(hass, events):
         # Yield entries
         for event in events_batch:
             if event.event_type == EVENT_STATE_CHANGED:
-
-                to_state = State.from_dict(event.data.get("new_state"))
-
-                domain = to_state.domain
+                entity_id = event.data.get("entity_id")
 
                 # Skip all but the last sensor state
                 if (
-                    domain in CONTINUOUS_DOMAINS
-                    and event != last_sensor_event[to_state.entity_id]
-                ):
-                    continue
-
-                # Don't show continuous sensor value changes in the logbook
-                if domain in CONTINUOUS_DOMAINS and to_state.attributes.get(
-                    "unit_of_measurement"
+                    entity_id.startswith(domain_prefixes)
+                    and event != last_sensor_event[entity_id]
                 ):
                     continue
 
-                yield {
-                    "when": event.time_fired,
-                    "name": to_state.name,
-                    "message": _entry_message_from_state(domain, to_state),
-                    "domain": domain,
-                    "entity_id": to_state.entity_id,
-                    "context_id": event.context.id,
-                    "context_user_id": event.context.user_id,
-                }
-
             elif event.event_type == EVENT_HOMEASSISTANT_START:
                 if start_stop_events.get(event.time_fired.minute) == 2:
                     continue
 
-                yield {
-                    "when": event.time_fired,
-                    "name": "Home Assistant",
-                    "message": "started",
-                    "domain": HA_DOMAIN,
-                    "context_id": event.context.id,
-                    "context_user_id": event.context.user_id,
-                }
+            entry = _entry_from_event(hass, event)
 
-            elif event.event_type == EVENT_HOMEASSISTANT_STOP:
-                if start_stop_events.get(event.time_fired.minute) == 2:
-                    action = "restarted"
-                else:
-                    action = "stopped"
-
-                yield {
-                    "when": event.time_fired,
-                    "name": "Home Assistant",
-                    "message": action,
-                    "domain": HA_DOMAIN,
-                    "context_id": event.context.id,
-                    "context_user_id": event.context.user_id,
-                }
-
-            elif event.event_type == EVENT_LOGBOOK_ENTRY:
-                domain = event.data.get(ATTR_DOMAIN)
-                entity_id = event.data.get(ATTR_ENTITY_ID)
-                if domain is None and entity_id is not None:
-                    try:
-                        domain = split_entity_id(str(entity_id))[0]
-                    except IndexError:
-                        pass
-
-                yield {
-                    "when": event.time_fired,
-                    "name": event.data.get(ATTR_NAME),
-                    "message": event.data.get(ATTR_MESSAGE),
-                    "domain": domain,
-                    "entity_id": entity_id,
-                    "context_id": event.context.id,
-                    "context_user_id": event.context.user_id,
-                }
-
-            elif event.event_type == EVENT_ALEXA_SMART_HOME:
-                data = event.data
-                entity_id = data["request"].get("entity_id")
-
-                if entity_id:
-                    state = hass.states.get(entity_id)
-                    name = state.name if state else entity_id
-                    message = "send command {}/{} for {}".format(
-                        data["request"]["namespace"], data["request"]["name"], name
-                    )
-                else:
-                    message = "send command {}/{}".format(
-                        data["request"]["namespace"], data["request"]["name"]
-                    )
+            if entry is None:
+                continue
 
-                yield {
-                    "when": event.time_fired,
-                    "name": "Amazon Alexa",
-                    "message": message,
-                    "domain": "alexa",
-                    "entity_id": entity_id,
-                    "context_id": event.context.id,
-                    "context_user_id": event.context.user_id,
-                }
-
-            elif event.event_type == EVENT_HOMEKIT_CHANGED:
-                data = event.data
-                entity_id = data.get(ATTR_ENTITY_ID)
-                value = data.get(ATTR_VALUE)
-
-                value_msg = f" to {value}" if value else ""
-                message = "send command {}{} for {}".format(
-                    data[ATTR_SERVICE], value_msg, data[ATTR_DISPLAY_NAME]
-                )
+            if (
+                event.event_type == EVENT_HOMEASSISTANT_STOP
+                and start_stop_events.get(event.time_fired.minute) == 2
+            ):
+                entry["message"] = "restarted"
+
+            yield entry
+
+
+def _entry_from_event(hass, event):
+    """Convert an event to a logbook entry, None if it has no entry."""
+    if event.event_type == EVENT_STATE_CHANGED:
+        to_state = State.from_dict(event.data.get("new_state"))
+
+        domain = to_state.domain
+
+        # Don't show continuous sensor value changes in the logbook
+        if domain in CONTINUOUS_DOMAINS and to_state.attributes.get(
+            "unit_of_measurement"
+        ):
+            return None
+
+        return {
+            "when": event.time_fired,
+            "name": to_state.name,
+            "message": _entry_message_from_state(domain, to_state),
+            "domain": domain,
+            "entity_id": to_state.entity_id,
+            "context_id": event.context.id,
+            "context_user_id": event.context.user_id,
+        }
+
+    elif event.event_type == EVENT_HOMEASSISTANT_START:
+        return {
+            "when": event.time_fired,
+            "name": "Home Assistant",
+            "message": "started",
+            "domain": HA_DOMAIN,
+            "context_id": event.context.id,
+            "context_user_id": event.context.user_id,
+        }
+
+    elif event.event_type == EVENT_HOMEASSISTANT_STOP:
+        return {
+            "when": event.time_fired,
+            "name": "Home Assistant",
+            "message": "stopped",
+            "domain": HA_DOMAIN,
+            "context_id": event.context.id,
+            "context_user_id": event.context.user_id,
+        }
+
+    elif event.event_type == EVENT_LOGBOOK_ENTRY:
+        domain = event.data.get(ATTR_DOMAIN)
+        entity_id = event.data.get(ATTR_ENTITY_ID)
+        if domain is None and entity_id is not None:
+            try:
+                domain = split_entity_id(str(entity_id))[0]
+            except IndexError:
+                pass
+
+        return {
+            "when": event.time_fired,
+            "name": event.data.get(ATTR_NAME),
+            "message": event.data.get(ATTR_MESSAGE),
+            "domain": domain,
+            "entity_id": entity_id,
+            "context_id": event.context.id,
+            "context_user_id": event.context.user_id,
+        }
+
+    elif event.event_type == EVENT_ALEXA_SMART_HOME:
+        data = event.data
+        entity_id = data["request"].get("entity_id")
+
+        if entity_id:
+            state = hass.states.get(entity_id)
+            name = state.name if state else entity_id
+            message = "send command {}/{} for {}".format(
+                data["request"]["namespace"], data["request"]["name"], name
+            )
+        else:
+            message = "send command {}/{}".format(
+                data["request"]["namespace"], data["request"]["name"]
+            )
+
+        return {
+            "when": event.time_fired,
+            "name": "Amazon Alexa",
+            "message": message,
+            "domain": "alexa",
+            "entity_id": entity_id,
+            "context_id": event.context.id,
+            "context_user_id": event.context.user_id,
+        }
+
+    elif event.event_type == EVENT_HOMEKIT_CHANGED:
+        data = event.data
+        entity_id = data.get(ATTR_ENTITY_ID)
+        value = data.get(ATTR_VALUE)
+
+        value_msg = f" to {value}" if value else ""
+        message = "send command {}{} for {}".format(
+            data[ATTR_SERVICE], value_msg, data[ATTR_DISPLAY_NAME]
+        )
+
+        return {
+            "when": event.time_fired,
+            "name": "HomeKit",
+            "message": message,
+            "domain": DOMAIN_HOMEKIT,
+            "entity_id": entity_id,
+            "context_id": event.context.id,
+            "context_user_id": event.context.user_id,
+        }
+
+    elif event.event_type == EVENT_AUTOMATION_TRIGGERED:
+        return {
+            "when": event.time_fired,
+            "name": event.data.get(ATTR_NAME),
+            "message": "has been triggered",
+            "domain": "automation",
+            "entity_id": event.data.get(ATTR_ENTITY_ID),
+            "context_id": event.context.id,
+            "context_user_id": event.context.user_id,
+        }
+
+    elif event.event_type == EVENT_SCRIPT_STARTED:
+        return {
+            "when": event.time_fired,
+            "name": event.data.get(ATTR_NAME),
+            "message": "started",
+            "domain": "script",
+            "entity_id": event.data.get(ATTR_ENTITY_ID),
+            "context_id": event.context.id,
+            "context_user_id": event.context.user_id,
+        }
 
-                yield {
-                    "when": event.time_fired,
-                    "name": "HomeKit",
-                    "message": message,
-                    "domain": DOMAIN_HOMEKIT,
-                    "entity_id": entity_id,
-                    "context_id": event.context.id,
-                    "context_user_id": event.context.user_id,
-                }
-
-            elif event.event_type == EVENT_AUTOMATION_TRIGGERED:
-                yield {
-                    "when": event.time_fired,
-                    "name": event.data.get(ATTR_NAME),
-                    "message": "has been triggered",
-                    "domain": "automation",
-                    "entity_id": event.data.get(ATTR_ENTITY_ID),
-                    "context_id": event.context.id,
-                    "context_user_id": event.context.user_id,
-                }
-
-            elif event.event_type == EVENT_SCRIPT_STARTED:
-                yield {
-                    "when": event.time_fired,
-                    "name": event.data.get(ATTR_NAME),
-                    "message": "started",
-                    "domain": "script",
-                    "entity_id": event.data.get(ATTR_ENTITY_ID),
-                    "context_id": event.context.id,
-                    "context_user_id": event.context.user_id,
-                }
+    return None
 
 
 def _get_related_entity_ids(session, entity_filter):
@@ -425,16 +787,17 @@ def _generate_filter_from_config(config):
 
 def _get_events(hass, config, start_day, end_day, entity_id=None):
     """Get events for a period of time."""
-    from homeassistant.components.recorder.models import Events, States
-    from homeassistant.components.recorder.util import session_scope
+    from homeassistant.components.recorder.models import Events, StateAttributes, States
 
     entities_filter = _generate_filter_from_config(config)
 
     def yield_events(query):
         """Yield Events that are not filtered away."""
+        # Parse attributes shared by states once
+        attributes_cache = {}
         for row in query.yield_per(500):
-            event = row.to_native()
-            if _keep_event(event, entities_filter):
+            event = _row_to_event(row, attributes_cache)
+            if event is not None and _keep_event(event, entities_filter):
                 yield event
 
     with session_scope(hass=hass) as session:
@@ -444,9 +807,28 @@ def _get_events(hass, config, start_day, end_day, entity_id=None):
             entity_ids = _get_related_entity_ids(session, entities_filter)
 
         query = (
-            session.query(Events)
+            session.query(
+                Events.event_type,
+                Events.event_data,
+                Events.origin,
+                Events.time_fired,
+                Events.context_id,
+                Events.context_user_id,
+                Events.slim,
+                States.state_id,
+                States.entity_id,
+                States.state,
+                States.attributes,
+                States.attributes_id,
+                States.last_changed,
+                States.last_updated,
+                StateAttributes.shared_attrs,
+            )
             .order_by(Events.time_fired)
             .outerjoin(States, (Events.event_id == States.event_id))
+            .outerjoin(
+                StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
+            )
             .filter(Events.event_type.in_(ALL_EVENT_TYPES))
             .filter((Events.time_fired > start_day) & (Events.time_fired < end_day))
             .filter(
@@ -461,6 +843,65 @@ def _get_events(hass, config, start_day, end_day, entity_id=None):
         return list(humanify(hass, yield_events(query)))
 
 
+def _row_to_event(row, attributes_cache):
+    """Convert a row of an event and its state to an event.
+
+    Slim state changes are recorded without event data, their new state is
+    rebuilt from the states row.
+    """
+    from homeassistant.components.recorder.models import process_timestamp
+
+    context = Context(id=row.context_id, user_id=row.context_user_id)
+    time_fired = process_timestamp(row.time_fired)
+
+    try:
+        if not row.slim:
+            return Event(
+                row.event_type,
+                json.loads(row.event_data),
+                EventOrigin(row.origin),
+                time_fired,
+                context=context,
+            )
+
+        if row.state_id is None:
+            # Nothing to rebuild the state change from
+            return None
+
+        if row.attributes_id is None:
+            attributes = json.loads(row.attributes)
+        elif row.attributes_id in attributes_cache:
+            attributes = attributes_cache[row.attributes_id]
+        else:
+            attributes = attributes_cache[row.attributes_id] = json.loads(
+                row.shared_attrs
+            )
+    except (TypeError, ValueError):
+        # When json.loads fails
+        _LOGGER.exception("Error converting row to event: %s", row)
+        return None
+
+    return Event(
+        EVENT_STATE_CHANGED,
+        {
+            "entity_id": row.entity_id,
+            # Slim events are only recorded for changes of an existing state
+            "old_state": {},
+            "new_state": {
+                "entity_id": row.entity_id,
+                "state": row.state,
+                "attributes": attributes,
+                "last_changed": process_timestamp(row.last_changed),
+                "last_updated": process_timestamp(row.last_updated),
+                "context": context.as_dict(),
+            },
+        },
+        EventOrigin(row.origin),
+        time_fired,
+        context=context,
+    )
+
+
 def _keep_event(event, entities_filter):
     domain, entity_id = None, None
 
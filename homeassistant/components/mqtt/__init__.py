@@ -11,13 +11,12 @@ import os
 import socket
 import ssl
 import time
-from typing import Any, Callable, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 import attr
 import requests.certs
 import voluptuous as vol
 import paho.mqtt.client as mqtt
-from paho.mqtt.matcher import MQTTMatcher
 
 from homeassistant import config_entries
 from homeassistant.components import websocket_api
@@ -704,6 +703,122 @@ class Subscription:
     encoding = attr.ib(type=str, default="utf-8")
 
 
+class _TopicNode:
+    """Level of a topic filter in the subscription index."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: Dict[str, _TopicNode] = {}
+        self.subscriptions: List[Subscription] = []
+
+
+class SubscriptionIndex:
+    """Index of subscriptions to find the ones matching a topic.
+
+    Subscriptions on plain topics are kept in a dictionary, subscriptions on
+    topic filters with wildcards in a trie with one level per node. Finding
+    the subscriptions for a topic only walks the trie paths that can match.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the index."""
+        self._exact: Dict[str, List[Subscription]] = {}
+        self._wildcard = _TopicNode()
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription to the index."""
+        topic = subscription.topic
+
+        if not _has_wildcard(topic):
+            self._exact.setdefault(topic, []).append(subscription)
+            return
+
+        node = self._wildcard
+        for level in topic.split("/"):
+            child = node.children.get(level)
+            if child is None:
+                child = node.children[level] = _TopicNode()
+            node = child
+        node.subscriptions.append(subscription)
+
+    def remove(self, subscription: Subscription) -> bool:
+        """Remove a subscription from the index.
+
+        Return if other subscriptions on the same topic remain.
+        """
+        topic = subscription.topic
+
+        if not _has_wildcard(topic):
+            subscriptions = self._exact[topic]
+            subscriptions.remove(subscription)
+            if subscriptions:
+                return True
+            del self._exact[topic]
+            return False
+
+        path = [(None, self._wildcard)]
+        for level in topic.split("/"):
+            path.append((level, path[-1][1].children[level]))
+
+        node = path[-1][1]
+        node.subscriptions.remove(subscription)
+        if node.subscriptions:
+            return True
+
+        # Prune the levels that no longer lead to a subscription
+        for idx in range(len(path) - 1, 0, -1):
+            level, node = path[idx]
+            if node.subscriptions or node.children:
+                break
+            del path[idx - 1][1].children[level]
+
+        return False
+
+    def matches(self, topic: str) -> List[Subscription]:
+        """Return the subscriptions matching a topic."""
+        result = list(self._exact.get(topic, ()))
+
+        if not self._wildcard.children:
+            return result
+
+        # Wildcards on the first level don't match topics starting with $
+        root_wildcards = not topic.startswith("$")
+        nodes = [self._wildcard]
+
+        for idx, level in enumerate(topic.split("/")):
+            wildcards = root_wildcards or idx > 0
+            next_nodes = []
+
+            for node in nodes:
+                children = node.children
+                child = children.get(level)
+                if child is not None:
+                    next_nodes.append(child)
+                if not wildcards:
+                    continue
+                child = children.get("+")
+                if child is not None:
+                    next_nodes.append(child)
+                child = children.get("#")
+                if child is not None:
+                    result.extend(child.subscriptions)
+
+            if not next_nodes:
+                return result
+            nodes = next_nodes
+
+        for node in nodes:
+            result.extend(node.subscriptions)
+            # A multi-level wildcard also matches its parent level
+            child = node.children.get("#")
+            if child is not None:
+                result.extend(child.subscriptions)
+
+        return result
+
+
 class MQTT:
     """Home Assistant MQTT client."""
 
@@ -731,6 +846,7 @@ class MQTT:
         self.port = port
         self.keepalive = keepalive
         self.subscriptions: List[Subscription] = []
+        self._subscription_index = SubscriptionIndex()
         self.birth_message = birth_message
         self.connected = False
         self._mqttc: mqtt.Client = None
@@ -833,6 +949,7 @@ class MQTT:
 
         subscription = Subscription(topic, msg_callback, qos, encoding)
         self.subscriptions.append(subscription)
+        self._subscription_index.add(subscription)
 
         await self._async_perform_subscription(topic, qos)
 
@@ -843,7 +960,7 @@ class MQTT:
                 raise HomeAssistantError("Can't remove subscription twice")
             self.subscriptions.remove(subscription)
 
-            if any(other.topic == topic for other in self.subscriptions):
+            if self._subscription_index.remove(subscription):
                 # Other subscriptions on topic remaining - don't unsubscribe.
                 return
 
@@ -915,10 +1032,7 @@ class MQTT:
             msg.payload,
         )
 
-        for subscription in self.subscriptions:
-            if not _match_topic(subscription.topic, msg.topic):
-                continue
-
+        for subscription in self._subscription_index.matches(msg.topic):
             payload: SubscribePayloadType = msg.payload
             if subscription.encoding is not None:
                 try:
@@ -974,15 +1088,9 @@ def _raise_on_error(result_code: int) -> None:
         )
 
 
-def _match_topic(subscription: str, topic: str) -> bool:
-    """Test if topic matches subscription."""
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-    try:
-        next(matcher.iter_match(topic))
-        return True
-    except StopIteration:
-        return False
+def _has_wildcard(topic: str) -> bool:
+    """Return if a topic filter contains a wildcard."""
+    return "+" in topic or "#" in topic
 
 
 class MqttAttributes(Entity):
@@ -1,13 +1,13 @@
 """Support for recording details."""
 import asyncio
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 import concurrent.futures
 from datetime import datetime, timedelta
 import logging
 import queue
 import threading
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
 from sqlite3 import Connection
 
 import voluptuous as vol
@@ -38,7 +38,7 @@ import homeassistant.util.dt as dt_util
 
 from . import migration, purge
 from .const import DATA_INSTANCE
-from .models import Base, Events, RecorderRuns, States
+from .models import Base, Events, RecorderRuns, StateAttributes, States
 from .util import session_scope
 
 _LOGGER = logging.getLogger(__name__)
@@ -47,6 +47,10 @@ DOMAIN = "recorder"
 
 SERVICE_PURGE = "purge"
 
+EVENT_RECORDER_PURGED = "recorder_purged"
+
+ATTR_BATCHES = "batches"
+ATTR_DURATION = "duration"
 ATTR_KEEP_DAYS = "keep_days"
 ATTR_REPACK = "repack"
 
@@ -64,9 +68,18 @@ CONF_DB_URL = "db_url"
 CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
+CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_MAX_BATCH_SIZE = "max_batch_size"
+CONF_SLIM_STATE_EVENTS = "slim_state_events"
+
+DEFAULT_COMMIT_INTERVAL = 1
+DEFAULT_MAX_BATCH_SIZE = 1000
 
 CONNECT_RETRY_WAIT = 3
 
+# Number of attributes JSON strings remembered with their row id
+ATTRIBUTES_IDS_CACHE_SIZE = 2048
+
 FILTER_SCHEMA = vol.Schema(
     {
         vol.Optional(CONF_EXCLUDE, default={}): vol.Schema(
@@ -96,6 +109,13 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Coerce(int), vol.Range(min=0)
                 ),
                 vol.Optional(CONF_DB_URL): cv.string,
+                vol.Optional(
+                    CONF_COMMIT_INTERVAL, default=DEFAULT_COMMIT_INTERVAL
+                ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                vol.Optional(
+                    CONF_MAX_BATCH_SIZE, default=DEFAULT_MAX_BATCH_SIZE
+                ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                vol.Optional(CONF_SLIM_STATE_EVENTS, default=False): cv.boolean,
             }
         )
     },
@@ -133,6 +153,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     conf = config[DOMAIN]
     keep_days = conf.get(CONF_PURGE_KEEP_DAYS)
     purge_interval = conf.get(CONF_PURGE_INTERVAL)
+    commit_interval = conf.get(CONF_COMMIT_INTERVAL)
+    max_batch_size = conf.get(CONF_MAX_BATCH_SIZE)
+    slim_state_events = conf.get(CONF_SLIM_STATE_EVENTS)
 
     db_url = conf.get(CONF_DB_URL, None)
     if not db_url:
@@ -144,9 +167,12 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         hass=hass,
         keep_days=keep_days,
         purge_interval=purge_interval,
+        commit_interval=commit_interval,
+        max_batch_size=max_batch_size,
         uri=db_url,
         include=include,
         exclude=exclude,
+        slim_state_events=slim_state_events,
     )
     instance.async_initialize()
     instance.start()
@@ -164,6 +190,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
 PurgeTask = namedtuple("PurgeTask", ["keep_days", "repack"])
 
+# Returned when a batch ended without hitting a shutdown or purge request
+_BATCH_DONE = object()
+
 
 class Recorder(threading.Thread):
     """A threaded recorder class."""
@@ -173,9 +202,12 @@ class Recorder(threading.Thread):
         hass: HomeAssistant,
         keep_days: int,
         purge_interval: int,
+        commit_interval: float,
+        max_batch_size: int,
         uri: str,
         include: Dict,
         exclude: Dict,
+        slim_state_events: bool = False,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -183,12 +215,19 @@ class Recorder(threading.Thread):
         self.hass = hass
         self.keep_days = keep_days
         self.purge_interval = purge_interval
+        self.commit_interval = commit_interval
+        self.max_batch_size = max_batch_size
+        self.slim_state_events = slim_state_events
         self.queue: Any = queue.Queue()
         self.recording_start = dt_util.utcnow()
         self.db_url = uri
         self.async_db_ready = asyncio.Future()
         self.engine: Any = None
         self.run_info: Any = None
+        self._purge_started: Optional[float] = None
+        self._purge_batches = 0
+        self._attributes_ids: Dict[str, int] = OrderedDict()
+        self._writers: List[Callable] = []
 
         self.entity_filter = generate_filter(
             include.get(CONF_DOMAINS, []),
@@ -205,6 +244,17 @@ class Recorder(threading.Thread):
         """Initialize the recorder."""
         self.hass.bus.async_listen(MATCH_ALL, self.event_listener)
 
+    @callback
+    def async_add_writer(self, writer: Callable) -> None:
+        """Add a writer of rows derived from the recorded events.
+
+        The writer is called in the recorder thread with the session and the
+        events of each batch, before the transaction recording them commits.
+        Errors other than database errors are logged and do not stop the
+        events from being recorded.
+        """
+        self._writers.append(writer)
+
     def do_adhoc_purge(self, **kwargs):
         """Trigger an adhoc purge retaining keep_days worth of data."""
         keep_days = kwargs.get(ATTR_KEEP_DAYS, self.keep_days)
@@ -311,78 +361,141 @@ class Recorder(threading.Thread):
             self.hass.helpers.event.track_point_in_time(async_purge, run)
 
         while True:
-            event = self.queue.get()
+            item = self.queue.get()
+
+            if item is not None and not isinstance(item, PurgeTask):
+                batch = [item]
+                item = self._fill_batch(batch)
+                self._save_events([event for event in batch if self._keep_event(event)])
+                for _ in batch:
+                    self.queue.task_done()
+                if item is _BATCH_DONE:
+                    continue
 
-            if event is None:
+            if item is None:
                 self._close_run()
                 self._close_connection()
                 self.queue.task_done()
                 return
-            if isinstance(event, PurgeTask):
-                purge.purge_old_data(self, event.keep_days, event.repack)
-                self.queue.task_done()
-                continue
-            if event.event_type == EVENT_TIME_CHANGED:
-                self.queue.task_done()
-                continue
-            if event.event_type in self.exclude_t:
-                self.queue.task_done()
-                continue
 
-            entity_id = event.data.get(ATTR_ENTITY_ID)
-            if entity_id is not None:
-                if not self.entity_filter(entity_id):
-                    self.queue.task_done()
-                    continue
+            self._purge(item)
+            self.queue.task_done()
+
+    def _purge(self, task):
+        """Purge a batch of old data and queue the next batch, if any."""
+        if self._purge_started is None:
+            self._purge_started = time.monotonic()
+        self._purge_batches += 1
+
+        finished = purge.purge_old_data(self, task.keep_days, task.repack)
+        # The purge may have deleted attributes that are no longer used
+        self._attributes_ids.clear()
+
+        if finished is False:
+            # Record the events queued meanwhile before the next batch
+            self.queue.put(task)
+            return
+
+        duration = time.monotonic() - self._purge_started
+        batches = self._purge_batches
+        self._purge_started = None
+        self._purge_batches = 0
+
+        if finished is None:
+            # The error is logged, the next purge starts over
+            return
+
+        _LOGGER.debug(
+            "Purge finished in %d batches and %.1f seconds", batches, duration
+        )
+        self.hass.bus.fire(
+            EVENT_RECORDER_PURGED,
+            {
+                ATTR_KEEP_DAYS: task.keep_days,
+                ATTR_BATCHES: batches,
+                ATTR_DURATION: round(duration, 3),
+            },
+        )
+
+    def _fill_batch(self, batch):
+        """Drain queued events into batch until it is full or the interval is over.
+
+        Returns the shutdown or purge request that ended the batch early, if any.
+        """
+        deadline = time.monotonic() + self.commit_interval
+
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - time.monotonic()
+            try:
+                if timeout > 0:
+                    item = self.queue.get(timeout=timeout)
+                else:
+                    item = self.queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if item is None or isinstance(item, PurgeTask):
+                return item
 
-            tries = 1
-            updated = False
-            while not updated and tries <= 10:
-                if tries != 1:
-                    time.sleep(CONNECT_RETRY_WAIT)
-                try:
-                    with session_scope(session=self.get_session()) as session:
-                        try:
-                            dbevent = Events.from_event(event)
-                            session.add(dbevent)
-                            session.flush()
-                        except (TypeError, ValueError):
-                            _LOGGER.warning("Event is not JSON serializable: %s", event)
-
-                        if event.event_type == EVENT_STATE_CHANGED:
-                            try:
-                                dbstate = States.from_event(event)
-                                dbstate.event_id = dbevent.event_id
-                                session.add(dbstate)
-                            except (TypeError, ValueError):
-                                _LOGGER.warning(
-                                    "State is not JSON serializable: %s",
-                                    event.data.get("new_state"),
-                                )
-
-                    updated = True
-
-                except exc.OperationalError as err:
-                    _LOGGER.error(
-                        "Error in database connectivity: %s. "
-                        "(retrying in %s seconds)",
-                        err,
-                        CONNECT_RETRY_WAIT,
+            batch.append(item)
+
+        return _BATCH_DONE
+
+    def _keep_event(self, event):
+        """Return if an event should be recorded."""
+        if event.event_type == EVENT_TIME_CHANGED:
+            return False
+        if event.event_type in self.exclude_t:
+            return False
+
+        entity_id = event.data.get(ATTR_ENTITY_ID)
+        return entity_id is None or self.entity_filter(entity_id)
+
+    def _save_events(self, events):
+        """Save events in a single transaction, retrying on connection errors."""
+        if not events:
+            return
+
+        tries = 1
+        updated = False
+        while not updated and tries <= 10:
+            if tries != 1:
+                time.sleep(CONNECT_RETRY_WAIT)
+            try:
+                with session_scope(session=self.get_session()) as session:
+                    new_attributes_ids = _write_events(
+                        session, events, self._attributes_ids, self.slim_state_events
                     )
-                    tries += 1
+                    for writer in self._writers:
+                        _run_writer(writer, session, events)
 
-                except exc.SQLAlchemyError:
-                    updated = True
-                    _LOGGER.exception("Error saving event: %s", event)
+                updated = True
+                self._attributes_ids.update(new_attributes_ids)
+                while len(self._attributes_ids) > ATTRIBUTES_IDS_CACHE_SIZE:
+                    self._attributes_ids.popitem(last=False)
 
-            if not updated:
+            except exc.OperationalError as err:
                 _LOGGER.error(
-                    "Error in database update. Could not save "
-                    "after %d tries. Giving up",
-                    tries,
+                    "Error in database connectivity: %s. " "(retrying in %s seconds)",
+                    err,
+                    CONNECT_RETRY_WAIT,
                 )
+                tries += 1
 
-            self.queue.task_done()
+            except exc.SQLAlchemyError:
+                updated = True
+                if len(events) == 1:
+                    _LOGGER.exception("Error saving event: %s", events[0])
+                else:
+                    # Save the events one by one so only the offender is lost
+                    for event in events:
+                        self._save_events([event])
+
+        if not updated:
+            _LOGGER.error(
+                "Error in database update. Could not save " "after %d tries. Giving up",
+                tries,
+            )
 
     @callback
     def event_listener(self, event):
@@ -453,3 +566,107 @@ class Recorder(threading.Thread):
             self.run_info.end = dt_util.utcnow()
             session.add(self.run_info)
         self.run_info = None
+
+
+def _write_events(session, events, attributes_ids, slim_state_events=False):
+    """Add events and the states they carry to the session using bulk inserts.
+
+    States refer to their attributes by id, looked up in attributes_ids, the
+    database or inserted. Returns the ids of attributes not in attributes_ids,
+    to be cached once the session is committed.
+
+    With slim_state_events, changes of existing states are recorded as slim
+    events: the states row holds the new state, the old state is in the
+    states row of the previous change.
+    """
+    db_events = []
+    db_states = []
+    for event in events:
+        dbstate = None
+        if event.event_type == EVENT_STATE_CHANGED:
+            try:
+                dbstate = States.from_event(event)
+            except (TypeError, ValueError):
+                _LOGGER.warning(
+                    "State is not JSON serializable: %s", event.data.get("new_state")
+                )
+        db_states.append(dbstate)
+
+        slim = slim_state_events and dbstate is not None and _is_state_change(event)
+        try:
+            db_events.append(Events.from_event(event, slim))
+        except (TypeError, ValueError):
+            _LOGGER.warning("Event is not JSON serializable: %s", event)
+            db_events.append(None)
+
+    session.add_all([dbevent for dbevent in db_events if dbevent is not None])
+    # Flush to have the event ids available for the states
+    session.flush()
+
+    for dbevent, dbstate in zip(db_events, db_states):
+        if dbstate is not None and dbevent is not None:
+            dbstate.event_id = dbevent.event_id
+    db_states = [dbstate for dbstate in db_states if dbstate is not None]
+
+    new_attributes_ids = _link_attributes(session, db_states, attributes_ids)
+    session.bulk_save_objects(db_states)
+    return new_attributes_ids
+
+
+def _run_writer(writer, session, events):
+    """Run a writer, logging its errors unless they are database errors."""
+    try:
+        writer(session, events)
+    except exc.SQLAlchemyError:
+        raise
+    except Exception:  # pylint: disable=broad-except
+        _LOGGER.exception(
+            "Error writing rows for %d events with %s", len(events), writer
+        )
+
+
+def _is_state_change(event):
+    """Return if an event changes an existing state that is not removed."""
+    return (
+        event.event_type == EVENT_STATE_CHANGED
+        and event.data.get("old_state") is not None
+        and event.data.get("new_state") is not None
+    )
+
+
+def _link_attributes(session, db_states, attributes_ids):
+    """Set the attributes ids of states, inserting new attributes."""
+    missing = {}
+    for dbstate in db_states:
+        shared_attrs = dbstate.state_attributes.shared_attrs
+        if shared_attrs in attributes_ids:
+            attributes_ids.move_to_end(shared_attrs)
+        else:
+            missing.setdefault(shared_attrs, dbstate.state_attributes)
+
+    new_attributes_ids = {}
+    hashes = list({attributes.hash for attributes in missing.values()})
+    # Stay below the bound parameter limit of SQLite
+    for idx in range(0, len(hashes), 500):
+        query = session.query(
+            StateAttributes.attributes_id, StateAttributes.shared_attrs
+        ).filter(StateAttributes.hash.in_(hashes[idx : idx + 500]))
+        for attributes_id, shared_attrs in query:
+            if shared_attrs in missing:
+                new_attributes_ids[shared_attrs] = attributes_id
+                del missing[shared_attrs]
+
+    if missing:
+        session.add_all(missing.values())
+        # Flush to have the attributes ids available for the states
+        session.flush()
+        for shared_attrs, attributes in missing.items():
+            new_attributes_ids[shared_attrs] = attributes.attributes_id
+
+    for dbstate in db_states:
+        shared_attrs = dbstate.state_attributes.shared_attrs
+        dbstate.attributes_id = attributes_ids.get(
+            shared_attrs, new_attributes_ids.get(shared_attrs)
+        )
+
+    return new_attributes_ids
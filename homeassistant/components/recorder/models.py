@@ -2,8 +2,10 @@
 import json
 from datetime import datetime
 import logging
+import zlib
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     Column,
     DateTime,
@@ -15,6 +17,7 @@ from sqlalchemy import (
     distinct,
 )
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import relationship
 from sqlalchemy.orm.session import Session
 
 import homeassistant.util.dt as dt_util
@@ -25,7 +28,10 @@ from homeassistant.helpers.json import JSONEncoder
 # pylint: disable=invalid-name
 Base = declarative_base()
 
-SCHEMA_VERSION = 7
+SCHEMA_VERSION = 10
+
+# Schema version that added the logbook_entries table
+LOGBOOK_SCHEMA_VERSION = 10
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -43,18 +49,25 @@ class Events(Base):  # type: ignore
     context_id = Column(String(36), index=True)
     context_user_id = Column(String(36), index=True)
     # context_parent_id = Column(String(36), index=True)
+    # State changes recorded without event data, the states row linked to
+    # the event holds the new state
+    slim = Column(Boolean, default=False)
 
     @staticmethod
-    def from_event(event):
-        """Create an event database object from a native event."""
+    def from_event(event, slim=False):
+        """Create an event database object from a native event.
+
+        A slim event is recorded with empty event data.
+        """
         return Events(
             event_type=event.event_type,
-            event_data=json.dumps(event.data, cls=JSONEncoder),
+            event_data="{}" if slim else json.dumps(event.data, cls=JSONEncoder),
             origin=str(event.origin),
             time_fired=event.time_fired,
             context_id=event.context.id,
             context_user_id=event.context.user_id,
             # context_parent_id=event.context.parent_id,
+            slim=slim,
         )
 
     def to_native(self):
@@ -65,7 +78,7 @@ class Events(Base):  # type: ignore
                 self.event_type,
                 json.loads(self.event_data),
                 EventOrigin(self.origin),
-                _process_timestamp(self.time_fired),
+                process_timestamp(self.time_fired),
                 context=context,
             )
         except ValueError:
@@ -74,6 +87,41 @@ class Events(Base):  # type: ignore
             return None
 
 
+class StateAttributes(Base):  # type: ignore
+    """State attributes, shared by all states with the same attributes."""
+
+    __tablename__ = "state_attributes"
+    attributes_id = Column(Integer, primary_key=True)
+    hash = Column(BigInteger, index=True)
+    shared_attrs = Column(Text)
+
+    @staticmethod
+    def from_event(event):
+        """Create object from a state_changed event."""
+        state = event.data.get("new_state")
+        if state is None:
+            shared_attrs = "{}"
+        else:
+            shared_attrs = json.dumps(dict(state.attributes), cls=JSONEncoder)
+
+        return StateAttributes(
+            hash=StateAttributes.hash_shared_attrs(shared_attrs),
+            shared_attrs=shared_attrs,
+        )
+
+    @staticmethod
+    def hash_shared_attrs(shared_attrs):
+        """Return the hash used to look up attributes by their JSON."""
+        return zlib.crc32(shared_attrs.encode("utf-8"))
+
+    def to_native(self):
+        """Convert to a dict, parsed once per row loaded in a session."""
+        native = getattr(self, "_native", None)
+        if native is None:
+            native = self._native = json.loads(self.shared_attrs)
+        return native
+
+
 class States(Base):  # type: ignore
     """State change history."""
 
@@ -82,6 +130,7 @@ class States(Base):  # type: ignore
     domain = Column(String(64))
     entity_id = Column(String(255), index=True)
     state = Column(String(255))
+    # Only set on states recorded before schema version 8
     attributes = Column(Text)
     event_id = Column(Integer, ForeignKey("events.event_id"), index=True)
     last_changed = Column(DateTime(timezone=True), default=datetime.utcnow)
@@ -90,6 +139,10 @@ class States(Base):  # type: ignore
     context_id = Column(String(36), index=True)
     context_user_id = Column(String(36), index=True)
     # context_parent_id = Column(String(36), index=True)
+    attributes_id = Column(
+        Integer, ForeignKey("state_attributes.attributes_id"), index=True
+    )
+    state_attributes = relationship(StateAttributes, lazy="joined")
 
     __table_args__ = (
         # Used for fetching the state of entities at a specific time
@@ -108,19 +161,18 @@ class States(Base):  # type: ignore
             context_id=event.context.id,
             context_user_id=event.context.user_id,
             # context_parent_id=event.context.parent_id,
+            state_attributes=StateAttributes.from_event(event),
         )
 
         # State got deleted
         if state is None:
             dbstate.state = ""
             dbstate.domain = split_entity_id(entity_id)[0]
-            dbstate.attributes = "{}"
             dbstate.last_changed = event.time_fired
             dbstate.last_updated = event.time_fired
         else:
             dbstate.domain = state.domain
             dbstate.state = state.state
-            dbstate.attributes = json.dumps(dict(state.attributes), cls=JSONEncoder)
             dbstate.last_changed = state.last_changed
             dbstate.last_updated = state.last_updated
 
@@ -130,12 +182,16 @@ class States(Base):  # type: ignore
         """Convert to an HA state object."""
         context = Context(id=self.context_id, user_id=self.context_user_id)
         try:
+            if self.state_attributes is not None:
+                attributes = self.state_attributes.to_native()
+            else:
+                attributes = json.loads(self.attributes)
             return State(
                 self.entity_id,
                 self.state,
-                json.loads(self.attributes),
-                _process_timestamp(self.last_changed),
-                _process_timestamp(self.last_updated),
+                attributes,
+                process_timestamp(self.last_changed),
+                process_timestamp(self.last_updated),
                 context=context,
                 # Temp, because database can still store invalid entity IDs
                 # Remove with 1.0 or in 2020.
@@ -147,6 +203,50 @@ class States(Base):  # type: ignore
             return None
 
 
+class LogbookEntries(Base):  # type: ignore
+    """Logbook entries, written by the logbook as events are recorded."""
+
+    __tablename__ = "logbook_entries"
+    entry_id = Column(Integer, primary_key=True)
+    time_fired = Column(DateTime(timezone=True), index=True)
+    name = Column(String(255))
+    message = Column(Text)
+    domain = Column(String(64))
+    entity_id = Column(String(255))
+    context_id = Column(String(36), index=True)
+    context_user_id = Column(String(36))
+
+    __table_args__ = (
+        # Used for fetching the logbook of an entity
+        Index("ix_logbook_entries_entity_id_time_fired", "entity_id", "time_fired"),
+    )
+
+    @staticmethod
+    def from_entry(entry):
+        """Create object from a logbook entry."""
+        return LogbookEntries(
+            time_fired=entry["when"],
+            name=entry["name"],
+            message=entry["message"],
+            domain=entry["domain"],
+            entity_id=entry.get("entity_id"),
+            context_id=entry["context_id"],
+            context_user_id=entry["context_user_id"],
+        )
+
+    def to_native(self):
+        """Convert to a logbook entry."""
+        return {
+            "when": process_timestamp(self.time_fired),
+            "name": self.name,
+            "message": self.message,
+            "domain": self.domain,
+            "entity_id": self.entity_id,
+            "context_id": self.context_id,
+            "context_user_id": self.context_user_id,
+        }
+
+
 class RecorderRuns(Base):  # type: ignore
     """Representation of recorder run."""
 
@@ -194,7 +294,7 @@ class SchemaChanges(Base):  # type: ignore
     changed = Column(DateTime(timezone=True), default=datetime.utcnow)
 
 
-def _process_timestamp(ts):
+def process_timestamp(ts):
     """Process a timestamp into datetime object."""
     if ts is None:
         return None
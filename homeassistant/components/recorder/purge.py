@@ -2,36 +2,84 @@
 from datetime import timedelta
 import logging
 
+from sqlalchemy import exists
 from sqlalchemy.exc import SQLAlchemyError
 
 import homeassistant.util.dt as dt_util
-from .models import Events, States
+from .models import Events, LogbookEntries, StateAttributes, States
 
 from .util import session_scope
 
 _LOGGER = logging.getLogger(__name__)
 
+# Size of the range of ids purged per table in one transaction
+PURGE_BATCH_SIZE = 10000
+
 
 def purge_old_data(instance, purge_days, repack):
-    """Purge events and states older than purge_days ago."""
+    """Purge a batch of recorded data older than purge_days ago.
+
+    Returns True when all old data is purged, False when this needs to be
+    called again to purge the next batch and None when purging failed. Each
+    batch is committed, so events recorded in between do not have to wait for
+    the whole purge.
+    """
     purge_before = dt_util.utcnow() - timedelta(days=purge_days)
     _LOGGER.debug("Purging events before %s", purge_before)
 
     try:
         with session_scope(session=instance.get_session()) as session:
-            deleted_rows = (
-                session.query(States)
-                .filter((States.last_updated < purge_before))
-                .delete(synchronize_session=False)
+            finished = True
+
+            batch = _batch_filter(
+                session, States.state_id, States.last_updated, purge_before
+            )
+            if batch is not None:
+                attributes_ids = [
+                    attributes_id
+                    for attributes_id, in session.query(States.attributes_id)
+                    .filter(batch & States.attributes_id.isnot(None))
+                    .distinct()
+                ]
+                deleted_rows = (
+                    session.query(States)
+                    .filter(batch)
+                    .delete(synchronize_session=False)
+                )
+                _LOGGER.debug("Deleted %s states", deleted_rows)
+                deleted_rows = _purge_attributes(session, attributes_ids)
+                _LOGGER.debug("Deleted %s state attributes", deleted_rows)
+                finished = False
+
+            batch = _batch_filter(
+                session, Events.event_id, Events.time_fired, purge_before
             )
-            _LOGGER.debug("Deleted %s states", deleted_rows)
+            if batch is not None:
+                deleted_rows = (
+                    session.query(Events)
+                    .filter(batch)
+                    .delete(synchronize_session=False)
+                )
+                _LOGGER.debug("Deleted %s events", deleted_rows)
+                finished = False
 
-            deleted_rows = (
-                session.query(Events)
-                .filter((Events.time_fired < purge_before))
-                .delete(synchronize_session=False)
+            batch = _batch_filter(
+                session,
+                LogbookEntries.entry_id,
+                LogbookEntries.time_fired,
+                purge_before,
             )
-            _LOGGER.debug("Deleted %s events", deleted_rows)
+            if batch is not None:
+                deleted_rows = (
+                    session.query(LogbookEntries)
+                    .filter(batch)
+                    .delete(synchronize_session=False)
+                )
+                _LOGGER.debug("Deleted %s logbook entries", deleted_rows)
+                finished = False
+
+        if not finished:
+            return False
 
         # Execute sqlite vacuum command to free up space on disk
         if repack and instance.engine.driver == "pysqlite":
@@ -40,3 +88,41 @@ def purge_old_data(instance, purge_days, repack):
 
     except SQLAlchemyError as err:
         _LOGGER.warning("Error purging history: %s.", err)
+        return None
+
+    return True
+
+
+def _batch_filter(session, id_column, time_column, purge_before):
+    """Return a filter for old rows in the first PURGE_BATCH_SIZE ids of old rows.
+
+    Returns None if there are no old rows.
+    """
+    first_id = (
+        session.query(id_column)
+        .filter(time_column < purge_before)
+        .order_by(id_column)
+        .limit(1)
+        .scalar()
+    )
+
+    if first_id is None:
+        return None
+
+    return (id_column < first_id + PURGE_BATCH_SIZE) & (time_column < purge_before)
+
+
+def _purge_attributes(session, attributes_ids):
+    """Delete the attributes in attributes_ids that no state uses anymore."""
+    deleted_rows = 0
+    # Stay below the bound parameter limit of SQLite
+    for idx in range(0, len(attributes_ids), 500):
+        deleted_rows += (
+            session.query(StateAttributes)
+            .filter(StateAttributes.attributes_id.in_(attributes_ids[idx : idx + 500]))
+            .filter(
+                ~exists().where(States.attributes_id == StateAttributes.attributes_id)
+            )
+            .delete(synchronize_session=False)
+        )
+    return deleted_rows
@@ -3,8 +3,11 @@ from contextlib import contextmanager
 import logging
 import time
 
+from aiohttp import hdrs, web
 from sqlalchemy.exc import OperationalError, SQLAlchemyError
 
+from homeassistant.const import CONTENT_TYPE_JSON, HTTP_BAD_REQUEST
+
 from .const import DATA_INSTANCE
 
 _LOGGER = logging.getLogger(__name__)
@@ -81,3 +84,58 @@ def execute(qry):
             if tryno == RETRIES - 1:
                 raise
             time.sleep(QUERY_RETRY_WAIT)
+
+
+def after(columns, key):
+    """Return a filter for rows ordered after a sort key of columns."""
+    column, *columns = columns
+    value, *key = key
+
+    if not columns:
+        return column > value
+
+    return (column > value) | ((column == value) & after(columns, key))
+
+
+async def async_stream_json(view, request, stream):
+    """Write the JSON of a stream of rows as a chunked response of a view.
+
+    The optional limit and cursor parameters of the request page through the
+    stream, the URL of the next page is returned in the Link header. The
+    stream returns the next cursor from prepare, raising ValueError for an
+    unknown cursor, and the chunks of the document from next_chunk.
+    """
+    hass = request.app["hass"]
+
+    try:
+        if "limit" in request.query:
+            stream.limit = int(request.query["limit"])
+            if stream.limit < 1:
+                raise ValueError
+    except ValueError:
+        return view.json_message("Invalid limit", HTTP_BAD_REQUEST)
+
+    try:
+        if "cursor" in request.query:
+            stream.cursor = int(request.query["cursor"])
+        next_cursor = await hass.async_add_executor_job(stream.prepare)
+    except ValueError:
+        return view.json_message("Invalid cursor", HTTP_BAD_REQUEST)
+
+    response = web.StreamResponse()
+    response.content_type = CONTENT_TYPE_JSON
+    if next_cursor is not None:
+        response.headers[hdrs.LINK] = '<{}>; rel="next"'.format(
+            request.rel_url.update_query(cursor=next_cursor)
+        )
+    response.enable_chunked_encoding()
+    await response.prepare(request)
+
+    while True:
+        chunk = await hass.async_add_executor_job(stream.next_chunk)
+        if chunk is None:
+            break
+        await response.write(chunk)
+
+    await response.write_eof()
+    return response
@@ -1,7 +1,8 @@
 """Support for statistics for sensor values."""
 import logging
-import statistics
+import math
 from collections import deque
+from heapq import heapify, heappop, heappush
 
 import voluptuous as vol
 
@@ -89,6 +90,7 @@ class StatisticsSensor(Entity):
         self._unit_of_measurement = None
         self.states = deque(maxlen=self._sampling_size)
         self.ages = deque(maxlen=self._sampling_size)
+        self._rolling = None if self.is_binary else RollingStatistics()
 
         self.count = 0
         self.mean = self.median = self.stdev = self.variance = None
@@ -132,19 +134,26 @@ class StatisticsSensor(Entity):
         if new_state.state in [STATE_UNKNOWN, STATE_UNAVAILABLE]:
             return
 
-        try:
-            if self.is_binary:
-                self.states.append(new_state.state)
-            else:
-                self.states.append(float(new_state.state))
+        if self.is_binary:
+            value = new_state.state
+        else:
+            try:
+                value = float(new_state.state)
+            except ValueError:
+                _LOGGER.error(
+                    "%s: parsing error, expected number and received %s",
+                    self.entity_id,
+                    new_state.state,
+                )
+                return
 
-            self.ages.append(new_state.last_updated)
-        except ValueError:
-            _LOGGER.error(
-                "%s: parsing error, expected number and received %s",
-                self.entity_id,
-                new_state.state,
-            )
+            if len(self.states) == self._sampling_size:
+                # The deque drops the oldest value when we append
+                self._rolling.remove_oldest()
+            self._rolling.add(value)
+
+        self.states.append(value)
+        self.ages.append(new_state.last_updated)
 
     @property
     def name(self):
@@ -212,6 +221,8 @@ class StatisticsSensor(Entity):
             )
             self.ages.popleft()
             self.states.popleft()
+            if self._rolling is not None:
+                self._rolling.remove_oldest()
 
     async def async_update(self):
         """Get the latest data and updates the states."""
@@ -222,24 +233,26 @@ class StatisticsSensor(Entity):
         self.count = len(self.states)
 
         if not self.is_binary:
-            try:  # require only one data point
-                self.mean = round(statistics.mean(self.states), self._precision)
-                self.median = round(statistics.median(self.states), self._precision)
-            except statistics.StatisticsError as err:
-                _LOGGER.debug("%s: %s", self.entity_id, err)
+            rolling = self._rolling
+
+            if self.count:  # require only one data point
+                self.mean = round(rolling.mean, self._precision)
+                self.median = round(rolling.median, self._precision)
+            else:
+                _LOGGER.debug("%s: no data points", self.entity_id)
                 self.mean = self.median = STATE_UNKNOWN
 
-            try:  # require at least two data points
-                self.stdev = round(statistics.stdev(self.states), self._precision)
-                self.variance = round(statistics.variance(self.states), self._precision)
-            except statistics.StatisticsError as err:
-                _LOGGER.debug("%s: %s", self.entity_id, err)
+            if self.count > 1:  # require at least two data points
+                self.stdev = round(math.sqrt(rolling.variance), self._precision)
+                self.variance = round(rolling.variance, self._precision)
+            else:
+                _LOGGER.debug("%s: less than two data points", self.entity_id)
                 self.stdev = self.variance = STATE_UNKNOWN
 
             if self.states:
-                self.total = round(sum(self.states), self._precision)
-                self.min = round(min(self.states), self._precision)
-                self.max = round(max(self.states), self._precision)
+                self.total = round(rolling.total, self._precision)
+                self.min = round(rolling.min, self._precision)
+                self.max = round(rolling.max, self._precision)
 
                 self.min_age = self.ages[0]
                 self.max_age = self.ages[-1]
@@ -306,3 +319,213 @@ class StatisticsSensor(Entity):
         self.async_schedule_update_ha_state(True)
 
         _LOGGER.debug("%s: initializing from database completed", self.entity_id)
+
+
+class RollingStatistics:
+    """Statistics of a window of values, updated as values come and go.
+
+    Values are added at the end of the window and removed from the start.
+    Sum, mean and variance are running aggregates (Welford's algorithm),
+    min and max are kept in monotonic queues and the median in two heaps,
+    so each update takes O(log n) instead of a pass over all values.
+
+    The aggregates are only valid while the window is not empty, variance
+    needs at least two values.
+    """
+
+    def __init__(self):
+        """Initialize an empty window."""
+        self._values = deque()
+        self._seq = 0  # Sequence number of the next value
+        self._total = 0.0
+        self._mean = 0.0
+        self._m2 = 0.0  # Sum of squared differences from the mean
+        self._until_resync = 0
+        # Candidates for min and max as (seq, value), oldest first
+        self._min = deque()
+        self._max = deque()
+        self._median = _RollingMedian()
+
+    def __len__(self):
+        """Return the number of values in the window."""
+        return len(self._values)
+
+    def add(self, value):
+        """Add a value to the end of the window."""
+        seq = self._seq
+        self._seq += 1
+        self._values.append(value)
+
+        self._total += value
+        delta = value - self._mean
+        self._mean += delta / len(self._values)
+        self._m2 += delta * (value - self._mean)
+
+        # Older values can't become the min or max while this one is around
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((seq, value))
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((seq, value))
+
+        self._median.add(value, seq)
+
+    def remove_oldest(self):
+        """Remove the value at the start of the window."""
+        seq = self._seq - len(self._values)
+        value = self._values.popleft()
+        count = len(self._values)
+
+        if count:
+            self._total -= value
+            delta = value - self._mean
+            self._mean -= delta / count
+            self._m2 -= delta * (value - self._mean)
+
+        if self._min[0][0] == seq:
+            self._min.popleft()
+        if self._max[0][0] == seq:
+            self._max.popleft()
+
+        self._median.remove(value, seq)
+
+        self._until_resync -= 1
+        if not count or self._until_resync <= 0:
+            self._resync()
+
+    def _resync(self):
+        """Recalculate the running aggregates from the window.
+
+        Removing values accumulates rounding errors. Doing this once per
+        length of the window keeps updates O(1) amortized.
+        """
+        count = len(self._values)
+        self._until_resync = count
+
+        if not count:
+            self._total = self._mean = self._m2 = 0.0
+            return
+
+        self._total = math.fsum(self._values)
+        self._mean = self._total / count
+        self._m2 = math.fsum((value - self._mean) ** 2 for value in self._values)
+
+    @property
+    def total(self):
+        """Return the sum of the values."""
+        return self._total
+
+    @property
+    def mean(self):
+        """Return the mean of the values."""
+        return self._mean
+
+    @property
+    def variance(self):
+        """Return the sample variance of the values."""
+        return max(self._m2, 0.0) / (len(self._values) - 1)
+
+    @property
+    def min(self):
+        """Return the smallest value."""
+        return self._min[0][1]
+
+    @property
+    def max(self):
+        """Return the largest value."""
+        return self._max[0][1]
+
+    @property
+    def median(self):
+        """Return the median of the values."""
+        return self._median.median
+
+
+class _RollingMedian:
+    """Median of a window of values.
+
+    The lower half of the values is kept in a max heap and the upper half in
+    a min heap. Removed values are marked and only dropped from a heap when
+    they reach the top, or when the heaps are mostly removed values.
+    """
+
+    def __init__(self):
+        """Initialize an empty window."""
+        self._low = []  # (-value, -seq), so the top is the largest
+        self._high = []  # (value, seq)
+        self._low_size = 0
+        self._high_size = 0
+        self._removed = set()
+
+    def add(self, value, seq):
+        """Add a value."""
+        if self._low_size and (value, seq) > self._low_top():
+            heappush(self._high, (value, seq))
+            self._high_size += 1
+        else:
+            heappush(self._low, (-value, -seq))
+            self._low_size += 1
+
+        self._rebalance()
+
+    def remove(self, value, seq):
+        """Remove a value that was added before."""
+        if (value, seq) <= self._low_top():
+            self._low_size -= 1
+        else:
+            self._high_size -= 1
+
+        self._removed.add(seq)
+
+        if len(self._removed) > self._low_size + self._high_size:
+            self._compact()
+        else:
+            self._rebalance()
+
+    @property
+    def median(self):
+        """Return the median."""
+        if self._low_size > self._high_size:
+            return self._low_top()[0]
+
+        return (self._low_top()[0] + self._high_top()[0]) / 2
+
+    def _low_top(self):
+        """Return the largest value of the lower half as (value, seq)."""
+        low = self._low
+        while -low[0][1] in self._removed:
+            self._removed.remove(-heappop(low)[1])
+        return -low[0][0], -low[0][1]
+
+    def _high_top(self):
+        """Return the smallest value of the upper half as (value, seq)."""
+        high = self._high
+        while high[0][1] in self._removed:
+            self._removed.remove(heappop(high)[1])
+        return high[0]
+
+    def _rebalance(self):
+        """Make the lower half the same size or one larger than the upper."""
+        if self._low_size > self._high_size + 1:
+            value, seq = self._low_top()
+            heappop(self._low)
+            heappush(self._high, (value, seq))
+            self._low_size -= 1
+            self._high_size += 1
+        elif self._low_size < self._high_size:
+            value, seq = self._high_top()
+            heappop(self._high)
+            heappush(self._low, (-value, -seq))
+            self._high_size -= 1
+            self._low_size += 1
+
+    def _compact(self):
+        """Drop all removed values from the heaps."""
+        removed = self._removed
+        self._low = [item for item in self._low if -item[1] not in removed]
+        self._high = [item for item in self._high if item[1] not in removed]
+        heapify(self._low)
+        heapify(self._high)
+        removed.clear()
+        self._rebalance()
@@ -25,7 +25,10 @@ from homeassistant.const import (
 from homeassistant.exceptions import TemplateError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import async_generate_entity_id
-from homeassistant.helpers.event import async_track_state_change, async_track_same_state
+from homeassistant.helpers.event import (
+    async_track_same_state,
+    async_track_template_renders,
+)
 from .const import CONF_AVAILABILITY_TEMPLATE
 
 _LOGGER = logging.getLogger(__name__)
@@ -63,49 +66,18 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
         icon_template = device_config.get(CONF_ICON_TEMPLATE)
         entity_picture_template = device_config.get(CONF_ENTITY_PICTURE_TEMPLATE)
         availability_template = device_config.get(CONF_AVAILABILITY_TEMPLATE)
-        entity_ids = set()
-        manual_entity_ids = device_config.get(ATTR_ENTITY_ID)
         attribute_templates = device_config.get(CONF_ATTRIBUTE_TEMPLATES, {})
 
-        invalid_templates = []
-
-        templates = {
-            CONF_VALUE_TEMPLATE: value_template,
-            CONF_ICON_TEMPLATE: icon_template,
-            CONF_ENTITY_PICTURE_TEMPLATE: entity_picture_template,
-            CONF_AVAILABILITY_TEMPLATE: availability_template,
-        }
-
-        for tpl_name, template in chain(templates.items(), attribute_templates.items()):
-            if template is None:
-                continue
-            template.hass = hass
-
-            if manual_entity_ids is not None:
-                continue
+        templates = (
+            value_template,
+            icon_template,
+            entity_picture_template,
+            availability_template,
+        )
 
-            template_entity_ids = template.extract_entities()
-            if template_entity_ids == MATCH_ALL:
-                entity_ids = MATCH_ALL
-                # Cut off _template from name
-                invalid_templates.append(tpl_name.replace("_template", ""))
-            elif entity_ids != MATCH_ALL:
-                entity_ids |= set(template_entity_ids)
-
-        if manual_entity_ids is not None:
-            entity_ids = manual_entity_ids
-        elif entity_ids != MATCH_ALL:
-            entity_ids = list(entity_ids)
-
-        if invalid_templates:
-            _LOGGER.warning(
-                "Template binary sensor %s has no entity ids configured to"
-                " track nor were we able to extract the entities to track"
-                " from the %s template(s). This entity will only be able"
-                " to be updated manually.",
-                device,
-                ", ".join(invalid_templates),
-            )
+        for template in chain(templates, attribute_templates.values()):
+            if template is not None:
+                template.hass = hass
 
         friendly_name = device_config.get(ATTR_FRIENDLY_NAME, device)
         device_class = device_config.get(CONF_DEVICE_CLASS)
@@ -122,7 +94,7 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
                 icon_template,
                 entity_picture_template,
                 availability_template,
-                entity_ids,
+                device_config.get(ATTR_ENTITY_ID),
                 delay_on,
                 delay_off,
                 attribute_templates,
@@ -167,6 +139,9 @@ class BinarySensorTemplate(BinarySensorDevice):
         self._icon = None
         self._entity_picture = None
         self._entities = entity_ids
+        self._render_tracker = async_track_template_renders(
+            hass, self._async_template_state_listener, entity_ids=entity_ids
+        )
         self._delay_on = delay_on
         self._delay_off = delay_off
         self._available = True
@@ -176,26 +151,24 @@ class BinarySensorTemplate(BinarySensorDevice):
     async def async_added_to_hass(self):
         """Register callbacks."""
 
-        @callback
-        def template_bsensor_state_listener(entity, old_state, new_state):
-            """Handle the target device state changes."""
-            self.async_check_state()
-
         @callback
         def template_bsensor_startup(event):
             """Update template on startup."""
-            if self._entities != MATCH_ALL:
-                # Track state change only for valid templates
-                async_track_state_change(
-                    self.hass, self._entities, template_bsensor_state_listener
-                )
-
             self.async_check_state()
 
         self.hass.bus.async_listen_once(
             EVENT_HOMEASSISTANT_START, template_bsensor_startup
         )
 
+    async def async_will_remove_from_hass(self):
+        """Stop tracking the states used by the templates."""
+        self._render_tracker.async_remove()
+
+    @callback
+    def _async_template_state_listener(self, event):
+        """Handle changes of the states used by the templates."""
+        self.async_check_state()
+
     @property
     def name(self):
         """Return the name of the sensor."""
@@ -301,8 +274,9 @@ class BinarySensorTemplate(BinarySensorDevice):
 
     @callback
     def async_check_state(self):
-        """Update the state from the template."""
-        state = self._async_render()
+        """Update the state from the template, tracking the states it uses."""
+        with self._render_tracker.async_collect():
+            state = self._async_render()
 
         # return if the state don't change or is invalid
         if state is None or state == self.state:
@@ -324,7 +298,7 @@ class BinarySensorTemplate(BinarySensorDevice):
             self.hass,
             period,
             set_state,
-            entity_ids=self._entities,
+            entity_ids=self._entities or MATCH_ALL,
             async_check_same_func=lambda *args: self._async_render() == state,
         )
 
@@ -24,7 +24,6 @@ from homeassistant.const import (
     CONF_FRIENDLY_NAME,
     CONF_ENTITY_ID,
     EVENT_HOMEASSISTANT_START,
-    MATCH_ALL,
     CONF_VALUE_TEMPLATE,
     CONF_ICON_TEMPLATE,
     CONF_DEVICE_CLASS,
@@ -36,7 +35,7 @@ from homeassistant.const import (
 from homeassistant.exceptions import TemplateError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import async_generate_entity_id
-from homeassistant.helpers.event import async_track_state_change
+from homeassistant.helpers.event import async_track_template_renders
 from homeassistant.helpers.script import Script
 from .const import CONF_AVAILABILITY_TEMPLATE
 
@@ -121,42 +120,6 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
                 "Must specify at least one of %s" or "%s", OPEN_ACTION, POSITION_ACTION
             )
             continue
-        template_entity_ids = set()
-        if state_template is not None:
-            temp_ids = state_template.extract_entities()
-            if str(temp_ids) != MATCH_ALL:
-                template_entity_ids |= set(temp_ids)
-
-        if position_template is not None:
-            temp_ids = position_template.extract_entities()
-            if str(temp_ids) != MATCH_ALL:
-                template_entity_ids |= set(temp_ids)
-
-        if tilt_template is not None:
-            temp_ids = tilt_template.extract_entities()
-            if str(temp_ids) != MATCH_ALL:
-                template_entity_ids |= set(temp_ids)
-
-        if icon_template is not None:
-            temp_ids = icon_template.extract_entities()
-            if str(temp_ids) != MATCH_ALL:
-                template_entity_ids |= set(temp_ids)
-
-        if entity_picture_template is not None:
-            temp_ids = entity_picture_template.extract_entities()
-            if str(temp_ids) != MATCH_ALL:
-                template_entity_ids |= set(temp_ids)
-
-        if availability_template is not None:
-            temp_ids = availability_template.extract_entities()
-            if str(temp_ids) != MATCH_ALL:
-                template_entity_ids |= set(temp_ids)
-
-        if not template_entity_ids:
-            template_entity_ids = MATCH_ALL
-
-        entity_ids = device_config.get(CONF_ENTITY_ID, template_entity_ids)
-
         covers.append(
             CoverTemplate(
                 hass,
@@ -176,7 +139,7 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
                 tilt_action,
                 optimistic,
                 tilt_optimistic,
-                entity_ids,
+                device_config.get(CONF_ENTITY_ID),
             )
         )
     if not covers:
@@ -245,7 +208,9 @@ class CoverTemplate(CoverDevice):
         self._entity_picture = None
         self._position = None
         self._tilt_value = None
-        self._entities = entity_ids
+        self._render_tracker = async_track_template_renders(
+            hass, self._async_template_state_listener, entity_ids=entity_ids
+        )
         self._available = True
 
         if self._template is not None:
@@ -264,24 +229,24 @@ class CoverTemplate(CoverDevice):
     async def async_added_to_hass(self):
         """Register callbacks."""
 
-        @callback
-        def template_cover_state_listener(entity, old_state, new_state):
-            """Handle target device state changes."""
-            self.async_schedule_update_ha_state(True)
-
         @callback
         def template_cover_startup(event):
             """Update template on startup."""
-            async_track_state_change(
-                self.hass, self._entities, template_cover_state_listener
-            )
-
             self.async_schedule_update_ha_state(True)
 
         self.hass.bus.async_listen_once(
             EVENT_HOMEASSISTANT_START, template_cover_startup
         )
 
+    async def async_will_remove_from_hass(self):
+        """Stop tracking the states used by the templates."""
+        self._render_tracker.async_remove()
+
+    @callback
+    def _async_template_state_listener(self, event):
+        """Handle changes of the states used by the templates."""
+        self.async_schedule_update_ha_state(True)
+
     @property
     def name(self):
         """Return the name of the cover."""
@@ -417,7 +382,13 @@ class CoverTemplate(CoverDevice):
             self.async_schedule_update_ha_state()
 
     async def async_update(self):
-        """Update the state from the template."""
+        """Update the state from the templates, tracking the states they use."""
+        with self._render_tracker.async_collect():
+            self._async_render_templates()
+
+    @callback
+    def _async_render_templates(self):
+        """Render the templates."""
         if self._template is not None:
             try:
                 state = self._template.async_render().lower()
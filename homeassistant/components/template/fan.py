@@ -25,13 +25,13 @@ from homeassistant.const import (
     CONF_ENTITY_ID,
     STATE_ON,
     STATE_OFF,
-    MATCH_ALL,
     EVENT_HOMEASSISTANT_START,
     STATE_UNKNOWN,
 )
 from homeassistant.core import callback
 from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.entity import async_generate_entity_id
+from homeassistant.helpers.event import async_track_template_renders
 from homeassistant.helpers.script import Script
 from .const import CONF_AVAILABILITY_TEMPLATE
 
@@ -98,9 +98,6 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
 
         speed_list = device_config[CONF_SPEED_LIST]
 
-        entity_ids = set()
-        manual_entity_ids = device_config.get(CONF_ENTITY_ID)
-
         for template in (
             state_template,
             speed_template,
@@ -108,23 +105,8 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
             direction_template,
             availability_template,
         ):
-            if template is None:
-                continue
-            template.hass = hass
-
-            if entity_ids == MATCH_ALL or manual_entity_ids is not None:
-                continue
-
-            template_entity_ids = template.extract_entities()
-            if template_entity_ids == MATCH_ALL:
-                entity_ids = MATCH_ALL
-            else:
-                entity_ids |= set(template_entity_ids)
-
-        if manual_entity_ids is not None:
-            entity_ids = manual_entity_ids
-        elif entity_ids != MATCH_ALL:
-            entity_ids = list(entity_ids)
+            if template is not None:
+                template.hass = hass
 
         fans.append(
             TemplateFan(
@@ -142,7 +124,7 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
                 set_oscillating_action,
                 set_direction_action,
                 speed_list,
-                entity_ids,
+                device_config.get(CONF_ENTITY_ID),
             )
         )
 
@@ -218,7 +200,9 @@ class TemplateFan(FanEntity):
         if self._availability_template:
             self._availability_template.hass = self.hass
 
-        self._entities = entity_ids
+        self._render_tracker = async_track_template_renders(
+            hass, self._async_template_state_listener, entity_ids=entity_ids
+        )
         # List of valid speeds
         self._speed_list = speed_list
 
@@ -334,24 +318,30 @@ class TemplateFan(FanEntity):
     async def async_added_to_hass(self):
         """Register callbacks."""
 
-        @callback
-        def template_fan_state_listener(entity, old_state, new_state):
-            """Handle target device state changes."""
-            self.async_schedule_update_ha_state(True)
-
         @callback
         def template_fan_startup(event):
             """Update template on startup."""
-            self.hass.helpers.event.async_track_state_change(
-                self._entities, template_fan_state_listener
-            )
-
             self.async_schedule_update_ha_state(True)
 
         self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_START, template_fan_startup)
 
+    async def async_will_remove_from_hass(self):
+        """Stop tracking the states used by the templates."""
+        self._render_tracker.async_remove()
+
+    @callback
+    def _async_template_state_listener(self, event):
+        """Handle changes of the states used by the templates."""
+        self.async_schedule_update_ha_state(True)
+
     async def async_update(self):
-        """Update the state from the template."""
+        """Update the state from the templates, tracking the states they use."""
+        with self._render_tracker.async_collect():
+            self._async_render_templates()
+
+    @callback
+    def _async_render_templates(self):
+        """Render the templates."""
         # Update state
         try:
             state = self._template.async_render()
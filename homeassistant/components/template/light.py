@@ -19,14 +19,13 @@ from homeassistant.const import (
     STATE_ON,
     STATE_OFF,
     EVENT_HOMEASSISTANT_START,
-    MATCH_ALL,
     CONF_LIGHTS,
 )
 from homeassistant.helpers.config_validation import PLATFORM_SCHEMA
 from homeassistant.exceptions import TemplateError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import async_generate_entity_id
-from homeassistant.helpers.event import async_track_state_change
+from homeassistant.helpers.event import async_track_template_renders
 from homeassistant.helpers.script import Script
 from .const import CONF_AVAILABILITY_TEMPLATE
 
@@ -73,38 +72,6 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
         level_action = device_config.get(CONF_LEVEL_ACTION)
         level_template = device_config.get(CONF_LEVEL_TEMPLATE)
 
-        template_entity_ids = set()
-
-        if state_template is not None:
-            temp_ids = state_template.extract_entities()
-            if str(temp_ids) != MATCH_ALL:
-                template_entity_ids |= set(temp_ids)
-
-        if level_template is not None:
-            temp_ids = level_template.extract_entities()
-            if str(temp_ids) != MATCH_ALL:
-                template_entity_ids |= set(temp_ids)
-
-        if icon_template is not None:
-            temp_ids = icon_template.extract_entities()
-            if str(temp_ids) != MATCH_ALL:
-                template_entity_ids |= set(temp_ids)
-
-        if entity_picture_template is not None:
-            temp_ids = entity_picture_template.extract_entities()
-            if str(temp_ids) != MATCH_ALL:
-                template_entity_ids |= set(temp_ids)
-
-        if availability_template is not None:
-            temp_ids = availability_template.extract_entities()
-            if str(temp_ids) != MATCH_ALL:
-                template_entity_ids |= set(temp_ids)
-
-        if not template_entity_ids:
-            template_entity_ids = MATCH_ALL
-
-        entity_ids = device_config.get(CONF_ENTITY_ID, template_entity_ids)
-
         lights.append(
             LightTemplate(
                 hass,
@@ -118,7 +85,7 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
                 off_action,
                 level_action,
                 level_template,
-                entity_ids,
+                device_config.get(CONF_ENTITY_ID),
             )
         )
 
@@ -169,7 +136,9 @@ class LightTemplate(Light):
         self._icon = None
         self._entity_picture = None
         self._brightness = None
-        self._entities = entity_ids
+        self._render_tracker = async_track_template_renders(
+            hass, self._async_template_state_listener, entity_ids=entity_ids
+        )
         self._available = True
 
         if self._template is not None:
@@ -229,29 +198,24 @@ class LightTemplate(Light):
     async def async_added_to_hass(self):
         """Register callbacks."""
 
-        @callback
-        def template_light_state_listener(entity, old_state, new_state):
-            """Handle target device state changes."""
-            self.async_schedule_update_ha_state(True)
-
         @callback
         def template_light_startup(event):
             """Update template on startup."""
-            if (
-                self._template is not None
-                or self._level_template is not None
-                or self._availability_template is not None
-            ):
-                async_track_state_change(
-                    self.hass, self._entities, template_light_state_listener
-                )
-
             self.async_schedule_update_ha_state(True)
 
         self.hass.bus.async_listen_once(
             EVENT_HOMEASSISTANT_START, template_light_startup
         )
 
+    async def async_will_remove_from_hass(self):
+        """Stop tracking the states used by the templates."""
+        self._render_tracker.async_remove()
+
+    @callback
+    def _async_template_state_listener(self, event):
+        """Handle changes of the states used by the templates."""
+        self.async_schedule_update_ha_state(True)
+
     async def async_turn_on(self, **kwargs):
         """Turn the light on."""
         optimistic_set = False
@@ -285,7 +249,13 @@ class LightTemplate(Light):
             self.async_schedule_update_ha_state()
 
     async def async_update(self):
-        """Update the state from the template."""
+        """Update the state from the templates, tracking the states they use."""
+        with self._render_tracker.async_collect():
+            self._async_render_templates()
+
+    @callback
+    def _async_render_templates(self):
+        """Render the templates."""
         if self._template is not None:
             try:
                 state = self._template.async_render().lower()
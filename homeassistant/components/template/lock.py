@@ -14,10 +14,9 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_START,
     STATE_ON,
     STATE_LOCKED,
-    MATCH_ALL,
 )
 from homeassistant.exceptions import TemplateError
-from homeassistant.helpers.event import async_track_state_change
+from homeassistant.helpers.event import async_track_template_renders
 from homeassistant.helpers.script import Script
 from .const import CONF_AVAILABILITY_TEMPLATE
 
@@ -46,27 +45,10 @@ async def async_setup_platform(hass, config, async_add_devices, discovery_info=N
     name = config.get(CONF_NAME)
     value_template = config.get(CONF_VALUE_TEMPLATE)
     value_template.hass = hass
-    value_template_entity_ids = value_template.extract_entities()
-
-    if value_template_entity_ids == MATCH_ALL:
-        _LOGGER.warning(
-            "Template lock '%s' has no entity ids configured to track nor "
-            "were we able to extract the entities to track from the '%s' "
-            "template. This entity will only be able to be updated "
-            "manually.",
-            name,
-            CONF_VALUE_TEMPLATE,
-        )
-
-    template_entity_ids = set()
-    template_entity_ids |= set(value_template_entity_ids)
 
     availability_template = config.get(CONF_AVAILABILITY_TEMPLATE)
     if availability_template is not None:
         availability_template.hass = hass
-        temp_ids = availability_template.extract_entities()
-        if str(temp_ids) != MATCH_ALL:
-            template_entity_ids |= set(temp_ids)
 
     async_add_devices(
         [
@@ -75,7 +57,6 @@ async def async_setup_platform(hass, config, async_add_devices, discovery_info=N
                 name,
                 value_template,
                 availability_template,
-                template_entity_ids,
                 config.get(CONF_LOCK),
                 config.get(CONF_UNLOCK),
                 config.get(CONF_OPTIMISTIC),
@@ -93,7 +74,6 @@ class TemplateLock(LockDevice):
         name,
         value_template,
         availability_template,
-        entity_ids,
         command_lock,
         command_unlock,
         optimistic,
@@ -104,7 +84,9 @@ class TemplateLock(LockDevice):
         self._name = name
         self._state_template = value_template
         self._availability_template = availability_template
-        self._state_entities = entity_ids
+        self._render_tracker = async_track_template_renders(
+            hass, self._async_template_state_listener
+        )
         self._command_lock = Script(hass, command_lock)
         self._command_unlock = Script(hass, command_unlock)
         self._optimistic = optimistic
@@ -113,25 +95,24 @@ class TemplateLock(LockDevice):
     async def async_added_to_hass(self):
         """Register callbacks."""
 
-        @callback
-        def template_lock_state_listener(entity, old_state, new_state):
-            """Handle target device state changes."""
-            self.async_schedule_update_ha_state(True)
-
         @callback
         def template_lock_startup(event):
             """Update template on startup."""
-            if self._state_entities != MATCH_ALL:
-                # Track state change only for valid templates
-                async_track_state_change(
-                    self._hass, self._state_entities, template_lock_state_listener
-                )
             self.async_schedule_update_ha_state(True)
 
         self._hass.bus.async_listen_once(
             EVENT_HOMEASSISTANT_START, template_lock_startup
         )
 
+    async def async_will_remove_from_hass(self):
+        """Stop tracking the states used by the templates."""
+        self._render_tracker.async_remove()
+
+    @callback
+    def _async_template_state_listener(self, event):
+        """Handle changes of the states used by the templates."""
+        self.async_schedule_update_ha_state(True)
+
     @property
     def assumed_state(self):
         """Return true if we do optimistic updates."""
@@ -158,7 +139,13 @@ class TemplateLock(LockDevice):
         return self._available
 
     async def async_update(self):
-        """Update the state from the template."""
+        """Update the state from the templates, tracking the states they use."""
+        with self._render_tracker.async_collect():
+            self._async_render_templates()
+
+    @callback
+    def _async_render_templates(self):
+        """Render the templates."""
         try:
             self._state = self._state_template.async_render().lower() in (
                 "true",
@@ -21,14 +21,13 @@ from homeassistant.const import (
     CONF_SENSORS,
     EVENT_HOMEASSISTANT_START,
     CONF_FRIENDLY_NAME_TEMPLATE,
-    MATCH_ALL,
     CONF_DEVICE_CLASS,
 )
 
 from homeassistant.exceptions import TemplateError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import Entity, async_generate_entity_id
-from homeassistant.helpers.event import async_track_state_change
+from homeassistant.helpers.event import async_track_template_renders
 from .const import CONF_AVAILABILITY_TEMPLATE
 
 CONF_ATTRIBUTE_TEMPLATES = "attribute_templates"
@@ -72,48 +71,17 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
         device_class = device_config.get(CONF_DEVICE_CLASS)
         attribute_templates = device_config[CONF_ATTRIBUTE_TEMPLATES]
 
-        entity_ids = set()
-        manual_entity_ids = device_config.get(ATTR_ENTITY_ID)
-        invalid_templates = []
-
-        templates = {
-            CONF_VALUE_TEMPLATE: state_template,
-            CONF_ICON_TEMPLATE: icon_template,
-            CONF_ENTITY_PICTURE_TEMPLATE: entity_picture_template,
-            CONF_FRIENDLY_NAME_TEMPLATE: friendly_name_template,
-            CONF_AVAILABILITY_TEMPLATE: availability_template,
-        }
-
-        for tpl_name, template in chain(templates.items(), attribute_templates.items()):
-            if template is None:
-                continue
-            template.hass = hass
-
-            if manual_entity_ids is not None:
-                continue
-
-            template_entity_ids = template.extract_entities()
-            if template_entity_ids == MATCH_ALL:
-                entity_ids = MATCH_ALL
-                # Cut off _template from name
-                invalid_templates.append(tpl_name.replace("_template", ""))
-            elif entity_ids != MATCH_ALL:
-                entity_ids |= set(template_entity_ids)
-
-        if invalid_templates:
-            _LOGGER.warning(
-                "Template sensor %s has no entity ids configured to track nor"
-                " were we able to extract the entities to track from the %s "
-                "template(s). This entity will only be able to be updated "
-                "manually.",
-                device,
-                ", ".join(invalid_templates),
-            )
+        templates = (
+            state_template,
+            icon_template,
+            entity_picture_template,
+            friendly_name_template,
+            availability_template,
+        )
 
-        if manual_entity_ids is not None:
-            entity_ids = manual_entity_ids
-        elif entity_ids != MATCH_ALL:
-            entity_ids = list(entity_ids)
+        for template in chain(templates, attribute_templates.values()):
+            if template is not None:
+                template.hass = hass
 
         sensors.append(
             SensorTemplate(
@@ -126,7 +94,7 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
                 icon_template,
                 entity_picture_template,
                 availability_template,
-                entity_ids,
+                device_config.get(ATTR_ENTITY_ID),
                 device_class,
                 attribute_templates,
             )
@@ -168,7 +136,9 @@ class SensorTemplate(Entity):
         self._availability_template = availability_template
         self._icon = None
         self._entity_picture = None
-        self._entities = entity_ids
+        self._render_tracker = async_track_template_renders(
+            hass, self._async_template_state_listener, entity_ids=entity_ids
+        )
         self._device_class = device_class
         self._available = True
         self._attribute_templates = attribute_templates
@@ -177,26 +147,24 @@ class SensorTemplate(Entity):
     async def async_added_to_hass(self):
         """Register callbacks."""
 
-        @callback
-        def template_sensor_state_listener(entity, old_state, new_state):
-            """Handle device state changes."""
-            self.async_schedule_update_ha_state(True)
-
         @callback
         def template_sensor_startup(event):
             """Update template on startup."""
-            if self._entities != MATCH_ALL:
-                # Track state change only for valid templates
-                async_track_state_change(
-                    self.hass, self._entities, template_sensor_state_listener
-                )
-
             self.async_schedule_update_ha_state(True)
 
         self.hass.bus.async_listen_once(
             EVENT_HOMEASSISTANT_START, template_sensor_startup
         )
 
+    async def async_will_remove_from_hass(self):
+        """Stop tracking the states used by the templates."""
+        self._render_tracker.async_remove()
+
+    @callback
+    def _async_template_state_listener(self, event):
+        """Handle changes of the states used by the templates."""
+        self.async_schedule_update_ha_state(True)
+
     @property
     def name(self):
         """Return the name of the sensor."""
@@ -243,7 +211,13 @@ class SensorTemplate(Entity):
         return False
 
     async def async_update(self):
-        """Update the state from the template."""
+        """Update the state from the templates, tracking the states they use."""
+        with self._render_tracker.async_collect():
+            self._async_render_templates()
+
+    @callback
+    def _async_render_templates(self):
+        """Render the templates."""
         try:
             self._state = self._template.async_render()
             self._available = True
@@ -19,12 +19,11 @@ from homeassistant.const import (
     ATTR_ENTITY_ID,
     CONF_SWITCHES,
     EVENT_HOMEASSISTANT_START,
-    MATCH_ALL,
 )
 from homeassistant.exceptions import TemplateError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import async_generate_entity_id
-from homeassistant.helpers.event import async_track_state_change
+from homeassistant.helpers.event import async_track_template_renders
 from homeassistant.helpers.script import Script
 from .const import CONF_AVAILABILITY_TEMPLATE
 
@@ -64,45 +63,16 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
         availability_template = device_config.get(CONF_AVAILABILITY_TEMPLATE)
         on_action = device_config[ON_ACTION]
         off_action = device_config[OFF_ACTION]
-        manual_entity_ids = device_config.get(ATTR_ENTITY_ID)
-        entity_ids = set()
-
-        templates = {
-            CONF_VALUE_TEMPLATE: state_template,
-            CONF_ICON_TEMPLATE: icon_template,
-            CONF_ENTITY_PICTURE_TEMPLATE: entity_picture_template,
-            CONF_AVAILABILITY_TEMPLATE: availability_template,
-        }
-        invalid_templates = []
-
-        for template_name, template in templates.items():
+
+        for template in (
+            state_template,
+            icon_template,
+            entity_picture_template,
+            availability_template,
+        ):
             if template is not None:
                 template.hass = hass
 
-                if manual_entity_ids is not None:
-                    continue
-
-                template_entity_ids = template.extract_entities()
-                if template_entity_ids == MATCH_ALL:
-                    invalid_templates.append(template_name.replace("_template", ""))
-                    entity_ids = MATCH_ALL
-                elif entity_ids != MATCH_ALL:
-                    entity_ids |= set(template_entity_ids)
-        if invalid_templates:
-            _LOGGER.warning(
-                "Template sensor %s has no entity ids configured to track nor"
-                " were we able to extract the entities to track from the %s "
-                "template(s). This entity will only be able to be updated "
-                "manually.",
-                device,
-                ", ".join(invalid_templates),
-            )
-        else:
-            if manual_entity_ids is None:
-                entity_ids = list(entity_ids)
-            else:
-                entity_ids = manual_entity_ids
-
         switches.append(
             SwitchTemplate(
                 hass,
@@ -114,7 +84,7 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
                 availability_template,
                 on_action,
                 off_action,
-                entity_ids,
+                device_config.get(ATTR_ENTITY_ID),
             )
         )
     if not switches:
@@ -156,30 +126,32 @@ class SwitchTemplate(SwitchDevice):
         self._availability_template = availability_template
         self._icon = None
         self._entity_picture = None
-        self._entities = entity_ids
+        self._render_tracker = async_track_template_renders(
+            hass, self._async_template_state_listener, entity_ids=entity_ids
+        )
         self._available = True
 
     async def async_added_to_hass(self):
         """Register callbacks."""
 
-        @callback
-        def template_switch_state_listener(entity, old_state, new_state):
-            """Handle target device state changes."""
-            self.async_schedule_update_ha_state(True)
-
         @callback
         def template_switch_startup(event):
             """Update template on startup."""
-            async_track_state_change(
-                self.hass, self._entities, template_switch_state_listener
-            )
-
             self.async_schedule_update_ha_state(True)
 
         self.hass.bus.async_listen_once(
             EVENT_HOMEASSISTANT_START, template_switch_startup
         )
 
+    async def async_will_remove_from_hass(self):
+        """Stop tracking the states used by the templates."""
+        self._render_tracker.async_remove()
+
+    @callback
+    def _async_template_state_listener(self, event):
+        """Handle changes of the states used by the templates."""
+        self.async_schedule_update_ha_state(True)
+
     @property
     def name(self):
         """Return the name of the switch."""
@@ -219,7 +191,13 @@ class SwitchTemplate(SwitchDevice):
         await self._off_script.async_run(context=self._context)
 
     async def async_update(self):
-        """Update the state from the template."""
+        """Update the state from the templates, tracking the states they use."""
+        with self._render_tracker.async_collect():
+            self._async_render_templates()
+
+    @callback
+    def _async_render_templates(self):
+        """Render the templates."""
         try:
             state = self._template.async_render().lower()
 
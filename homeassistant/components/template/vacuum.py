@@ -35,13 +35,13 @@ from homeassistant.const import (
     CONF_FRIENDLY_NAME,
     CONF_VALUE_TEMPLATE,
     CONF_ENTITY_ID,
-    MATCH_ALL,
     EVENT_HOMEASSISTANT_START,
     STATE_UNKNOWN,
 )
 from homeassistant.core import callback
 from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.entity import async_generate_entity_id
+from homeassistant.helpers.event import async_track_template_renders
 from homeassistant.helpers.script import Script
 
 from .const import CONF_AVAILABILITY_TEMPLATE
@@ -109,45 +109,14 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
 
         fan_speed_list = device_config[CONF_FAN_SPEED_LIST]
 
-        entity_ids = set()
-        manual_entity_ids = device_config.get(CONF_ENTITY_ID)
-        invalid_templates = []
-
-        for tpl_name, template in (
-            (CONF_VALUE_TEMPLATE, state_template),
-            (CONF_BATTERY_LEVEL_TEMPLATE, battery_level_template),
-            (CONF_FAN_SPEED_TEMPLATE, fan_speed_template),
-            (CONF_AVAILABILITY_TEMPLATE, availability_template),
+        for template in (
+            state_template,
+            battery_level_template,
+            fan_speed_template,
+            availability_template,
         ):
-            if template is None:
-                continue
-            template.hass = hass
-
-            if manual_entity_ids is not None:
-                continue
-
-            template_entity_ids = template.extract_entities()
-            if template_entity_ids == MATCH_ALL:
-                entity_ids = MATCH_ALL
-                # Cut off _template from name
-                invalid_templates.append(tpl_name[:-9])
-            elif entity_ids != MATCH_ALL:
-                entity_ids |= set(template_entity_ids)
-
-        if invalid_templates:
-            _LOGGER.warning(
-                "Template vacuum %s has no entity ids configured to track nor"
-                " were we able to extract the entities to track from the %s "
-                "template(s). This entity will only be able to be updated "
-                "manually.",
-                device,
-                ", ".join(invalid_templates),
-            )
-
-        if manual_entity_ids is not None:
-            entity_ids = manual_entity_ids
-        elif entity_ids != MATCH_ALL:
-            entity_ids = list(entity_ids)
+            if template is not None:
+                template.hass = hass
 
         vacuums.append(
             TemplateVacuum(
@@ -166,7 +135,7 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
                 locate_action,
                 set_fan_speed_action,
                 fan_speed_list,
-                entity_ids,
+                device_config.get(CONF_ENTITY_ID),
             )
         )
 
@@ -250,7 +219,9 @@ class TemplateVacuum(StateVacuumDevice):
         if self._battery_level_template:
             self._supported_features |= SUPPORT_BATTERY
 
-        self._entities = entity_ids
+        self._render_tracker = async_track_template_renders(
+            hass, self._async_template_state_listener, entity_ids=entity_ids
+        )
         # List of valid fan speeds
         self._fan_speed_list = fan_speed_list
 
@@ -353,28 +324,32 @@ class TemplateVacuum(StateVacuumDevice):
     async def async_added_to_hass(self):
         """Register callbacks."""
 
-        @callback
-        def template_vacuum_state_listener(entity, old_state, new_state):
-            """Handle target device state changes."""
-            self.async_schedule_update_ha_state(True)
-
         @callback
         def template_vacuum_startup(event):
             """Update template on startup."""
-            if self._entities != MATCH_ALL:
-                # Track state changes only for valid templates
-                self.hass.helpers.event.async_track_state_change(
-                    self._entities, template_vacuum_state_listener
-                )
-
             self.async_schedule_update_ha_state(True)
 
         self.hass.bus.async_listen_once(
             EVENT_HOMEASSISTANT_START, template_vacuum_startup
         )
 
+    async def async_will_remove_from_hass(self):
+        """Stop tracking the states used by the templates."""
+        self._render_tracker.async_remove()
+
+    @callback
+    def _async_template_state_listener(self, event):
+        """Handle changes of the states used by the templates."""
+        self.async_schedule_update_ha_state(True)
+
     async def async_update(self):
-        """Update the state from the template."""
+        """Update the state from the templates, tracking the states they use."""
+        with self._render_tracker.async_collect():
+            self._async_render_templates()
+
+    @callback
+    def _async_render_templates(self):
+        """Render the templates."""
         # Update state
         if self._template is not None:
             try:
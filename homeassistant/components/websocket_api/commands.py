@@ -7,7 +7,9 @@ from homeassistant.core import callback, DOMAIN as HASS_DOMAIN
 from homeassistant.exceptions import Unauthorized, ServiceNotFound, HomeAssistantError
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.service import async_get_all_descriptions
-from homeassistant.helpers.event import async_track_state_change
+from homeassistant.helpers.entity_platform import DATA_POLL_STATISTICS
+from homeassistant.helpers.event import async_track_template_renders
+from homeassistant.setup import DATA_STARTUP_REPORT
 
 from . import const, decorators, messages
 
@@ -26,6 +28,10 @@ def async_register_commands(hass, async_reg):
     async_reg(hass, handle_get_config)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
+    async_reg(hass, handle_startup_report)
+    async_reg(hass, handle_poll_statistics)
+    async_reg(hass, handle_executor_statistics)
+    async_reg(hass, handle_loop_monitor_report)
 
 
 def pong_message(iden):
@@ -62,7 +68,7 @@ def handle_subscribe_events(hass, connection, msg):
             ):
                 return
 
-            connection.send_message(messages.event_message(msg["id"], event))
+            _send_event(connection, msg["id"], event)
 
     else:
 
@@ -72,7 +78,7 @@ def handle_subscribe_events(hass, connection, msg):
             if event.event_type == EVENT_TIME_CHANGED:
                 return
 
-            connection.send_message(messages.event_message(msg["id"], event.as_dict()))
+            _send_event(connection, msg["id"], event)
 
     connection.subscriptions[msg["id"]] = hass.bus.async_listen(
         event_type, forward_events
@@ -81,6 +87,18 @@ def handle_subscribe_events(hass, connection, msg):
     connection.send_message(messages.result_message(msg["id"]))
 
 
+@callback
+def _send_event(connection, iden, event):
+    """Send an event, serialized once for all subscriptions."""
+    try:
+        message = messages.cached_event_message(iden, event)
+    except (ValueError, TypeError):
+        # Let the connection report the error for this subscription
+        message = messages.event_message(iden, event.as_dict())
+
+    connection.send_message(message)
+
+
 @callback
 @decorators.websocket_command(
     {
@@ -228,24 +246,96 @@ def handle_render_template(hass, connection, msg):
 
     variables = msg.get("variables")
 
-    entity_ids = msg.get("entity_ids")
-    if entity_ids is None:
-        entity_ids = template.extract_entities(variables)
-
     @callback
     def state_listener(*_):
+        with tracker.async_collect():
+            result = template.async_render(variables)
+        connection.send_message(messages.event_message(msg["id"], {"result": result}))
+
+    # Without entity_ids, track the states used by the last render
+    tracker = async_track_template_renders(
+        hass, state_listener, entity_ids=msg.get("entity_ids")
+    )
+    connection.subscriptions[msg["id"]] = tracker.async_remove
+
+    connection.send_result(msg["id"])
+    state_listener()
+
+
+@callback
+@decorators.require_admin
+@decorators.websocket_command({vol.Required("type"): "startup_report"})
+def handle_startup_report(hass, connection, msg):
+    """Handle startup report command.
+
+    Async friendly.
+    """
+    report = hass.data.get(DATA_STARTUP_REPORT)
+
+    if report is None:
         connection.send_message(
-            messages.event_message(
-                msg["id"], {"result": template.async_render(variables)}
+            messages.error_message(
+                msg["id"], const.ERR_NOT_FOUND, "Startup was not profiled."
             )
         )
+        return
+
+    connection.send_message(messages.result_message(msg["id"], report))
 
-    if entity_ids and entity_ids != MATCH_ALL:
-        connection.subscriptions[msg["id"]] = async_track_state_change(
-            hass, entity_ids, state_listener
+
+@callback
+@decorators.require_admin
+@decorators.websocket_command({vol.Required("type"): "poll_statistics"})
+def handle_poll_statistics(hass, connection, msg):
+    """Handle poll statistics command.
+
+    Async friendly.
+    """
+    connection.send_message(
+        messages.result_message(
+            msg["id"],
+            {
+                platform: stats.as_dict()
+                for platform, stats in hass.data.get(DATA_POLL_STATISTICS, {}).items()
+            },
         )
-    else:
-        connection.subscriptions[msg["id"]] = lambda: None
+    )
 
-    connection.send_result(msg["id"])
-    state_listener()
+
+@callback
+@decorators.require_admin
+@decorators.websocket_command({vol.Required("type"): "executor_statistics"})
+def handle_executor_statistics(hass, connection, msg):
+    """Handle executor statistics command.
+
+    Async friendly.
+    """
+    connection.send_message(
+        messages.result_message(msg["id"], hass.executors.async_statistics())
+    )
+
+
+@callback
+@decorators.require_admin
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "loop_monitor_report",
+        vol.Optional("top", default=10): cv.positive_int,
+    }
+)
+def handle_loop_monitor_report(hass, connection, msg):
+    """Handle loop monitor report command.
+
+    Async friendly.
+    """
+    if hass.loop_monitor is None:
+        connection.send_message(
+            messages.error_message(
+                msg["id"], const.ERR_NOT_FOUND, "The loop monitor is not enabled."
+            )
+        )
+        return
+
+    connection.send_message(
+        messages.result_message(msg["id"], hass.loop_monitor.async_report(msg["top"]))
+    )
@@ -18,6 +18,10 @@ MINIMAL_MESSAGE_SCHEMA = vol.Schema(
 # Base schema to extend by message handlers
 BASE_COMMAND_MESSAGE_SCHEMA = vol.Schema({vol.Required("id"): cv.positive_int})
 
+# Stand-in for the message id in event messages shared between subscriptions
+IDEN_TEMPLATE = "__IDEN__"
+IDEN_JSON_TEMPLATE = '"__IDEN__"'
+
 
 def result_message(iden, result=None):
     """Return a success result message."""
@@ -37,3 +41,19 @@ def error_message(iden, code, message):
 def event_message(iden, event):
     """Return an event message."""
     return {"id": iden, "type": "event", "event": event}
+
+
+def cached_event_message(iden, event):
+    """Return an event message serialized to JSON.
+
+    The event is serialized only once, no matter how many subscriptions
+    it is sent to.
+    """
+    return event.cached(__name__, _event_message_json).replace(
+        IDEN_JSON_TEMPLATE, str(iden), 1
+    )
+
+
+def _event_message_json(event):
+    """Serialize an event message with a placeholder for the id."""
+    return const.JSON_DUMP(event_message(IDEN_TEMPLATE, event.as_dict()))
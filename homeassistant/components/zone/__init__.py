@@ -17,6 +17,7 @@ from homeassistant.const import (
 )
 from homeassistant.helpers import config_per_platform
 from homeassistant.helpers.entity import async_generate_entity_id
+from homeassistant.helpers.event import async_track_state_change_domain_event
 from homeassistant.util import slugify
 from homeassistant.const import ATTR_LATITUDE, ATTR_LONGITUDE
 from homeassistant.util.location import distance
@@ -24,7 +25,7 @@ from homeassistant.util.location import distance
 
 from .config_flow import configured_zones
 from .const import CONF_PASSIVE, DOMAIN, HOME_ZONE, ATTR_PASSIVE, ATTR_RADIUS
-from .zone import Zone
+from .zone import Zone, ZoneIndex
 
 
 # mypy: allow-untyped-calls, allow-untyped-defs
@@ -38,6 +39,8 @@ DEFAULT_RADIUS = 100
 ENTITY_ID_FORMAT = "zone.{}"
 ENTITY_ID_HOME = ENTITY_ID_FORMAT.format(HOME_ZONE)
 
+DATA_INDEX = "zone_index"
+
 ICON_HOME = "mdi:home"
 ICON_IMPORT = "mdi:import"
 
@@ -61,11 +64,16 @@ def async_active_zone(hass, latitude, longitude, radius=0):
 
     This method must be run in the event loop.
     """
+    index = hass.data.get(DATA_INDEX)
+
     # Sort entity IDs so that we are deterministic if equal distance to 2 zones
-    zones = (
-        hass.states.get(entity_id)
-        for entity_id in sorted(hass.states.async_entity_ids(DOMAIN))
-    )
+    if index is not None:
+        zones = index.async_candidates(latitude, longitude, radius)
+    else:
+        zones = (
+            hass.states.get(entity_id)
+            for entity_id in sorted(hass.states.async_entity_ids(DOMAIN))
+        )
 
     min_dist = None
     closest = None
@@ -99,6 +107,9 @@ def async_active_zone(hass, latitude, longitude, radius=0):
 async def async_setup(hass, config):
     """Set up configured zones as well as home assistant zone if necessary."""
     hass.data[DOMAIN] = {}
+    index = hass.data[DATA_INDEX] = ZoneIndex(hass)
+    async_track_state_change_domain_event(hass, DOMAIN, index.async_invalidate)
+
     entities: Set[str] = set()
     zone_entries = configured_zones(hass)
     for _, entry in config_per_platform(config, DOMAIN):
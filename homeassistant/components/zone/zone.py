@@ -1,16 +1,26 @@
 """Zone entity and functionality."""
 
-from typing import cast
+import math
+from typing import Dict, List, Optional, Tuple, cast
 
 from homeassistant.const import ATTR_HIDDEN, ATTR_LATITUDE, ATTR_LONGITUDE
-from homeassistant.core import State
+from homeassistant.core import Event, State, callback
 from homeassistant.helpers.entity import Entity
 from homeassistant.util.location import distance
 
-from .const import ATTR_PASSIVE, ATTR_RADIUS
+from .const import ATTR_PASSIVE, ATTR_RADIUS, DOMAIN
 
 STATE = "zoning"
 
+# Size in degrees of the grid cells used to find the zones near a location
+INDEX_CELL_SIZE = 0.05
+# Zones and locations covering more cells are not looked up in the grid
+INDEX_MAX_CELLS = 64
+# Meters per degree of latitude, rounded down so the boxes are never too small
+INDEX_METERS_PER_DEGREE = 100000
+# Closer to the poles or the antimeridian the grid is not used
+INDEX_MAX_LATITUDE = 80
+
 
 # mypy: allow-untyped-defs
 
@@ -32,6 +42,130 @@ def in_zone(zone: State, latitude: float, longitude: float, radius: float = 0) -
     return zone_dist - radius < cast(float, zone.attributes[ATTR_RADIUS])
 
 
+def _grid_cells(
+    latitude: float, longitude: float, radius: float
+) -> Optional[List[Tuple[int, int]]]:
+    """Return the grid cells covering a circle, None if there are too many."""
+    lat_extent = radius / INDEX_METERS_PER_DEGREE
+    max_latitude = abs(latitude) + lat_extent
+
+    if max_latitude >= INDEX_MAX_LATITUDE:
+        return None
+
+    lon_extent = lat_extent / math.cos(math.radians(max_latitude))
+
+    if not -180 <= longitude - lon_extent <= longitude + lon_extent <= 180:
+        return None
+
+    lat_cells = range(
+        math.floor((latitude - lat_extent) / INDEX_CELL_SIZE),
+        math.floor((latitude + lat_extent) / INDEX_CELL_SIZE) + 1,
+    )
+    lon_cells = range(
+        math.floor((longitude - lon_extent) / INDEX_CELL_SIZE),
+        math.floor((longitude + lon_extent) / INDEX_CELL_SIZE) + 1,
+    )
+
+    if len(lat_cells) * len(lon_cells) > INDEX_MAX_CELLS:
+        return None
+
+    return [(lat_cell, lon_cell) for lat_cell in lat_cells for lon_cell in lon_cells]
+
+
+class ZoneIndex:
+    """Grid of the active zones by location.
+
+    The grid is built on the first lookup after a zone state changed. As
+    state changed listeners run after the state is set, lookups also check
+    that the states of the candidates found are current. A zone that is
+    added or moved into the location is only found once the listener ran.
+    """
+
+    def __init__(self, hass):
+        """Initialize the zone index."""
+        self.hass = hass
+        self._zones: Optional[List[State]] = None
+        self._unindexed: List[State] = []
+        self._cells: Dict[Tuple[int, int], List[State]] = {}
+
+    @callback
+    def async_invalidate(self, event: Optional[Event] = None) -> None:
+        """Rebuild the grid on the next lookup."""
+        self._zones = None
+
+    @callback
+    def _async_build(self) -> List[State]:
+        """Build the grid from the states of the active zones."""
+        zones = []
+        self._unindexed = []
+        self._cells = {}
+
+        for entity_id in self.hass.states.async_entity_ids(DOMAIN):
+            zone = self.hass.states.get(entity_id)
+
+            if zone is None:
+                continue
+
+            if zone.attributes.get(ATTR_PASSIVE):
+                continue
+
+            zones.append(zone)
+
+            try:
+                cells = _grid_cells(
+                    zone.attributes[ATTR_LATITUDE],
+                    zone.attributes[ATTR_LONGITUDE],
+                    zone.attributes[ATTR_RADIUS],
+                )
+            except (KeyError, TypeError):
+                cells = None
+
+            if cells is None:
+                self._unindexed.append(zone)
+                continue
+
+            for cell in cells:
+                self._cells.setdefault(cell, []).append(zone)
+
+        self._zones = zones
+        return zones
+
+    @callback
+    def _async_lookup(
+        self, zones: List[State], cells: Optional[List[Tuple[int, int]]]
+    ) -> List[State]:
+        """Return the indexed zones in the grid cells."""
+        if cells is None:
+            return zones
+
+        found = {zone.entity_id: zone for zone in self._unindexed}
+        for cell in cells:
+            for zone in self._cells.get(cell, ()):
+                found[zone.entity_id] = zone
+        return list(found.values())
+
+    @callback
+    def async_candidates(
+        self, latitude: float, longitude: float, radius: float = 0
+    ) -> List[State]:
+        """Return the active zones that a location may be in.
+
+        Zones are sorted by entity id.
+        """
+        zones = self._zones
+        if zones is None:
+            zones = self._async_build()
+
+        cells = _grid_cells(latitude, longitude, radius)
+        candidates = self._async_lookup(zones, cells)
+
+        get = self.hass.states.get
+        if any(get(zone.entity_id) is not zone for zone in candidates):
+            candidates = self._async_lookup(self._async_build(), cells)
+
+        return sorted(candidates, key=lambda zone: zone.entity_id)
+
+
 class Zone(Entity):
     """Representation of a Zone."""
 
@@ -38,10 +38,18 @@ from homeassistant.const import (
     CONF_WHITELIST_EXTERNAL_DIRS,
     CONF_AUTH_PROVIDERS,
     CONF_AUTH_MFA_MODULES,
+    CONF_EXECUTOR_POOLS,
+    CONF_LOOP_MONITOR,
     CONF_TYPE,
     CONF_ID,
 )
-from homeassistant.core import DOMAIN as CONF_CORE, SOURCE_YAML, HomeAssistant, callback
+from homeassistant.core import (
+    DOMAIN as CONF_CORE,
+    SOURCE_YAML,
+    HomeAssistant,
+    LoopMonitor,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import Integration, IntegrationNotFound
 from homeassistant.requirements import (
@@ -215,6 +223,13 @@ CORE_CONFIG_SCHEMA = CUSTOMIZE_CONFIG_SCHEMA.extend(
             ],
             _no_duplicate_auth_mfa_module,
         ),
+        # Integrations that run their executor jobs in a pool of their own,
+        # with the number of workers of the pool
+        vol.Optional(CONF_EXECUTOR_POOLS): {
+            cv.string: vol.All(vol.Coerce(int), vol.Range(min=1))
+        },
+        # Measure the time jobs block the event loop
+        vol.Optional(CONF_LOOP_MONITOR): cv.boolean,
     }
 )
 
@@ -512,6 +527,16 @@ async def async_process_ha_core_config(hass: HomeAssistant, config: Dict) -> Non
     if CONF_TIME_ZONE in config:
         hac.set_time_zone(config[CONF_TIME_ZONE])
 
+    hass.executors.async_configure(config.get(CONF_EXECUTOR_POOLS, {}))
+
+    if config.get(CONF_LOOP_MONITOR, False):
+        if hass.loop_monitor is None:
+            hass.loop_monitor = LoopMonitor(hass)
+            hass.loop_monitor.async_start()
+    elif hass.loop_monitor is not None:
+        hass.loop_monitor.async_stop()
+        hass.loop_monitor = None
+
     # Init whitelist external dir
     hac.whitelist_external_dirs = {hass.config.path("www")}
     if CONF_WHITELIST_EXTERNAL_DIRS in config:
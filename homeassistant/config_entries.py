@@ -9,7 +9,7 @@ import weakref
 import attr
 
 from homeassistant import data_entry_flow, loader
-from homeassistant.core import callback, HomeAssistant
+from homeassistant.core import callback, current_integration, HomeAssistant
 from homeassistant.exceptions import HomeAssistantError, ConfigEntryNotReady
 from homeassistant.setup import async_setup_component, async_process_deps_reqs
 from homeassistant.util.decorator import Registry
@@ -185,6 +185,8 @@ class ConfigEntry:
                 self.state = ENTRY_STATE_MIGRATION_ERROR
                 return
 
+        token = current_integration.set(self.domain)
+
         try:
             result = await component.async_setup_entry(  # type: ignore
                 hass, self
@@ -219,6 +221,8 @@ class ConfigEntry:
                 "Error setting up entry %s for %s", self.title, integration.domain
             )
             result = False
+        finally:
+            current_integration.reset(token)
 
         # Only store setup result as state if it was not forwarded.
         if self.domain != integration.domain:
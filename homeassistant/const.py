@@ -76,6 +76,7 @@ CONF_ENTITY_NAMESPACE = "entity_namespace"
 CONF_ENTITY_PICTURE_TEMPLATE = "entity_picture_template"
 CONF_EVENT = "event"
 CONF_EXCLUDE = "exclude"
+CONF_EXECUTOR_POOLS = "executor_pools"
 CONF_FILE_PATH = "file_path"
 CONF_FILENAME = "filename"
 CONF_FOR = "for"
@@ -93,6 +94,7 @@ CONF_ID = "id"
 CONF_IP_ADDRESS = "ip_address"
 CONF_LATITUDE = "latitude"
 CONF_LONGITUDE = "longitude"
+CONF_LOOP_MONITOR = "loop_monitor"
 CONF_LIGHTS = "lights"
 CONF_MAC = "mac"
 CONF_METHOD = "method"
@@ -5,10 +5,13 @@ Home Assistant is a Home Automation framework for observing the state
 of entities and react to changes.
 """
 import asyncio
+import collections.abc
 from concurrent.futures import ThreadPoolExecutor
+import contextvars
 import datetime
 import enum
 import functools
+from heapq import heapify, heappop, heappush
 import logging
 import os
 import pathlib
@@ -29,6 +32,7 @@ from typing import (
     TYPE_CHECKING,
     Awaitable,
     Mapping,
+    Tuple,
 )
 
 from async_timeout import timeout
@@ -102,8 +106,26 @@ SOURCE_YAML = "yaml"
 # How long to wait till things that run on startup have to finish.
 TIMEOUT_EVENT_START = 15
 
+# Longest the scheduler sleeps before checking the wall clock again
+SCHEDULER_MAX_SLEEP = 10  # seconds
+
+# How often the loop monitor measures the event loop lag
+LOOP_MONITOR_LAG_INTERVAL = 1  # seconds
+# How often the loop monitor logs a summary
+LOOP_MONITOR_SUMMARY_INTERVAL = 300  # seconds
+# Jobs that block the event loop longer than this are logged
+LOOP_MONITOR_SLOW_JOB = 0.5  # seconds
+# Number of jobs and integrations in the loop monitor summary
+LOOP_MONITOR_SUMMARY_TOP = 5
+
 _LOGGER = logging.getLogger(__name__)
 
+# Integration that is being set up, polled or is handling a service call.
+# Executor jobs are run in the executor pool of this integration.
+current_integration: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "current_integration", default=None
+)
+
 
 def split_entity_id(entity_id: str) -> List[str]:
     """Split a state entity_id into domain, object_id."""
@@ -177,12 +199,16 @@ class HomeAssistant:
 
         self.executor = ThreadPoolExecutor(**executor_opts)
         self.loop.set_default_executor(self.executor)
+        self.executors = ExecutorPools(self)
+        # Measures the time jobs block the event loop, when enabled
+        self.loop_monitor: Optional[LoopMonitor] = None
         self.loop.set_exception_handler(async_loop_exception_handler)
         self._pending_tasks: list = []
         self._track_task = True
         self.bus = EventBus(self)
         self.services = ServiceRegistry(self)
         self.states = StateMachine(self.bus, self.loop)
+        self.scheduler = Scheduler(self)
         self.config = Config(self)
         self.components = loader.Components(self)
         self.helpers = loader.Helpers(self)
@@ -297,6 +323,7 @@ class HomeAssistant:
         args: parameters for method to call.
         """
         task = None
+        monitor = self.loop_monitor
 
         # Check for partials to properly determine if coroutine function
         check_target = target
@@ -304,15 +331,21 @@ class HomeAssistant:
             check_target = check_target.func
 
         if asyncio.iscoroutine(check_target):
+            if monitor is not None:
+                target = monitor.async_wrap_coroutine(target)
             task = self.loop.create_task(target)  # type: ignore
         elif is_callback(check_target):
-            self.loop.call_soon(target, *args)
+            if monitor is None:
+                self.loop.call_soon(target, *args)
+            else:
+                self.loop.call_soon(monitor.async_run_callback, target, args)
         elif asyncio.iscoroutinefunction(check_target):
-            task = self.loop.create_task(target(*args))
+            coro = target(*args)
+            if monitor is not None:
+                coro = monitor.async_wrap_coroutine(coro)
+            task = self.loop.create_task(coro)
         else:
-            task = self.loop.run_in_executor(  # type: ignore
-                None, target, *args
-            )
+            task = self.executors.async_submit(target, *args)
 
         # If a task is scheduled
         if self._track_task and task is not None:
@@ -328,6 +361,9 @@ class HomeAssistant:
 
         target: target to call.
         """
+        if self.loop_monitor is not None:
+            target = self.loop_monitor.async_wrap_coroutine(target)
+
         task: asyncio.tasks.Task = self.loop.create_task(target)
 
         if self._track_task:
@@ -339,8 +375,11 @@ class HomeAssistant:
     def async_add_executor_job(
         self, target: Callable[..., T], *args: Any
     ) -> Awaitable[T]:
-        """Add an executor job from within the event loop."""
-        task = self.loop.run_in_executor(None, target, *args)
+        """Add an executor job from within the event loop.
+
+        The job runs in the executor pool of the current integration.
+        """
+        task = self.executors.async_submit(target, *args)
 
         # If a task is scheduled
         if self._track_task:
@@ -368,7 +407,10 @@ class HomeAssistant:
         args: parameters for method to call.
         """
         if not asyncio.iscoroutine(target) and is_callback(target):
-            target(*args)
+            if self.loop_monitor is None:
+                target(*args)
+            else:
+                self.loop_monitor.async_run_callback(target, args)
         else:
             self.async_add_job(target, *args)
 
@@ -426,9 +468,12 @@ class HomeAssistant:
 
         # stage 2
         self.state = CoreState.not_running
+        if self.loop_monitor is not None:
+            self.loop_monitor.async_stop()
         self.bus.async_fire(EVENT_HOMEASSISTANT_CLOSE)
         await self.async_block_till_done()
         self.executor.shutdown()
+        self.executors.shutdown()
 
         self.exit_code = exit_code
 
@@ -465,7 +510,7 @@ class EventOrigin(enum.Enum):
 class Event:
     """Representation of an event within the bus."""
 
-    __slots__ = ["event_type", "data", "origin", "time_fired", "context"]
+    __slots__ = ["event_type", "data", "origin", "time_fired", "context", "_cache"]
 
     def __init__(
         self,
@@ -481,6 +526,22 @@ class Event:
         self.origin = origin
         self.time_fired = time_fired or dt_util.utcnow()
         self.context: Context = context or Context()
+        self._cache: Optional[Dict[str, Any]] = None
+
+    def cached(self, key: str, factory: Callable[["Event"], Any]) -> Any:
+        """Return factory(event), calling factory only once per key.
+
+        Allows consumers of the event to share work, like serialization.
+
+        Async friendly.
+        """
+        if self._cache is None:
+            self._cache = {}
+        elif key in self._cache:
+            return self._cache[key]
+
+        value = self._cache[key] = factory(self)
+        return value
 
     def as_dict(self) -> Dict:
         """Create a dict representation of this Event.
@@ -522,7 +583,7 @@ class EventBus:
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
-        self._listeners: Dict[str, List[Callable]] = {}
+        self._listeners: Dict[str, List[Tuple[Callable, contextvars.Context]]] = {}
         self._hass = hass
 
     @callback
@@ -579,8 +640,11 @@ class EventBus:
         if not listeners:
             return
 
-        for func in listeners:
-            self._hass.async_add_job(func, event)
+        add_job = self._hass.async_add_job
+        for func, func_context in listeners:
+            # Run the listener in the context it was added from, so it is
+            # attributed to its own integration and not to the one firing
+            func_context.run(add_job, func, event)
 
     def listen(self, event_type: str, listener: Callable) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type.
@@ -607,10 +671,11 @@ class EventBus:
 
         This method must be run in the event loop.
         """
+        entry = (listener, contextvars.copy_context())
         if event_type in self._listeners:
-            self._listeners[event_type].append(listener)
+            self._listeners[event_type].append(entry)
         else:
-            self._listeners[event_type] = [listener]
+            self._listeners[event_type] = [entry]
 
         def remove_listener() -> None:
             """Remove the listener."""
@@ -671,14 +736,18 @@ class EventBus:
         This method must be run in the event loop.
         """
         try:
-            self._listeners[event_type].remove(listener)
+            listeners = self._listeners[event_type]
+            index = next(
+                idx for idx, (func, _) in enumerate(listeners) if func == listener
+            )
+            del listeners[index]
 
             # delete event_type list if empty
-            if not self._listeners[event_type]:
+            if not listeners:
                 self._listeners.pop(event_type)
-        except (KeyError, ValueError):
+        except (KeyError, StopIteration):
             # KeyError is key event_type listener did not exist
-            # ValueError if listener did not exist within event_type
+            # StopIteration if listener did not exist within event_type
             _LOGGER.warning("Unable to remove unknown listener %s", listener)
 
 
@@ -1260,7 +1329,11 @@ class ServiceRegistry:
         elif handler.is_coroutinefunction:
             await handler.func(service_call)
         else:
-            await self._hass.async_add_executor_job(handler.func, service_call)
+            token = current_integration.set(service_call.domain)
+            try:
+                await self._hass.async_add_executor_job(handler.func, service_call)
+            finally:
+                current_integration.reset(token)
 
 
 class Config:
@@ -1436,6 +1509,687 @@ class Config:
         await store.async_save(data)
 
 
+@attr.s(slots=True)
+class ExecutorStatistics:
+    """Statistics of the executor jobs of an integration.
+
+    Wait is the time between when a job was added and when it started.
+    """
+
+    jobs = attr.ib(type=int, default=0)
+    queued = attr.ib(type=int, default=0)
+    running = attr.ib(type=int, default=0)
+    wait_last = attr.ib(type=float, default=0.0)
+    wait_max = attr.ib(type=float, default=0.0)
+    wait_total = attr.ib(type=float, default=0.0)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the statistics as a dictionary."""
+        return {
+            "jobs": self.jobs,
+            "queued": self.queued,
+            "running": self.running,
+            "wait": {
+                "last": self.wait_last,
+                "max": self.wait_max,
+                "average": self.wait_total / (self.jobs or 1),
+            },
+        }
+
+
+class ExecutorPools:
+    """Run executor jobs in the executor pool of their integration.
+
+    Integrations share the default executor, unless they are given a pool of
+    their own with async_configure. An integration whose jobs block then
+    only occupies the workers of its own pool.
+
+    Jobs are added to the integration in current_integration, which is set
+    while an integration is set up, polled or handles a service call, and
+    is inherited by the tasks and timers started from there.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the executor pools."""
+        self._hass = hass
+        self.pools: Dict[str, ThreadPoolExecutor] = {}
+        self.statistics: Dict[str, ExecutorStatistics] = {}
+        # Guards the statistics, which are updated by the workers
+        self._lock = threading.Lock()
+
+    @callback
+    def async_configure(self, pool_sizes: Dict[str, int]) -> None:
+        """Set the integrations that have their own pool and its size.
+
+        Pools of integrations that are left out are shut down once their
+        running jobs are done.
+        """
+        for domain in set(self.pools) - set(pool_sizes):
+            self.pools.pop(domain).shutdown(wait=False)
+
+        for domain, max_workers in pool_sizes.items():
+            pool = self.pools.get(domain)
+
+            if pool is not None:
+                # pylint: disable=protected-access
+                if pool._max_workers == max_workers:  # type: ignore
+                    continue
+                pool.shutdown(wait=False)
+
+            self.pools[domain] = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix=f"SyncWorker_{domain}"
+            )
+
+    @callback
+    def async_submit(self, target: Callable[..., T], *args: Any) -> asyncio.Future:
+        """Run a job in the executor pool of the current integration.
+
+        This method must be run in the event loop.
+        """
+        domain = current_integration.get()
+
+        if domain is None:
+            return self._hass.loop.run_in_executor(None, target, *args)
+
+        stats = self.statistics.get(domain)
+
+        if stats is None:
+            stats = self.statistics[domain] = ExecutorStatistics()
+
+        with self._lock:
+            stats.queued += 1
+
+        return self._hass.loop.run_in_executor(
+            self.pools.get(domain), self._run_job, stats, monotonic(), target, args
+        )
+
+    def _run_job(
+        self,
+        stats: ExecutorStatistics,
+        added: float,
+        target: Callable[..., T],
+        args: Any,
+    ) -> T:
+        """Run a job in a worker and keep track of it."""
+        wait = monotonic() - added
+
+        with self._lock:
+            stats.jobs += 1
+            stats.queued -= 1
+            stats.running += 1
+            stats.wait_last = wait
+            stats.wait_max = max(stats.wait_max, wait)
+            stats.wait_total += wait
+
+        try:
+            return target(*args)
+        finally:
+            with self._lock:
+                stats.running -= 1
+
+    @callback
+    def async_statistics(self) -> Dict[str, Dict[str, Any]]:
+        """Return the statistics of the executor jobs per integration."""
+        with self._lock:
+            statistics = {
+                domain: stats.as_dict() for domain, stats in self.statistics.items()
+            }
+
+        for domain, stats_dict in statistics.items():
+            pool = self.pools.get(domain)
+            # pylint: disable=protected-access
+            stats_dict["max_workers"] = (
+                pool._max_workers if pool is not None else None  # type: ignore
+            )
+
+        return statistics
+
+    def shutdown(self) -> None:
+        """Shut down the pools of the integrations."""
+        for pool in self.pools.values():
+            pool.shutdown()
+
+
+def _callable_name(func: Any) -> str:
+    """Return the qualified name of a callable."""
+    module = getattr(func, "__module__", None) or ""
+    name = getattr(func, "__qualname__", None) or type(func).__qualname__
+    return f"{module}.{name}"
+
+
+def module_integration(module: str) -> str:
+    """Return the integration a module belongs to."""
+    parts = module.split(".", 3)
+
+    if parts[0] == "homeassistant" and len(parts) > 2 and parts[1] == "components":
+        return parts[2]
+
+    if parts[0] == "custom_components" and len(parts) > 1:
+        return parts[1]
+
+    return DOMAIN
+
+
+@attr.s(slots=True)
+class JobStatistics:
+    """Statistics of the time a job blocked the event loop.
+
+    The time includes jobs that were run by the job itself.
+    """
+
+    name = attr.ib(type=str)
+    integration = attr.ib(type=str)
+    runs = attr.ib(type=int, default=0)
+    total = attr.ib(type=float, default=0.0)
+    max = attr.ib(type=float, default=0.0)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the statistics as a dictionary."""
+        return {
+            "name": self.name,
+            "integration": self.integration,
+            "runs": self.runs,
+            "total": self.total,
+            "max": self.max,
+        }
+
+
+class _TimedCoroutine(collections.abc.Coroutine):
+    """Coroutine that adds the time of each step of another one to stats."""
+
+    __slots__ = ("_monitor", "_coro", "_stats")
+
+    def __init__(
+        self, monitor: "LoopMonitor", coro: Coroutine, stats: JobStatistics
+    ) -> None:
+        """Initialize the timed coroutine."""
+        self._monitor = monitor
+        self._coro = coro
+        self._stats = stats
+
+    def send(self, value: Any) -> Any:
+        """Run a step of the coroutine."""
+        start = monotonic()
+        try:
+            return self._coro.send(value)
+        finally:
+            self._monitor.async_add(self._stats, monotonic() - start)
+
+    def throw(self, typ: Any, val: Any = None, tb: Any = None) -> Any:
+        """Run a step of the coroutine, raising an exception in it."""
+        start = monotonic()
+        try:
+            return self._coro.throw(typ, val, tb)
+        finally:
+            self._monitor.async_add(self._stats, monotonic() - start)
+
+    def close(self) -> None:
+        """Close the coroutine."""
+        self._coro.close()
+
+    def __await__(self) -> "_TimedCoroutine":
+        """Return the iterator of the coroutine."""
+        return self
+
+    def __next__(self) -> Any:
+        """Run a step of the coroutine."""
+        return self.send(None)
+
+
+class LoopMonitor:
+    """Measure how long jobs block the event loop, and the loop lag.
+
+    Jobs are callbacks and steps of coroutines added with async_add_job,
+    async_run_job and async_create_task, which include event listeners.
+    Time is attributed to the integration of the module of the job.
+
+    Lag is how much later than planned a timer of the event loop runs.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the loop monitor."""
+        self._hass = hass
+        self.jobs: Dict[Any, JobStatistics] = {}
+        self.lag_last = 0.0
+        self.lag_max = 0.0
+        self._lag_total = 0.0
+        self._lag_samples = 0
+        # Lag and total time per job at the last summary
+        self._summary_lag_max = 0.0
+        self._summary_totals: Dict[Any, float] = {}
+        self._lag_handle: Optional[asyncio.TimerHandle] = None
+        self._summary_handle: Optional[asyncio.TimerHandle] = None
+
+    @callback
+    def async_start(self) -> None:
+        """Start measuring the loop lag and logging summaries."""
+        loop = self._hass.loop
+        self._lag_handle = loop.call_later(
+            LOOP_MONITOR_LAG_INTERVAL,
+            self._async_measure_lag,
+            loop.time() + LOOP_MONITOR_LAG_INTERVAL,
+        )
+        self._summary_handle = loop.call_later(
+            LOOP_MONITOR_SUMMARY_INTERVAL, self._async_log_summary
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop measuring the loop lag and logging summaries."""
+        if self._lag_handle is not None:
+            self._lag_handle.cancel()
+            self._lag_handle = None
+        if self._summary_handle is not None:
+            self._summary_handle.cancel()
+            self._summary_handle = None
+
+    @callback
+    def async_run_callback(self, target: Callable[..., None], args: Any) -> None:
+        """Run a callback and add the time it took."""
+        start = monotonic()
+        try:
+            target(*args)
+        finally:
+            self.async_add(self._async_callback_stats(target), monotonic() - start)
+
+    @callback
+    def async_wrap_coroutine(self, coro: Coroutine) -> Coroutine:
+        """Return a coroutine that adds the time of the steps of coro."""
+        # Native and generator based coroutines
+        code = getattr(coro, "cr_code", None) or getattr(coro, "gi_code", None)
+        frame = getattr(coro, "cr_frame", None) or getattr(coro, "gi_frame", None)
+
+        if code is None or frame is None:
+            return coro
+
+        stats = self.jobs.get(code)
+
+        if stats is None:
+            module = frame.f_globals.get("__name__", "")
+            stats = self.jobs[code] = JobStatistics(
+                f"{module}.{getattr(coro, '__qualname__', code.co_name)}",
+                module_integration(module),
+            )
+
+        return _TimedCoroutine(self, coro, stats)
+
+    @callback
+    def _async_callback_stats(self, target: Callable[..., None]) -> JobStatistics:
+        """Return the statistics of a callback."""
+        func: Any = target
+        while isinstance(func, functools.partial):
+            func = func.func
+        # Methods are created on access, use the function they wrap
+        func = getattr(func, "__func__", func)
+        # Like coroutines, key on the code so closures share their statistics,
+        # other callables on their name
+        key = getattr(func, "__code__", None) or _callable_name(func)
+        stats = self.jobs.get(key)
+
+        if stats is None:
+            module = getattr(func, "__module__", None) or ""
+            stats = self.jobs[key] = JobStatistics(
+                _callable_name(func), module_integration(module)
+            )
+
+        return stats
+
+    @callback
+    def async_add(self, stats: JobStatistics, duration: float) -> None:
+        """Add a run of a job."""
+        stats.runs += 1
+        stats.total += duration
+
+        if duration > stats.max:
+            stats.max = duration
+
+        if duration > LOOP_MONITOR_SLOW_JOB:
+            _LOGGER.warning(
+                "Job %s of %s blocked the event loop for %.2f seconds",
+                stats.name,
+                stats.integration,
+                duration,
+            )
+
+    @callback
+    def _async_measure_lag(self, planned: float) -> None:
+        """Measure how late the timer ran and schedule the next one."""
+        loop = self._hass.loop
+        now = loop.time()
+        lag = max(now - planned, 0)
+        self.lag_last = lag
+        self.lag_max = max(self.lag_max, lag)
+        self._summary_lag_max = max(self._summary_lag_max, lag)
+        self._lag_total += lag
+        self._lag_samples += 1
+        self._lag_handle = loop.call_later(
+            LOOP_MONITOR_LAG_INTERVAL,
+            self._async_measure_lag,
+            now + LOOP_MONITOR_LAG_INTERVAL,
+        )
+
+    @callback
+    def _async_log_summary(self) -> None:
+        """Log the jobs that blocked the loop most since the last summary."""
+        self._summary_handle = self._hass.loop.call_later(
+            LOOP_MONITOR_SUMMARY_INTERVAL, self._async_log_summary
+        )
+
+        totals = self._summary_totals
+        increases = sorted(
+            (
+                (stats.total - totals.get(key, 0), stats)
+                for key, stats in self.jobs.items()
+            ),
+            key=lambda item: item[0],
+            reverse=True,
+        )[:LOOP_MONITOR_SUMMARY_TOP]
+
+        _LOGGER.info(
+            "Event loop in the last %d seconds: max lag %.3f seconds, "
+            "most time spent in %s",
+            LOOP_MONITOR_SUMMARY_INTERVAL,
+            self._summary_lag_max,
+            ", ".join(
+                f"{stats.name} ({stats.integration}): {increase:.3f}s"
+                for increase, stats in increases
+            ),
+        )
+
+        self._summary_lag_max = 0.0
+        self._summary_totals = {key: stats.total for key, stats in self.jobs.items()}
+
+    @callback
+    def async_report(self, top: int = 10) -> Dict[str, Any]:
+        """Return the lag and the top jobs and integrations by time spent."""
+        integrations: Dict[str, float] = {}
+
+        for stats in self.jobs.values():
+            integrations[stats.integration] = (
+                integrations.get(stats.integration, 0) + stats.total
+            )
+
+        return {
+            "lag": {
+                "last": self.lag_last,
+                "max": self.lag_max,
+                "average": self._lag_total / (self._lag_samples or 1),
+            },
+            "integrations": dict(
+                sorted(integrations.items(), key=lambda item: item[1], reverse=True)[
+                    :top
+                ]
+            ),
+            "jobs": [
+                stats.as_dict()
+                for stats in sorted(
+                    self.jobs.values(), key=lambda stats: stats.total, reverse=True
+                )[:top]
+            ],
+        }
+
+
+class _ScheduledJob:
+    """A job waiting in the scheduler."""
+
+    __slots__ = (
+        "point_in_time",
+        "seq",
+        "target",
+        "calculate_next",
+        "queued",
+        "context",
+    )
+
+    def __init__(
+        self,
+        point_in_time: datetime.datetime,
+        seq: int,
+        target: Optional[Callable[..., Any]],
+        calculate_next: Optional[Callable[[datetime.datetime], datetime.datetime]],
+    ) -> None:
+        """Initialize a scheduled job."""
+        self.point_in_time = point_in_time
+        self.seq = seq
+        self.target = target
+        self.calculate_next = calculate_next
+        self.queued = False
+        # Run the job in the context it was scheduled from, like call_later
+        self.context = contextvars.copy_context()
+
+    def __lt__(self, other: "_ScheduledJob") -> bool:
+        """Order jobs by due time, then by order of scheduling."""
+        return (self.point_in_time, self.seq) < (other.point_in_time, other.seq)
+
+
+class Scheduler:
+    """Run jobs at points in UTC time.
+
+    Jobs are kept in a heap ordered by due time. Once the timer is started,
+    the event loop wakes up the scheduler when the first job is due, so
+    pending jobs cost nothing until then.
+
+    Before the timer is started, jobs are run by time_changed events
+    instead. This is how time is simulated in tests.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._jobs: List[_ScheduledJob] = []
+        self._seq = 0
+        self._cancelled = 0
+        self._started = False
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._handle_wakeup: Optional[datetime.datetime] = None
+        self._unsub_time_changed: Optional[CALLBACK_TYPE] = None
+        self._last_now: Optional[datetime.datetime] = None
+        self._uncalculated: List[_ScheduledJob] = []
+
+    @callback
+    def async_schedule(
+        self,
+        point_in_time: datetime.datetime,
+        target: Callable[..., Any],
+        calculate_next: Optional[
+            Callable[[datetime.datetime], datetime.datetime]
+        ] = None,
+    ) -> CALLBACK_TYPE:
+        """Run target with the current UTC time at point_in_time.
+
+        If calculate_next is given, the job repeats: after each run it is
+        scheduled again at calculate_next(now + 1 second). When time runs
+        backwards, calculate_next is used to reschedule.
+
+        Returns a function to cancel the job.
+
+        This method must be run in the event loop.
+        """
+        job = _ScheduledJob(
+            dt_util.as_utc(point_in_time), self._seq, target, calculate_next
+        )
+        self._seq += 1
+        self._async_push(job)
+
+        if self._started:
+            self._async_arm()
+        else:
+            if calculate_next is not None:
+                # Simulated time: calculate from the next time_changed event
+                self._uncalculated.append(job)
+            if self._unsub_time_changed is None:
+                self._unsub_time_changed = self._hass.bus.async_listen(
+                    EVENT_TIME_CHANGED, self._async_time_changed
+                )
+
+        @callback
+        def cancel() -> None:
+            """Cancel the job."""
+            if job.target is None:
+                return
+            job.target = None
+            if job.queued:
+                self._cancelled += 1
+                self._async_jobs_changed()
+
+        return cancel
+
+    @callback
+    def async_start(self) -> None:
+        """Start running jobs at their due time using the event loop clock."""
+        self._started = True
+        self._uncalculated.clear()
+        self._async_unsub_time_changed()
+        self._last_now = None
+        self._async_arm()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop running jobs."""
+        self._started = False
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    @callback
+    def _async_push(self, job: _ScheduledJob) -> None:
+        """Add a job to the heap."""
+        job.queued = True
+        heappush(self._jobs, job)
+
+    @callback
+    def _async_pop(self) -> _ScheduledJob:
+        """Remove the first job from the heap."""
+        job = heappop(self._jobs)
+        job.queued = False
+        if job.target is None:
+            self._cancelled -= 1
+        return job
+
+    @callback
+    def _async_jobs_changed(self) -> None:
+        """Clean up after a job was cancelled."""
+        if self._cancelled == len(self._jobs):
+            for job in self._jobs:
+                job.queued = False
+            self._jobs.clear()
+            self._uncalculated.clear()
+            self._cancelled = 0
+            self._async_unsub_time_changed()
+            if self._handle is not None:
+                self._handle.cancel()
+                self._handle = None
+        elif self._cancelled > 100 and self._cancelled * 2 > len(self._jobs):
+            # Drop the cancelled jobs instead of waiting for them to be due
+            for job in self._jobs:
+                job.queued = job.target is not None
+            self._jobs = [job for job in self._jobs if job.queued]
+            heapify(self._jobs)
+            self._cancelled = 0
+
+    @callback
+    def _async_unsub_time_changed(self) -> None:
+        """Stop listening to time_changed events."""
+        if self._unsub_time_changed is not None:
+            self._unsub_time_changed()
+            self._unsub_time_changed = None
+            self._last_now = None
+
+    @callback
+    def _async_time_changed(self, event: Event) -> None:
+        """Run the jobs due at a simulated time."""
+        now = dt_util.as_utc(event.data[ATTR_NOW])
+
+        if self._last_now is None or now < self._last_now:
+            # Time rolled back or repeating jobs not yet calculated
+            self._async_recalculate(self._jobs, now)
+        elif self._uncalculated:
+            self._async_recalculate(self._uncalculated, now)
+
+        self._last_now = now
+        self._async_run_due(now)
+
+        if not self._jobs:
+            self._async_unsub_time_changed()
+
+    @callback
+    def _async_timer_fired(self) -> None:
+        """Run the jobs that are due and wait for the next one."""
+        self._handle = None
+        now = dt_util.utcnow()
+
+        # Repeating jobs would not run until the system time catches up again
+        # if it abruptly jumps backwards, so calculate them from now.
+        if self._last_now is not None and now < self._last_now:
+            self._async_recalculate(self._jobs, now)
+
+        self._last_now = now
+        self._async_run_due(now)
+        self._async_arm()
+
+    @callback
+    def _async_recalculate(
+        self, jobs: List[_ScheduledJob], now: datetime.datetime
+    ) -> None:
+        """Calculate the next run of repeating jobs from now."""
+        for job in jobs:
+            if job.queued and job.target is not None and job.calculate_next:
+                job.point_in_time = dt_util.as_utc(job.calculate_next(now))
+        heapify(self._jobs)
+        self._uncalculated.clear()
+
+    @callback
+    def _async_arm(self) -> None:
+        """Make sure the event loop wakes us up when the first job is due."""
+        while self._jobs and self._jobs[0].target is None:
+            self._async_pop()
+
+        if not self._started or not self._jobs:
+            return
+
+        point_in_time = self._jobs[0].point_in_time
+
+        if self._handle is not None:
+            if self._handle_wakeup <= point_in_time:  # type: ignore
+                return
+            self._handle.cancel()
+
+        # Wake up regularly to pick up on changes of the wall clock
+        now = dt_util.utcnow()
+        delay = min((point_in_time - now).total_seconds(), SCHEDULER_MAX_SLEEP)
+        delay = max(delay, 0)
+        self._handle = self._hass.loop.call_later(delay, self._async_timer_fired)
+        self._handle_wakeup = now + datetime.timedelta(seconds=delay)
+
+    @callback
+    def _async_run_due(self, now: datetime.datetime) -> None:
+        """Run the jobs that are due at now."""
+        due = []
+        while self._jobs and self._jobs[0].point_in_time <= now:
+            job = self._async_pop()
+            if job.target is not None:
+                due.append(job)
+
+        for job in due:
+            target = job.target
+            # A job run before this one might have cancelled it
+            if target is None:
+                continue
+
+            if job.calculate_next is None:
+                job.target = None
+            else:
+                job.point_in_time = dt_util.as_utc(
+                    job.calculate_next(now + datetime.timedelta(seconds=1))
+                )
+                self._async_push(job)
+
+            try:
+                job.context.run(self._hass.async_run_job, target, now)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error running scheduled job %s", target)
+
+
 def _async_create_timer(hass: HomeAssistant) -> None:
     """Create a timer that will start on HOMEASSISTANT_START."""
     handle = None
@@ -1467,8 +2221,10 @@ def _async_create_timer(hass: HomeAssistant) -> None:
         """Stop the timer."""
         if handle is not None:
             handle.cancel()
+        hass.scheduler.async_stop()
 
     hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, stop_timer)
 
     _LOGGER.info("Timer:starting")
     schedule_tick(dt_util.utcnow())
+    hass.scheduler.async_start()
@@ -0,0 +1,5351 @@
+"""Automatically generated by hassfest.
+
+To update, run python3 -m script.hassfest
+"""
+
+# fmt: off
+
+MANIFESTS = {
+    "abode": {
+        "domain": "abode",
+        "name": "Abode",
+        "config_flow": True,
+        "requirements": ["abodepy==0.16.6"],
+        "dependencies": [],
+    },
+    "acer_projector": {
+        "domain": "acer_projector",
+        "name": "Acer projector",
+        "requirements": ["pyserial==3.1.1"],
+        "dependencies": [],
+    },
+    "actiontec": {
+        "domain": "actiontec",
+        "name": "Actiontec",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "adguard": {
+        "domain": "adguard",
+        "name": "AdGuard Home",
+        "config_flow": True,
+        "requirements": ["adguardhome==0.3.0"],
+        "dependencies": [],
+    },
+    "ads": {
+        "domain": "ads",
+        "name": "Ads",
+        "requirements": ["pyads==3.0.7"],
+        "dependencies": [],
+    },
+    "aftership": {
+        "domain": "aftership",
+        "name": "Aftership",
+        "requirements": ["pyaftership==0.1.2"],
+        "dependencies": [],
+    },
+    "air_quality": {
+        "domain": "air_quality",
+        "name": "Air quality",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "airly": {
+        "domain": "airly",
+        "name": "Airly",
+        "config_flow": True,
+        "requirements": ["airly==0.0.2"],
+        "dependencies": [],
+    },
+    "airvisual": {
+        "domain": "airvisual",
+        "name": "Airvisual",
+        "requirements": ["pyairvisual==3.0.1"],
+        "dependencies": [],
+    },
+    "aladdin_connect": {
+        "domain": "aladdin_connect",
+        "name": "Aladdin connect",
+        "requirements": ["aladdin_connect==0.3"],
+        "dependencies": [],
+    },
+    "alarm_control_panel": {
+        "domain": "alarm_control_panel",
+        "name": "Alarm control panel",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "alarmdecoder": {
+        "domain": "alarmdecoder",
+        "name": "Alarmdecoder",
+        "requirements": ["alarmdecoder==1.13.2"],
+        "dependencies": [],
+    },
+    "alarmdotcom": {
+        "domain": "alarmdotcom",
+        "name": "Alarmdotcom",
+        "requirements": ["pyalarmdotcom==0.3.2"],
+        "dependencies": [],
+    },
+    "alert": {
+        "domain": "alert",
+        "name": "Alert",
+        "requirements": [],
+        "dependencies": [],
+        "after_dependencies": ["notify"],
+    },
+    "alexa": {
+        "domain": "alexa",
+        "name": "Alexa",
+        "requirements": [],
+        "dependencies": ["http"],
+    },
+    "alpha_vantage": {
+        "domain": "alpha_vantage",
+        "name": "Alpha vantage",
+        "requirements": ["alpha_vantage==2.1.1"],
+        "dependencies": [],
+    },
+    "amazon_polly": {
+        "domain": "amazon_polly",
+        "name": "Amazon polly",
+        "requirements": ["boto3==1.9.233"],
+        "dependencies": [],
+    },
+    "ambiclimate": {
+        "domain": "ambiclimate",
+        "name": "Ambiclimate",
+        "config_flow": True,
+        "requirements": ["ambiclimate==0.2.1"],
+        "dependencies": [],
+    },
+    "ambient_station": {
+        "domain": "ambient_station",
+        "name": "Ambient station",
+        "config_flow": True,
+        "requirements": ["aioambient==0.3.2"],
+        "dependencies": [],
+    },
+    "amcrest": {
+        "domain": "amcrest",
+        "name": "Amcrest",
+        "requirements": ["amcrest==1.5.3"],
+        "dependencies": ["ffmpeg"],
+    },
+    "ampio": {
+        "domain": "ampio",
+        "name": "Ampio",
+        "requirements": ["asmog==0.0.6"],
+        "dependencies": [],
+    },
+    "android_ip_webcam": {
+        "domain": "android_ip_webcam",
+        "name": "Android ip webcam",
+        "requirements": ["pydroid-ipcam==0.8"],
+        "dependencies": [],
+    },
+    "androidtv": {
+        "domain": "androidtv",
+        "name": "Androidtv",
+        "requirements": ["adb-shell==0.0.7", "androidtv==0.0.32"],
+        "dependencies": [],
+    },
+    "anel_pwrctrl": {
+        "domain": "anel_pwrctrl",
+        "name": "Anel pwrctrl",
+        "requirements": ["anel_pwrctrl-homeassistant==0.0.1.dev2"],
+        "dependencies": [],
+    },
+    "anthemav": {
+        "domain": "anthemav",
+        "name": "Anthemav",
+        "requirements": ["anthemav==1.1.10"],
+        "dependencies": [],
+    },
+    "apache_kafka": {
+        "domain": "apache_kafka",
+        "name": "Apache Kafka",
+        "requirements": ["aiokafka==0.5.1"],
+        "dependencies": [],
+    },
+    "apcupsd": {
+        "domain": "apcupsd",
+        "name": "Apcupsd",
+        "requirements": ["apcaccess==0.0.13"],
+        "dependencies": [],
+    },
+    "api": {
+        "domain": "api",
+        "name": "Home Assistant API",
+        "requirements": [],
+        "dependencies": ["http"],
+    },
+    "apns": {
+        "domain": "apns",
+        "name": "Apns",
+        "requirements": ["apns2==0.3.0"],
+        "dependencies": [],
+    },
+    "apple_tv": {
+        "domain": "apple_tv",
+        "name": "Apple tv",
+        "requirements": ["pyatv==0.3.13"],
+        "dependencies": ["configurator"],
+    },
+    "apprise": {
+        "domain": "apprise",
+        "name": "Apprise",
+        "requirements": ["apprise==0.8.1"],
+        "dependencies": [],
+    },
+    "aprs": {
+        "domain": "aprs",
+        "name": "APRS",
+        "requirements": ["aprslib==0.6.46", "geopy==1.19.0"],
+        "dependencies": [],
+    },
+    "aqualogic": {
+        "domain": "aqualogic",
+        "name": "Aqualogic",
+        "requirements": ["aqualogic==1.0"],
+        "dependencies": [],
+    },
+    "aquostv": {
+        "domain": "aquostv",
+        "name": "Aquostv",
+        "requirements": ["sharp_aquos_rc==0.3.2"],
+        "dependencies": [],
+    },
+    "arcam_fmj": {
+        "domain": "arcam_fmj",
+        "name": "Arcam FMJ Receiver control",
+        "config_flow": False,
+        "requirements": ["arcam-fmj==0.4.3"],
+        "dependencies": [],
+    },
+    "arduino": {
+        "domain": "arduino",
+        "name": "Arduino",
+        "requirements": ["PyMata==2.20"],
+        "dependencies": [],
+    },
+    "arest": {
+        "domain": "arest",
+        "name": "Arest",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "arlo": {
+        "domain": "arlo",
+        "name": "Arlo",
+        "requirements": ["pyarlo==0.2.3"],
+        "dependencies": ["ffmpeg"],
+    },
+    "aruba": {
+        "domain": "aruba",
+        "name": "Aruba",
+        "requirements": ["pexpect==4.6.0"],
+        "dependencies": [],
+    },
+    "arwn": {
+        "domain": "arwn",
+        "name": "Arwn",
+        "requirements": [],
+        "dependencies": ["mqtt"],
+    },
+    "asterisk_cdr": {
+        "domain": "asterisk_cdr",
+        "name": "Asterisk cdr",
+        "requirements": [],
+        "dependencies": ["asterisk_mbox"],
+    },
+    "asterisk_mbox": {
+        "domain": "asterisk_mbox",
+        "name": "Asterisk mbox",
+        "requirements": ["asterisk_mbox==0.5.0"],
+        "dependencies": [],
+    },
+    "asuswrt": {
+        "domain": "asuswrt",
+        "name": "Asuswrt",
+        "requirements": ["aioasuswrt==1.1.21"],
+        "dependencies": [],
+    },
+    "atome": {
+        "domain": "atome",
+        "name": "Atome",
+        "requirements": ["pyatome==0.1.1"],
+        "dependencies": [],
+    },
+    "august": {
+        "domain": "august",
+        "name": "August",
+        "requirements": ["py-august==0.7.0"],
+        "dependencies": ["configurator"],
+    },
+    "aurora": {
+        "domain": "aurora",
+        "name": "Aurora",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "aurora_abb_powerone": {
+        "domain": "aurora_abb_powerone",
+        "name": "Aurora ABB Solar PV",
+        "requirements": ["aurorapy==0.2.6"],
+        "dependencies": [],
+    },
+    "auth": {
+        "domain": "auth",
+        "name": "Auth",
+        "requirements": [],
+        "dependencies": ["http"],
+    },
+    "automatic": {
+        "domain": "automatic",
+        "name": "Automatic",
+        "requirements": ["aioautomatic==0.6.5"],
+        "dependencies": ["configurator", "http"],
+    },
+    "automation": {
+        "domain": "automation",
+        "name": "Automation",
+        "requirements": [],
+        "dependencies": ["device_automation", "group", "webhook"],
+    },
+    "avea": {
+        "domain": "avea",
+        "name": "Elgato Avea",
+        "requirements": ["avea==1.2.8"],
+        "dependencies": [],
+    },
+    "avion": {
+        "domain": "avion",
+        "name": "Avion",
+        "requirements": ["avion==0.10"],
+        "dependencies": [],
+    },
+    "awair": {
+        "domain": "awair",
+        "name": "Awair",
+        "requirements": ["python_awair==0.0.4"],
+        "dependencies": [],
+    },
+    "aws": {
+        "domain": "aws",
+        "name": "Aws",
+        "requirements": ["aiobotocore==0.10.2"],
+        "dependencies": [],
+    },
+    "axis": {
+        "domain": "axis",
+        "name": "Axis",
+        "config_flow": True,
+        "requirements": ["axis==25"],
+        "dependencies": [],
+    },
+    "azure_event_hub": {
+        "domain": "azure_event_hub",
+        "name": "Azure Event Hub",
+        "requirements": ["azure-eventhub==1.3.1"],
+        "dependencies": [],
+    },
+    "baidu": {
+        "domain": "baidu",
+        "name": "Baidu",
+        "requirements": ["baidu-aip==1.6.6"],
+        "dependencies": [],
+    },
+    "bayesian": {
+        "domain": "bayesian",
+        "name": "Bayesian",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "bbb_gpio": {
+        "domain": "bbb_gpio",
+        "name": "Bbb gpio",
+        "requirements": ["Adafruit_BBIO==1.0.0"],
+        "dependencies": [],
+    },
+    "bbox": {
+        "domain": "bbox",
+        "name": "Bbox",
+        "requirements": ["pybbox==0.0.5-alpha"],
+        "dependencies": [],
+    },
+    "beewi_smartclim": {
+        "domain": "beewi_smartclim",
+        "name": "BeeWi SmartClim BLE sensor",
+        "requirements": ["beewi_smartclim==0.0.7"],
+        "dependencies": [],
+    },
+    "bh1750": {
+        "domain": "bh1750",
+        "name": "Bh1750",
+        "requirements": ["i2csense==0.0.4", "smbus-cffi==0.5.1"],
+        "dependencies": [],
+    },
+    "binary_sensor": {
+        "domain": "binary_sensor",
+        "name": "Binary sensor",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "bitcoin": {
+        "domain": "bitcoin",
+        "name": "Bitcoin",
+        "requirements": ["blockchain==1.4.4"],
+        "dependencies": [],
+    },
+    "bizkaibus": {
+        "domain": "bizkaibus",
+        "name": "Bizkaibus",
+        "requirements": ["bizkaibus==0.1.1"],
+        "dependencies": [],
+    },
+    "blackbird": {
+        "domain": "blackbird",
+        "name": "Blackbird",
+        "requirements": ["pyblackbird==0.5"],
+        "dependencies": [],
+    },
+    "blink": {
+        "domain": "blink",
+        "name": "Blink",
+        "requirements": ["blinkpy==0.14.2"],
+        "dependencies": [],
+    },
+    "blinksticklight": {
+        "domain": "blinksticklight",
+        "name": "Blinksticklight",
+        "requirements": ["blinkstick==1.1.8"],
+        "dependencies": [],
+    },
+    "blinkt": {
+        "domain": "blinkt",
+        "name": "Blinkt",
+        "requirements": ["blinkt==0.1.0"],
+        "dependencies": [],
+    },
+    "blockchain": {
+        "domain": "blockchain",
+        "name": "Blockchain",
+        "requirements": ["python-blockchain-api==0.0.2"],
+        "dependencies": [],
+    },
+    "bloomsky": {
+        "domain": "bloomsky",
+        "name": "Bloomsky",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "bluesound": {
+        "domain": "bluesound",
+        "name": "Bluesound",
+        "requirements": ["xmltodict==0.12.0"],
+        "dependencies": [],
+    },
+    "bluetooth_le_tracker": {
+        "domain": "bluetooth_le_tracker",
+        "name": "Bluetooth le tracker",
+        "requirements": ["pygatt[GATTTOOL]==4.0.5"],
+        "dependencies": [],
+    },
+    "bluetooth_tracker": {
+        "domain": "bluetooth_tracker",
+        "name": "Bluetooth tracker",
+        "requirements": ["bt_proximity==0.2", "pybluez==0.22"],
+        "dependencies": [],
+    },
+    "bme280": {
+        "domain": "bme280",
+        "name": "Bme280",
+        "requirements": ["i2csense==0.0.4", "smbus-cffi==0.5.1"],
+        "dependencies": [],
+    },
+    "bme680": {
+        "domain": "bme680",
+        "name": "Bme680",
+        "requirements": ["bme680==1.0.5", "smbus-cffi==0.5.1"],
+        "dependencies": [],
+    },
+    "bmw_connected_drive": {
+        "domain": "bmw_connected_drive",
+        "name": "BMW Connected Drive",
+        "requirements": ["bimmer_connected==0.6.0"],
+        "dependencies": [],
+    },
+    "bom": {
+        "domain": "bom",
+        "name": "Bom",
+        "requirements": ["bomradarloop==0.1.3"],
+        "dependencies": [],
+    },
+    "braviatv": {
+        "domain": "braviatv",
+        "name": "Braviatv",
+        "requirements": ["braviarc-homeassistant==0.3.7.dev0", "getmac==0.8.1"],
+        "dependencies": ["configurator"],
+    },
+    "broadlink": {
+        "domain": "broadlink",
+        "name": "Broadlink",
+        "requirements": ["broadlink==0.12.0"],
+        "dependencies": [],
+    },
+    "brottsplatskartan": {
+        "domain": "brottsplatskartan",
+        "name": "Brottsplatskartan",
+        "requirements": ["brottsplatskartan==0.0.1"],
+        "dependencies": [],
+    },
+    "browser": {
+        "domain": "browser",
+        "name": "Browser",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "brunt": {
+        "domain": "brunt",
+        "name": "Brunt",
+        "requirements": ["brunt==0.1.3"],
+        "dependencies": [],
+    },
+    "bt_home_hub_5": {
+        "domain": "bt_home_hub_5",
+        "name": "Bt home hub 5",
+        "requirements": ["bthomehub5-devicelist==0.1.1"],
+        "dependencies": [],
+    },
+    "bt_smarthub": {
+        "domain": "bt_smarthub",
+        "name": "Bt smarthub",
+        "requirements": ["btsmarthub_devicelist==0.1.3"],
+        "dependencies": [],
+    },
+    "buienradar": {
+        "domain": "buienradar",
+        "name": "Buienradar",
+        "requirements": ["buienradar==1.0.1"],
+        "dependencies": [],
+    },
+    "caldav": {
+        "domain": "caldav",
+        "name": "Caldav",
+        "requirements": ["caldav==0.6.1"],
+        "dependencies": [],
+    },
+    "calendar": {
+        "domain": "calendar",
+        "name": "Calendar",
+        "requirements": [],
+        "dependencies": ["http"],
+    },
+    "camera": {
+        "domain": "camera",
+        "name": "Camera",
+        "requirements": [],
+        "dependencies": ["http"],
+        "after_dependencies": ["stream"],
+    },
+    "canary": {
+        "domain": "canary",
+        "name": "Canary",
+        "requirements": ["py-canary==0.5.0"],
+        "dependencies": ["ffmpeg"],
+    },
+    "cast": {
+        "domain": "cast",
+        "name": "Cast",
+        "config_flow": True,
+        "requirements": ["pychromecast==4.0.1"],
+        "dependencies": [],
+    },
+    "cert_expiry": {
+        "domain": "cert_expiry",
+        "name": "Cert expiry",
+        "config_flow": True,
+        "requirements": [],
+        "dependencies": [],
+    },
+    "channels": {
+        "domain": "channels",
+        "name": "Channels",
+        "requirements": ["pychannels==1.0.0"],
+        "dependencies": [],
+    },
+    "cisco_ios": {
+        "domain": "cisco_ios",
+        "name": "Cisco ios",
+        "requirements": ["pexpect==4.6.0"],
+        "dependencies": [],
+    },
+    "cisco_mobility_express": {
+        "domain": "cisco_mobility_express",
+        "name": "Cisco mobility express",
+        "requirements": ["ciscomobilityexpress==0.3.3"],
+        "dependencies": [],
+    },
+    "cisco_webex_teams": {
+        "domain": "cisco_webex_teams",
+        "name": "Cisco webex teams",
+        "requirements": ["webexteamssdk==1.1.1"],
+        "dependencies": [],
+    },
+    "ciscospark": {
+        "domain": "ciscospark",
+        "name": "Ciscospark",
+        "requirements": ["ciscosparkapi==0.4.2"],
+        "dependencies": [],
+    },
+    "citybikes": {
+        "domain": "citybikes",
+        "name": "Citybikes",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "clementine": {
+        "domain": "clementine",
+        "name": "Clementine",
+        "requirements": ["python-clementine-remote==1.0.1"],
+        "dependencies": [],
+    },
+    "clickatell": {
+        "domain": "clickatell",
+        "name": "Clickatell",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "clicksend": {
+        "domain": "clicksend",
+        "name": "Clicksend",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "clicksend_tts": {
+        "domain": "clicksend_tts",
+        "name": "Clicksend tts",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "climate": {
+        "domain": "climate",
+        "name": "Climate",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "cloud": {
+        "domain": "cloud",
+        "name": "Cloud",
+        "requirements": ["hass-nabucasa==0.22"],
+        "dependencies": ["http", "webhook"],
+    },
+    "cloudflare": {
+        "domain": "cloudflare",
+        "name": "Cloudflare",
+        "requirements": ["pycfdns==0.0.1"],
+        "dependencies": [],
+    },
+    "cmus": {
+        "domain": "cmus",
+        "name": "Cmus",
+        "requirements": ["pycmus==0.1.1"],
+        "dependencies": [],
+    },
+    "co2signal": {
+        "domain": "co2signal",
+        "name": "Co2signal",
+        "requirements": ["co2signal==0.4.2"],
+        "dependencies": [],
+    },
+    "coinbase": {
+        "domain": "coinbase",
+        "name": "Coinbase",
+        "requirements": ["coinbase==2.1.0"],
+        "dependencies": [],
+    },
+    "coinmarketcap": {
+        "domain": "coinmarketcap",
+        "name": "Coinmarketcap",
+        "requirements": ["coinmarketcap==5.0.3"],
+        "dependencies": [],
+    },
+    "comed_hourly_pricing": {
+        "domain": "comed_hourly_pricing",
+        "name": "Comed hourly pricing",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "comfoconnect": {
+        "domain": "comfoconnect",
+        "name": "Comfoconnect",
+        "requirements": ["pycomfoconnect==0.3"],
+        "dependencies": [],
+    },
+    "command_line": {
+        "domain": "command_line",
+        "name": "Command line",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "concord232": {
+        "domain": "concord232",
+        "name": "Concord232",
+        "requirements": ["concord232==0.15"],
+        "dependencies": [],
+    },
+    "config": {
+        "domain": "config",
+        "name": "Config",
+        "requirements": [],
+        "dependencies": ["http"],
+    },
+    "configurator": {
+        "domain": "configurator",
+        "name": "Configurator",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "conversation": {
+        "domain": "conversation",
+        "name": "Conversation",
+        "requirements": [],
+        "dependencies": ["http"],
+    },
+    "coolmaster": {
+        "domain": "coolmaster",
+        "name": "Coolmaster",
+        "requirements": ["pycoolmasternet==0.0.4"],
+        "dependencies": [],
+    },
+    "counter": {
+        "domain": "counter",
+        "name": "Counter",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "cover": {
+        "domain": "cover",
+        "name": "Cover",
+        "requirements": [],
+        "dependencies": ["group"],
+    },
+    "cppm_tracker": {
+        "domain": "cppm_tracker",
+        "name": "Cppm tracker",
+        "requirements": ["clearpasspy==1.0.2"],
+        "dependencies": [],
+    },
+    "cpuspeed": {
+        "domain": "cpuspeed",
+        "name": "Cpuspeed",
+        "requirements": ["py-cpuinfo==5.0.0"],
+        "dependencies": [],
+    },
+    "crimereports": {
+        "domain": "crimereports",
+        "name": "Crimereports",
+        "requirements": ["crimereports==1.0.1"],
+        "dependencies": [],
+    },
+    "cups": {
+        "domain": "cups",
+        "name": "Cups",
+        "requirements": ["pycups==1.9.73"],
+        "dependencies": [],
+    },
+    "currencylayer": {
+        "domain": "currencylayer",
+        "name": "Currencylayer",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "daikin": {
+        "domain": "daikin",
+        "name": "Daikin",
+        "config_flow": True,
+        "requirements": ["pydaikin==1.6.1"],
+        "dependencies": [],
+    },
+    "danfoss_air": {
+        "domain": "danfoss_air",
+        "name": "Danfoss air",
+        "requirements": ["pydanfossair==0.1.0"],
+        "dependencies": [],
+    },
+    "darksky": {
+        "domain": "darksky",
+        "name": "Darksky",
+        "requirements": ["python-forecastio==1.4.0"],
+        "dependencies": [],
+    },
+    "datadog": {
+        "domain": "datadog",
+        "name": "Datadog",
+        "requirements": ["datadog==0.15.0"],
+        "dependencies": [],
+    },
+    "ddwrt": {
+        "domain": "ddwrt",
+        "name": "Ddwrt",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "deconz": {
+        "domain": "deconz",
+        "name": "Deconz",
+        "config_flow": True,
+        "requirements": ["pydeconz==64"],
+        "dependencies": [],
+    },
+    "decora": {
+        "domain": "decora",
+        "name": "Decora",
+        "requirements": ["bluepy==1.1.4", "decora==0.6"],
+        "dependencies": [],
+    },
+    "decora_wifi": {
+        "domain": "decora_wifi",
+        "name": "Decora wifi",
+        "requirements": ["decora_wifi==1.4"],
+        "dependencies": [],
+    },
+    "default_config": {
+        "domain": "default_config",
+        "name": "Default config",
+        "requirements": [],
+        "dependencies": ["automation", "cloud", "config", "frontend", "history", "logbook", "map", "mobile_app", "person", "script", "ssdp", "sun", "system_health", "updater", "zeroconf"],
+    },
+    "delijn": {
+        "domain": "delijn",
+        "name": "De Lijn",
+        "requirements": ["pydelijn==0.5.1"],
+        "dependencies": [],
+    },
+    "deluge": {
+        "domain": "deluge",
+        "name": "Deluge",
+        "requirements": ["deluge-client==1.7.1"],
+        "dependencies": [],
+    },
+    "demo": {
+        "domain": "demo",
+        "name": "Demo",
+        "requirements": [],
+        "dependencies": ["conversation", "zone", "group", "configurator"],
+    },
+    "denon": {
+        "domain": "denon",
+        "name": "Denon",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "denonavr": {
+        "domain": "denonavr",
+        "name": "Denonavr",
+        "requirements": ["denonavr==0.7.10"],
+        "dependencies": [],
+    },
+    "deutsche_bahn": {
+        "domain": "deutsche_bahn",
+        "name": "Deutsche bahn",
+        "requirements": ["schiene==0.23"],
+        "dependencies": [],
+    },
+    "device_automation": {
+        "domain": "device_automation",
+        "name": "Device automation",
+        "requirements": [],
+        "dependencies": ["webhook"],
+    },
+    "device_sun_light_trigger": {
+        "domain": "device_sun_light_trigger",
+        "name": "Device sun light trigger",
+        "requirements": [],
+        "dependencies": ["device_tracker", "group", "light", "person"],
+    },
+    "device_tracker": {
+        "domain": "device_tracker",
+        "name": "Device tracker",
+        "requirements": [],
+        "dependencies": ["group", "zone"],
+    },
+    "dht": {
+        "domain": "dht",
+        "name": "Dht",
+        "requirements": ["Adafruit-DHT==1.4.0"],
+        "dependencies": [],
+    },
+    "dialogflow": {
+        "domain": "dialogflow",
+        "name": "Dialogflow",
+        "config_flow": True,
+        "requirements": [],
+        "dependencies": ["webhook"],
+    },
+    "digital_ocean": {
+        "domain": "digital_ocean",
+        "name": "Digital ocean",
+        "requirements": ["python-digitalocean==1.13.2"],
+        "dependencies": [],
+    },
+    "digitalloggers": {
+        "domain": "digitalloggers",
+        "name": "Digitalloggers",
+        "requirements": ["dlipower==0.7.165"],
+        "dependencies": [],
+    },
+    "directv": {
+        "domain": "directv",
+        "name": "Directv",
+        "requirements": ["directpy==0.5"],
+        "dependencies": [],
+    },
+    "discogs": {
+        "domain": "discogs",
+        "name": "Discogs",
+        "requirements": ["discogs_client==2.2.1"],
+        "dependencies": [],
+    },
+    "discord": {
+        "domain": "discord",
+        "name": "Discord",
+        "requirements": ["discord.py==1.2.3"],
+        "dependencies": [],
+    },
+    "discovery": {
+        "domain": "discovery",
+        "name": "Discovery",
+        "requirements": ["netdisco==2.6.0"],
+        "dependencies": [],
+    },
+    "dlib_face_detect": {
+        "domain": "dlib_face_detect",
+        "name": "Dlib face detect",
+        "requirements": ["face_recognition==1.2.3"],
+        "dependencies": [],
+    },
+    "dlib_face_identify": {
+        "domain": "dlib_face_identify",
+        "name": "Dlib face identify",
+        "requirements": ["face_recognition==1.2.3"],
+        "dependencies": [],
+    },
+    "dlink": {
+        "domain": "dlink",
+        "name": "Dlink",
+        "requirements": ["pyW215==0.6.0"],
+        "dependencies": [],
+    },
+    "dlna_dmr": {
+        "domain": "dlna_dmr",
+        "name": "Dlna dmr",
+        "requirements": ["async-upnp-client==0.14.11"],
+        "dependencies": [],
+    },
+    "dnsip": {
+        "domain": "dnsip",
+        "name": "Dnsip",
+        "requirements": ["aiodns==2.0.0"],
+        "dependencies": [],
+    },
+    "dominos": {
+        "domain": "dominos",
+        "name": "Dominos",
+        "requirements": ["pizzapi==0.0.3"],
+        "dependencies": ["http"],
+    },
+    "doods": {
+        "domain": "doods",
+        "name": "DOODS - Distributed Outside Object Detection Service",
+        "requirements": ["pydoods==1.0.2"],
+        "dependencies": [],
+    },
+    "doorbird": {
+        "domain": "doorbird",
+        "name": "Doorbird",
+        "requirements": ["doorbirdpy==2.0.8"],
+        "dependencies": [],
+    },
+    "dovado": {
+        "domain": "dovado",
+        "name": "Dovado",
+        "requirements": ["dovado==0.4.1"],
+        "dependencies": [],
+    },
+    "downloader": {
+        "domain": "downloader",
+        "name": "Downloader",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "dsmr": {
+        "domain": "dsmr",
+        "name": "Dsmr",
+        "requirements": ["dsmr_parser==0.12"],
+        "dependencies": [],
+    },
+    "dte_energy_bridge": {
+        "domain": "dte_energy_bridge",
+        "name": "Dte energy bridge",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "dublin_bus_transport": {
+        "domain": "dublin_bus_transport",
+        "name": "Dublin bus transport",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "duckdns": {
+        "domain": "duckdns",
+        "name": "Duckdns",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "duke_energy": {
+        "domain": "duke_energy",
+        "name": "Duke energy",
+        "requirements": ["pydukeenergy==0.0.6"],
+        "dependencies": [],
+    },
+    "dunehd": {
+        "domain": "dunehd",
+        "name": "Dunehd",
+        "requirements": ["pdunehd==1.3"],
+        "dependencies": [],
+    },
+    "dwd_weather_warnings": {
+        "domain": "dwd_weather_warnings",
+        "name": "Dwd weather warnings",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "dweet": {
+        "domain": "dweet",
+        "name": "Dweet",
+        "requirements": ["dweepy==0.3.0"],
+        "dependencies": [],
+    },
+    "dyson": {
+        "domain": "dyson",
+        "name": "Dyson",
+        "requirements": ["libpurecool==0.5.0"],
+        "dependencies": [],
+    },
+    "ebox": {
+        "domain": "ebox",
+        "name": "Ebox",
+        "requirements": ["pyebox==1.1.4"],
+        "dependencies": [],
+    },
+    "ebusd": {
+        "domain": "ebusd",
+        "name": "Ebusd",
+        "requirements": ["ebusdpy==0.0.16"],
+        "dependencies": [],
+    },
+    "ecoal_boiler": {
+        "domain": "ecoal_boiler",
+        "name": "Ecoal boiler",
+        "requirements": ["ecoaliface==0.4.0"],
+        "dependencies": [],
+    },
+    "ecobee": {
+        "domain": "ecobee",
+        "name": "Ecobee",
+        "config_flow": True,
+        "requirements": ["python-ecobee-api==0.1.4"],
+        "dependencies": [],
+    },
+    "econet": {
+        "domain": "econet",
+        "name": "Econet",
+        "requirements": ["pyeconet==0.0.11"],
+        "dependencies": [],
+    },
+    "ecovacs": {
+        "domain": "ecovacs",
+        "name": "Ecovacs",
+        "requirements": ["sucks==0.9.4"],
+        "dependencies": [],
+    },
+    "eddystone_temperature": {
+        "domain": "eddystone_temperature",
+        "name": "Eddystone temperature",
+        "requirements": ["beacontools[scan]==1.2.3", "construct==2.9.45"],
+        "dependencies": [],
+    },
+    "edimax": {
+        "domain": "edimax",
+        "name": "Edimax",
+        "requirements": ["pyedimax==0.1"],
+        "dependencies": [],
+    },
+    "ee_brightbox": {
+        "domain": "ee_brightbox",
+        "name": "Ee brightbox",
+        "requirements": ["eebrightbox==0.0.4"],
+        "dependencies": [],
+    },
+    "efergy": {
+        "domain": "efergy",
+        "name": "Efergy",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "egardia": {
+        "domain": "egardia",
+        "name": "Egardia",
+        "requirements": ["pythonegardia==1.0.40"],
+        "dependencies": [],
+    },
+    "eight_sleep": {
+        "domain": "eight_sleep",
+        "name": "Eight sleep",
+        "requirements": ["pyeight==0.1.1"],
+        "dependencies": [],
+    },
+    "eliqonline": {
+        "domain": "eliqonline",
+        "name": "Eliqonline",
+        "requirements": ["eliqonline==1.2.2"],
+        "dependencies": [],
+    },
+    "elkm1": {
+        "domain": "elkm1",
+        "name": "Elkm1",
+        "requirements": ["elkm1-lib==0.7.15"],
+        "dependencies": [],
+    },
+    "elv": {
+        "domain": "elv",
+        "name": "ELV PCA",
+        "requirements": ["pypca==0.0.5"],
+        "dependencies": [],
+    },
+    "emby": {
+        "domain": "emby",
+        "name": "Emby",
+        "requirements": ["pyemby==1.6"],
+        "dependencies": [],
+    },
+    "emoncms": {
+        "domain": "emoncms",
+        "name": "Emoncms",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "emoncms_history": {
+        "domain": "emoncms_history",
+        "name": "Emoncms history",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "emulated_hue": {
+        "domain": "emulated_hue",
+        "name": "Emulated hue",
+        "requirements": ["aiohttp_cors==0.7.0"],
+        "dependencies": [],
+    },
+    "emulated_roku": {
+        "domain": "emulated_roku",
+        "name": "Emulated roku",
+        "config_flow": True,
+        "requirements": ["emulated_roku==0.1.8"],
+        "dependencies": [],
+    },
+    "enigma2": {
+        "domain": "enigma2",
+        "name": "Enigma2",
+        "requirements": ["openwebifpy==3.1.1"],
+        "dependencies": [],
+    },
+    "enocean": {
+        "domain": "enocean",
+        "name": "Enocean",
+        "requirements": ["enocean==0.50"],
+        "dependencies": [],
+    },
+    "enphase_envoy": {
+        "domain": "enphase_envoy",
+        "name": "Enphase envoy",
+        "requirements": ["envoy_reader==0.8.6"],
+        "dependencies": [],
+    },
+    "entur_public_transport": {
+        "domain": "entur_public_transport",
+        "name": "Entur public transport",
+        "requirements": ["enturclient==0.2.0"],
+        "dependencies": [],
+    },
+    "environment_canada": {
+        "domain": "environment_canada",
+        "name": "Environment Canada",
+        "requirements": ["env_canada==0.0.25"],
+        "dependencies": [],
+    },
+    "envirophat": {
+        "domain": "envirophat",
+        "name": "Envirophat",
+        "requirements": ["envirophat==0.0.6", "smbus-cffi==0.5.1"],
+        "dependencies": [],
+    },
+    "envisalink": {
+        "domain": "envisalink",
+        "name": "Envisalink",
+        "requirements": ["pyenvisalink==4.0"],
+        "dependencies": [],
+    },
+    "ephember": {
+        "domain": "ephember",
+        "name": "Ephember",
+        "requirements": ["pyephember==0.2.0"],
+        "dependencies": [],
+    },
+    "epson": {
+        "domain": "epson",
+        "name": "Epson",
+        "requirements": ["epson-projector==0.1.3"],
+        "dependencies": [],
+    },
+    "epsonworkforce": {
+        "domain": "epsonworkforce",
+        "name": "Epson Workforce",
+        "requirements": ["epsonprinter==0.0.9"],
+        "dependencies": [],
+    },
+    "eq3btsmart": {
+        "domain": "eq3btsmart",
+        "name": "Eq3btsmart",
+        "requirements": ["construct==2.9.45", "python-eq3bt==0.1.9"],
+        "dependencies": [],
+    },
+    "esphome": {
+        "domain": "esphome",
+        "name": "ESPHome",
+        "config_flow": True,
+        "requirements": ["aioesphomeapi==2.2.0"],
+        "dependencies": [],
+    },
+    "essent": {
+        "domain": "essent",
+        "name": "Essent",
+        "requirements": ["PyEssent==0.13"],
+        "dependencies": [],
+    },
+    "etherscan": {
+        "domain": "etherscan",
+        "name": "Etherscan",
+        "requirements": ["python-etherscan-api==0.0.3"],
+        "dependencies": [],
+    },
+    "eufy": {
+        "domain": "eufy",
+        "name": "Eufy",
+        "requirements": ["lakeside==0.12"],
+        "dependencies": [],
+    },
+    "everlights": {
+        "domain": "everlights",
+        "name": "Everlights",
+        "requirements": ["pyeverlights==0.1.0"],
+        "dependencies": [],
+    },
+    "evohome": {
+        "domain": "evohome",
+        "name": "Evohome",
+        "requirements": ["evohome-async==0.3.3b5"],
+        "dependencies": [],
+    },
+    "facebook": {
+        "domain": "facebook",
+        "name": "Facebook",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "facebox": {
+        "domain": "facebox",
+        "name": "Facebox",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "fail2ban": {
+        "domain": "fail2ban",
+        "name": "Fail2ban",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "familyhub": {
+        "domain": "familyhub",
+        "name": "Familyhub",
+        "requirements": ["python-family-hub-local==0.0.2"],
+        "dependencies": [],
+    },
+    "fan": {
+        "domain": "fan",
+        "name": "Fan",
+        "requirements": [],
+        "dependencies": ["group"],
+    },
+    "fastdotcom": {
+        "domain": "fastdotcom",
+        "name": "Fastdotcom",
+        "requirements": ["fastdotcom==0.0.3"],
+        "dependencies": [],
+    },
+    "feedreader": {
+        "domain": "feedreader",
+        "name": "Feedreader",
+        "requirements": ["feedparser-homeassistant==5.2.2.dev1"],
+        "dependencies": [],
+    },
+    "ffmpeg": {
+        "domain": "ffmpeg",
+        "name": "Ffmpeg",
+        "requirements": ["ha-ffmpeg==2.0"],
+        "dependencies": [],
+    },
+    "ffmpeg_motion": {
+        "domain": "ffmpeg_motion",
+        "name": "Ffmpeg motion",
+        "requirements": [],
+        "dependencies": ["ffmpeg"],
+    },
+    "ffmpeg_noise": {
+        "domain": "ffmpeg_noise",
+        "name": "Ffmpeg noise",
+        "requirements": [],
+        "dependencies": ["ffmpeg"],
+    },
+    "fibaro": {
+        "domain": "fibaro",
+        "name": "Fibaro",
+        "requirements": ["fiblary3==0.1.7"],
+        "dependencies": [],
+    },
+    "fido": {
+        "domain": "fido",
+        "name": "Fido",
+        "requirements": ["pyfido==2.1.1"],
+        "dependencies": [],
+    },
+    "file": {
+        "domain": "file",
+        "name": "File",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "filesize": {
+        "domain": "filesize",
+        "name": "Filesize",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "filter": {
+        "domain": "filter",
+        "name": "Filter",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "fints": {
+        "domain": "fints",
+        "name": "Fints",
+        "requirements": ["fints==1.0.1"],
+        "dependencies": [],
+    },
+    "fitbit": {
+        "domain": "fitbit",
+        "name": "Fitbit",
+        "requirements": ["fitbit==0.3.1"],
+        "dependencies": ["configurator", "http"],
+    },
+    "fixer": {
+        "domain": "fixer",
+        "name": "Fixer",
+        "requirements": ["fixerio==1.0.0a0"],
+        "dependencies": [],
+    },
+    "fleetgo": {
+        "domain": "fleetgo",
+        "name": "FleetGO",
+        "requirements": ["ritassist==0.9.2"],
+        "dependencies": [],
+    },
+    "flexit": {
+        "domain": "flexit",
+        "name": "Flexit",
+        "requirements": ["pyflexit==0.3"],
+        "dependencies": ["modbus"],
+    },
+    "flic": {
+        "domain": "flic",
+        "name": "Flic",
+        "requirements": ["pyflic-homeassistant==0.4.dev0"],
+        "dependencies": [],
+    },
+    "flock": {
+        "domain": "flock",
+        "name": "Flock",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "flunearyou": {
+        "domain": "flunearyou",
+        "name": "Flunearyou",
+        "requirements": ["pyflunearyou==1.0.3"],
+        "dependencies": [],
+    },
+    "flux": {
+        "domain": "flux",
+        "name": "Flux",
+        "requirements": [],
+        "dependencies": [],
+        "after_dependencies": ["light"],
+    },
+    "flux_led": {
+        "domain": "flux_led",
+        "name": "Flux led",
+        "requirements": ["flux_led==0.22"],
+        "dependencies": [],
+    },
+    "folder": {
+        "domain": "folder",
+        "name": "Folder",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "folder_watcher": {
+        "domain": "folder_watcher",
+        "name": "Folder watcher",
+        "requirements": ["watchdog==0.8.3"],
+        "dependencies": [],
+    },
+    "foobot": {
+        "domain": "foobot",
+        "name": "Foobot",
+        "requirements": ["foobot_async==0.3.1"],
+        "dependencies": [],
+    },
+    "fortigate": {
+        "domain": "fortigate",
+        "name": "Fortigate",
+        "requirements": ["pyfgt==0.5.1"],
+        "dependencies": [],
+    },
+    "fortios": {
+        "domain": "fortios",
+        "name": "Home Assistant Device Tracker to support FortiOS",
+        "requirements": ["fortiosapi==0.10.8"],
+        "dependencies": [],
+    },
+    "foscam": {
+        "domain": "foscam",
+        "name": "Foscam",
+        "requirements": ["libpyfoscam==1.0"],
+        "dependencies": [],
+    },
+    "foursquare": {
+        "domain": "foursquare",
+        "name": "Foursquare",
+        "requirements": [],
+        "dependencies": ["http"],
+    },
+    "free_mobile": {
+        "domain": "free_mobile",
+        "name": "Free mobile",
+        "requirements": ["freesms==0.1.2"],
+        "dependencies": [],
+    },
+    "freebox": {
+        "domain": "freebox",
+        "name": "Freebox",
+        "requirements": ["aiofreepybox==0.0.8"],
+        "dependencies": [],
+    },
+    "freedns": {
+        "domain": "freedns",
+        "name": "Freedns",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "fritz": {
+        "domain": "fritz",
+        "name": "Fritz",
+        "requirements": ["fritzconnection==0.8.4"],
+        "dependencies": [],
+    },
+    "fritzbox": {
+        "domain": "fritzbox",
+        "name": "Fritzbox",
+        "requirements": ["pyfritzhome==0.4.0"],
+        "dependencies": [],
+    },
+    "fritzbox_callmonitor": {
+        "domain": "fritzbox_callmonitor",
+        "name": "Fritzbox callmonitor",
+        "requirements": ["fritzconnection==0.8.4"],
+        "dependencies": [],
+    },
+    "fritzbox_netmonitor": {
+        "domain": "fritzbox_netmonitor",
+        "name": "Fritzbox netmonitor",
+        "requirements": ["fritzconnection==0.8.4"],
+        "dependencies": [],
+    },
+    "fritzdect": {
+        "domain": "fritzdect",
+        "name": "Fritzdect",
+        "requirements": ["fritzhome==1.0.4"],
+        "dependencies": [],
+    },
+    "fronius": {
+        "domain": "fronius",
+        "name": "Fronius",
+        "requirements": ["pyfronius==0.4.6"],
+        "dependencies": [],
+    },
+    "frontend": {
+        "domain": "frontend",
+        "name": "Home Assistant Frontend",
+        "requirements": ["home-assistant-frontend==20191014.0"],
+        "dependencies": ["api", "auth", "http", "lovelace", "onboarding", "system_log", "websocket_api"],
+    },
+    "frontier_silicon": {
+        "domain": "frontier_silicon",
+        "name": "Frontier silicon",
+        "requirements": ["afsapi==0.0.4"],
+        "dependencies": [],
+    },
+    "futurenow": {
+        "domain": "futurenow",
+        "name": "Futurenow",
+        "requirements": ["pyfnip==0.2"],
+        "dependencies": [],
+    },
+    "garadget": {
+        "domain": "garadget",
+        "name": "Garadget",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "gc100": {
+        "domain": "gc100",
+        "name": "Gc100",
+        "requirements": ["python-gc100==1.0.3a"],
+        "dependencies": [],
+    },
+    "gearbest": {
+        "domain": "gearbest",
+        "name": "Gearbest",
+        "requirements": ["gearbest_parser==1.0.7"],
+        "dependencies": [],
+    },
+    "geizhals": {
+        "domain": "geizhals",
+        "name": "Geizhals",
+        "requirements": ["geizhals==0.0.9"],
+        "dependencies": [],
+    },
+    "generic": {
+        "domain": "generic",
+        "name": "Generic",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "generic_thermostat": {
+        "domain": "generic_thermostat",
+        "name": "Generic thermostat",
+        "requirements": [],
+        "dependencies": ["sensor", "switch"],
+    },
+    "geniushub": {
+        "domain": "geniushub",
+        "name": "Genius Hub",
+        "requirements": ["geniushub-client==0.6.28"],
+        "dependencies": [],
+    },
+    "geo_json_events": {
+        "domain": "geo_json_events",
+        "name": "Geo json events",
+        "requirements": ["geojson_client==0.4"],
+        "dependencies": [],
+    },
+    "geo_location": {
+        "domain": "geo_location",
+        "name": "Geo location",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "geo_rss_events": {
+        "domain": "geo_rss_events",
+        "name": "Geo RSS events",
+        "requirements": ["georss_generic_client==0.2"],
+        "dependencies": [],
+    },
+    "geofency": {
+        "domain": "geofency",
+        "name": "Geofency",
+        "config_flow": True,
+        "requirements": [],
+        "dependencies": ["webhook"],
+    },
+    "geonetnz_quakes": {
+        "domain": "geonetnz_quakes",
+        "name": "GeoNet NZ Quakes",
+        "config_flow": True,
+        "requirements": ["aio_geojson_geonetnz_quakes==0.10"],
+        "dependencies": [],
+    },
+    "github": {
+        "domain": "github",
+        "name": "Github",
+        "requirements": ["PyGithub==1.43.8"],
+        "dependencies": [],
+    },
+    "gitlab_ci": {
+        "domain": "gitlab_ci",
+        "name": "Gitlab ci",
+        "requirements": ["python-gitlab==1.6.0"],
+        "dependencies": [],
+    },
+    "gitter": {
+        "domain": "gitter",
+        "name": "Gitter",
+        "requirements": ["gitterpy==0.1.7"],
+        "dependencies": [],
+    },
+    "glances": {
+        "domain": "glances",
+        "name": "Glances",
+        "requirements": ["glances_api==0.2.0"],
+        "dependencies": [],
+    },
+    "gntp": {
+        "domain": "gntp",
+        "name": "Gntp",
+        "requirements": ["gntp==1.0.3"],
+        "dependencies": [],
+    },
+    "goalfeed": {
+        "domain": "goalfeed",
+        "name": "Goalfeed",
+        "requirements": ["pysher==1.0.1"],
+        "dependencies": [],
+    },
+    "gogogate2": {
+        "domain": "gogogate2",
+        "name": "Gogogate2",
+        "requirements": ["pygogogate2==0.1.1"],
+        "dependencies": [],
+    },
+    "google": {
+        "domain": "google",
+        "name": "Google",
+        "requirements": ["google-api-python-client==1.6.4", "httplib2==0.10.3", "oauth2client==4.0.0"],
+        "dependencies": [],
+    },
+    "google_assistant": {
+        "domain": "google_assistant",
+        "name": "Google assistant",
+        "requirements": [],
+        "dependencies": ["http"],
+    },
+    "google_cloud": {
+        "domain": "google_cloud",
+        "name": "Google Cloud Platform",
+        "requirements": ["google-cloud-texttospeech==0.4.0"],
+        "dependencies": [],
+    },
+    "google_domains": {
+        "domain": "google_domains",
+        "name": "Google domains",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "google_maps": {
+        "domain": "google_maps",
+        "name": "Google maps",
+        "requirements": ["locationsharinglib==4.1.0"],
+        "dependencies": [],
+    },
+    "google_pubsub": {
+        "domain": "google_pubsub",
+        "name": "Google pubsub",
+        "requirements": ["google-cloud-pubsub==0.39.1"],
+        "dependencies": [],
+    },
+    "google_translate": {
+        "domain": "google_translate",
+        "name": "Google Translate",
+        "requirements": ["gTTS-token==1.1.3"],
+        "dependencies": [],
+    },
+    "google_travel_time": {
+        "domain": "google_travel_time",
+        "name": "Google travel time",
+        "requirements": ["googlemaps==2.5.1"],
+        "dependencies": [],
+    },
+    "google_wifi": {
+        "domain": "google_wifi",
+        "name": "Google wifi",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "gpmdp": {
+        "domain": "gpmdp",
+        "name": "Gpmdp",
+        "requirements": ["websocket-client==0.54.0"],
+        "dependencies": ["configurator"],
+    },
+    "gpsd": {
+        "domain": "gpsd",
+        "name": "Gpsd",
+        "requirements": ["gps3==0.33.3"],
+        "dependencies": [],
+    },
+    "gpslogger": {
+        "domain": "gpslogger",
+        "name": "Gpslogger",
+        "config_flow": True,
+        "requirements": [],
+        "dependencies": ["webhook"],
+    },
+    "graphite": {
+        "domain": "graphite",
+        "name": "Graphite",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "greeneye_monitor": {
+        "domain": "greeneye_monitor",
+        "name": "Greeneye monitor",
+        "requirements": ["greeneye_monitor==1.0"],
+        "dependencies": [],
+    },
+    "greenwave": {
+        "domain": "greenwave",
+        "name": "Greenwave",
+        "requirements": ["greenwavereality==0.5.1"],
+        "dependencies": [],
+    },
+    "group": {
+        "domain": "group",
+        "name": "Group",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "growatt_server": {
+        "domain": "growatt_server",
+        "name": "Growatt Server",
+        "requirements": ["growattServer==0.0.1"],
+        "dependencies": [],
+    },
+    "gstreamer": {
+        "domain": "gstreamer",
+        "name": "Gstreamer",
+        "requirements": ["gstreamer-player==1.1.2"],
+        "dependencies": [],
+    },
+    "gtfs": {
+        "domain": "gtfs",
+        "name": "Gtfs",
+        "requirements": ["pygtfs==0.1.5"],
+        "dependencies": [],
+    },
+    "gtt": {
+        "domain": "gtt",
+        "name": "Gtt",
+        "requirements": ["pygtt==1.1.2"],
+        "dependencies": [],
+    },
+    "habitica": {
+        "domain": "habitica",
+        "name": "Habitica",
+        "requirements": ["habitipy==0.2.0"],
+        "dependencies": [],
+    },
+    "hangouts": {
+        "domain": "hangouts",
+        "name": "Hangouts",
+        "config_flow": True,
+        "requirements": ["hangups==0.4.9"],
+        "dependencies": [],
+    },
+    "harman_kardon_avr": {
+        "domain": "harman_kardon_avr",
+        "name": "Harman kardon avr",
+        "requirements": ["hkavr==0.0.5"],
+        "dependencies": [],
+    },
+    "harmony": {
+        "domain": "harmony",
+        "name": "Harmony",
+        "requirements": ["aioharmony==0.1.13"],
+        "dependencies": [],
+    },
+    "hassio": {
+        "domain": "hassio",
+        "name": "Hass.io",
+        "requirements": [],
+        "dependencies": ["http", "panel_custom"],
+    },
+    "haveibeenpwned": {
+        "domain": "haveibeenpwned",
+        "name": "Haveibeenpwned",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "hddtemp": {
+        "domain": "hddtemp",
+        "name": "Hddtemp",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "hdmi_cec": {
+        "domain": "hdmi_cec",
+        "name": "Hdmi cec",
+        "requirements": ["pyCEC==0.4.13"],
+        "dependencies": [],
+    },
+    "heatmiser": {
+        "domain": "heatmiser",
+        "name": "Heatmiser",
+        "requirements": ["heatmiserV3==0.9.1"],
+        "dependencies": [],
+    },
+    "heos": {
+        "domain": "heos",
+        "name": "HEOS",
+        "config_flow": True,
+        "requirements": ["pyheos==0.6.0"],
+        "dependencies": [],
+    },
+    "here_travel_time": {
+        "domain": "here_travel_time",
+        "name": "HERE travel time",
+        "requirements": ["herepy==0.6.3.1"],
+        "dependencies": [],
+    },
+    "hikvision": {
+        "domain": "hikvision",
+        "name": "Hikvision",
+        "requirements": ["pyhik==0.2.4"],
+        "dependencies": [],
+    },
+    "hikvisioncam": {
+        "domain": "hikvisioncam",
+        "name": "Hikvisioncam",
+        "requirements": ["hikvision==0.4"],
+        "dependencies": [],
+    },
+    "history": {
+        "domain": "history",
+        "name": "History",
+        "requirements": [],
+        "dependencies": ["http", "recorder"],
+    },
+    "history_graph": {
+        "domain": "history_graph",
+        "name": "History graph",
+        "requirements": [],
+        "dependencies": ["history"],
+    },
+    "history_stats": {
+        "domain": "history_stats",
+        "name": "History stats",
+        "requirements": [],
+        "dependencies": ["history"],
+    },
+    "hitron_coda": {
+        "domain": "hitron_coda",
+        "name": "Hitron coda",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "hive": {
+        "domain": "hive",
+        "name": "Hive",
+        "requirements": ["pyhiveapi==0.2.19.3"],
+        "dependencies": [],
+    },
+    "hlk_sw16": {
+        "domain": "hlk_sw16",
+        "name": "Hlk sw16",
+        "requirements": ["hlk-sw16==0.0.7"],
+        "dependencies": [],
+    },
+    "homeassistant": {
+        "domain": "homeassistant",
+        "name": "Home Assistant Core Integration",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "homekit": {
+        "domain": "homekit",
+        "name": "Homekit",
+        "requirements": ["HAP-python==2.6.0"],
+        "dependencies": [],
+    },
+    "homekit_controller": {
+        "domain": "homekit_controller",
+        "name": "Homekit controller",
+        "config_flow": True,
+        "requirements": ["homekit[IP]==0.15.0"],
+        "dependencies": [],
+    },
+    "homematic": {
+        "domain": "homematic",
+        "name": "Homematic",
+        "requirements": ["pyhomematic==0.1.61"],
+        "dependencies": [],
+    },
+    "homematicip_cloud": {
+        "domain": "homematicip_cloud",
+        "name": "Homematicip cloud",
+        "config_flow": True,
+        "requirements": ["homematicip==0.10.13"],
+        "dependencies": [],
+    },
+    "homeworks": {
+        "domain": "homeworks",
+        "name": "Homeworks",
+        "requirements": ["pyhomeworks==0.0.6"],
+        "dependencies": [],
+    },
+    "honeywell": {
+        "domain": "honeywell",
+        "name": "Honeywell",
+        "requirements": ["somecomfort==0.5.2"],
+        "dependencies": [],
+    },
+    "hook": {
+        "domain": "hook",
+        "name": "Hook",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "horizon": {
+        "domain": "horizon",
+        "name": "Horizon",
+        "requirements": ["horimote==0.4.1"],
+        "dependencies": [],
+    },
+    "hp_ilo": {
+        "domain": "hp_ilo",
+        "name": "Hp ilo",
+        "requirements": ["python-hpilo==4.3"],
+        "dependencies": [],
+    },
+    "html5": {
+        "domain": "html5",
+        "name": "HTML5 Notifications",
+        "requirements": ["pywebpush==1.9.2"],
+        "dependencies": ["frontend"],
+    },
+    "http": {
+        "domain": "http",
+        "name": "HTTP",
+        "requirements": ["aiohttp_cors==0.7.0"],
+        "dependencies": [],
+    },
+    "htu21d": {
+        "domain": "htu21d",
+        "name": "Htu21d",
+        "requirements": ["i2csense==0.0.4", "smbus-cffi==0.5.1"],
+        "dependencies": [],
+    },
+    "huawei_lte": {
+        "domain": "huawei_lte",
+        "name": "Huawei LTE",
+        "requirements": ["getmac==0.8.1", "huawei-lte-api==1.3.0"],
+        "dependencies": [],
+    },
+    "huawei_router": {
+        "domain": "huawei_router",
+        "name": "Huawei router",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "hue": {
+        "domain": "hue",
+        "name": "Philips Hue",
+        "config_flow": True,
+        "requirements": ["aiohue==1.9.2"],
+        "dependencies": [],
+    },
+    "hunterdouglas_powerview": {
+        "domain": "hunterdouglas_powerview",
+        "name": "Hunterdouglas powerview",
+        "requirements": ["aiopvapi==1.6.14"],
+        "dependencies": [],
+    },
+    "hydrawise": {
+        "domain": "hydrawise",
+        "name": "Hydrawise",
+        "requirements": ["hydrawiser==0.1.1"],
+        "dependencies": [],
+    },
+    "hyperion": {
+        "domain": "hyperion",
+        "name": "Hyperion",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "ialarm": {
+        "domain": "ialarm",
+        "name": "Ialarm",
+        "requirements": ["pyialarm==0.3"],
+        "dependencies": [],
+    },
+    "iaqualink": {
+        "domain": "iaqualink",
+        "name": "Jandy iAqualink",
+        "config_flow": True,
+        "requirements": ["iaqualink==0.2.9"],
+        "dependencies": [],
+    },
+    "icloud": {
+        "domain": "icloud",
+        "name": "Icloud",
+        "requirements": ["pyicloud==0.9.1"],
+        "dependencies": ["configurator"],
+    },
+    "idteck_prox": {
+        "domain": "idteck_prox",
+        "name": "Idteck prox",
+        "requirements": ["rfk101py==0.0.1"],
+        "dependencies": [],
+    },
+    "ifttt": {
+        "domain": "ifttt",
+        "name": "Ifttt",
+        "config_flow": True,
+        "requirements": ["pyfttt==0.3"],
+        "dependencies": ["webhook"],
+    },
+    "iglo": {
+        "domain": "iglo",
+        "name": "Iglo",
+        "requirements": ["iglo==1.2.7"],
+        "dependencies": [],
+    },
+    "ign_sismologia": {
+        "domain": "ign_sismologia",
+        "name": "IGN Sismologia",
+        "requirements": ["georss_ign_sismologia_client==0.2"],
+        "dependencies": [],
+    },
+    "ihc": {
+        "domain": "ihc",
+        "name": "Ihc",
+        "requirements": ["defusedxml==0.6.0", "ihcsdk==2.3.0"],
+        "dependencies": [],
+    },
+    "image_processing": {
+        "domain": "image_processing",
+        "name": "Image processing",
+        "requirements": ["pillow==6.2.0"],
+        "dependencies": ["camera"],
+    },
+    "imap": {
+        "domain": "imap",
+        "name": "Imap",
+        "requirements": ["aioimaplib==0.7.15"],
+        "dependencies": [],
+    },
+    "imap_email_content": {
+        "domain": "imap_email_content",
+        "name": "Imap email content",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "incomfort": {
+        "domain": "incomfort",
+        "name": "Intergas InComfort/Intouch Lan2RF gateway",
+        "requirements": ["incomfort-client==0.3.5"],
+        "dependencies": [],
+    },
+    "influxdb": {
+        "domain": "influxdb",
+        "name": "Influxdb",
+        "requirements": ["influxdb==5.2.3"],
+        "dependencies": [],
+    },
+    "input_boolean": {
+        "domain": "input_boolean",
+        "name": "Input boolean",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "input_datetime": {
+        "domain": "input_datetime",
+        "name": "Input datetime",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "input_number": {
+        "domain": "input_number",
+        "name": "Input number",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "input_select": {
+        "domain": "input_select",
+        "name": "Input select",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "input_text": {
+        "domain": "input_text",
+        "name": "Input text",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "insteon": {
+        "domain": "insteon",
+        "name": "Insteon",
+        "requirements": ["insteonplm==0.16.5"],
+        "dependencies": [],
+    },
+    "integration": {
+        "domain": "integration",
+        "name": "Integration",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "intent_script": {
+        "domain": "intent_script",
+        "name": "Intent script",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "ios": {
+        "domain": "ios",
+        "name": "Ios",
+        "config_flow": True,
+        "requirements": [],
+        "dependencies": ["device_tracker", "http", "zeroconf"],
+    },
+    "iota": {
+        "domain": "iota",
+        "name": "Iota",
+        "requirements": ["pyota==2.0.5"],
+        "dependencies": [],
+    },
+    "iperf3": {
+        "domain": "iperf3",
+        "name": "Iperf3",
+        "requirements": ["iperf3==0.1.11"],
+        "dependencies": [],
+    },
+    "ipma": {
+        "domain": "ipma",
+        "name": "Ipma",
+        "config_flow": True,
+        "requirements": ["pyipma==1.2.1"],
+        "dependencies": [],
+    },
+    "iqvia": {
+        "domain": "iqvia",
+        "name": "IQVIA",
+        "config_flow": True,
+        "requirements": ["numpy==1.17.3", "pyiqvia==0.2.1"],
+        "dependencies": [],
+    },
+    "irish_rail_transport": {
+        "domain": "irish_rail_transport",
+        "name": "Irish rail transport",
+        "requirements": ["pyirishrail==0.0.2"],
+        "dependencies": [],
+    },
+    "islamic_prayer_times": {
+        "domain": "islamic_prayer_times",
+        "name": "Islamic prayer times",
+        "requirements": ["prayer_times_calculator==0.0.3"],
+        "dependencies": [],
+    },
+    "iss": {
+        "domain": "iss",
+        "name": "Iss",
+        "requirements": ["pyiss==1.0.1"],
+        "dependencies": [],
+    },
+    "isy994": {
+        "domain": "isy994",
+        "name": "Isy994",
+        "requirements": ["PyISY==1.1.2"],
+        "dependencies": [],
+    },
+    "itach": {
+        "domain": "itach",
+        "name": "Itach",
+        "requirements": ["pyitachip2ir==0.0.7"],
+        "dependencies": [],
+    },
+    "itunes": {
+        "domain": "itunes",
+        "name": "Itunes",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "izone": {
+        "domain": "izone",
+        "name": "izone",
+        "config_flow": True,
+        "requirements": ["python-izone==1.1.1"],
+        "dependencies": [],
+    },
+    "jewish_calendar": {
+        "domain": "jewish_calendar",
+        "name": "Jewish calendar",
+        "requirements": ["hdate==0.9.1"],
+        "dependencies": [],
+    },
+    "joaoapps_join": {
+        "domain": "joaoapps_join",
+        "name": "Joaoapps join",
+        "requirements": ["python-join-api==0.0.4"],
+        "dependencies": [],
+    },
+    "juicenet": {
+        "domain": "juicenet",
+        "name": "Juicenet",
+        "requirements": ["python-juicenet==0.0.5"],
+        "dependencies": [],
+    },
+    "kaiterra": {
+        "domain": "kaiterra",
+        "name": "Kaiterra",
+        "requirements": ["kaiterra-async-client==0.0.2"],
+        "dependencies": [],
+    },
+    "kankun": {
+        "domain": "kankun",
+        "name": "Kankun",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "keba": {
+        "domain": "keba",
+        "name": "Keba Charging Station",
+        "requirements": ["keba-kecontact==0.2.0"],
+        "dependencies": [],
+    },
+    "keenetic_ndms2": {
+        "domain": "keenetic_ndms2",
+        "name": "Keenetic ndms2",
+        "requirements": ["ndms2_client==0.0.10"],
+        "dependencies": [],
+    },
+    "keyboard": {
+        "domain": "keyboard",
+        "name": "Keyboard",
+        "requirements": ["pyuserinput==0.1.11"],
+        "dependencies": [],
+    },
+    "keyboard_remote": {
+        "domain": "keyboard_remote",
+        "name": "Keyboard remote",
+        "requirements": ["evdev==0.6.1"],
+        "dependencies": [],
+    },
+    "kira": {
+        "domain": "kira",
+        "name": "Kira",
+        "requirements": ["pykira==0.1.1"],
+        "dependencies": [],
+    },
+    "kiwi": {
+        "domain": "kiwi",
+        "name": "Kiwi",
+        "requirements": ["kiwiki-client==0.1.1"],
+        "dependencies": [],
+    },
+    "knx": {
+        "domain": "knx",
+        "name": "Knx",
+        "requirements": ["xknx==0.11.2"],
+        "dependencies": [],
+    },
+    "kodi": {
+        "domain": "kodi",
+        "name": "Kodi",
+        "requirements": ["jsonrpc-async==0.6", "jsonrpc-websocket==0.6"],
+        "dependencies": [],
+    },
+    "konnected": {
+        "domain": "konnected",
+        "name": "Konnected",
+        "requirements": ["konnected==0.1.5"],
+        "dependencies": ["http"],
+    },
+    "kwb": {
+        "domain": "kwb",
+        "name": "Kwb",
+        "requirements": ["pykwb==0.0.8"],
+        "dependencies": [],
+    },
+    "lacrosse": {
+        "domain": "lacrosse",
+        "name": "Lacrosse",
+        "requirements": ["pylacrosse==0.4.0"],
+        "dependencies": [],
+    },
+    "lametric": {
+        "domain": "lametric",
+        "name": "Lametric",
+        "requirements": ["lmnotify==0.0.4"],
+        "dependencies": [],
+    },
+    "lannouncer": {
+        "domain": "lannouncer",
+        "name": "Lannouncer",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "lastfm": {
+        "domain": "lastfm",
+        "name": "Lastfm",
+        "requirements": ["pylast==3.1.0"],
+        "dependencies": [],
+    },
+    "launch_library": {
+        "domain": "launch_library",
+        "name": "Launch library",
+        "requirements": ["pylaunches==0.2.0"],
+        "dependencies": [],
+    },
+    "lcn": {
+        "domain": "lcn",
+        "name": "Lcn",
+        "requirements": ["pypck==0.6.3"],
+        "dependencies": [],
+    },
+    "lg_netcast": {
+        "domain": "lg_netcast",
+        "name": "Lg netcast",
+        "requirements": ["pylgnetcast-homeassistant==0.2.0.dev0"],
+        "dependencies": [],
+    },
+    "lg_soundbar": {
+        "domain": "lg_soundbar",
+        "name": "Lg soundbar",
+        "requirements": ["temescal==0.1"],
+        "dependencies": [],
+    },
+    "life360": {
+        "domain": "life360",
+        "name": "Life360",
+        "config_flow": True,
+        "requirements": ["life360==4.1.1"],
+        "dependencies": [],
+    },
+    "lifx": {
+        "domain": "lifx",
+        "name": "Lifx",
+        "config_flow": True,
+        "requirements": ["aiolifx==0.6.7", "aiolifx_effects==0.2.2"],
+        "dependencies": [],
+    },
+    "lifx_cloud": {
+        "domain": "lifx_cloud",
+        "name": "Lifx cloud",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "lifx_legacy": {
+        "domain": "lifx_legacy",
+        "name": "Lifx legacy",
+        "requirements": ["liffylights==0.9.4"],
+        "dependencies": [],
+    },
+    "light": {
+        "domain": "light",
+        "name": "Light",
+        "requirements": [],
+        "dependencies": ["group"],
+    },
+    "lightwave": {
+        "domain": "lightwave",
+        "name": "Lightwave",
+        "requirements": ["lightwave==0.15"],
+        "dependencies": [],
+    },
+    "limitlessled": {
+        "domain": "limitlessled",
+        "name": "Limitlessled",
+        "requirements": ["limitlessled==1.1.3"],
+        "dependencies": [],
+    },
+    "linksys_smart": {
+        "domain": "linksys_smart",
+        "name": "Linksys smart",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "linky": {
+        "domain": "linky",
+        "name": "Linky",
+        "config_flow": True,
+        "requirements": ["pylinky==0.4.0"],
+        "dependencies": [],
+    },
+    "linode": {
+        "domain": "linode",
+        "name": "Linode",
+        "requirements": ["linode-api==4.1.9b1"],
+        "dependencies": [],
+    },
+    "linux_battery": {
+        "domain": "linux_battery",
+        "name": "Linux battery",
+        "requirements": ["batinfo==0.4.2"],
+        "dependencies": [],
+    },
+    "lirc": {
+        "domain": "lirc",
+        "name": "Lirc",
+        "requirements": ["python-lirc==1.2.3"],
+        "dependencies": [],
+    },
+    "litejet": {
+        "domain": "litejet",
+        "name": "Litejet",
+        "requirements": ["pylitejet==0.1"],
+        "dependencies": [],
+    },
+    "liveboxplaytv": {
+        "domain": "liveboxplaytv",
+        "name": "Liveboxplaytv",
+        "requirements": ["liveboxplaytv==2.0.2", "pyteleloisirs==3.5"],
+        "dependencies": [],
+    },
+    "llamalab_automate": {
+        "domain": "llamalab_automate",
+        "name": "Llamalab automate",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "local_file": {
+        "domain": "local_file",
+        "name": "Local file",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "locative": {
+        "domain": "locative",
+        "name": "Locative",
+        "config_flow": True,
+        "requirements": [],
+        "dependencies": ["webhook"],
+    },
+    "lock": {
+        "domain": "lock",
+        "name": "Lock",
+        "requirements": [],
+        "dependencies": ["group"],
+    },
+    "lockitron": {
+        "domain": "lockitron",
+        "name": "Lockitron",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "logbook": {
+        "domain": "logbook",
+        "name": "Logbook",
+        "requirements": [],
+        "dependencies": ["frontend", "recorder"],
+    },
+    "logentries": {
+        "domain": "logentries",
+        "name": "Logentries",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "logger": {
+        "domain": "logger",
+        "name": "Logger",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "logi_circle": {
+        "domain": "logi_circle",
+        "name": "Logi Circle",
+        "config_flow": True,
+        "requirements": ["logi_circle==0.2.2"],
+        "dependencies": ["ffmpeg"],
+    },
+    "london_air": {
+        "domain": "london_air",
+        "name": "London air",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "london_underground": {
+        "domain": "london_underground",
+        "name": "London underground",
+        "requirements": ["london-tube-status==0.2"],
+        "dependencies": [],
+    },
+    "loopenergy": {
+        "domain": "loopenergy",
+        "name": "Loopenergy",
+        "requirements": ["pyloopenergy==0.1.3"],
+        "dependencies": [],
+    },
+    "lovelace": {
+        "domain": "lovelace",
+        "name": "Lovelace",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "luci": {
+        "domain": "luci",
+        "name": "Luci",
+        "requirements": ["openwrt-luci-rpc==1.1.1"],
+        "dependencies": [],
+    },
+    "luftdaten": {
+        "domain": "luftdaten",
+        "name": "Luftdaten",
+        "config_flow": True,
+        "requirements": ["luftdaten==0.6.3"],
+        "dependencies": [],
+    },
+    "lupusec": {
+        "domain": "lupusec",
+        "name": "Lupusec",
+        "requirements": ["lupupy==0.0.17"],
+        "dependencies": [],
+    },
+    "lutron": {
+        "domain": "lutron",
+        "name": "Lutron",
+        "requirements": ["pylutron==0.2.5"],
+        "dependencies": [],
+    },
+    "lutron_caseta": {
+        "domain": "lutron_caseta",
+        "name": "Lutron caseta",
+        "requirements": ["pylutron-caseta==0.5.0"],
+        "dependencies": [],
+    },
+    "lw12wifi": {
+        "domain": "lw12wifi",
+        "name": "Lw12wifi",
+        "requirements": ["lw12==0.9.2"],
+        "dependencies": [],
+    },
+    "lyft": {
+        "domain": "lyft",
+        "name": "Lyft",
+        "requirements": ["lyft_rides==0.2"],
+        "dependencies": [],
+    },
+    "magicseaweed": {
+        "domain": "magicseaweed",
+        "name": "Magicseaweed",
+        "requirements": ["magicseaweed==1.0.3"],
+        "dependencies": [],
+    },
+    "mailbox": {
+        "domain": "mailbox",
+        "name": "Mailbox",
+        "requirements": [],
+        "dependencies": ["http"],
+    },
+    "mailgun": {
+        "domain": "mailgun",
+        "name": "Mailgun",
+        "config_flow": True,
+        "requirements": ["pymailgunner==1.4"],
+        "dependencies": ["webhook"],
+    },
+    "manual": {
+        "domain": "manual",
+        "name": "Manual",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "manual_mqtt": {
+        "domain": "manual_mqtt",
+        "name": "Manual mqtt",
+        "requirements": [],
+        "dependencies": ["mqtt"],
+    },
+    "map": {
+        "domain": "map",
+        "name": "Map",
+        "requirements": [],
+        "dependencies": ["frontend"],
+    },
+    "marytts": {
+        "domain": "marytts",
+        "name": "Marytts",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "mastodon": {
+        "domain": "mastodon",
+        "name": "Mastodon",
+        "requirements": ["Mastodon.py==1.5.0"],
+        "dependencies": [],
+    },
+    "matrix": {
+        "domain": "matrix",
+        "name": "Matrix",
+        "requirements": ["matrix-client==0.2.0"],
+        "dependencies": [],
+    },
+    "maxcube": {
+        "domain": "maxcube",
+        "name": "Maxcube",
+        "requirements": ["maxcube-api==0.1.0"],
+        "dependencies": [],
+    },
+    "mcp23017": {
+        "domain": "mcp23017",
+        "name": "MCP23017 I/O Expander",
+        "requirements": ["RPi.GPIO==0.7.0", "adafruit-blinka==1.2.1", "adafruit-circuitpython-mcp230xx==1.1.2"],
+        "dependencies": [],
+    },
+    "media_extractor": {
+        "domain": "media_extractor",
+        "name": "Media extractor",
+        "requirements": ["youtube_dl==2019.10.16"],
+        "dependencies": ["media_player"],
+    },
+    "media_player": {
+        "domain": "media_player",
+        "name": "Media player",
+        "requirements": [],
+        "dependencies": ["http"],
+    },
+    "mediaroom": {
+        "domain": "mediaroom",
+        "name": "Mediaroom",
+        "requirements": ["pymediaroom==0.6.4"],
+        "dependencies": [],
+    },
+    "melissa": {
+        "domain": "melissa",
+        "name": "Melissa",
+        "requirements": ["py-melissa-climate==2.0.0"],
+        "dependencies": [],
+    },
+    "meraki": {
+        "domain": "meraki",
+        "name": "Meraki",
+        "requirements": [],
+        "dependencies": ["http"],
+    },
+    "message_bird": {
+        "domain": "message_bird",
+        "name": "Message bird",
+        "requirements": ["messagebird==1.2.0"],
+        "dependencies": [],
+    },
+    "met": {
+        "domain": "met",
+        "name": "Met",
+        "config_flow": True,
+        "requirements": ["pyMetno==0.4.6"],
+        "dependencies": [],
+    },
+    "meteo_france": {
+        "domain": "meteo_france",
+        "name": "Meteo france",
+        "requirements": ["meteofrance==0.3.7", "vigilancemeteo==3.0.0"],
+        "dependencies": [],
+    },
+    "meteoalarm": {
+        "domain": "meteoalarm",
+        "name": "meteoalarm",
+        "requirements": ["meteoalertapi==0.1.6"],
+        "dependencies": [],
+    },
+    "metoffice": {
+        "domain": "metoffice",
+        "name": "Metoffice",
+        "requirements": ["datapoint==0.4.3"],
+        "dependencies": [],
+    },
+    "mfi": {
+        "domain": "mfi",
+        "name": "Mfi",
+        "requirements": ["mficlient==0.3.0"],
+        "dependencies": [],
+    },
+    "mhz19": {
+        "domain": "mhz19",
+        "name": "Mhz19",
+        "requirements": ["pmsensor==0.4"],
+        "dependencies": [],
+    },
+    "microsoft": {
+        "domain": "microsoft",
+        "name": "Microsoft",
+        "requirements": ["pycsspeechtts==1.0.2"],
+        "dependencies": [],
+    },
+    "microsoft_face": {
+        "domain": "microsoft_face",
+        "name": "Microsoft face",
+        "requirements": [],
+        "dependencies": ["camera"],
+    },
+    "microsoft_face_detect": {
+        "domain": "microsoft_face_detect",
+        "name": "Microsoft face detect",
+        "requirements": [],
+        "dependencies": ["microsoft_face"],
+    },
+    "microsoft_face_identify": {
+        "domain": "microsoft_face_identify",
+        "name": "Microsoft face identify",
+        "requirements": [],
+        "dependencies": ["microsoft_face"],
+    },
+    "miflora": {
+        "domain": "miflora",
+        "name": "Miflora",
+        "requirements": ["bluepy==1.1.4", "miflora==0.4.0"],
+        "dependencies": [],
+    },
+    "mikrotik": {
+        "domain": "mikrotik",
+        "name": "Mikrotik",
+        "requirements": ["librouteros==2.3.0"],
+        "dependencies": [],
+    },
+    "mill": {
+        "domain": "mill",
+        "name": "Mill",
+        "requirements": ["millheater==0.3.4"],
+        "dependencies": [],
+    },
+    "min_max": {
+        "domain": "min_max",
+        "name": "Min max",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "minio": {
+        "domain": "minio",
+        "name": "Minio",
+        "requirements": ["minio==4.0.9"],
+        "dependencies": [],
+    },
+    "mitemp_bt": {
+        "domain": "mitemp_bt",
+        "name": "Mitemp bt",
+        "requirements": ["mitemp_bt==0.0.1"],
+        "dependencies": [],
+    },
+    "mjpeg": {
+        "domain": "mjpeg",
+        "name": "Mjpeg",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "mobile_app": {
+        "domain": "mobile_app",
+        "name": "Home Assistant Mobile App Support",
+        "config_flow": True,
+        "requirements": ["PyNaCl==1.3.0"],
+        "dependencies": ["cloud", "http", "webhook"],
+    },
+    "mochad": {
+        "domain": "mochad",
+        "name": "Mochad",
+        "requirements": ["pymochad==0.2.0"],
+        "dependencies": [],
+    },
+    "modbus": {
+        "domain": "modbus",
+        "name": "Modbus",
+        "requirements": ["pymodbus==1.5.2"],
+        "dependencies": [],
+    },
+    "modem_callerid": {
+        "domain": "modem_callerid",
+        "name": "Modem callerid",
+        "requirements": ["basicmodem==0.7"],
+        "dependencies": [],
+    },
+    "mold_indicator": {
+        "domain": "mold_indicator",
+        "name": "Mold indicator",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "monoprice": {
+        "domain": "monoprice",
+        "name": "Monoprice",
+        "requirements": ["pymonoprice==0.3"],
+        "dependencies": [],
+    },
+    "moon": {
+        "domain": "moon",
+        "name": "Moon",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "mopar": {
+        "domain": "mopar",
+        "name": "Mopar",
+        "requirements": ["motorparts==1.1.0"],
+        "dependencies": [],
+    },
+    "mpchc": {
+        "domain": "mpchc",
+        "name": "Mpchc",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "mpd": {
+        "domain": "mpd",
+        "name": "Mpd",
+        "requirements": ["python-mpd2==1.0.0"],
+        "dependencies": [],
+    },
+    "mqtt": {
+        "domain": "mqtt",
+        "name": "MQTT",
+        "config_flow": True,
+        "requirements": ["hbmqtt==0.9.5", "paho-mqtt==1.4.0"],
+        "dependencies": ["http"],
+    },
+    "mqtt_eventstream": {
+        "domain": "mqtt_eventstream",
+        "name": "Mqtt eventstream",
+        "requirements": [],
+        "dependencies": ["mqtt"],
+    },
+    "mqtt_json": {
+        "domain": "mqtt_json",
+        "name": "Mqtt json",
+        "requirements": [],
+        "dependencies": ["mqtt"],
+    },
+    "mqtt_room": {
+        "domain": "mqtt_room",
+        "name": "Mqtt room",
+        "requirements": [],
+        "dependencies": ["mqtt"],
+    },
+    "mqtt_statestream": {
+        "domain": "mqtt_statestream",
+        "name": "Mqtt statestream",
+        "requirements": [],
+        "dependencies": ["mqtt"],
+    },
+    "mvglive": {
+        "domain": "mvglive",
+        "name": "Mvglive",
+        "requirements": ["PyMVGLive==1.1.4"],
+        "dependencies": [],
+    },
+    "mychevy": {
+        "domain": "mychevy",
+        "name": "Mychevy",
+        "requirements": ["mychevy==1.2.0"],
+        "dependencies": [],
+    },
+    "mycroft": {
+        "domain": "mycroft",
+        "name": "Mycroft",
+        "requirements": ["mycroftapi==2.0"],
+        "dependencies": [],
+    },
+    "myq": {
+        "domain": "myq",
+        "name": "Myq",
+        "requirements": ["pymyq==1.2.1"],
+        "dependencies": [],
+    },
+    "mysensors": {
+        "domain": "mysensors",
+        "name": "Mysensors",
+        "requirements": ["pymysensors==0.18.0"],
+        "dependencies": [],
+        "after_dependencies": ["mqtt"],
+    },
+    "mystrom": {
+        "domain": "mystrom",
+        "name": "Mystrom",
+        "requirements": ["python-mystrom==0.5.0"],
+        "dependencies": ["http"],
+    },
+    "mythicbeastsdns": {
+        "domain": "mythicbeastsdns",
+        "name": "Mythicbeastsdns",
+        "requirements": ["mbddns==0.1.2"],
+        "dependencies": [],
+    },
+    "n26": {
+        "domain": "n26",
+        "name": "N26",
+        "requirements": ["n26==0.2.7"],
+        "dependencies": [],
+    },
+    "nad": {
+        "domain": "nad",
+        "name": "Nad",
+        "requirements": ["nad_receiver==0.0.11"],
+        "dependencies": [],
+    },
+    "namecheapdns": {
+        "domain": "namecheapdns",
+        "name": "Namecheapdns",
+        "requirements": ["defusedxml==0.6.0"],
+        "dependencies": [],
+    },
+    "nanoleaf": {
+        "domain": "nanoleaf",
+        "name": "Nanoleaf",
+        "requirements": ["pynanoleaf==0.0.5"],
+        "dependencies": [],
+    },
+    "neato": {
+        "domain": "neato",
+        "name": "Neato",
+        "config_flow": True,
+        "requirements": ["pybotvac==0.0.17"],
+        "dependencies": [],
+    },
+    "nederlandse_spoorwegen": {
+        "domain": "nederlandse_spoorwegen",
+        "name": "Nederlandse spoorwegen",
+        "requirements": ["nsapi==2.7.4"],
+        "dependencies": [],
+    },
+    "nello": {
+        "domain": "nello",
+        "name": "Nello",
+        "requirements": ["pynello==2.0.2"],
+        "dependencies": [],
+    },
+    "ness_alarm": {
+        "domain": "ness_alarm",
+        "name": "Ness alarm",
+        "requirements": ["nessclient==0.9.15"],
+        "dependencies": [],
+    },
+    "nest": {
+        "domain": "nest",
+        "name": "Nest",
+        "config_flow": True,
+        "requirements": ["python-nest==4.1.0"],
+        "dependencies": [],
+    },
+    "netatmo": {
+        "domain": "netatmo",
+        "name": "Netatmo",
+        "requirements": ["pyatmo==2.3.2"],
+        "dependencies": ["webhook"],
+    },
+    "netdata": {
+        "domain": "netdata",
+        "name": "Netdata",
+        "requirements": ["netdata==0.1.2"],
+        "dependencies": [],
+    },
+    "netgear": {
+        "domain": "netgear",
+        "name": "Netgear",
+        "requirements": ["pynetgear==0.6.1"],
+        "dependencies": [],
+    },
+    "netgear_lte": {
+        "domain": "netgear_lte",
+        "name": "Netgear lte",
+        "requirements": ["eternalegypt==0.0.10"],
+        "dependencies": [],
+    },
+    "netio": {
+        "domain": "netio",
+        "name": "Netio",
+        "requirements": ["pynetio==0.1.9.1"],
+        "dependencies": ["http"],
+    },
+    "neurio_energy": {
+        "domain": "neurio_energy",
+        "name": "Neurio energy",
+        "requirements": ["neurio==0.3.1"],
+        "dependencies": [],
+    },
+    "nextbus": {
+        "domain": "nextbus",
+        "name": "NextBus",
+        "requirements": ["py_nextbusnext==0.1.4"],
+        "dependencies": [],
+    },
+    "nfandroidtv": {
+        "domain": "nfandroidtv",
+        "name": "Nfandroidtv",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "niko_home_control": {
+        "domain": "niko_home_control",
+        "name": "Niko home control",
+        "requirements": ["niko-home-control==0.2.1"],
+        "dependencies": [],
+    },
+    "nilu": {
+        "domain": "nilu",
+        "name": "Nilu",
+        "requirements": ["niluclient==0.1.2"],
+        "dependencies": [],
+    },
+    "nissan_leaf": {
+        "domain": "nissan_leaf",
+        "name": "Nissan leaf",
+        "requirements": ["pycarwings2==2.9"],
+        "dependencies": [],
+    },
+    "nmap_tracker": {
+        "domain": "nmap_tracker",
+        "name": "Nmap tracker",
+        "requirements": ["python-nmap==0.6.1", "getmac==0.8.1"],
+        "dependencies": [],
+    },
+    "nmbs": {
+        "domain": "nmbs",
+        "name": "Nmbs",
+        "requirements": ["pyrail==0.0.3"],
+        "dependencies": [],
+    },
+    "no_ip": {
+        "domain": "no_ip",
+        "name": "No ip",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "noaa_tides": {
+        "domain": "noaa_tides",
+        "name": "Noaa tides",
+        "requirements": ["py_noaa==0.3.0"],
+        "dependencies": [],
+    },
+    "norway_air": {
+        "domain": "norway_air",
+        "name": "Norway air",
+        "requirements": ["pyMetno==0.4.6"],
+        "dependencies": [],
+    },
+    "notify": {
+        "domain": "notify",
+        "name": "Notify",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "notion": {
+        "domain": "notion",
+        "name": "Notion",
+        "config_flow": True,
+        "requirements": ["aionotion==1.1.0"],
+        "dependencies": [],
+    },
+    "nsw_fuel_station": {
+        "domain": "nsw_fuel_station",
+        "name": "Nsw fuel station",
+        "requirements": ["nsw-fuel-api-client==1.0.10"],
+        "dependencies": [],
+    },
+    "nsw_rural_fire_service_feed": {
+        "domain": "nsw_rural_fire_service_feed",
+        "name": "Nsw rural fire service feed",
+        "requirements": ["geojson_client==0.4"],
+        "dependencies": [],
+    },
+    "nuheat": {
+        "domain": "nuheat",
+        "name": "Nuheat",
+        "requirements": ["nuheat==0.3.0"],
+        "dependencies": [],
+    },
+    "nuimo_controller": {
+        "domain": "nuimo_controller",
+        "name": "Nuimo controller",
+        "requirements": ["--only-binary=all nuimo==0.1.0"],
+        "dependencies": [],
+    },
+    "nuki": {
+        "domain": "nuki",
+        "name": "Nuki",
+        "requirements": ["pynuki==1.3.3"],
+        "dependencies": [],
+    },
+    "nut": {
+        "domain": "nut",
+        "name": "Nut",
+        "requirements": ["pynut2==2.1.2"],
+        "dependencies": [],
+    },
+    "nws": {
+        "domain": "nws",
+        "name": "National Weather Service",
+        "requirements": ["pynws==0.8.1"],
+        "dependencies": [],
+    },
+    "nx584": {
+        "domain": "nx584",
+        "name": "Nx584",
+        "requirements": ["pynx584==0.4"],
+        "dependencies": [],
+    },
+    "nzbget": {
+        "domain": "nzbget",
+        "name": "Nzbget",
+        "requirements": ["pynzbgetapi==0.2.0"],
+        "dependencies": [],
+    },
+    "oasa_telematics": {
+        "domain": "oasa_telematics",
+        "name": "OASA Telematics",
+        "requirements": ["oasatelematics==0.3"],
+        "dependencies": [],
+    },
+    "obihai": {
+        "domain": "obihai",
+        "name": "Obihai",
+        "requirements": ["pyobihai==1.2.0"],
+        "dependencies": [],
+    },
+    "octoprint": {
+        "domain": "octoprint",
+        "name": "Octoprint",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "oem": {
+        "domain": "oem",
+        "name": "Oem",
+        "requirements": ["oemthermostat==1.1"],
+        "dependencies": [],
+    },
+    "ohmconnect": {
+        "domain": "ohmconnect",
+        "name": "Ohmconnect",
+        "requirements": ["defusedxml==0.6.0"],
+        "dependencies": [],
+    },
+    "ombi": {
+        "domain": "ombi",
+        "name": "Ombi",
+        "requirements": ["pyombi==0.1.5"],
+        "dependencies": [],
+    },
+    "onboarding": {
+        "domain": "onboarding",
+        "name": "Onboarding",
+        "requirements": [],
+        "dependencies": ["auth", "http"],
+    },
+    "onewire": {
+        "domain": "onewire",
+        "name": "Onewire",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "onkyo": {
+        "domain": "onkyo",
+        "name": "Onkyo",
+        "requirements": ["onkyo-eiscp==1.2.7"],
+        "dependencies": [],
+    },
+    "onvif": {
+        "domain": "onvif",
+        "name": "Onvif",
+        "requirements": ["onvif-zeep-async==0.2.0"],
+        "dependencies": ["ffmpeg"],
+    },
+    "openalpr_cloud": {
+        "domain": "openalpr_cloud",
+        "name": "Openalpr cloud",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "openalpr_local": {
+        "domain": "openalpr_local",
+        "name": "Openalpr local",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "opencv": {
+        "domain": "opencv",
+        "name": "Opencv",
+        "requirements": ["numpy==1.17.3", "opencv-python-headless==4.1.1.26"],
+        "dependencies": [],
+    },
+    "openevse": {
+        "domain": "openevse",
+        "name": "Openevse",
+        "requirements": ["openevsewifi==0.4"],
+        "dependencies": [],
+    },
+    "openexchangerates": {
+        "domain": "openexchangerates",
+        "name": "Openexchangerates",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "opengarage": {
+        "domain": "opengarage",
+        "name": "Opengarage",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "openhardwaremonitor": {
+        "domain": "openhardwaremonitor",
+        "name": "Openhardwaremonitor",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "openhome": {
+        "domain": "openhome",
+        "name": "Openhome",
+        "requirements": ["openhomedevice==0.4.2"],
+        "dependencies": [],
+    },
+    "opensensemap": {
+        "domain": "opensensemap",
+        "name": "Opensensemap",
+        "requirements": ["opensensemap-api==0.1.5"],
+        "dependencies": [],
+    },
+    "opensky": {
+        "domain": "opensky",
+        "name": "Opensky",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "opentherm_gw": {
+        "domain": "opentherm_gw",
+        "name": "Opentherm Gateway",
+        "config_flow": True,
+        "requirements": ["pyotgw==0.5b0"],
+        "dependencies": [],
+    },
+    "openuv": {
+        "domain": "openuv",
+        "name": "Openuv",
+        "config_flow": True,
+        "requirements": ["pyopenuv==1.0.9"],
+        "dependencies": [],
+    },
+    "openweathermap": {
+        "domain": "openweathermap",
+        "name": "Openweathermap",
+        "requirements": ["pyowm==2.10.0"],
+        "dependencies": [],
+    },
+    "opple": {
+        "domain": "opple",
+        "name": "Opple",
+        "requirements": ["pyoppleio==1.0.5"],
+        "dependencies": [],
+    },
+    "orangepi_gpio": {
+        "domain": "orangepi_gpio",
+        "name": "Orangepi GPIO",
+        "requirements": ["OPi.GPIO==0.3.6"],
+        "dependencies": [],
+    },
+    "oru": {
+        "domain": "oru",
+        "name": "Orange and Rockland Utility Smart Energy Meter Sensor",
+        "requirements": ["oru==0.1.9"],
+        "dependencies": [],
+    },
+    "orvibo": {
+        "domain": "orvibo",
+        "name": "Orvibo",
+        "requirements": ["orvibo==1.1.1"],
+        "dependencies": [],
+    },
+    "osramlightify": {
+        "domain": "osramlightify",
+        "name": "Osramlightify",
+        "requirements": ["lightify==1.0.7.2"],
+        "dependencies": [],
+    },
+    "otp": {
+        "domain": "otp",
+        "name": "Otp",
+        "requirements": ["pyotp==2.3.0"],
+        "dependencies": [],
+    },
+    "owlet": {
+        "domain": "owlet",
+        "name": "Owlet",
+        "requirements": ["pyowlet==1.0.3"],
+        "dependencies": [],
+    },
+    "owntracks": {
+        "domain": "owntracks",
+        "name": "Owntracks",
+        "config_flow": True,
+        "requirements": ["PyNaCl==1.3.0"],
+        "dependencies": ["webhook"],
+        "after_dependencies": ["mqtt"],
+    },
+    "panasonic_bluray": {
+        "domain": "panasonic_bluray",
+        "name": "Panasonic bluray",
+        "requirements": ["panacotta==0.1"],
+        "dependencies": [],
+    },
+    "panasonic_viera": {
+        "domain": "panasonic_viera",
+        "name": "Panasonic viera",
+        "requirements": ["panasonic_viera==0.3.2", "wakeonlan==1.1.6"],
+        "dependencies": [],
+    },
+    "pandora": {
+        "domain": "pandora",
+        "name": "Pandora",
+        "requirements": ["pexpect==4.6.0"],
+        "dependencies": [],
+    },
+    "panel_custom": {
+        "domain": "panel_custom",
+        "name": "Panel custom",
+        "requirements": [],
+        "dependencies": ["frontend"],
+    },
+    "panel_iframe": {
+        "domain": "panel_iframe",
+        "name": "Panel iframe",
+        "requirements": [],
+        "dependencies": ["frontend"],
+    },
+    "pencom": {
+        "domain": "pencom",
+        "name": "Pencom",
+        "requirements": ["pencompy==0.0.3"],
+        "dependencies": [],
+    },
+    "persistent_notification": {
+        "domain": "persistent_notification",
+        "name": "Persistent notification",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "person": {
+        "domain": "person",
+        "name": "Person",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "philips_js": {
+        "domain": "philips_js",
+        "name": "Philips js",
+        "requirements": ["ha-philipsjs==0.0.8"],
+        "dependencies": [],
+    },
+    "pi_hole": {
+        "domain": "pi_hole",
+        "name": "Pi hole",
+        "requirements": ["hole==0.5.0"],
+        "dependencies": [],
+    },
+    "picotts": {
+        "domain": "picotts",
+        "name": "Picotts",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "piglow": {
+        "domain": "piglow",
+        "name": "Piglow",
+        "requirements": ["piglow==1.2.4"],
+        "dependencies": [],
+    },
+    "pilight": {
+        "domain": "pilight",
+        "name": "Pilight",
+        "requirements": ["pilight==0.1.1"],
+        "dependencies": [],
+    },
+    "ping": {
+        "domain": "ping",
+        "name": "Ping",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "pioneer": {
+        "domain": "pioneer",
+        "name": "Pioneer",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "pjlink": {
+        "domain": "pjlink",
+        "name": "Pjlink",
+        "requirements": ["pypjlink2==1.2.0"],
+        "dependencies": [],
+    },
+    "plaato": {
+        "domain": "plaato",
+        "name": "Plaato Airlock",
+        "config_flow": True,
+        "requirements": [],
+        "dependencies": ["webhook"],
+    },
+    "plant": {
+        "domain": "plant",
+        "name": "Plant",
+        "requirements": [],
+        "dependencies": ["group", "zone"],
+    },
+    "plex": {
+        "domain": "plex",
+        "name": "Plex",
+        "config_flow": True,
+        "requirements": ["plexapi==3.0.6", "plexauth==0.0.4"],
+        "dependencies": ["http"],
+    },
+    "plugwise": {
+        "domain": "plugwise",
+        "name": "Plugwise",
+        "requirements": ["haanna==0.10.1"],
+        "dependencies": [],
+    },
+    "plum_lightpad": {
+        "domain": "plum_lightpad",
+        "name": "Plum lightpad",
+        "requirements": ["plumlightpad==0.0.11"],
+        "dependencies": [],
+    },
+    "pocketcasts": {
+        "domain": "pocketcasts",
+        "name": "Pocketcasts",
+        "requirements": ["pocketcasts==0.1"],
+        "dependencies": [],
+    },
+    "point": {
+        "domain": "point",
+        "name": "Point",
+        "config_flow": True,
+        "requirements": ["pypoint==1.1.1"],
+        "dependencies": ["webhook"],
+    },
+    "postnl": {
+        "domain": "postnl",
+        "name": "Postnl",
+        "requirements": ["postnl_api==1.0.2"],
+        "dependencies": [],
+    },
+    "prezzibenzina": {
+        "domain": "prezzibenzina",
+        "name": "Prezzibenzina",
+        "requirements": ["prezzibenzina-py==1.1.4"],
+        "dependencies": [],
+    },
+    "proliphix": {
+        "domain": "proliphix",
+        "name": "Proliphix",
+        "requirements": ["proliphix==0.4.1"],
+        "dependencies": [],
+    },
+    "prometheus": {
+        "domain": "prometheus",
+        "name": "Prometheus",
+        "requirements": ["prometheus_client==0.7.1"],
+        "dependencies": ["http"],
+    },
+    "prowl": {
+        "domain": "prowl",
+        "name": "Prowl",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "proximity": {
+        "domain": "proximity",
+        "name": "Proximity",
+        "requirements": [],
+        "dependencies": ["device_tracker", "zone"],
+    },
+    "proxy": {
+        "domain": "proxy",
+        "name": "Proxy",
+        "requirements": ["pillow==6.2.0"],
+        "dependencies": [],
+    },
+    "ps4": {
+        "domain": "ps4",
+        "name": "Ps4",
+        "config_flow": True,
+        "requirements": ["pyps4-2ndscreen==1.0.1"],
+        "dependencies": [],
+    },
+    "ptvsd": {
+        "domain": "ptvsd",
+        "name": "ptvsd",
+        "requirements": ["ptvsd==4.2.8"],
+        "dependencies": [],
+    },
+    "pulseaudio_loopback": {
+        "domain": "pulseaudio_loopback",
+        "name": "Pulseaudio loopback",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "push": {
+        "domain": "push",
+        "name": "Push",
+        "requirements": [],
+        "dependencies": ["webhook"],
+    },
+    "pushbullet": {
+        "domain": "pushbullet",
+        "name": "Pushbullet",
+        "requirements": ["pushbullet.py==0.11.0"],
+        "dependencies": [],
+    },
+    "pushetta": {
+        "domain": "pushetta",
+        "name": "Pushetta",
+        "requirements": ["pushetta==1.0.15"],
+        "dependencies": [],
+    },
+    "pushover": {
+        "domain": "pushover",
+        "name": "Pushover",
+        "requirements": ["python-pushover==0.4"],
+        "dependencies": [],
+    },
+    "pushsafer": {
+        "domain": "pushsafer",
+        "name": "Pushsafer",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "pvoutput": {
+        "domain": "pvoutput",
+        "name": "Pvoutput",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "pyload": {
+        "domain": "pyload",
+        "name": "Pyload",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "python_script": {
+        "domain": "python_script",
+        "name": "Python script",
+        "requirements": ["restrictedpython==5.0"],
+        "dependencies": [],
+    },
+    "qbittorrent": {
+        "domain": "qbittorrent",
+        "name": "Qbittorrent",
+        "requirements": ["python-qbittorrent==0.3.1"],
+        "dependencies": [],
+    },
+    "qld_bushfire": {
+        "domain": "qld_bushfire",
+        "name": "Queensland Bushfire Alert",
+        "requirements": ["georss_qld_bushfire_alert_client==0.3"],
+        "dependencies": [],
+    },
+    "qnap": {
+        "domain": "qnap",
+        "name": "Qnap",
+        "requirements": ["qnapstats==0.2.7"],
+        "dependencies": [],
+    },
+    "qrcode": {
+        "domain": "qrcode",
+        "name": "Qrcode",
+        "requirements": ["pillow==6.2.0", "pyzbar==0.1.7"],
+        "dependencies": [],
+    },
+    "quantum_gateway": {
+        "domain": "quantum_gateway",
+        "name": "Quantum gateway",
+        "requirements": ["quantum-gateway==0.0.5"],
+        "dependencies": [],
+    },
+    "qwikswitch": {
+        "domain": "qwikswitch",
+        "name": "Qwikswitch",
+        "requirements": ["pyqwikswitch==0.93"],
+        "dependencies": [],
+    },
+    "rachio": {
+        "domain": "rachio",
+        "name": "Rachio",
+        "requirements": ["rachiopy==0.1.3"],
+        "dependencies": [],
+    },
+    "radarr": {
+        "domain": "radarr",
+        "name": "Radarr",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "radiotherm": {
+        "domain": "radiotherm",
+        "name": "Radiotherm",
+        "requirements": ["radiotherm==2.0.0"],
+        "dependencies": [],
+    },
+    "rainbird": {
+        "domain": "rainbird",
+        "name": "Rainbird",
+        "requirements": ["pyrainbird==0.4.1"],
+        "dependencies": [],
+    },
+    "raincloud": {
+        "domain": "raincloud",
+        "name": "Raincloud",
+        "requirements": ["raincloudy==0.0.7"],
+        "dependencies": [],
+    },
+    "rainforest_eagle": {
+        "domain": "rainforest_eagle",
+        "name": "Rainforest Eagle-200",
+        "requirements": ["eagle200_reader==0.2.1"],
+        "dependencies": [],
+    },
+    "rainmachine": {
+        "domain": "rainmachine",
+        "name": "Rainmachine",
+        "config_flow": True,
+        "requirements": ["regenmaschine==1.5.1"],
+        "dependencies": [],
+    },
+    "random": {
+        "domain": "random",
+        "name": "Random",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "raspihats": {
+        "domain": "raspihats",
+        "name": "Raspihats",
+        "requirements": ["raspihats==2.2.3", "smbus-cffi==0.5.1"],
+        "dependencies": [],
+    },
+    "raspyrfm": {
+        "domain": "raspyrfm",
+        "name": "Raspyrfm",
+        "requirements": ["raspyrfm-client==1.2.8"],
+        "dependencies": [],
+    },
+    "recollect_waste": {
+        "domain": "recollect_waste",
+        "name": "Recollect waste",
+        "requirements": ["recollect-waste==1.0.1"],
+        "dependencies": [],
+    },
+    "recorder": {
+        "domain": "recorder",
+        "name": "Recorder",
+        "requirements": ["sqlalchemy==1.3.10"],
+        "dependencies": [],
+    },
+    "recswitch": {
+        "domain": "recswitch",
+        "name": "Recswitch",
+        "requirements": ["pyrecswitch==1.0.2"],
+        "dependencies": [],
+    },
+    "reddit": {
+        "domain": "reddit",
+        "name": "Reddit",
+        "requirements": ["praw==6.3.1"],
+        "dependencies": [],
+    },
+    "rejseplanen": {
+        "domain": "rejseplanen",
+        "name": "Rejseplanen",
+        "requirements": ["rjpl==0.3.5"],
+        "dependencies": [],
+    },
+    "remember_the_milk": {
+        "domain": "remember_the_milk",
+        "name": "Remember the milk",
+        "requirements": ["RtmAPI==0.7.2", "httplib2==0.10.3"],
+        "dependencies": ["configurator"],
+    },
+    "remote": {
+        "domain": "remote",
+        "name": "Remote",
+        "requirements": [],
+        "dependencies": ["group"],
+    },
+    "remote_rpi_gpio": {
+        "domain": "remote_rpi_gpio",
+        "name": "remote_rpi_gpio",
+        "requirements": ["gpiozero==1.5.1"],
+        "dependencies": [],
+    },
+    "repetier": {
+        "domain": "repetier",
+        "name": "Repetier Server",
+        "requirements": ["pyrepetier==3.0.5"],
+        "dependencies": [],
+    },
+    "rest": {
+        "domain": "rest",
+        "name": "Rest",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "rest_command": {
+        "domain": "rest_command",
+        "name": "Rest command",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "rflink": {
+        "domain": "rflink",
+        "name": "Rflink",
+        "requirements": ["rflink==0.0.46"],
+        "dependencies": [],
+    },
+    "rfxtrx": {
+        "domain": "rfxtrx",
+        "name": "Rfxtrx",
+        "requirements": ["pyRFXtrx==0.23"],
+        "dependencies": [],
+    },
+    "ring": {
+        "domain": "ring",
+        "name": "Ring",
+        "requirements": ["ring_doorbell==0.2.3"],
+        "dependencies": ["ffmpeg"],
+    },
+    "ripple": {
+        "domain": "ripple",
+        "name": "Ripple",
+        "requirements": ["python-ripple-api==0.0.3"],
+        "dependencies": [],
+    },
+    "rmvtransport": {
+        "domain": "rmvtransport",
+        "name": "Rmvtransport",
+        "requirements": ["PyRMVtransport==0.2.9"],
+        "dependencies": [],
+    },
+    "rocketchat": {
+        "domain": "rocketchat",
+        "name": "Rocketchat",
+        "requirements": ["rocketchat-API==0.6.1"],
+        "dependencies": [],
+    },
+    "roku": {
+        "domain": "roku",
+        "name": "Roku",
+        "requirements": ["roku==3.1"],
+        "dependencies": [],
+    },
+    "roomba": {
+        "domain": "roomba",
+        "name": "Roomba",
+        "requirements": ["roombapy==1.3.1"],
+        "dependencies": [],
+    },
+    "route53": {
+        "domain": "route53",
+        "name": "Route53",
+        "requirements": ["boto3==1.9.233", "ipify==1.0.0"],
+        "dependencies": [],
+    },
+    "rova": {
+        "domain": "rova",
+        "name": "Rova",
+        "requirements": ["rova==0.1.0"],
+        "dependencies": [],
+    },
+    "rpi_camera": {
+        "domain": "rpi_camera",
+        "name": "Rpi camera",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "rpi_gpio": {
+        "domain": "rpi_gpio",
+        "name": "Rpi gpio",
+        "requirements": ["RPi.GPIO==0.7.0"],
+        "dependencies": [],
+    },
+    "rpi_gpio_pwm": {
+        "domain": "rpi_gpio_pwm",
+        "name": "Rpi gpio pwm",
+        "requirements": ["pwmled==1.4.1"],
+        "dependencies": [],
+    },
+    "rpi_pfio": {
+        "domain": "rpi_pfio",
+        "name": "Rpi pfio",
+        "requirements": ["pifacecommon==4.2.2", "pifacedigitalio==3.0.5"],
+        "dependencies": [],
+    },
+    "rpi_rf": {
+        "domain": "rpi_rf",
+        "name": "Rpi rf",
+        "requirements": ["rpi-rf==0.9.7"],
+        "dependencies": [],
+    },
+    "rss_feed_template": {
+        "domain": "rss_feed_template",
+        "name": "Rss feed template",
+        "requirements": [],
+        "dependencies": ["http"],
+    },
+    "rtorrent": {
+        "domain": "rtorrent",
+        "name": "Rtorrent",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "russound_rio": {
+        "domain": "russound_rio",
+        "name": "Russound rio",
+        "requirements": ["russound_rio==0.1.7"],
+        "dependencies": [],
+    },
+    "russound_rnet": {
+        "domain": "russound_rnet",
+        "name": "Russound rnet",
+        "requirements": ["russound==0.1.9"],
+        "dependencies": [],
+    },
+    "sabnzbd": {
+        "domain": "sabnzbd",
+        "name": "Sabnzbd",
+        "requirements": ["pysabnzbd==1.1.0"],
+        "dependencies": ["configurator"],
+    },
+    "saj": {
+        "domain": "saj",
+        "name": "SAJ",
+        "requirements": ["pysaj==0.0.9"],
+        "dependencies": [],
+    },
+    "samsungtv": {
+        "domain": "samsungtv",
+        "name": "Samsungtv",
+        "requirements": ["samsungctl[websocket]==0.7.1", "wakeonlan==1.1.6"],
+        "dependencies": [],
+    },
+    "satel_integra": {
+        "domain": "satel_integra",
+        "name": "Satel integra",
+        "requirements": ["satel_integra==0.3.4"],
+        "dependencies": [],
+    },
+    "scene": {
+        "domain": "scene",
+        "name": "Scene",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "scrape": {
+        "domain": "scrape",
+        "name": "Scrape",
+        "requirements": ["beautifulsoup4==4.8.1"],
+        "dependencies": [],
+    },
+    "script": {
+        "domain": "script",
+        "name": "Script",
+        "requirements": [],
+        "dependencies": ["group"],
+    },
+    "scsgate": {
+        "domain": "scsgate",
+        "name": "Scsgate",
+        "requirements": ["scsgate==0.1.0"],
+        "dependencies": [],
+    },
+    "season": {
+        "domain": "season",
+        "name": "Season",
+        "requirements": ["ephem==3.7.6.0"],
+        "dependencies": [],
+    },
+    "sendgrid": {
+        "domain": "sendgrid",
+        "name": "Sendgrid",
+        "requirements": ["sendgrid==6.1.0"],
+        "dependencies": [],
+    },
+    "sense": {
+        "domain": "sense",
+        "name": "Sense",
+        "requirements": ["sense_energy==0.7.0"],
+        "dependencies": [],
+    },
+    "sensehat": {
+        "domain": "sensehat",
+        "name": "Sensehat",
+        "requirements": ["sense-hat==2.2.0"],
+        "dependencies": [],
+    },
+    "sensibo": {
+        "domain": "sensibo",
+        "name": "Sensibo",
+        "requirements": ["pysensibo==1.0.3"],
+        "dependencies": [],
+    },
+    "sensor": {
+        "domain": "sensor",
+        "name": "Sensor",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "serial": {
+        "domain": "serial",
+        "name": "Serial",
+        "requirements": ["pyserial-asyncio==0.4"],
+        "dependencies": [],
+    },
+    "serial_pm": {
+        "domain": "serial_pm",
+        "name": "Serial pm",
+        "requirements": ["pmsensor==0.4"],
+        "dependencies": [],
+    },
+    "sesame": {
+        "domain": "sesame",
+        "name": "Sesame Smart Lock",
+        "requirements": ["pysesame2==1.0.1"],
+        "dependencies": [],
+    },
+    "seven_segments": {
+        "domain": "seven_segments",
+        "name": "Seven segments",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "seventeentrack": {
+        "domain": "seventeentrack",
+        "name": "Seventeentrack",
+        "requirements": ["py17track==2.2.2"],
+        "dependencies": [],
+    },
+    "shell_command": {
+        "domain": "shell_command",
+        "name": "Shell command",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "shiftr": {
+        "domain": "shiftr",
+        "name": "Shiftr",
+        "requirements": ["paho-mqtt==1.4.0"],
+        "dependencies": [],
+    },
+    "shodan": {
+        "domain": "shodan",
+        "name": "Shodan",
+        "requirements": ["shodan==1.19.0"],
+        "dependencies": [],
+    },
+    "shopping_list": {
+        "domain": "shopping_list",
+        "name": "Shopping list",
+        "requirements": [],
+        "dependencies": ["http"],
+    },
+    "sht31": {
+        "domain": "sht31",
+        "name": "Sht31",
+        "requirements": ["Adafruit-GPIO==1.0.3", "Adafruit-SHT31==1.0.2"],
+        "dependencies": [],
+    },
+    "sigfox": {
+        "domain": "sigfox",
+        "name": "Sigfox",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "simplepush": {
+        "domain": "simplepush",
+        "name": "Simplepush",
+        "requirements": ["simplepush==1.1.4"],
+        "dependencies": [],
+    },
+    "simplisafe": {
+        "domain": "simplisafe",
+        "name": "Simplisafe",
+        "config_flow": True,
+        "requirements": ["simplisafe-python==5.0.1"],
+        "dependencies": [],
+    },
+    "simulated": {
+        "domain": "simulated",
+        "name": "Simulated",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "sinch": {
+        "domain": "sinch",
+        "name": "Sinch",
+        "requirements": ["clx-sdk-xms==1.0.0"],
+        "dependencies": [],
+    },
+    "sisyphus": {
+        "domain": "sisyphus",
+        "name": "Sisyphus",
+        "requirements": ["sisyphus-control==2.2.1"],
+        "dependencies": [],
+    },
+    "sky_hub": {
+        "domain": "sky_hub",
+        "name": "Sky hub",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "skybeacon": {
+        "domain": "skybeacon",
+        "name": "Skybeacon",
+        "requirements": ["pygatt[GATTTOOL]==4.0.5"],
+        "dependencies": [],
+    },
+    "skybell": {
+        "domain": "skybell",
+        "name": "Skybell",
+        "requirements": ["skybellpy==0.4.0"],
+        "dependencies": [],
+    },
+    "slack": {
+        "domain": "slack",
+        "name": "Slack",
+        "requirements": ["slacker==0.13.0"],
+        "dependencies": [],
+    },
+    "sleepiq": {
+        "domain": "sleepiq",
+        "name": "Sleepiq",
+        "requirements": ["sleepyq==0.7"],
+        "dependencies": [],
+    },
+    "slide": {
+        "domain": "slide",
+        "name": "Slide",
+        "requirements": ["goslide-api==0.5.1"],
+        "dependencies": [],
+    },
+    "sma": {
+        "domain": "sma",
+        "name": "Sma",
+        "requirements": ["pysma==0.3.4"],
+        "dependencies": [],
+    },
+    "smappee": {
+        "domain": "smappee",
+        "name": "Smappee",
+        "requirements": ["smappy==0.2.16"],
+        "dependencies": [],
+    },
+    "smarthab": {
+        "domain": "smarthab",
+        "name": "SmartHab",
+        "requirements": ["smarthab==0.20"],
+        "dependencies": [],
+    },
+    "smartthings": {
+        "domain": "smartthings",
+        "name": "Smartthings",
+        "config_flow": True,
+        "requirements": ["pysmartapp==0.3.2", "pysmartthings==0.6.9"],
+        "dependencies": ["webhook"],
+    },
+    "smarty": {
+        "domain": "smarty",
+        "name": "smarty",
+        "requirements": ["pysmarty==0.8"],
+        "dependencies": [],
+    },
+    "smhi": {
+        "domain": "smhi",
+        "name": "Smhi",
+        "config_flow": True,
+        "requirements": ["smhi-pkg==1.0.10"],
+        "dependencies": [],
+    },
+    "smtp": {
+        "domain": "smtp",
+        "name": "Smtp",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "snapcast": {
+        "domain": "snapcast",
+        "name": "Snapcast",
+        "requirements": ["snapcast==2.0.10"],
+        "dependencies": [],
+    },
+    "snips": {
+        "domain": "snips",
+        "name": "Snips",
+        "requirements": [],
+        "dependencies": ["mqtt"],
+    },
+    "snmp": {
+        "domain": "snmp",
+        "name": "Snmp",
+        "requirements": ["pysnmp==4.4.11"],
+        "dependencies": [],
+    },
+    "sochain": {
+        "domain": "sochain",
+        "name": "Sochain",
+        "requirements": ["python-sochain-api==0.0.2"],
+        "dependencies": [],
+    },
+    "socialblade": {
+        "domain": "socialblade",
+        "name": "Socialblade",
+        "requirements": ["socialbladeclient==0.2"],
+        "dependencies": [],
+    },
+    "solaredge": {
+        "domain": "solaredge",
+        "name": "Solaredge",
+        "config_flow": True,
+        "requirements": ["solaredge==0.0.2", "stringcase==1.2.0"],
+        "dependencies": [],
+    },
+    "solaredge_local": {
+        "domain": "solaredge_local",
+        "name": "Solar Edge Local",
+        "requirements": ["solaredge-local==0.2.0"],
+        "dependencies": [],
+    },
+    "solax": {
+        "domain": "solax",
+        "name": "Solax Inverter",
+        "requirements": ["solax==0.2.2"],
+        "dependencies": [],
+    },
+    "soma": {
+        "domain": "soma",
+        "name": "Soma Open API",
+        "config_flow": True,
+        "requirements": ["pysoma==0.0.10"],
+        "dependencies": [],
+    },
+    "somfy": {
+        "domain": "somfy",
+        "name": "Somfy Open API",
+        "config_flow": True,
+        "requirements": ["pymfy==0.6.0"],
+        "dependencies": ["http"],
+    },
+    "somfy_mylink": {
+        "domain": "somfy_mylink",
+        "name": "Somfy MyLink",
+        "requirements": ["somfy-mylink-synergy==1.0.6"],
+        "dependencies": [],
+    },
+    "sonarr": {
+        "domain": "sonarr",
+        "name": "Sonarr",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "songpal": {
+        "domain": "songpal",
+        "name": "Songpal",
+        "requirements": ["python-songpal==0.11.1"],
+        "dependencies": [],
+    },
+    "sonos": {
+        "domain": "sonos",
+        "name": "Sonos",
+        "config_flow": True,
+        "requirements": ["pysonos==0.0.24"],
+        "dependencies": [],
+    },
+    "sony_projector": {
+        "domain": "sony_projector",
+        "name": "Sony projector",
+        "requirements": ["pysdcp==1"],
+        "dependencies": [],
+    },
+    "soundtouch": {
+        "domain": "soundtouch",
+        "name": "Soundtouch",
+        "requirements": ["libsoundtouch==0.7.2"],
+        "dependencies": [],
+    },
+    "spaceapi": {
+        "domain": "spaceapi",
+        "name": "Spaceapi",
+        "requirements": [],
+        "dependencies": ["http"],
+    },
+    "spc": {
+        "domain": "spc",
+        "name": "Spc",
+        "requirements": ["pyspcwebgw==0.4.0"],
+        "dependencies": [],
+    },
+    "speedtestdotnet": {
+        "domain": "speedtestdotnet",
+        "name": "Speedtestdotnet",
+        "requirements": ["speedtest-cli==2.1.1"],
+        "dependencies": [],
+    },
+    "spider": {
+        "domain": "spider",
+        "name": "Spider",
+        "requirements": ["spiderpy==1.3.1"],
+        "dependencies": [],
+    },
+    "splunk": {
+        "domain": "splunk",
+        "name": "Splunk",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "spotcrime": {
+        "domain": "spotcrime",
+        "name": "Spotcrime",
+        "requirements": ["spotcrime==1.0.4"],
+        "dependencies": [],
+    },
+    "spotify": {
+        "domain": "spotify",
+        "name": "Spotify",
+        "requirements": ["spotipy-homeassistant==2.4.4.dev1"],
+        "dependencies": ["configurator", "http"],
+    },
+    "sql": {
+        "domain": "sql",
+        "name": "Sql",
+        "requirements": ["sqlalchemy==1.3.10"],
+        "dependencies": [],
+    },
+    "squeezebox": {
+        "domain": "squeezebox",
+        "name": "Squeezebox",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "ssdp": {
+        "domain": "ssdp",
+        "name": "SSDP",
+        "requirements": ["netdisco==2.6.0"],
+        "dependencies": [],
+    },
+    "starlingbank": {
+        "domain": "starlingbank",
+        "name": "Starlingbank",
+        "requirements": ["starlingbank==3.1"],
+        "dependencies": [],
+    },
+    "startca": {
+        "domain": "startca",
+        "name": "Startca",
+        "requirements": ["xmltodict==0.12.0"],
+        "dependencies": [],
+    },
+    "statistics": {
+        "domain": "statistics",
+        "name": "Statistics",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "statsd": {
+        "domain": "statsd",
+        "name": "Statsd",
+        "requirements": ["statsd==3.2.1"],
+        "dependencies": [],
+    },
+    "steam_online": {
+        "domain": "steam_online",
+        "name": "Steam online",
+        "requirements": ["steamodd==4.21"],
+        "dependencies": [],
+    },
+    "stiebel_eltron": {
+        "domain": "stiebel_eltron",
+        "name": "STIEBEL ELTRON",
+        "requirements": ["pystiebeleltron==0.0.1.dev2"],
+        "dependencies": ["modbus"],
+    },
+    "stream": {
+        "domain": "stream",
+        "name": "Stream",
+        "requirements": ["av==6.1.2"],
+        "dependencies": ["http"],
+    },
+    "streamlabswater": {
+        "domain": "streamlabswater",
+        "name": "Streamlabs Water",
+        "requirements": ["streamlabswater==1.0.1"],
+        "dependencies": [],
+    },
+    "suez_water": {
+        "domain": "suez_water",
+        "name": "Suez Water Consumption Sensor",
+        "requirements": ["pysuez==0.1.17"],
+        "dependencies": [],
+    },
+    "sun": {
+        "domain": "sun",
+        "name": "Sun",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "supervisord": {
+        "domain": "supervisord",
+        "name": "Supervisord",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "supla": {
+        "domain": "supla",
+        "name": "Supla",
+        "requirements": ["pysupla==0.0.3"],
+        "dependencies": [],
+    },
+    "swiss_hydrological_data": {
+        "domain": "swiss_hydrological_data",
+        "name": "Swiss hydrological data",
+        "requirements": ["swisshydrodata==0.0.3"],
+        "dependencies": [],
+    },
+    "swiss_public_transport": {
+        "domain": "swiss_public_transport",
+        "name": "Swiss public transport",
+        "requirements": ["python_opendata_transport==0.1.4"],
+        "dependencies": [],
+    },
+    "swisscom": {
+        "domain": "swisscom",
+        "name": "Swisscom",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "switch": {
+        "domain": "switch",
+        "name": "Switch",
+        "requirements": [],
+        "dependencies": ["group"],
+    },
+    "switchbot": {
+        "domain": "switchbot",
+        "name": "Switchbot",
+        "requirements": ["PySwitchbot==0.6.2"],
+        "dependencies": [],
+    },
+    "switcher_kis": {
+        "domain": "switcher_kis",
+        "name": "Switcher",
+        "requirements": ["aioswitcher==2019.4.26"],
+        "dependencies": [],
+    },
+    "switchmate": {
+        "domain": "switchmate",
+        "name": "Switchmate",
+        "requirements": ["pySwitchmate==0.4.6"],
+        "dependencies": [],
+    },
+    "syncthru": {
+        "domain": "syncthru",
+        "name": "Syncthru",
+        "requirements": ["pysyncthru==0.5.0"],
+        "dependencies": [],
+    },
+    "synology": {
+        "domain": "synology",
+        "name": "Synology",
+        "requirements": ["py-synology==0.2.0"],
+        "dependencies": [],
+    },
+    "synology_chat": {
+        "domain": "synology_chat",
+        "name": "Synology chat",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "synology_srm": {
+        "domain": "synology_srm",
+        "name": "Synology SRM",
+        "requirements": ["synology-srm==0.0.7"],
+        "dependencies": [],
+    },
+    "synologydsm": {
+        "domain": "synologydsm",
+        "name": "Synologydsm",
+        "requirements": ["python-synology==0.2.0"],
+        "dependencies": [],
+    },
+    "syslog": {
+        "domain": "syslog",
+        "name": "Syslog",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "system_health": {
+        "domain": "system_health",
+        "name": "System health",
+        "requirements": [],
+        "dependencies": ["http"],
+    },
+    "system_log": {
+        "domain": "system_log",
+        "name": "System log",
+        "requirements": [],
+        "dependencies": ["http"],
+    },
+    "systemmonitor": {
+        "domain": "systemmonitor",
+        "name": "Systemmonitor",
+        "requirements": ["psutil==5.6.3"],
+        "dependencies": [],
+    },
+    "tado": {
+        "domain": "tado",
+        "name": "Tado",
+        "requirements": ["python-tado==0.2.9"],
+        "dependencies": [],
+    },
+    "tahoma": {
+        "domain": "tahoma",
+        "name": "Tahoma",
+        "requirements": ["tahoma-api==0.0.14"],
+        "dependencies": [],
+    },
+    "tank_utility": {
+        "domain": "tank_utility",
+        "name": "Tank utility",
+        "requirements": ["tank_utility==1.4.0"],
+        "dependencies": [],
+    },
+    "tapsaff": {
+        "domain": "tapsaff",
+        "name": "Tapsaff",
+        "requirements": ["tapsaff==0.2.1"],
+        "dependencies": [],
+    },
+    "tautulli": {
+        "domain": "tautulli",
+        "name": "Tautulli",
+        "requirements": ["pytautulli==0.5.0"],
+        "dependencies": [],
+    },
+    "tcp": {
+        "domain": "tcp",
+        "name": "Tcp",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "ted5000": {
+        "domain": "ted5000",
+        "name": "Ted5000",
+        "requirements": ["xmltodict==0.12.0"],
+        "dependencies": [],
+    },
+    "teksavvy": {
+        "domain": "teksavvy",
+        "name": "Teksavvy",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "telegram": {
+        "domain": "telegram",
+        "name": "Telegram",
+        "requirements": [],
+        "dependencies": ["telegram_bot"],
+    },
+    "telegram_bot": {
+        "domain": "telegram_bot",
+        "name": "Telegram bot",
+        "requirements": ["python-telegram-bot==11.1.0"],
+        "dependencies": ["http"],
+    },
+    "tellduslive": {
+        "domain": "tellduslive",
+        "name": "Tellduslive",
+        "config_flow": True,
+        "requirements": ["tellduslive==0.10.10"],
+        "dependencies": [],
+    },
+    "tellstick": {
+        "domain": "tellstick",
+        "name": "Tellstick",
+        "requirements": ["tellcore-net==0.4", "tellcore-py==1.1.2"],
+        "dependencies": [],
+    },
+    "telnet": {
+        "domain": "telnet",
+        "name": "Telnet",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "temper": {
+        "domain": "temper",
+        "name": "Temper",
+        "requirements": ["temperusb==1.5.3"],
+        "dependencies": [],
+    },
+    "template": {
+        "domain": "template",
+        "name": "Template",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "tensorflow": {
+        "domain": "tensorflow",
+        "name": "Tensorflow",
+        "requirements": ["tensorflow==1.13.2", "numpy==1.17.3", "protobuf==3.6.1"],
+        "dependencies": [],
+    },
+    "tesla": {
+        "domain": "tesla",
+        "name": "Tesla",
+        "requirements": ["teslajsonpy==0.0.25"],
+        "dependencies": [],
+    },
+    "tfiac": {
+        "domain": "tfiac",
+        "name": "Tfiac",
+        "requirements": ["pytfiac==0.4"],
+        "dependencies": [],
+    },
+    "thermoworks_smoke": {
+        "domain": "thermoworks_smoke",
+        "name": "Thermoworks smoke",
+        "requirements": ["stringcase==1.2.0", "thermoworks_smoke==0.1.8"],
+        "dependencies": [],
+    },
+    "thethingsnetwork": {
+        "domain": "thethingsnetwork",
+        "name": "Thethingsnetwork",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "thingspeak": {
+        "domain": "thingspeak",
+        "name": "Thingspeak",
+        "requirements": ["thingspeak==0.4.1"],
+        "dependencies": [],
+    },
+    "thinkingcleaner": {
+        "domain": "thinkingcleaner",
+        "name": "Thinkingcleaner",
+        "requirements": ["pythinkingcleaner==0.0.3"],
+        "dependencies": [],
+    },
+    "thomson": {
+        "domain": "thomson",
+        "name": "Thomson",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "threshold": {
+        "domain": "threshold",
+        "name": "Threshold",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "tibber": {
+        "domain": "tibber",
+        "name": "Tibber",
+        "requirements": ["pyTibber==0.11.7"],
+        "dependencies": [],
+    },
+    "tikteck": {
+        "domain": "tikteck",
+        "name": "Tikteck",
+        "requirements": ["tikteck==0.4"],
+        "dependencies": [],
+    },
+    "tile": {
+        "domain": "tile",
+        "name": "Tile",
+        "requirements": ["pytile==2.0.6"],
+        "dependencies": [],
+    },
+    "time_date": {
+        "domain": "time_date",
+        "name": "Time date",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "timer": {
+        "domain": "timer",
+        "name": "Timer",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "tod": {
+        "domain": "tod",
+        "name": "Tod",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "todoist": {
+        "domain": "todoist",
+        "name": "Todoist",
+        "requirements": ["todoist-python==8.0.0"],
+        "dependencies": [],
+    },
+    "tof": {
+        "domain": "tof",
+        "name": "Tof",
+        "requirements": ["VL53L1X2==0.1.5"],
+        "dependencies": ["rpi_gpio"],
+    },
+    "tomato": {
+        "domain": "tomato",
+        "name": "Tomato",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "toon": {
+        "domain": "toon",
+        "name": "Toon",
+        "config_flow": True,
+        "requirements": ["toonapilib==3.2.4"],
+        "dependencies": [],
+    },
+    "torque": {
+        "domain": "torque",
+        "name": "Torque",
+        "requirements": [],
+        "dependencies": ["http"],
+    },
+    "totalconnect": {
+        "domain": "totalconnect",
+        "name": "Totalconnect",
+        "requirements": ["total_connect_client==0.28"],
+        "dependencies": [],
+    },
+    "touchline": {
+        "domain": "touchline",
+        "name": "Touchline",
+        "requirements": ["pytouchline==0.7"],
+        "dependencies": [],
+    },
+    "tplink": {
+        "domain": "tplink",
+        "name": "Tplink",
+        "config_flow": True,
+        "requirements": ["pyHS100==0.3.5", "tplink==0.2.1"],
+        "dependencies": [],
+    },
+    "tplink_lte": {
+        "domain": "tplink_lte",
+        "name": "Tplink lte",
+        "requirements": ["tp-connected==0.0.4"],
+        "dependencies": [],
+    },
+    "traccar": {
+        "domain": "traccar",
+        "name": "Traccar",
+        "config_flow": True,
+        "requirements": ["pytraccar==0.9.0", "stringcase==1.2.0"],
+        "dependencies": ["webhook"],
+    },
+    "trackr": {
+        "domain": "trackr",
+        "name": "Trackr",
+        "requirements": ["pytrackr==0.0.5"],
+        "dependencies": [],
+    },
+    "tradfri": {
+        "domain": "tradfri",
+        "name": "Tradfri",
+        "config_flow": True,
+        "requirements": ["pytradfri[async]==6.3.1"],
+        "dependencies": [],
+    },
+    "trafikverket_train": {
+        "domain": "trafikverket_train",
+        "name": "Trafikverket train information",
+        "requirements": ["pytrafikverket==0.1.5.9"],
+        "dependencies": [],
+    },
+    "trafikverket_weatherstation": {
+        "domain": "trafikverket_weatherstation",
+        "name": "Trafikverket weatherstation",
+        "requirements": ["pytrafikverket==0.1.5.9"],
+        "dependencies": [],
+    },
+    "transmission": {
+        "domain": "transmission",
+        "name": "Transmission",
+        "config_flow": True,
+        "requirements": ["transmissionrpc==0.11"],
+        "dependencies": [],
+    },
+    "transport_nsw": {
+        "domain": "transport_nsw",
+        "name": "Transport nsw",
+        "requirements": ["PyTransportNSW==0.1.1"],
+        "dependencies": [],
+    },
+    "travisci": {
+        "domain": "travisci",
+        "name": "Travisci",
+        "requirements": ["TravisPy==0.3.5"],
+        "dependencies": [],
+    },
+    "trend": {
+        "domain": "trend",
+        "name": "Trend",
+        "requirements": ["numpy==1.17.3"],
+        "dependencies": [],
+    },
+    "tts": {
+        "domain": "tts",
+        "name": "Tts",
+        "requirements": ["mutagen==1.42.0"],
+        "dependencies": ["http"],
+    },
+    "tuya": {
+        "domain": "tuya",
+        "name": "Tuya",
+        "requirements": ["tuyaha==0.0.4"],
+        "dependencies": [],
+    },
+    "twentemilieu": {
+        "domain": "twentemilieu",
+        "name": "Twente Milieu",
+        "config_flow": True,
+        "requirements": ["twentemilieu==0.1.0"],
+        "dependencies": [],
+    },
+    "twilio": {
+        "domain": "twilio",
+        "name": "Twilio",
+        "config_flow": True,
+        "requirements": ["twilio==6.19.1"],
+        "dependencies": ["webhook"],
+    },
+    "twilio_call": {
+        "domain": "twilio_call",
+        "name": "Twilio call",
+        "requirements": [],
+        "dependencies": ["twilio"],
+    },
+    "twilio_sms": {
+        "domain": "twilio_sms",
+        "name": "Twilio sms",
+        "requirements": [],
+        "dependencies": ["twilio"],
+    },
+    "twitch": {
+        "domain": "twitch",
+        "name": "Twitch",
+        "requirements": ["python-twitch-client==0.6.0"],
+        "dependencies": [],
+    },
+    "twitter": {
+        "domain": "twitter",
+        "name": "Twitter",
+        "requirements": ["TwitterAPI==2.5.9"],
+        "dependencies": [],
+    },
+    "ubee": {
+        "domain": "ubee",
+        "name": "Ubee",
+        "requirements": ["pyubee==0.7"],
+        "dependencies": [],
+    },
+    "ubus": {
+        "domain": "ubus",
+        "name": "Ubus",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "ue_smart_radio": {
+        "domain": "ue_smart_radio",
+        "name": "Ue smart radio",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "uk_transport": {
+        "domain": "uk_transport",
+        "name": "Uk transport",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "unifi": {
+        "domain": "unifi",
+        "name": "Unifi",
+        "config_flow": True,
+        "requirements": ["aiounifi==11"],
+        "dependencies": [],
+    },
+    "unifi_direct": {
+        "domain": "unifi_direct",
+        "name": "Unifi direct",
+        "requirements": ["pexpect==4.6.0"],
+        "dependencies": [],
+    },
+    "universal": {
+        "domain": "universal",
+        "name": "Universal",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "upc_connect": {
+        "domain": "upc_connect",
+        "name": "Upc connect",
+        "requirements": ["connect-box==0.2.5"],
+        "dependencies": [],
+    },
+    "upcloud": {
+        "domain": "upcloud",
+        "name": "Upcloud",
+        "requirements": ["upcloud-api==0.4.3"],
+        "dependencies": [],
+    },
+    "updater": {
+        "domain": "updater",
+        "name": "Updater",
+        "requirements": ["distro==1.4.0"],
+        "dependencies": [],
+    },
+    "upnp": {
+        "domain": "upnp",
+        "name": "Upnp",
+        "config_flow": True,
+        "requirements": ["async-upnp-client==0.14.11"],
+        "dependencies": [],
+    },
+    "uptime": {
+        "domain": "uptime",
+        "name": "Uptime",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "uptimerobot": {
+        "domain": "uptimerobot",
+        "name": "Uptimerobot",
+        "requirements": ["pyuptimerobot==0.0.5"],
+        "dependencies": [],
+    },
+    "uscis": {
+        "domain": "uscis",
+        "name": "Uscis",
+        "requirements": ["uscisstatus==0.1.1"],
+        "dependencies": [],
+    },
+    "usgs_earthquakes_feed": {
+        "domain": "usgs_earthquakes_feed",
+        "name": "Usgs earthquakes feed",
+        "requirements": ["geojson_client==0.4"],
+        "dependencies": [],
+    },
+    "utility_meter": {
+        "domain": "utility_meter",
+        "name": "Utility meter",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "uvc": {
+        "domain": "uvc",
+        "name": "Uvc",
+        "requirements": ["uvcclient==0.11.0"],
+        "dependencies": [],
+    },
+    "vacuum": {
+        "domain": "vacuum",
+        "name": "Vacuum",
+        "requirements": [],
+        "dependencies": ["group"],
+    },
+    "vallox": {
+        "domain": "vallox",
+        "name": "Vallox",
+        "requirements": ["vallox-websocket-api==2.2.0"],
+        "dependencies": [],
+    },
+    "vasttrafik": {
+        "domain": "vasttrafik",
+        "name": "Vasttrafik",
+        "requirements": ["vtjp==0.1.14"],
+        "dependencies": [],
+    },
+    "velbus": {
+        "domain": "velbus",
+        "name": "Velbus",
+        "config_flow": True,
+        "requirements": ["python-velbus==2.0.27"],
+        "dependencies": [],
+    },
+    "velux": {
+        "domain": "velux",
+        "name": "Velux",
+        "requirements": ["pyvlx==0.2.11"],
+        "dependencies": [],
+    },
+    "venstar": {
+        "domain": "venstar",
+        "name": "Venstar",
+        "requirements": ["venstarcolortouch==0.9"],
+        "dependencies": [],
+    },
+    "vera": {
+        "domain": "vera",
+        "name": "Vera",
+        "requirements": ["pyvera==0.3.6"],
+        "dependencies": [],
+    },
+    "verisure": {
+        "domain": "verisure",
+        "name": "Verisure",
+        "requirements": ["jsonpath==0.75", "vsure==1.5.2"],
+        "dependencies": [],
+    },
+    "version": {
+        "domain": "version",
+        "name": "Version",
+        "requirements": ["pyhaversion==3.1.0"],
+        "dependencies": [],
+    },
+    "vesync": {
+        "domain": "vesync",
+        "name": "VeSync",
+        "config_flow": True,
+        "requirements": ["pyvesync==1.1.0"],
+        "dependencies": [],
+    },
+    "viaggiatreno": {
+        "domain": "viaggiatreno",
+        "name": "Viaggiatreno",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "vicare": {
+        "domain": "vicare",
+        "name": "Viessmann ViCare",
+        "requirements": ["PyViCare==0.1.1"],
+        "dependencies": [],
+    },
+    "vivotek": {
+        "domain": "vivotek",
+        "name": "Vivotek",
+        "requirements": ["libpyvivotek==0.2.2"],
+        "dependencies": [],
+    },
+    "vizio": {
+        "domain": "vizio",
+        "name": "Vizio",
+        "requirements": ["pyvizio==0.0.7"],
+        "dependencies": [],
+    },
+    "vlc": {
+        "domain": "vlc",
+        "name": "Vlc",
+        "requirements": ["python-vlc==1.1.2"],
+        "dependencies": [],
+    },
+    "vlc_telnet": {
+        "domain": "vlc_telnet",
+        "name": "VLC telnet",
+        "requirements": ["python-telnet-vlc==1.0.4"],
+        "dependencies": [],
+    },
+    "voicerss": {
+        "domain": "voicerss",
+        "name": "Voicerss",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "volkszaehler": {
+        "domain": "volkszaehler",
+        "name": "Volkszaehler",
+        "requirements": ["volkszaehler==0.1.2"],
+        "dependencies": [],
+    },
+    "volumio": {
+        "domain": "volumio",
+        "name": "Volumio",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "volvooncall": {
+        "domain": "volvooncall",
+        "name": "Volvooncall",
+        "requirements": ["volvooncall==0.8.7"],
+        "dependencies": [],
+    },
+    "vultr": {
+        "domain": "vultr",
+        "name": "Vultr",
+        "requirements": ["vultr==0.1.2"],
+        "dependencies": [],
+    },
+    "w800rf32": {
+        "domain": "w800rf32",
+        "name": "W800rf32",
+        "requirements": ["pyW800rf32==0.1"],
+        "dependencies": [],
+    },
+    "wake_on_lan": {
+        "domain": "wake_on_lan",
+        "name": "Wake on lan",
+        "requirements": ["wakeonlan==1.1.6"],
+        "dependencies": [],
+    },
+    "waqi": {
+        "domain": "waqi",
+        "name": "Waqi",
+        "requirements": ["waqiasync==1.0.0"],
+        "dependencies": [],
+    },
+    "water_heater": {
+        "domain": "water_heater",
+        "name": "Water heater",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "waterfurnace": {
+        "domain": "waterfurnace",
+        "name": "Waterfurnace",
+        "requirements": ["waterfurnace==1.1.0"],
+        "dependencies": [],
+    },
+    "watson_iot": {
+        "domain": "watson_iot",
+        "name": "Watson iot",
+        "requirements": ["ibmiotf==0.3.4"],
+        "dependencies": [],
+    },
+    "watson_tts": {
+        "domain": "watson_tts",
+        "name": "IBM Watson TTS",
+        "requirements": ["ibm-watson==3.0.3"],
+        "dependencies": [],
+    },
+    "waze_travel_time": {
+        "domain": "waze_travel_time",
+        "name": "Waze travel time",
+        "requirements": ["WazeRouteCalculator==0.10"],
+        "dependencies": [],
+    },
+    "weather": {
+        "domain": "weather",
+        "name": "Weather",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "webhook": {
+        "domain": "webhook",
+        "name": "Webhook",
+        "requirements": [],
+        "dependencies": ["http"],
+    },
+    "weblink": {
+        "domain": "weblink",
+        "name": "Weblink",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "webostv": {
+        "domain": "webostv",
+        "name": "Webostv",
+        "requirements": ["pylgtv==0.1.9", "websockets==6.0"],
+        "dependencies": ["configurator"],
+    },
+    "websocket_api": {
+        "domain": "websocket_api",
+        "name": "Websocket api",
+        "requirements": [],
+        "dependencies": ["http"],
+    },
+    "wemo": {
+        "domain": "wemo",
+        "name": "Wemo",
+        "config_flow": True,
+        "requirements": ["pywemo==0.4.34"],
+        "dependencies": [],
+    },
+    "whois": {
+        "domain": "whois",
+        "name": "Whois",
+        "requirements": ["python-whois==0.7.2"],
+        "dependencies": [],
+    },
+    "wink": {
+        "domain": "wink",
+        "name": "Wink",
+        "requirements": ["pubnubsub-handler==1.0.8", "python-wink==1.10.5"],
+        "dependencies": ["configurator"],
+    },
+    "wirelesstag": {
+        "domain": "wirelesstag",
+        "name": "Wirelesstag",
+        "requirements": ["wirelesstagpy==0.4.0"],
+        "dependencies": [],
+    },
+    "withings": {
+        "domain": "withings",
+        "name": "Withings",
+        "config_flow": True,
+        "requirements": ["withings-api==2.0.0b8"],
+        "dependencies": ["api", "http", "webhook"],
+    },
+    "workday": {
+        "domain": "workday",
+        "name": "Workday",
+        "requirements": ["holidays==0.9.11"],
+        "dependencies": [],
+    },
+    "worldclock": {
+        "domain": "worldclock",
+        "name": "Worldclock",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "worldtidesinfo": {
+        "domain": "worldtidesinfo",
+        "name": "Worldtidesinfo",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "worxlandroid": {
+        "domain": "worxlandroid",
+        "name": "Worxlandroid",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "wsdot": {
+        "domain": "wsdot",
+        "name": "Wsdot",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "wunderground": {
+        "domain": "wunderground",
+        "name": "Wunderground",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "wunderlist": {
+        "domain": "wunderlist",
+        "name": "Wunderlist",
+        "requirements": ["wunderpy2==0.1.6"],
+        "dependencies": [],
+    },
+    "wwlln": {
+        "domain": "wwlln",
+        "name": "World Wide Lightning Location Network",
+        "config_flow": True,
+        "requirements": ["aiowwlln==2.0.2"],
+        "dependencies": [],
+    },
+    "x10": {
+        "domain": "x10",
+        "name": "X10",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "xbox_live": {
+        "domain": "xbox_live",
+        "name": "Xbox live",
+        "requirements": ["xboxapi==0.1.1"],
+        "dependencies": [],
+    },
+    "xeoma": {
+        "domain": "xeoma",
+        "name": "Xeoma",
+        "requirements": ["pyxeoma==1.4.1"],
+        "dependencies": [],
+    },
+    "xfinity": {
+        "domain": "xfinity",
+        "name": "Xfinity",
+        "requirements": ["xfinity-gateway==0.0.4"],
+        "dependencies": [],
+    },
+    "xiaomi": {
+        "domain": "xiaomi",
+        "name": "Xiaomi",
+        "requirements": [],
+        "dependencies": ["ffmpeg"],
+    },
+    "xiaomi_aqara": {
+        "domain": "xiaomi_aqara",
+        "name": "Xiaomi aqara",
+        "requirements": ["PyXiaomiGateway==0.12.4"],
+        "dependencies": [],
+    },
+    "xiaomi_miio": {
+        "domain": "xiaomi_miio",
+        "name": "Xiaomi miio",
+        "requirements": ["construct==2.9.45", "python-miio==0.4.6"],
+        "dependencies": [],
+    },
+    "xiaomi_tv": {
+        "domain": "xiaomi_tv",
+        "name": "Xiaomi tv",
+        "requirements": ["pymitv==1.4.3"],
+        "dependencies": [],
+    },
+    "xmpp": {
+        "domain": "xmpp",
+        "name": "Xmpp",
+        "requirements": ["slixmpp==1.4.2"],
+        "dependencies": [],
+    },
+    "xs1": {
+        "domain": "xs1",
+        "name": "Xs1",
+        "requirements": ["xs1-api-client==2.3.5"],
+        "dependencies": [],
+    },
+    "yale_smart_alarm": {
+        "domain": "yale_smart_alarm",
+        "name": "Yale smart alarm",
+        "requirements": ["yalesmartalarmclient==0.1.6"],
+        "dependencies": [],
+    },
+    "yamaha": {
+        "domain": "yamaha",
+        "name": "Yamaha",
+        "requirements": ["rxv==0.6.0"],
+        "dependencies": [],
+    },
+    "yamaha_musiccast": {
+        "domain": "yamaha_musiccast",
+        "name": "Yamaha musiccast",
+        "requirements": ["pymusiccast==0.1.6"],
+        "dependencies": [],
+    },
+    "yandex_transport": {
+        "domain": "yandex_transport",
+        "name": "Yandex Transport",
+        "requirements": ["ya_ma==0.3.8"],
+        "dependencies": [],
+    },
+    "yandextts": {
+        "domain": "yandextts",
+        "name": "Yandextts",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "yeelight": {
+        "domain": "yeelight",
+        "name": "Yeelight",
+        "requirements": ["yeelight==0.5.0"],
+        "dependencies": [],
+    },
+    "yeelightsunflower": {
+        "domain": "yeelightsunflower",
+        "name": "Yeelightsunflower",
+        "requirements": ["yeelightsunflower==0.0.10"],
+        "dependencies": [],
+    },
+    "yessssms": {
+        "domain": "yessssms",
+        "name": "Yessssms",
+        "requirements": ["YesssSMS==0.4.1"],
+        "dependencies": [],
+    },
+    "yi": {
+        "domain": "yi",
+        "name": "Yi",
+        "requirements": ["aioftp==0.12.0"],
+        "dependencies": ["ffmpeg"],
+    },
+    "yr": {
+        "domain": "yr",
+        "name": "Yr",
+        "requirements": ["xmltodict==0.12.0"],
+        "dependencies": [],
+    },
+    "yweather": {
+        "domain": "yweather",
+        "name": "Yweather",
+        "requirements": ["yahooweather==0.10"],
+        "dependencies": [],
+    },
+    "zabbix": {
+        "domain": "zabbix",
+        "name": "Zabbix",
+        "requirements": ["pyzabbix==0.7.4"],
+        "dependencies": [],
+    },
+    "zamg": {
+        "domain": "zamg",
+        "name": "Zamg",
+        "requirements": [],
+        "dependencies": [],
+    },
+    "zengge": {
+        "domain": "zengge",
+        "name": "Zengge",
+        "requirements": ["zengge==0.2"],
+        "dependencies": [],
+    },
+    "zeroconf": {
+        "domain": "zeroconf",
+        "name": "Zeroconf",
+        "requirements": ["zeroconf==0.23.0"],
+        "dependencies": ["api"],
+    },
+    "zestimate": {
+        "domain": "zestimate",
+        "name": "Zestimate",
+        "requirements": ["xmltodict==0.12.0"],
+        "dependencies": [],
+    },
+    "zha": {
+        "domain": "zha",
+        "name": "Zigbee Home Automation",
+        "config_flow": True,
+        "requirements": ["bellows-homeassistant==0.10.0", "zha-quirks==0.0.26", "zigpy-deconz==0.5.0", "zigpy-homeassistant==0.9.0", "zigpy-xbee-homeassistant==0.5.0", "zigpy-zigate==0.4.1"],
+        "dependencies": [],
+    },
+    "zhong_hong": {
+        "domain": "zhong_hong",
+        "name": "Zhong hong",
+        "requirements": ["zhong_hong_hvac==1.0.9"],
+        "dependencies": [],
+    },
+    "zigbee": {
+        "domain": "zigbee",
+        "name": "Zigbee",
+        "requirements": ["xbee-helper==0.0.7"],
+        "dependencies": [],
+    },
+    "ziggo_mediabox_xl": {
+        "domain": "ziggo_mediabox_xl",
+        "name": "Ziggo mediabox xl",
+        "requirements": ["ziggo-mediabox-xl==1.1.0"],
+        "dependencies": [],
+    },
+    "zone": {
+        "domain": "zone",
+        "name": "Zone",
+        "config_flow": True,
+        "requirements": [],
+        "dependencies": [],
+    },
+    "zoneminder": {
+        "domain": "zoneminder",
+        "name": "Zoneminder",
+        "requirements": ["zm-py==0.3.3"],
+        "dependencies": [],
+    },
+    "zwave": {
+        "domain": "zwave",
+        "name": "Z-Wave",
+        "config_flow": True,
+        "requirements": ["homeassistant-pyozw==0.1.4", "pydispatcher==2.0.5"],
+        "dependencies": [],
+    },
+}
@@ -194,11 +194,13 @@ class EntityComponent:
             return [entity for entity in self.entities if entity.available]
 
         entity_ids = await async_extract_entity_ids(self.hass, service, expand_group)
-        return [
-            entity
-            for entity in self.entities
-            if entity.available and entity.entity_id in entity_ids
-        ]
+        entities = []
+        for platform in self._platforms.values():
+            for entity_id in entity_ids:
+                entity = platform.entities.get(entity_id)
+                if entity is not None and entity.available:
+                    entities.append(entity)
+        return entities
 
     @callback
     def async_register_entity_service(self, name, schema, func, required_features=None):
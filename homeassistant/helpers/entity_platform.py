@@ -1,15 +1,26 @@
 """Class to manage the entities for a single platform."""
 import asyncio
 from contextvars import ContextVar
+import random
+from time import monotonic
 from typing import Optional
 
+import attr
+
 from homeassistant.const import DEVICE_DEFAULT_NAME
-from homeassistant.core import callback, valid_entity_id, split_entity_id
+from homeassistant.core import (
+    callback,
+    current_integration,
+    valid_entity_id,
+    split_entity_id,
+)
 from homeassistant.exceptions import HomeAssistantError, PlatformNotReady
+from homeassistant.setup import async_profile_dependencies, async_profile_phase
 from homeassistant.util.async_ import run_callback_threadsafe
+import homeassistant.util.dt as dt_util
 
 from .entity_registry import DISABLED_INTEGRATION
-from .event import async_track_time_interval, async_call_later
+from .event import async_track_point_in_utc_time, async_call_later
 
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
@@ -18,6 +29,60 @@ SLOW_SETUP_WARNING = 10
 SLOW_SETUP_MAX_WAIT = 60
 PLATFORM_NOT_READY_RETRIES = 10
 
+# Maximum number of entity polls running at the same time
+MAX_PARALLEL_POLLS = 32
+# Maximum number of entity polls of a single platform running at the same time
+PLATFORM_MAX_PARALLEL_POLLS = 8
+
+DATA_POLL_SEMAPHORE = "entity_platform_poll_semaphore"
+DATA_POLL_STATISTICS = "entity_platform_poll_statistics"
+
+
+@attr.s(slots=True)
+class PollStatistics:
+    """Statistics of the polls of the entities of a platform.
+
+    Lag is the time between when a poll was due and when it started.
+    """
+
+    polls = attr.ib(type=int, default=0)
+    skipped = attr.ib(type=int, default=0)
+    duration_last = attr.ib(type=float, default=0.0)
+    duration_max = attr.ib(type=float, default=0.0)
+    duration_total = attr.ib(type=float, default=0.0)
+    lag_last = attr.ib(type=float, default=0.0)
+    lag_max = attr.ib(type=float, default=0.0)
+    lag_total = attr.ib(type=float, default=0.0)
+
+    @callback
+    def async_add_poll(self, duration, lag):
+        """Add a finished poll."""
+        self.polls += 1
+        self.duration_last = duration
+        self.duration_max = max(self.duration_max, duration)
+        self.duration_total += duration
+        self.lag_last = lag
+        self.lag_max = max(self.lag_max, lag)
+        self.lag_total += lag
+
+    def as_dict(self):
+        """Return the statistics as a dictionary."""
+        polls = self.polls or 1
+        return {
+            "polls": self.polls,
+            "skipped": self.skipped,
+            "duration": {
+                "last": self.duration_last,
+                "max": self.duration_max,
+                "average": self.duration_total / polls,
+            },
+            "lag": {
+                "last": self.lag_last,
+                "max": self.lag_max,
+                "average": self.lag_total / polls,
+            },
+        }
+
 
 class EntityPlatform:
     """Manage the entities for a single platform."""
@@ -55,11 +120,17 @@ class EntityPlatform:
         self.config_entry = None
         self.entities = {}
         self._tasks = []
-        # Method to cancel the state change listener
-        self._async_unsub_polling = None
+        # Methods to cancel the next poll of each polled entity
+        self._async_unsub_polls = {}
+        # Entities that are being polled
+        self._polls_in_flight = set()
+        self._poll_semaphore = None
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup = None
-        self._process_updates = None
+        # Platforms with the same name share their statistics
+        self.poll_statistics = hass.data.setdefault(
+            DATA_POLL_STATISTICS, {}
+        ).setdefault(f"{domain}.{platform_name}", PollStatistics())
 
         # Platform is None for the EntityComponent "catch-all" EntityPlatform
         # which powers entity_component.add_entities
@@ -99,8 +170,7 @@ class EntityPlatform:
 
             # This should not be replaced with hass.async_add_job because
             # we don't want to track this task in case it blocks startup.
-            return hass.loop.run_in_executor(
-                None,
+            return hass.executors.async_submit(
                 platform.setup_platform,
                 hass,
                 platform_config,
@@ -131,6 +201,7 @@ class EntityPlatform:
         async_create_setup_task creates a coroutine that sets up platform.
         """
         current_platform.set(self)
+        current_integration.set(self.platform_name)
         logger = self.logger
         hass = self.hass
         full_name = f"{self.domain}.{self.platform_name}"
@@ -144,18 +215,21 @@ class EntityPlatform:
             SLOW_SETUP_WARNING,
         )
 
+        async_profile_dependencies(hass, full_name, (self.platform_name,))
+
         try:
-            task = async_create_setup_task()
+            with async_profile_phase(hass, full_name, "setup"):
+                task = async_create_setup_task()
 
-            await asyncio.wait_for(asyncio.shield(task), SLOW_SETUP_MAX_WAIT)
+                await asyncio.wait_for(asyncio.shield(task), SLOW_SETUP_MAX_WAIT)
 
-            # Block till all entities are done
-            if self._tasks:
-                pending = [task for task in self._tasks if not task.done()]
-                self._tasks.clear()
+                # Block till all entities are done
+                if self._tasks:
+                    pending = [task for task in self._tasks if not task.done()]
+                    self._tasks.clear()
 
-                if pending:
-                    await asyncio.wait(pending)
+                    if pending:
+                        await asyncio.wait(pending)
 
             hass.config.components.add(full_name)
             return True
@@ -252,15 +326,6 @@ class EntityPlatform:
         await asyncio.wait(tasks)
         self.async_entities_added_callback()
 
-        if self._async_unsub_polling is not None or not any(
-            entity.should_poll for entity in self.entities.values()
-        ):
-            return
-
-        self._async_unsub_polling = async_track_time_interval(
-            self.hass, self._update_entity_states, self.scan_interval
-        )
-
     async def _async_add_entity(
         self, entity, update_before_add, entity_registry, device_registry
     ):
@@ -400,13 +465,28 @@ class EntityPlatform:
 
         entity_id = entity.entity_id
         self.entities[entity_id] = entity
-        entity.async_on_remove(lambda: self.entities.pop(entity_id))
+
+        @callback
+        def async_remove_entity():
+            """Forget the entity and stop polling it."""
+            self.entities.pop(entity_id)
+            unsub_poll = self._async_unsub_polls.pop(entity_id, None)
+            if unsub_poll is not None:
+                unsub_poll()
+
+        entity.async_on_remove(async_remove_entity)
 
         await entity.async_internal_added_to_hass()
         await entity.async_added_to_hass()
 
         await entity.async_update_ha_state()
 
+        if entity.should_poll and entity_id in self.entities:
+            # Spread the polls of the entities over the scan interval
+            self._async_schedule_poll(
+                entity, dt_util.utcnow() + self.scan_interval * random.random()
+            )
+
     async def async_reset(self):
         """Remove all entities and reset data.
 
@@ -423,49 +503,94 @@ class EntityPlatform:
 
         await asyncio.wait(tasks)
 
-        if self._async_unsub_polling is not None:
-            self._async_unsub_polling()
-            self._async_unsub_polling = None
-
     async def async_remove_entity(self, entity_id):
         """Remove entity id from platform."""
         await self.entities[entity_id].async_remove()
 
-        # Clean up polling job if no longer needed
-        if self._async_unsub_polling is not None and not any(
-            entity.should_poll for entity in self.entities.values()
-        ):
-            self._async_unsub_polling()
-            self._async_unsub_polling = None
+    @callback
+    def _async_schedule_poll(self, entity, point_in_time):
+        """Schedule the next poll of an entity."""
+
+        @callback
+        def async_poll_due(now):
+            """Handle a poll of the entity being due."""
+            self._async_poll_due(entity, point_in_time, now)
+
+        self._async_unsub_polls[entity.entity_id] = async_track_point_in_utc_time(
+            self.hass, async_poll_due, point_in_time
+        )
 
-    async def _update_entity_states(self, now):
-        """Update the states of all the polling entities.
+    @callback
+    def _async_poll_due(self, entity, point_in_time, now):
+        """Poll an entity unless its previous poll is still running.
 
-        To protect from flooding the executor, we will update async entities
-        in parallel and other entities sequential.
+        Polls are scheduled at fixed intervals from the first poll, so the
+        entities of a platform stay spread over the scan interval.
 
         This method must be run in the event loop.
         """
-        if self._process_updates is None:
-            self._process_updates = asyncio.Lock()
-        if self._process_updates.locked():
+        entity_id = entity.entity_id
+        next_poll = point_in_time + self.scan_interval
+
+        if next_poll <= now:
+            # Skip the polls that are already overdue
+            next_poll += self.scan_interval * (
+                (now - next_poll) // self.scan_interval + 1
+            )
+
+        self._async_schedule_poll(entity, next_poll)
+
+        if not entity.should_poll:
+            return
+
+        if entity_id in self._polls_in_flight:
+            self.poll_statistics.skipped += 1
             self.logger.warning(
-                "Updating %s %s took longer than the scheduled update " "interval %s",
-                self.platform_name,
-                self.domain,
+                "Updating %s took longer than the scheduled update interval %s",
+                entity_id,
                 self.scan_interval,
             )
             return
 
-        async with self._process_updates:
-            tasks = []
-            for entity in self.entities.values():
-                if not entity.should_poll:
-                    continue
-                tasks.append(entity.async_update_ha_state(True))
+        self._polls_in_flight.add(entity_id)
+        self.hass.async_create_task(
+            self._async_poll_entity(entity, (now - point_in_time).total_seconds())
+        )
+
+    async def _async_poll_entity(self, entity, lag):
+        """Update an entity, limiting the number of polls running at once.
+
+        lag is the number of seconds the poll was late when it was due.
+        """
+        hass = self.hass
+        current_integration.set(self.platform_name)
+        global_semaphore = hass.data.get(DATA_POLL_SEMAPHORE)
+
+        if global_semaphore is None:
+            global_semaphore = hass.data[DATA_POLL_SEMAPHORE] = asyncio.Semaphore(
+                MAX_PARALLEL_POLLS
+            )
+
+        if self._poll_semaphore is None:
+            self._poll_semaphore = asyncio.Semaphore(PLATFORM_MAX_PARALLEL_POLLS)
+
+        waiting = monotonic()
 
-            if tasks:
-                await asyncio.wait(tasks)
+        try:
+            # Wait for the platform first so a busy platform can't take all
+            # of the global slots
+            async with self._poll_semaphore, global_semaphore:
+                if self.entities.get(entity.entity_id) is not entity:
+                    # Removed while waiting
+                    return
+
+                start = monotonic()
+                await entity.async_update_ha_state(True)
+                self.poll_statistics.async_add_poll(
+                    monotonic() - start, lag + start - waiting
+                )
+        finally:
+            self._polls_in_flight.discard(entity.entity_id)
 
 
 current_platform: ContextVar[Optional[EntityPlatform]] = ContextVar(
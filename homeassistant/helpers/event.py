@@ -1,13 +1,22 @@
 """Helpers for listening to events."""
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 import functools as ft
-from typing import Callable
+import logging
+from typing import Any, Callable, Iterable, Iterator, Optional
 
 import attr
 
 from homeassistant.loader import bind_hass
 from homeassistant.helpers.sun import get_astral_event_next
-from homeassistant.core import HomeAssistant, callback, CALLBACK_TYPE
+from homeassistant.helpers.template import RenderInfo, async_collect_render_info
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    HomeAssistant,
+    callback,
+    split_entity_id,
+)
 from homeassistant.const import (
     ATTR_NOW,
     EVENT_STATE_CHANGED,
@@ -20,6 +29,15 @@ from homeassistant.const import (
 from homeassistant.util import dt as dt_util
 from homeassistant.util.async_ import run_callback_threadsafe
 
+TRACK_STATE_CHANGE_CALLBACKS = "track_state_change_callbacks"
+TRACK_STATE_CHANGE_LISTENER = "track_state_change_listener"
+TRACK_STATE_DOMAIN_CHANGE_CALLBACKS = "track_state_domain_change_callbacks"
+TRACK_STATE_DOMAIN_CHANGE_LISTENER = "track_state_domain_change_listener"
+
+# Renders iterating over all states are tracked at most this often
+ALL_STATES_RATE_LIMIT = timedelta(minutes=1)
+
+_LOGGER = logging.getLogger(__name__)
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # PyLint does not like the use of threaded_listener_factory
@@ -76,9 +94,6 @@ def async_track_state_change(hass, entity_ids, action, from_state=None, to_state
     @callback
     def state_change_listener(event):
         """Handle specific state changes."""
-        if entity_ids != MATCH_ALL and event.data.get("entity_id") not in entity_ids:
-            return
-
         old_state = event.data.get("old_state")
         if old_state is not None:
             old_state = old_state.state
@@ -95,37 +110,326 @@ def async_track_state_change(hass, entity_ids, action, from_state=None, to_state
                 event.data.get("new_state"),
             )
 
-    return hass.bus.async_listen(EVENT_STATE_CHANGED, state_change_listener)
+    if entity_ids == MATCH_ALL:
+        return hass.bus.async_listen(EVENT_STATE_CHANGED, state_change_listener)
+
+    return async_track_state_change_event(hass, entity_ids, state_change_listener)
 
 
 track_state_change = threaded_listener_factory(async_track_state_change)
 
 
+@callback
+@bind_hass
+def async_track_state_change_event(
+    hass: HomeAssistant, entity_ids: Iterable[str], action: Callable[..., None]
+) -> CALLBACK_TYPE:
+    """Track state changed events of specific entities.
+
+    The action is called with the state_changed event. Instead of every
+    listener filtering all state changes, a single listener dispatches each
+    state change to the actions tracking that entity id.
+
+    Must be run within the event loop.
+    """
+    if isinstance(entity_ids, str):
+        entity_ids = (entity_ids,)
+
+    return _async_track_keyed_state_change(
+        hass,
+        TRACK_STATE_CHANGE_CALLBACKS,
+        TRACK_STATE_CHANGE_LISTENER,
+        {entity_id.lower() for entity_id in entity_ids},
+        _entity_id_key,
+        action,
+    )
+
+
+@callback
+@bind_hass
+def async_track_state_change_domain_event(
+    hass: HomeAssistant, domains: Iterable[str], action: Callable[..., None]
+) -> CALLBACK_TYPE:
+    """Track state changed events of all entities in specific domains.
+
+    The action is called with the state_changed event.
+
+    Must be run within the event loop.
+    """
+    if isinstance(domains, str):
+        domains = (domains,)
+
+    return _async_track_keyed_state_change(
+        hass,
+        TRACK_STATE_DOMAIN_CHANGE_CALLBACKS,
+        TRACK_STATE_DOMAIN_CHANGE_LISTENER,
+        {domain.lower() for domain in domains},
+        _domain_key,
+        action,
+    )
+
+
+def _entity_id_key(event):
+    """Return the entity id of a state_changed event."""
+    return event.data.get("entity_id")
+
+
+def _domain_key(event):
+    """Return the domain of a state_changed event."""
+    return split_entity_id(event.data["entity_id"])[0]
+
+
+@callback
+def _async_track_keyed_state_change(
+    hass, callbacks_key, listener_key, keys, key_func, action
+):
+    """Add an action to the callbacks of keys and dispatch state changes to them.
+
+    A single state_changed listener is shared by all actions tracking by the
+    same kind of key. It is removed again when the last action is removed.
+    """
+    if not keys:
+        return lambda: None
+
+    keyed_callbacks = hass.data.setdefault(callbacks_key, {})
+
+    if listener_key not in hass.data:
+
+        @callback
+        def keyed_state_change_dispatcher(event):
+            """Call the actions tracking the key of the state change."""
+            key = key_func(event)
+            actions = keyed_callbacks.get(key)
+            if actions is None:
+                return
+
+            # Copy, actions can remove themselves while being called
+            for job in actions[:]:
+                try:
+                    hass.async_run_job(job, event)
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception("Error while processing state change of %s", key)
+
+        hass.data[listener_key] = hass.bus.async_listen(
+            EVENT_STATE_CHANGED, keyed_state_change_dispatcher
+        )
+
+    for key in keys:
+        keyed_callbacks.setdefault(key, []).append(action)
+
+    @callback
+    def remove_listener():
+        """Remove the action from the callbacks of keys."""
+        try:
+            for key in keys:
+                actions = keyed_callbacks[key]
+                actions.remove(action)
+                if not actions:
+                    del keyed_callbacks[key]
+        except (KeyError, ValueError):
+            # Listener was already removed
+            _LOGGER.warning("Unable to remove unknown listener %s", action)
+            return
+
+        if not keyed_callbacks:
+            hass.data.pop(listener_key)()
+
+    return remove_listener
+
+
+class TrackTemplateRenders:
+    """Track the states used by template renders.
+
+    Templates rendered in an async_collect block record the states they use.
+    After each block the action is subscribed to changes of exactly those
+    entities and to entities added to or removed from the domains iterated
+    over. Renders that iterate over all states or use no state at all are
+    tracked on every state change, calling the action at most once per
+    rate_limit after the last render. With entity_ids, those entities are tracked instead.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        action: Callable[..., None],
+        rate_limit: timedelta = ALL_STATES_RATE_LIMIT,
+        entity_ids: Optional[Iterable[str]] = None,
+    ) -> None:
+        """Initialize the tracker."""
+        self.hass = hass
+        self._action = action
+        self._entity_ids = entity_ids
+        self._rate_limit = rate_limit
+        self._tracked: Optional[tuple] = None
+        self._unsubs: list = []
+        self._last_render: Optional[datetime] = None
+        self._pending_event: Any = None
+        self._unsub_pending: Optional[CALLBACK_TYPE] = None
+
+    @contextmanager
+    def async_collect(self) -> Iterator[RenderInfo]:
+        """Collect the states used by the renders in the block and track them.
+
+        The block must not await, renders of other tasks would be collected too.
+        """
+        with async_collect_render_info(self.hass) as render_info:
+            yield render_info
+        self._last_render = dt_util.utcnow()
+        self._async_track(render_info)
+
+    @callback
+    def async_remove(self) -> None:
+        """Stop tracking."""
+        self._async_unsubscribe()
+        self._tracked = None
+        if self._unsub_pending is not None:
+            self._unsub_pending()
+            self._unsub_pending = None
+
+    @callback
+    def _async_track(self, render_info: RenderInfo) -> None:
+        """Subscribe to the states used by the last render, if they changed."""
+        if self._entity_ids is not None:
+            tracked = (frozenset(self._entity_ids), frozenset(), False)
+        else:
+            tracked = (
+                render_info.entities,
+                render_info.domains,
+                render_info.all_states,
+            )
+        if tracked == self._tracked:
+            return
+
+        self._async_unsubscribe()
+        self._tracked = tracked
+        entities, domains, all_states = tracked
+
+        # Renders using no states, like those of now(), are rendered on
+        # state changes as before
+        if all_states or not (entities or domains):
+            self._unsubs.append(
+                self.hass.bus.async_listen(
+                    EVENT_STATE_CHANGED, self._async_rate_limited_change
+                )
+            )
+            return
+
+        if entities:
+            self._unsubs.append(
+                async_track_state_change_event(
+                    self.hass, entities, self._async_call_action
+                )
+            )
+
+        if domains:
+            self._unsubs.append(
+                async_track_state_change_domain_event(
+                    self.hass, domains, self._async_domain_change
+                )
+            )
+
+    @callback
+    def _async_unsubscribe(self) -> None:
+        """Remove the state change listeners."""
+        while self._unsubs:
+            self._unsubs.pop()()
+
+    @callback
+    def _async_domain_change(self, event: Event) -> None:
+        """Call the action when an entity is added to or removed from a domain."""
+        if event.data.get("entity_id") in self._tracked[0]:
+            # Called by the listener of the entity already
+            return
+
+        if event.data.get("old_state") is None or event.data.get("new_state") is None:
+            self._async_call_action(event)
+
+    @callback
+    def _async_rate_limited_change(self, event: Event) -> None:
+        """Call the action, or schedule it when it was called too recently."""
+        self._pending_event = event
+        if self._unsub_pending is not None:
+            return
+
+        now = dt_util.utcnow()
+        if self._last_render is None or now - self._last_render >= self._rate_limit:
+            self._async_call_action(event)
+            return
+
+        @callback
+        def call_pending(_now):
+            """Call the action with the last state change."""
+            self._unsub_pending = None
+            self._async_call_action(self._pending_event)
+
+        self._unsub_pending = async_track_point_in_utc_time(
+            self.hass, call_pending, self._last_render + self._rate_limit
+        )
+
+    @callback
+    def _async_call_action(self, event: Event) -> None:
+        """Call the action with a state change."""
+        self._pending_event = None
+        self.hass.async_run_job(self._action, event)
+
+
+@callback
+@bind_hass
+def async_track_template_renders(
+    hass: HomeAssistant,
+    action: Callable[..., None],
+    rate_limit: timedelta = ALL_STATES_RATE_LIMIT,
+    entity_ids: Optional[Iterable[str]] = None,
+) -> TrackTemplateRenders:
+    """Track the states used by the templates rendered in async_collect blocks.
+
+    The action is called with the state_changed event. Render the templates
+    again in an async_collect block to track what they use now. Nothing is
+    tracked before the first block.
+
+    Must be run within the event loop.
+    """
+    return TrackTemplateRenders(hass, action, rate_limit, entity_ids)
+
+
 @callback
 @bind_hass
 def async_track_template(hass, template, action, variables=None):
-    """Add a listener that track state changes with template condition."""
+    """Add a listener that track state changes with template condition.
+
+    Tracks the states used by the last render of the template.
+    """
     from . import condition
 
     # Local variable to keep track of if the action has already been triggered
     already_triggered = False
 
     @callback
-    def template_condition_listener(entity_id, from_s, to_s):
+    def template_condition_listener(event):
         """Check if condition is correct and run action."""
         nonlocal already_triggered
-        template_result = condition.async_template(hass, template, variables)
+        with tracker.async_collect():
+            template_result = condition.async_template(hass, template, variables)
 
         # Check to see if template returns true
         if template_result and not already_triggered:
             already_triggered = True
-            hass.async_run_job(action, entity_id, from_s, to_s)
+            hass.async_run_job(
+                action,
+                event.data.get("entity_id"),
+                event.data.get("old_state"),
+                event.data.get("new_state"),
+            )
         elif not template_result:
             already_triggered = False
 
-    return async_track_state_change(
-        hass, template.extract_entities(variables), template_condition_listener
-    )
+    tracker = async_track_template_renders(hass, template_condition_listener)
+
+    # Render once to know which states to track
+    with tracker.async_collect():
+        condition.async_template(hass, template, variables)
+
+    return tracker.async_remove
 
 
 track_template = threaded_listener_factory(async_track_template)
@@ -209,30 +513,7 @@ def async_track_point_in_utc_time(
     hass: HomeAssistant, action: Callable[..., None], point_in_time: datetime
 ) -> CALLBACK_TYPE:
     """Add a listener that fires once after a specific point in UTC time."""
-    # Ensure point_in_time is UTC
-    point_in_time = dt_util.as_utc(point_in_time)
-
-    @callback
-    def point_in_time_listener(event):
-        """Listen for matching time_changed events."""
-        now = event.data[ATTR_NOW]
-
-        if now < point_in_time or hasattr(point_in_time_listener, "run"):
-            return
-
-        # Set variable so that we will never run twice.
-        # Because the event bus might have to wait till a thread comes
-        # available to execute this listener it might occur that the
-        # listener gets lined up twice to be executed. This will make
-        # sure the second time it does nothing.
-        point_in_time_listener.run = True
-        async_unsub()
-
-        hass.async_run_job(action, now)
-
-    async_unsub = hass.bus.async_listen(EVENT_TIME_CHANGED, point_in_time_listener)
-
-    return async_unsub
+    return hass.scheduler.async_schedule(point_in_time, action)
 
 
 track_point_in_utc_time = threaded_listener_factory(async_track_point_in_utc_time)
@@ -384,42 +665,23 @@ def async_track_utc_time_change(
     matching_minutes = dt_util.parse_time_expression(minute, 0, 59)
     matching_hours = dt_util.parse_time_expression(hour, 0, 23)
 
-    next_time = None
-
     def calculate_next(now):
-        """Calculate and set the next time the trigger should fire."""
-        nonlocal next_time
-
+        """Calculate the next time the trigger should fire."""
         localized_now = dt_util.as_local(now) if local else now
-        next_time = dt_util.find_next_time_expression_time(
+        return dt_util.find_next_time_expression_time(
             localized_now, matching_seconds, matching_minutes, matching_hours
         )
 
-    # Make sure rolling back the clock doesn't prevent the timer from
-    # triggering.
-    last_now = None
-
     @callback
-    def pattern_time_change_listener(event):
-        """Listen for matching time_changed events."""
-        nonlocal next_time, last_now
-
-        now = event.data[ATTR_NOW]
-
-        if last_now is None or now < last_now:
-            # Time rolled back or next time not yet calculated
-            calculate_next(now)
-
-        last_now = now
-
-        if next_time <= now:
-            hass.async_run_job(action, dt_util.as_local(now) if local else now)
-            calculate_next(now + timedelta(seconds=1))
-
-    # We can't use async_track_point_in_utc_time here because it would
-    # break in the case that the system time abruptly jumps backwards.
-    # Our custom last_now logic takes care of resolving that scenario.
-    return hass.bus.async_listen(EVENT_TIME_CHANGED, pattern_time_change_listener)
+    def pattern_time_change_listener(now):
+        """Run the action at a matching time."""
+        hass.async_run_job(action, dt_util.as_local(now) if local else now)
+
+    # The scheduler calculates the next time after each run, and again if
+    # the (simulated) clock is rolled back.
+    return hass.scheduler.async_schedule(
+        calculate_next(dt_util.utcnow()), pattern_time_change_listener, calculate_next
+    )
 
 
 track_utc_time_change = threaded_listener_factory(async_track_utc_time_change)
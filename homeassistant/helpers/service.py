@@ -297,11 +297,7 @@ async def entity_service_call(
                 platforms_entities.append(list(platform.entities.values()))
             else:
                 platforms_entities.append(
-                    [
-                        entity
-                        for entity in platform.entities.values()
-                        if entity.entity_id in entity_ids
-                    ]
+                    _async_platform_entities(platform, entity_ids)
                 )
 
     elif target_all_entities:
@@ -319,10 +315,7 @@ async def entity_service_call(
     else:
         for platform in platforms:
             platform_entities = []
-            for entity in platform.entities.values():
-                if entity.entity_id not in entity_ids:
-                    continue
-
+            for entity in _async_platform_entities(platform, entity_ids):
                 if not entity_perms(entity.entity_id, POLICY_CONTROL):
                     raise Unauthorized(
                         context=call.context,
@@ -338,7 +331,8 @@ async def entity_service_call(
         _handle_service_platform_call(
             func, data, entities, call.context, required_features
         )
-        for platform, entities in zip(platforms, platforms_entities)
+        for entities in platforms_entities
+        if entities
     ]
 
     if tasks:
@@ -348,12 +342,29 @@ async def entity_service_call(
             future.result()  # pop exception if have
 
 
+@ha.callback
+def _async_platform_entities(platform, entity_ids):
+    """Return the entities of a platform with one of the entity ids.
+
+    Looks the targets up in the entities of the platform, which are keyed by
+    entity id, instead of checking every entity of the platform.
+    """
+    entities = platform.entities
+    return [entities[entity_id] for entity_id in entity_ids if entity_id in entities]
+
+
 async def _handle_service_platform_call(
     func, data, entities, context, required_features
 ):
     """Handle a function call."""
     tasks = []
 
+    # Run the executor jobs of the entities in the pool of their integration.
+    # This runs in a task of its own, so the context is not shared.
+    integration = getattr(entities[0].platform, "platform_name", None)
+    if integration is not None:
+        ha.current_integration.set(integration)
+
     for entity in entities:
         if not entity.available:
             continue
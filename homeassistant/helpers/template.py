@@ -5,9 +5,12 @@ import logging
 import math
 import random
 import re
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime
 from functools import wraps
-from typing import Any, Iterable
+from typing import Any, FrozenSet, Iterable, Iterator
 
 import jinja2
 from jinja2 import contextfilter, contextfunction
@@ -41,6 +44,9 @@ DATE_STR_FORMAT = "%Y-%m-%d %H:%M:%S"
 _RENDER_INFO = "template.render_info"
 _ENVIRONMENT = "template.environment"
 
+# Number of compiled template sources kept, shared by all Template instances
+COMPILE_CACHE_SIZE = 4096
+
 _RE_NONE_ENTITIES = re.compile(r"distance\(|closest\(", re.I | re.M)
 _RE_GET_ENTITIES = re.compile(
     r"(?:(?:states\.|(?:is_state|is_state_attr|state_attr|states)"
@@ -128,6 +134,21 @@ class RenderInfo:
         """Template should re-render if the state changes."""
         return entity_id in self._entities
 
+    @property
+    def entities(self) -> FrozenSet[str]:
+        """Entity ids whose states were used."""
+        return frozenset(self._entities)
+
+    @property
+    def domains(self) -> FrozenSet[str]:
+        """Domains whose states were iterated over."""
+        return getattr(self, "_domains", frozenset())
+
+    @property
+    def all_states(self) -> bool:
+        """Return if all states were iterated over."""
+        return self._all_states
+
     def _filter_lifecycle(self, entity_id: str) -> bool:
         """Template should re-render if the state changes."""
         return (
@@ -155,6 +176,81 @@ class RenderInfo:
             self.filter_lifecycle = self._filter_lifecycle
 
 
+@contextmanager
+def async_collect_render_info(hass: HomeAssistantType) -> Iterator[RenderInfo]:
+    """Collect the states used by the templates rendered in the block.
+
+    The block must not await, renders of other tasks would be collected too.
+    """
+    assert _RENDER_INFO not in hass.data
+    render_info = hass.data[_RENDER_INFO] = RenderInfo(None)
+    try:
+        yield render_info
+    finally:
+        del hass.data[_RENDER_INFO]
+        # pylint: disable=protected-access
+        render_info._freeze()
+
+
+class CompileCache:
+    """Bounded cache of compiled template code shared by Template instances.
+
+    Compiled code does not depend on the hass instance it is later bound to,
+    so it is keyed by the source and whether the environment has hass, and
+    does not keep hass instances alive.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialize the cache."""
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._code: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def compile(self, env: "TemplateEnvironment", source: str) -> Any:
+        """Return the compiled code of a source, compiling it if needed."""
+        key = (env.hass is not None, source)
+        with self._lock:
+            code = self._code.get(key)
+            if code is not None:
+                self._code.move_to_end(key)
+                self.hits += 1
+                return code
+            self.misses += 1
+
+        code = env.compile(source)
+
+        with self._lock:
+            self._code[key] = code
+            if len(self._code) > self.maxsize:
+                self._code.popitem(last=False)
+        return code
+
+    def clear(self) -> None:
+        """Remove all compiled code and reset the counters."""
+        with self._lock:
+            self._code.clear()
+            self.hits = self.misses = 0
+
+    def info(self) -> dict:
+        """Return the counters for diagnostics."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._code),
+            "maxsize": self.maxsize,
+        }
+
+
+_COMPILE_CACHE = CompileCache(COMPILE_CACHE_SIZE)
+
+
+def compile_cache_info() -> dict:
+    """Return the hits, misses and size of the compiled template cache."""
+    return _COMPILE_CACHE.info()
+
+
 class Template:
     """Class to hold a template and manage caching and rendering."""
 
@@ -183,7 +279,7 @@ class Template:
             return
 
         try:
-            self._compiled_code = self._env.compile(self.template)
+            self._compiled_code = _COMPILE_CACHE.compile(self._env, self.template)
         except jinja2.exceptions.TemplateSyntaxError as err:
             raise TemplateError(err)
 
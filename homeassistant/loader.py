@@ -72,26 +72,17 @@ async def _async_get_custom_components(
     except ImportError:
         return {}
 
-    def get_sub_directories(paths: List) -> List:
-        """Return all sub directories in a set of paths."""
+    def resolve_sub_directories(paths: List) -> List[Optional["Integration"]]:
+        """Resolve the integrations in all sub directories of a set of paths."""
         return [
-            entry
+            Integration.resolve_from_root(hass, custom_components, entry.name)
             for path in paths
             for entry in pathlib.Path(path).iterdir()
             if entry.is_dir()
         ]
 
-    dirs = await hass.async_add_executor_job(
-        get_sub_directories, custom_components.__path__
-    )
-
-    integrations = await asyncio.gather(
-        *(
-            hass.async_add_executor_job(
-                Integration.resolve_from_root, hass, custom_components, comp.name
-            )
-            for comp in dirs
-        )
+    integrations = await hass.async_add_executor_job(
+        resolve_sub_directories, custom_components.__path__
     )
 
     return {
@@ -142,6 +133,14 @@ async def async_get_config_flows(hass: "HomeAssistant") -> Set[str]:
     return flows
 
 
+@ft.lru_cache(maxsize=None)
+def _builtin_path() -> pathlib.Path:
+    """Return the path of the built-in integrations."""
+    from homeassistant import components
+
+    return pathlib.Path(components.__file__).parent
+
+
 class Integration:
     """An integration in Home Assistant."""
 
@@ -170,6 +169,25 @@ class Integration:
 
         return None
 
+    @classmethod
+    def resolve_from_index(
+        cls, hass: "HomeAssistant", domain: str
+    ) -> "Optional[Integration]":
+        """Resolve a built-in integration from the generated manifest index.
+
+        Async friendly.
+        """
+        from homeassistant.generated.manifests import MANIFESTS
+
+        manifest = MANIFESTS.get(domain)
+
+        if manifest is None:
+            return None
+
+        return cls(
+            hass, f"{PACKAGE_BUILTIN}.{domain}", _builtin_path() / domain, manifest
+        )
+
     @classmethod
     def resolve_legacy(
         cls, hass: "HomeAssistant", domain: str
@@ -272,11 +290,16 @@ async def async_get_integration(hass: "HomeAssistant", domain: str) -> Integrati
         event.set()
         return integration
 
-    from homeassistant import components
+    # Built-in integrations are looked up in the manifest index, which is
+    # generated from their manifests, so they need no filesystem access.
+    integration = Integration.resolve_from_index(hass, domain)
 
-    integration = await hass.async_add_executor_job(
-        Integration.resolve_from_root, hass, components, domain
-    )
+    if integration is None:
+        from homeassistant import components
+
+        integration = await hass.async_add_executor_job(
+            Integration.resolve_from_root, hass, components, domain
+        )
 
     if integration is not None:
         cache[domain] = integration
@@ -2,13 +2,23 @@
 import argparse
 import asyncio
 from contextlib import suppress
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import partial
 import logging
+import os
+import tempfile
 from timeit import default_timer as timer
 from typing import Callable, Dict
 
 from homeassistant import core
-from homeassistant.const import ATTR_NOW, EVENT_STATE_CHANGED, EVENT_TIME_CHANGED
+from homeassistant.const import (
+    ATTR_NOW,
+    EVENT_HOMEASSISTANT_START,
+    EVENT_STATE_CHANGED,
+    EVENT_TIME_CHANGED,
+    STATE_OFF,
+    STATE_ON,
+)
 from homeassistant.util import dt as dt_util
 
 
@@ -109,6 +119,19 @@ async def async_million_time_changed_helper(hass):
 @benchmark
 async def async_million_state_changed_helper(hass):
     """Run a million events through state changed helper."""
+    return await _async_million_state_changed_helper(hass, 0)
+
+
+@benchmark
+async def async_million_state_changed_helper_disjoint_listeners(hass):
+    """Run a million events through state changed helper with 1k listeners.
+
+    The other listeners track different entities and should not be woken up.
+    """
+    return await _async_million_state_changed_helper(hass, 1000)
+
+
+async def _async_million_state_changed_helper(hass, other_listeners):
     count = 0
     entity_id = "light.kitchen"
     event = asyncio.Event()
@@ -122,6 +145,15 @@ async def async_million_state_changed_helper(hass):
         if count == 10 ** 6:
             event.set()
 
+    @core.callback
+    def other_listener(*args):
+        """Handle event of other entities."""
+
+    for idx in range(other_listeners):
+        hass.helpers.event.async_track_state_change(
+            "light.other_{}".format(idx), other_listener
+        )
+
     hass.helpers.event.async_track_state_change(entity_id, listener, "off", "on")
     event_data = {
         "entity_id": entity_id,
@@ -139,6 +171,1001 @@ async def async_million_state_changed_helper(hass):
     return timer() - start
 
 
+@benchmark
+async def recorder_million_state_changed(hass):
+    """Run a million state changed events through the recorder."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        instance = await _async_start_recorder(hass, tmpdir)
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_START)
+
+        entity_id = "light.kitchen"
+        event_data = {
+            "entity_id": entity_id,
+            "old_state": core.State(entity_id, "off"),
+            "new_state": core.State(entity_id, "on", {"brightness": 255}),
+        }
+
+        start = timer()
+
+        for _ in range(10 ** 6):
+            hass.bus.async_fire(EVENT_STATE_CHANGED, event_data)
+
+        await hass.async_block_till_done()
+        await hass.async_add_executor_job(instance.block_till_done)
+
+        runtime = timer() - start
+
+        await _async_stop_recorder(hass, instance)
+
+    return runtime
+
+
+@benchmark
+async def recorder_media_player_100k_state_changed(hass):
+    """Record 100k state changes of a media player with large attributes.
+
+    Prints the size of the database.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        instance = await _async_start_recorder(hass, tmpdir)
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_START)
+
+        entity_id = "media_player.living_room"
+        attributes = {
+            "friendly_name": "Living room",
+            "source_list": ["Input {}".format(idx) for idx in range(100)],
+            "sound_mode_list": ["Mode {}".format(idx) for idx in range(50)],
+            "supported_features": 21437,
+        }
+        old_state = core.State(entity_id, "off", attributes)
+
+        start = timer()
+
+        for idx in range(10 ** 5):
+            new_state = core.State(
+                entity_id, "on", {**attributes, "source": "Input {}".format(idx % 3)}
+            )
+            hass.bus.async_fire(
+                EVENT_STATE_CHANGED,
+                {
+                    "entity_id": entity_id,
+                    "old_state": old_state,
+                    "new_state": new_state,
+                },
+            )
+            old_state = new_state
+
+        await hass.async_block_till_done()
+        await hass.async_add_executor_job(instance.block_till_done)
+
+        runtime = timer() - start
+
+        await _async_stop_recorder(hass, instance)
+
+        print("Database size:", os.path.getsize(os.path.join(tmpdir, "benchmark.db")))
+
+    return runtime
+
+
+@benchmark
+async def logbook_day_of_state_changes(hass):
+    """Query the logbook for a day with 100 entities changing every minute.
+
+    State changes are recorded as slim events. Prints the size of the database.
+    """
+    from homeassistant.components import logbook
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        instance = await _async_start_recorder(hass, tmpdir, slim_state_events=True)
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_START)
+
+        start, end = await _async_record_day_of_state_changes(hass, instance)
+
+        start_time = timer()
+        await hass.async_add_executor_job(
+            logbook._get_events, hass, {}, start, end + timedelta(minutes=1)
+        )
+        runtime = timer() - start_time
+
+        await _async_stop_recorder(hass, instance)
+
+        print("Database size:", os.path.getsize(os.path.join(tmpdir, "benchmark.db")))
+
+    return runtime
+
+
+@benchmark
+async def logbook_stream_day_of_state_changes(hass):
+    """Stream the logbook entries of a day with 100 entities changing every minute.
+
+    The entries are written by the logbook while the states are recorded.
+    Prints the time recording took and the size of the database.
+    """
+    from homeassistant.components import logbook
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        instance = await _async_start_recorder(hass, tmpdir)
+        instance.async_add_writer(partial(logbook._write_entries, hass))
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_START)
+
+        start_time = timer()
+        start, end = await _async_record_day_of_state_changes(hass, instance)
+        print("Recording:", timer() - start_time)
+
+        start_time = timer()
+        stream = logbook.LogbookStream(hass, {}, start, end + timedelta(minutes=1))
+        await hass.async_add_executor_job(stream.prepare)
+        while await hass.async_add_executor_job(stream.next_chunk) is not None:
+            pass
+        runtime = timer() - start_time
+
+        await _async_stop_recorder(hass, instance)
+
+        print("Database size:", os.path.getsize(os.path.join(tmpdir, "benchmark.db")))
+
+    return runtime
+
+
+async def _async_record_day_of_state_changes(hass, instance):
+    """Record a day of 50 doors and 50 temperatures changing every minute.
+
+    Returns the start and end of the day.
+    """
+    end = dt_util.utcnow()
+    start = end - timedelta(days=1)
+    entities = [
+        (
+            "binary_sensor.door_{}".format(idx),
+            {"friendly_name": "Door {}".format(idx), "device_class": "door"},
+        )
+        for idx in range(50)
+    ] + [
+        (
+            "sensor.temperature_{}".format(idx),
+            {
+                "friendly_name": "Temperature {}".format(idx),
+                "unit_of_measurement": "°C",
+                "device_class": "temperature",
+            },
+        )
+        for idx in range(50)
+    ]
+    old_states = {}
+
+    for minute in range(24 * 60):
+        time_fired = start + timedelta(minutes=minute)
+        for entity_id, attributes in entities:
+            new_state = core.State(
+                entity_id,
+                str(minute % 2),
+                attributes,
+                last_changed=time_fired,
+                last_updated=time_fired,
+            )
+            instance.queue.put(
+                core.Event(
+                    EVENT_STATE_CHANGED,
+                    {
+                        "entity_id": entity_id,
+                        "old_state": old_states.get(entity_id),
+                        "new_state": new_state,
+                    },
+                    time_fired=time_fired,
+                )
+            )
+            old_states[entity_id] = new_state
+
+    await hass.async_add_executor_job(instance.block_till_done)
+
+    return start, end
+
+
+@benchmark
+async def recorder_purge_2m_rows(hass):
+    """Purge a database with 2 million old states and events.
+
+    Prints the longest time the recorder was blocked by a single batch.
+    """
+    from homeassistant.components.recorder import purge
+    from homeassistant.components.recorder.models import Events, States
+
+    count = 2 * 10 ** 6
+    longest = 0
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        instance = await _async_start_recorder(hass, tmpdir)
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_START)
+
+        old = dt_util.utcnow() - timedelta(days=30)
+
+        def generate():
+            """Insert old events and their states."""
+            with instance.engine.begin() as connection:
+                connection.execute(
+                    Events.__table__.insert(),
+                    [
+                        {
+                            "event_type": EVENT_STATE_CHANGED,
+                            "event_data": "{}",
+                            "origin": "LOCAL",
+                            "time_fired": old,
+                            "created": old,
+                        }
+                        for _ in range(count)
+                    ],
+                )
+                connection.execute(
+                    States.__table__.insert(),
+                    [
+                        {
+                            "domain": "sensor",
+                            "entity_id": "sensor.temperature",
+                            "state": "20",
+                            "attributes": "{}",
+                            "event_id": idx + 1,
+                            "last_changed": old,
+                            "last_updated": old,
+                            "created": old,
+                        }
+                        for idx in range(count)
+                    ],
+                )
+
+        def purge_all():
+            """Purge batches until done."""
+            nonlocal longest
+            finished = False
+            while finished is False:
+                batch_start = timer()
+                finished = purge.purge_old_data(instance, 10, False)
+                longest = max(longest, timer() - batch_start)
+
+        await hass.async_add_executor_job(generate)
+
+        start = timer()
+        await hass.async_add_executor_job(purge_all)
+        runtime = timer() - start
+
+        await _async_stop_recorder(hass, instance)
+
+    print("Longest batch:", longest)
+    return runtime
+
+
+@benchmark
+async def history_stats_week_period(hass):
+    """Run a week long history stats sensor for an hour of state changes.
+
+    Prints the number of rows read from the database.
+    """
+    from homeassistant.components import history
+    from homeassistant.components.history_stats.sensor import HistoryStatsSensor
+    from homeassistant.components.recorder.models import States
+    from homeassistant.components.recorder.util import session_scope
+    from homeassistant.helpers.template import Template
+
+    entity_id = "binary_sensor.door"
+    rows_read = 0
+    state_changes_during_period = history.state_changes_during_period
+    get_state = history.get_state
+    utcnow = dt_util.utcnow
+    now = dt_util.now
+
+    def counting_state_changes_during_period(*args, **kwargs):
+        """Count the rows returned."""
+        nonlocal rows_read
+        result = state_changes_during_period(*args, **kwargs)
+        rows_read += sum(len(states) for states in result.values())
+        return result
+
+    def counting_get_state(*args, **kwargs):
+        """Count the row returned."""
+        nonlocal rows_read
+        result = get_state(*args, **kwargs)
+        rows_read += result is not None
+        return result
+
+    # Simulate the hour that just passed
+    clock = utcnow() - timedelta(hours=1)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        instance = await _async_start_recorder(hass, tmpdir)
+
+        # A week of history with a state change every minute
+        with session_scope(hass=hass) as session:
+            session.bulk_save_objects(
+                [
+                    States(
+                        domain="binary_sensor",
+                        entity_id=entity_id,
+                        state="on" if idx % 2 else "off",
+                        attributes="{}",
+                        last_changed=clock - timedelta(minutes=idx),
+                        last_updated=clock - timedelta(minutes=idx),
+                        created=clock - timedelta(minutes=idx),
+                    )
+                    for idx in range(7 * 24 * 60, 0, -1)
+                ]
+            )
+
+        sensor = await hass.async_add_executor_job(
+            HistoryStatsSensor,
+            hass,
+            entity_id,
+            "on",
+            None,
+            Template("{{ now() }}", hass),
+            timedelta(days=7),
+            "time",
+            "Door open",
+        )
+        sensor.hass = hass
+        sensor.entity_id = "sensor.door_open"
+
+        # Wait for the updates scheduled by state changes
+        hass.async_track_tasks()
+
+        history.state_changes_during_period = counting_state_changes_during_period
+        history.get_state = counting_get_state
+        dt_util.utcnow = lambda: clock
+        dt_util.now = lambda time_zone=None: clock.astimezone(
+            time_zone or dt_util.DEFAULT_TIME_ZONE
+        )
+
+        start = timer()
+
+        try:
+            hass.states.async_set(entity_id, "off")
+            hass.bus.async_fire(EVENT_HOMEASSISTANT_START)
+            await hass.async_block_till_done()
+
+            # A state change every 10 seconds and polling every 30
+            for idx in range(6 * 60):
+                clock += timedelta(seconds=10)
+                hass.states.async_set(entity_id, "on" if idx % 2 else "off")
+                await hass.async_block_till_done()
+                if idx % 3 == 0:
+                    await sensor.async_update_ha_state(True)
+        finally:
+            history.state_changes_during_period = state_changes_during_period
+            history.get_state = get_state
+            dt_util.utcnow = utcnow
+            dt_util.now = now
+
+        runtime = timer() - start
+
+        await _async_stop_recorder(hass, instance)
+
+    print("Database rows read:", rows_read)
+    return runtime
+
+
+async def _async_start_recorder(hass, tmpdir, slim_state_events=False):
+    """Start a recorder with a database in tmpdir."""
+    from homeassistant.components import recorder
+
+    hass.config.config_dir = tmpdir
+    instance = recorder.Recorder(
+        hass,
+        keep_days=1,
+        purge_interval=0,
+        commit_interval=recorder.DEFAULT_COMMIT_INTERVAL,
+        max_batch_size=recorder.DEFAULT_MAX_BATCH_SIZE,
+        uri="sqlite:///{}".format(os.path.join(tmpdir, "benchmark.db")),
+        include={},
+        exclude={},
+        slim_state_events=slim_state_events,
+    )
+    hass.data[recorder.DATA_INSTANCE] = instance
+    instance.async_initialize()
+    instance.start()
+    await instance.async_db_ready
+    return instance
+
+
+async def _async_stop_recorder(hass, instance):
+    """Stop the recorder."""
+    instance.queue.put(None)
+    await hass.async_add_executor_job(instance.join)
+
+
+@benchmark
+async def mqtt_dispatch_10k_subscriptions(hass):
+    """Dispatch a 100k MQTT messages with 10k subscriptions."""
+    from homeassistant.components import mqtt
+
+    count = 0
+    event = asyncio.Event()
+
+    @core.callback
+    def listener(_):
+        """Handle message."""
+        nonlocal count
+        count += 1
+
+        if count == 10 ** 5:
+            event.set()
+
+    client = mqtt.MQTT(
+        hass,
+        broker="localhost",
+        port=1883,
+        client_id=None,
+        keepalive=60,
+        username=None,
+        password=None,
+        certificate=None,
+        client_key=None,
+        client_cert=None,
+        tls_insecure=None,
+        protocol=None,
+        will_message=None,
+        birth_message=None,
+        tls_version=None,
+    )
+
+    # Subscribe without a broker connection, like discovered entities would
+    # pylint: disable=protected-access
+    for idx in range(9000):
+        client._subscription_index.add(
+            mqtt.Subscription("homeassistant/sensor/node{}/state".format(idx), listener)
+        )
+    for idx in range(1000):
+        client._subscription_index.add(
+            mqtt.Subscription("zigbee/node{}/+/set".format(idx), listener)
+        )
+
+    messages = [
+        mqtt.Message("homeassistant/sensor/node{}/state".format(idx), b"on", 0, False)
+        for idx in range(0, 9000, 9)
+    ] + [
+        mqtt.Message("zigbee/node{}/light/set".format(idx), b"on", 0, False)
+        for idx in range(1000)
+    ]
+
+    start = timer()
+
+    for idx in range(10 ** 5):
+        client._mqtt_handle_message(messages[idx % len(messages)])
+
+    await event.wait()
+
+    return timer() - start
+
+
+@benchmark
+async def websocket_state_changed_50_subscribers(hass):
+    """Send 10k state changed events to 50 websocket subscriptions."""
+    from homeassistant.auth.models import User
+    from homeassistant.components.websocket_api import commands, const
+    from homeassistant.components.websocket_api.connection import ActiveConnection
+
+    count = 0
+    event = asyncio.Event()
+
+    @core.callback
+    def send_message(message):
+        """Encode the message like the websocket writer does."""
+        nonlocal count
+        if not isinstance(message, str):
+            const.JSON_DUMP(message)
+        count += 1
+
+        if count == 50 * 10 ** 4:
+            event.set()
+
+    user = User(name="Benchmark", perm_lookup=None, is_owner=True, is_active=True)
+    for idx in range(50):
+        connection = ActiveConnection(
+            logging.getLogger(__name__), hass, send_message, user, None
+        )
+        commands.handle_subscribe_events(
+            hass,
+            connection,
+            {"id": idx + 1, "type": "subscribe_events", "event_type": "state_changed"},
+        )
+
+    count = 0
+    entity_id = "light.kitchen"
+    old_state = core.State(entity_id, "off", {"friendly_name": "Kitchen"})
+    new_state = core.State(entity_id, "on", {"friendly_name": "Kitchen"})
+    event_data = {
+        "entity_id": entity_id,
+        "old_state": old_state,
+        "new_state": new_state,
+    }
+
+    start = timer()
+
+    for _ in range(10 ** 4):
+        hass.bus.async_fire(EVENT_STATE_CHANGED, event_data)
+
+    await event.wait()
+
+    return timer() - start
+
+
+@benchmark
+async def statistics_sensor_10k_samples(hass):
+    """Update a statistics sensor with 10k samples 20k times."""
+    from homeassistant.components.statistics.sensor import StatisticsSensor
+
+    sensor = StatisticsSensor("sensor.source", "Stats", 10 ** 4, None, 2)
+    now = dt_util.utcnow()
+    states = [
+        core.State("sensor.source", str(idx % 997 * 0.1), last_updated=now)
+        for idx in range(2 * 10 ** 4)
+    ]
+
+    start = timer()
+
+    for state in states:
+        # pylint: disable=protected-access
+        sensor._add_state_to_queue(state)
+        await sensor.async_update()
+
+    return timer() - start
+
+
+@benchmark
+async def template_config_2000_templates(hass):
+    """Load and reload 500 automations using 2,000 templates.
+
+    Prints the load and reload times, the compile cache counters and the
+    memory used by the loaded templates.
+    """
+    import tracemalloc
+    from homeassistant.components.automation import PLATFORM_SCHEMA
+    from homeassistant.helpers import template
+
+    config = []
+    for idx in range(500):
+        room = f"room_{idx % 50}"
+        config.append(
+            {
+                "alias": f"Automation {idx}",
+                "trigger": {
+                    "platform": "template",
+                    "value_template": f"{{{{ states('sensor.{room}_temperature')"
+                    " | float > 25 }}",
+                },
+                "condition": {
+                    "condition": "template",
+                    "value_template": "{{ is_state('sun.sun', 'below_horizon') }}",
+                },
+                "action": [
+                    {
+                        "wait_template": f"{{{{ is_state('binary_sensor.{room}_door',"
+                        " 'off') }}",
+                        "timeout": 60,
+                    },
+                    {
+                        "service": "notify.notify",
+                        "data_template": {
+                            "message": f"{room} is "
+                            f"{{{{ states('sensor.{room}_temperature') }}}} C"
+                        },
+                    },
+                ],
+            }
+        )
+
+    # pylint: disable=protected-access
+    template._COMPILE_CACHE.clear()
+    tracemalloc.start()
+
+    start = timer()
+    loaded = [PLATFORM_SCHEMA(automation) for automation in config]
+    load_time = timer() - start
+    memory = tracemalloc.get_traced_memory()[0]
+
+    start = timer()
+    reloaded = [PLATFORM_SCHEMA(automation) for automation in config]
+    reload_time = timer() - start
+
+    tracemalloc.stop()
+    assert len(loaded) == len(reloaded) == 500
+
+    print("Load:", load_time, "Reload:", reload_time)
+    print("Compile cache:", template.compile_cache_info())
+    print("Memory after load:", memory)
+
+    return load_time + reload_time
+
+
+@benchmark
+async def entity_service_call_10k_calls(hass):
+    """Call a light service 10k times with 600 lights on 12 platforms.
+
+    Every tenth call targets a group of 50 lights, the others one light.
+    """
+    from types import SimpleNamespace
+    from homeassistant.helpers.entity import Entity
+
+    class BenchmarkLight(Entity):
+        """Light that does nothing when turned on."""
+
+        should_poll = False
+
+        def __init__(self, entity_id):
+            """Initialize the light."""
+            self.entity_id = entity_id
+
+        async def async_turn_on(self, **kwargs):
+            """Turn the light on."""
+
+    platforms = [
+        SimpleNamespace(
+            entities={
+                entity_id: BenchmarkLight(entity_id)
+                for entity_id in (
+                    f"light.platform_{platform}_{idx}" for idx in range(50)
+                )
+            }
+        )
+        for platform in range(12)
+    ]
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        # hass.components loads the group integration from the config dir
+        hass.config.config_dir = tmpdir
+        return await _async_entity_service_calls(hass, platforms)
+
+
+async def _async_entity_service_calls(hass, platforms):
+    """Time the calls of entity_service_call_10k_calls."""
+    from homeassistant.components import group
+    from homeassistant.helpers.service import entity_service_call
+
+    await group.async_setup(hass, {})
+    hass.states.async_set(
+        "group.platform_0", "on", {"entity_id": list(platforms[0].entities)}
+    )
+    await hass.async_block_till_done()
+
+    calls = [
+        core.ServiceCall(
+            "light",
+            "turn_on",
+            {
+                "entity_id": "group.platform_0"
+                if idx % 10 == 0
+                else f"light.platform_{idx % 12}_{idx % 50}"
+            },
+        )
+        for idx in range(10 ** 4)
+    ]
+
+    start = timer()
+
+    for call in calls:
+        await entity_service_call(hass, platforms, "async_turn_on", call)
+
+    return timer() - start
+
+
+@benchmark
+async def http_auth_middleware_100k_requests(hass):
+    """Authenticate 100k API requests made with 50 access tokens."""
+    from ipaddress import ip_address
+    from types import SimpleNamespace
+    from aiohttp.test_utils import make_mocked_request
+    from homeassistant.auth import auth_manager_from_config
+    from homeassistant.components.http.auth import setup_auth
+    from homeassistant.components.http.const import KEY_AUTHENTICATED, KEY_REAL_IP
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        hass.config.config_dir = tmpdir
+        hass.auth = await auth_manager_from_config(hass, [], [])
+        user = await hass.auth.async_create_system_user("Benchmark")
+
+        requests = []
+        for _ in range(50):
+            refresh_token = await hass.auth.async_create_refresh_token(user)
+            access_token = hass.auth.async_create_access_token(refresh_token)
+            request = make_mocked_request(
+                "GET", "/api/states", {"Authorization": f"Bearer {access_token}"}
+            )
+            request[KEY_REAL_IP] = ip_address("127.0.0.1")
+            requests.append(request)
+
+        app = SimpleNamespace(middlewares=[])
+        setup_auth(hass, app)
+        auth_middleware = app.middlewares[0]
+
+        async def handler(request):
+            """Check the request was authenticated."""
+            assert request[KEY_AUTHENTICATED]
+
+        start = timer()
+
+        for idx in range(10 ** 5):
+            await auth_middleware(requests[idx % 50], handler)
+
+        return timer() - start
+
+
+@benchmark
+async def loader_resolve_120_integrations(hass):
+    """Resolve 120 integrations and their dependencies like startup does.
+
+    Integrations are resolved 10 times, each time with an empty cache.
+    """
+    from homeassistant import loader
+
+    domains = [
+        domain
+        for domain in sorted(
+            os.listdir(os.path.dirname(loader.__file__) + "/components")
+        )
+        if not domain.startswith("_")
+    ][:120]
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        hass.config.config_dir = tmpdir
+
+        start = timer()
+
+        for _ in range(10):
+            hass.data.pop(loader.DATA_INTEGRATIONS, None)
+            hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+            await asyncio.gather(
+                *(
+                    loader.async_component_dependencies(hass, domain)
+                    for domain in domains
+                )
+            )
+            await asyncio.gather(
+                *(loader.async_get_integration(hass, domain) for domain in domains)
+            )
+
+        return timer() - start
+
+
+@benchmark
+async def entity_polling_800_entities(hass):
+    """Poll 800 entities on 8 platforms for two scan intervals of 5 seconds.
+
+    Each update takes 10 ms in the executor. Returns the worst delay of a
+    job submitted to the executor every 50 ms while polling.
+    """
+    import time
+    from types import SimpleNamespace
+    from homeassistant.helpers.entity import Entity
+    from homeassistant.helpers.entity_platform import EntityPlatform
+
+    class BenchmarkSensor(Entity):
+        """Sensor that reads its state with a blocking call."""
+
+        def __init__(self, name):
+            """Initialize the sensor."""
+            self._name = name
+
+        @property
+        def name(self):
+            """Return the name of the sensor."""
+            return self._name
+
+        async def async_update(self):
+            """Read the state."""
+            await self.hass.async_add_executor_job(time.sleep, 0.01)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        hass.config.config_dir = tmpdir
+
+        for platform_idx in range(8):
+            platform = EntityPlatform(
+                hass=hass,
+                logger=logging.getLogger(__name__),
+                domain="sensor",
+                platform_name=f"platform_{platform_idx}",
+                platform=SimpleNamespace(),
+                scan_interval=timedelta(seconds=5),
+                entity_namespace=None,
+                async_entities_added_callback=lambda: None,
+            )
+            await platform.async_add_entities(
+                [BenchmarkSensor(f"{platform_idx} {idx}") for idx in range(100)]
+            )
+
+        hass.scheduler.async_start()
+        worst_delay = 0
+
+        for _ in range(200):
+            submitted = timer()
+            started = await hass.async_add_executor_job(timer)
+            worst_delay = max(worst_delay, started - submitted)
+            await asyncio.sleep(0.05)
+
+        return worst_delay
+
+
+@benchmark
+async def executor_jobs_next_to_slow_integration(hass):
+    """Run 500 short executor jobs while another integration blocks.
+
+    The slow integration has a pool of 4 workers of its own and adds 50 jobs
+    that block for a second, like network calls that time out.
+    """
+    import time
+
+    hass.executors.async_configure({"slow": 4})
+
+    token = core.current_integration.set("slow")
+    slow_jobs = [hass.async_add_executor_job(time.sleep, 1) for _ in range(50)]
+    core.current_integration.reset(token)
+
+    start = timer()
+
+    for _ in range(500):
+        await hass.async_add_executor_job(time.sleep, 0)
+
+    runtime = timer() - start
+
+    for job in slow_jobs:
+        job.cancel()
+
+    return runtime
+
+
+@benchmark
+async def loop_monitor_100k_events(hass):
+    """Fire 100k events to a callback and a coroutine listener, monitored."""
+    count = 0
+    event_name = "benchmark_event"
+    event = asyncio.Event()
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+
+    async def async_listener(_):
+        """Handle event in a task."""
+        nonlocal count
+        count += 1
+
+        if count == 10 ** 5:
+            event.set()
+
+    hass.loop_monitor = core.LoopMonitor(hass)
+    hass.bus.async_listen(event_name, listener)
+    hass.bus.async_listen(event_name, async_listener)
+
+    start = timer()
+
+    for _ in range(10 ** 5):
+        hass.bus.async_fire(event_name)
+
+    await event.wait()
+
+    return timer() - start
+
+
+@benchmark
+async def group_nested_300_lights(hass):
+    """Switch 300 lights in nested room, floor and house groups 20 times.
+
+    Every light is also a member of group.all_lights.
+    """
+    from homeassistant.components.group import Group
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        hass.config.config_dir = tmpdir
+
+        lights = [f"light.light_{idx}" for idx in range(300)]
+
+        for entity_id in lights:
+            hass.states.async_set(entity_id, STATE_OFF)
+
+        await Group.async_create_group(hass, "all_lights", lights)
+
+        floors = []
+        for floor_idx in range(3):
+            rooms = []
+            for room_idx in range(10):
+                offset = (floor_idx * 10 + room_idx) * 10
+                room = await Group.async_create_group(
+                    hass, f"room_{floor_idx}_{room_idx}", lights[offset : offset + 10]
+                )
+                rooms.append(room.entity_id)
+            floor = await Group.async_create_group(hass, f"floor_{floor_idx}", rooms)
+            floors.append(floor.entity_id)
+        await Group.async_create_group(hass, "house", floors)
+        await hass.async_block_till_done()
+
+        start = timer()
+
+        for idx in range(20):
+            state = STATE_ON if idx % 2 == 0 else STATE_OFF
+            for entity_id in lights:
+                hass.states.async_set(entity_id, state)
+            await hass.async_block_till_done()
+
+        return timer() - start
+
+
+@benchmark
+async def zone_active_zone_400_zones(hass):
+    """Find the active zone of 40 trackers 10k times among 400 zones."""
+    import random
+    from homeassistant.components import zone
+
+    rnd = random.Random(0)
+    await zone.async_setup(
+        hass,
+        {
+            zone.DOMAIN: [
+                {
+                    "name": f"Store {idx}",
+                    "latitude": rnd.uniform(51, 53),
+                    "longitude": rnd.uniform(4, 7),
+                    "radius": rnd.uniform(50, 300),
+                }
+                for idx in range(400)
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+
+    trackers = [(rnd.uniform(51, 53), rnd.uniform(4, 7)) for _ in range(40)]
+    accuracies = [rnd.uniform(0, 100) for _ in range(10)]
+
+    start = timer()
+
+    for idx in range(10 ** 4):
+        latitude, longitude = trackers[idx % 40]
+        zone.async_active_zone(hass, latitude, longitude, accuracies[idx % 10])
+
+    return timer() - start
+
+
+@benchmark
+async def yaml_config_reload_400_files(hass):
+    """Load a configuration split over 400 files 10 times, like reloads do."""
+    from homeassistant import config as conf_util
+    from homeassistant.util.yaml import clear_secret_cache
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        hass.config.config_dir = tmpdir
+        os.mkdir(os.path.join(tmpdir, "automations"))
+        files = {
+            "configuration.yaml": (
+                "homeassistant:\n  name: Benchmark\n"
+                "automation: !include_dir_merge_list automations\n"
+            ),
+            "secrets.yaml": "\n".join(f"secret_{idx}: value" for idx in range(400)),
+        }
+        for idx in range(400):
+            files[os.path.join("automations", f"automation_{idx}.yaml")] = "".join(
+                f"- alias: Automation {idx} {num}\n"
+                "  trigger:\n"
+                "    platform: state\n"
+                f"    entity_id: light.light_{num}\n"
+                "    to: 'on'\n"
+                "  action:\n"
+                "    service: notify.notify\n"
+                "    data:\n"
+                f"      message: !secret secret_{idx}\n"
+                for num in range(5)
+            )
+
+        # Files are only cached once they are a few seconds old
+        mtime = dt_util.utcnow().timestamp() - 60
+        for name, content in files.items():
+            path = os.path.join(tmpdir, name)
+            with open(path, "w") as fil:
+                fil.write(content)
+            os.utime(path, (mtime, mtime))
+
+        start = timer()
+
+        for _ in range(10):
+            await conf_util.async_hass_config_yaml(hass)
+            clear_secret_cache()
+
+        return timer() - start
+
+
 @benchmark
 @asyncio.coroutine
 def logbook_filtering_state(hass):
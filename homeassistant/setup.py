@@ -1,10 +1,21 @@
 """All methods needed to bootstrap a Home Assistant instance."""
 import asyncio
+from contextlib import contextmanager
 import logging.handlers
 from timeit import default_timer as timer
 
 from types import ModuleType
-from typing import Awaitable, Callable, Optional, Dict, List
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    Dict,
+    List,
+    Set,
+)
 
 from homeassistant import requirements, core, loader, config as conf_util
 from homeassistant.config import async_notify_setup_error
@@ -18,10 +29,113 @@ ATTR_COMPONENT = "component"
 
 DATA_SETUP = "setup_tasks"
 DATA_DEPS_REQS = "deps_reqs_processed"
+DATA_STARTUP_PROFILE = "startup_profile"
+DATA_STARTUP_REPORT = "startup_report"
 
 SLOW_SETUP_WARNING = 10
 
 
+class StartupProfile:
+    """Record the wall time of startup phases per integration."""
+
+    def __init__(self) -> None:
+        """Initialize the profile."""
+        self.start = timer()
+        self.phases: Dict[str, float] = {}
+        self.integrations: Dict[str, Dict[str, Any]] = {}
+        self.dependencies: Dict[str, Set[str]] = {}
+
+    @core.callback
+    def async_add(
+        self, name: Optional[str], phase: str, start: float, end: float
+    ) -> None:
+        """Add the time spent in a phase of an integration or of startup."""
+        start -= self.start
+        end -= self.start
+
+        if name is None:
+            self.phases[phase] = self.phases.get(phase, 0) + end - start
+            return
+
+        info = self.integrations.get(name)
+
+        if info is None:
+            info = self.integrations[name] = {"start": start, "end": end, "phases": {}}
+        else:
+            info["start"] = min(info["start"], start)
+            info["end"] = max(info["end"], end)
+
+        info["phases"][phase] = info["phases"].get(phase, 0) + end - start
+
+    @core.callback
+    def async_critical_path(self) -> List[str]:
+        """Return the chain of integrations that finished last.
+
+        The chain starts at the integration that finished last and follows
+        the dependency or platform that finished last at every step.
+        """
+        path: List[str] = []
+        candidates = set(self.integrations)
+
+        while candidates:
+            name = max(candidates, key=lambda name: self.integrations[name]["end"])
+            path.append(name)
+            candidates = {
+                other
+                for other in self.integrations
+                if other not in path
+                and (
+                    other in self.dependencies.get(name, ())
+                    or other.startswith(f"{name}.")
+                )
+            }
+
+        path.reverse()
+        return path
+
+    @core.callback
+    def async_report(self) -> Dict[str, Any]:
+        """Return the profile as a JSON serializable report."""
+        return {
+            "total": timer() - self.start,
+            "phases": self.phases,
+            "integrations": self.integrations,
+            "critical_path": self.async_critical_path(),
+        }
+
+
+@core.callback
+def async_profile_dependencies(
+    hass: core.HomeAssistant, name: str, dependencies: Iterable[str]
+) -> None:
+    """Record what an integration waits for if startup is profiled."""
+    profile: Optional[StartupProfile] = hass.data.get(DATA_STARTUP_PROFILE)
+
+    if profile is not None:
+        profile.dependencies[name] = set(dependencies)
+
+
+@contextmanager
+def async_profile_phase(
+    hass: core.HomeAssistant, name: Optional[str], phase: str
+) -> Iterator[None]:
+    """Record the time spent in a phase if startup is profiled.
+
+    Pass None as name for phases of startup that are not integration specific.
+    """
+    profile: Optional[StartupProfile] = hass.data.get(DATA_STARTUP_PROFILE)
+
+    if profile is None:
+        yield
+        return
+
+    start = timer()
+    try:
+        yield
+    finally:
+        profile.async_add(name, phase, start, timer())
+
+
 def setup_component(hass: core.HomeAssistant, domain: str, config: Dict) -> bool:
     """Set up a component and all its dependencies."""
     return asyncio.run_coroutine_threadsafe(
@@ -124,6 +238,10 @@ async def _async_setup_component(
         )
         return False
 
+    async_profile_dependencies(
+        hass, domain, integration.dependencies + (integration.after_dependencies or [])
+    )
+
     # Process requirements as soon as possible, so we can import the component
     # without requiring imports to be in functions.
     try:
@@ -132,9 +250,10 @@ async def _async_setup_component(
         log_error(str(err))
         return False
 
-    processed_config = await conf_util.async_process_component_config(
-        hass, config, integration
-    )
+    with async_profile_phase(hass, domain, "config"):
+        processed_config = await conf_util.async_process_component_config(
+            hass, config, integration
+        )
 
     if processed_config is None:
         log_error("Invalid config.")
@@ -144,7 +263,8 @@ async def _async_setup_component(
     _LOGGER.info("Setting up %s", domain)
 
     try:
-        component = integration.get_component()
+        with async_profile_phase(hass, domain, "import"):
+            component = integration.get_component()
     except ImportError:
         log_error("Unable to import component", False)
         return False
@@ -161,23 +281,27 @@ async def _async_setup_component(
             SLOW_SETUP_WARNING,
         )
 
+    token = core.current_integration.set(domain)
+
     try:
-        if hasattr(component, "async_setup"):
-            result = await component.async_setup(  # type: ignore
-                hass, processed_config
-            )
-        elif hasattr(component, "setup"):
-            result = await hass.async_add_executor_job(
-                component.setup, hass, processed_config  # type: ignore
-            )
-        else:
-            log_error("No setup function defined.")
-            return False
+        with async_profile_phase(hass, domain, "setup"):
+            if hasattr(component, "async_setup"):
+                result = await component.async_setup(  # type: ignore
+                    hass, processed_config
+                )
+            elif hasattr(component, "setup"):
+                result = await hass.async_add_executor_job(
+                    component.setup, hass, processed_config  # type: ignore
+                )
+            else:
+                log_error("No setup function defined.")
+                return False
     except Exception:  # pylint: disable=broad-except
         _LOGGER.exception("Error during setup of component %s", domain)
         async_notify_setup_error(hass, domain, True)
         return False
     finally:
+        core.current_integration.reset(token)
         end = timer()
         if warn_task:
             warn_task.cancel()
@@ -194,8 +318,9 @@ async def _async_setup_component(
         return False
 
     if hass.config_entries:
-        for entry in hass.config_entries.async_entries(domain):
-            await entry.async_setup(hass, integration=integration)
+        with async_profile_phase(hass, domain, "config_entries"):
+            for entry in hass.config_entries.async_entries(domain):
+                await entry.async_setup(hass, integration=integration)
 
     hass.config.components.add(domain)
 
@@ -277,15 +402,20 @@ async def async_process_deps_reqs(
     elif integration.domain in processed:
         return
 
-    if integration.dependencies and not await _async_process_dependencies(
-        hass, config, integration.domain, integration.dependencies
-    ):
-        raise HomeAssistantError("Could not set up all dependencies.")
+    if integration.dependencies:
+        with async_profile_phase(hass, integration.domain, "dependencies"):
+            dependencies_set_up = await _async_process_dependencies(
+                hass, config, integration.domain, integration.dependencies
+            )
+
+        if not dependencies_set_up:
+            raise HomeAssistantError("Could not set up all dependencies.")
 
     if not hass.config.skip_pip and integration.requirements:
-        await requirements.async_process_requirements(
-            hass, integration.domain, integration.requirements
-        )
+        with async_profile_phase(hass, integration.domain, "requirements"):
+            await requirements.async_process_requirements(
+                hass, integration.domain, integration.requirements
+            )
 
     processed.add(integration.domain)
 
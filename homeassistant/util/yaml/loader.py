@@ -1,10 +1,22 @@
 """Custom loader."""
 import logging
 import os
+import pickle
 import sys
 import fnmatch
+import time
 from collections import OrderedDict
-from typing import Union, List, Dict, Iterator, overload, TypeVar
+from typing import (
+    Union,
+    List,
+    Dict,
+    Iterator,
+    Optional,
+    TextIO,
+    Tuple,
+    overload,
+    TypeVar,
+)
 
 import yaml
 
@@ -32,6 +44,14 @@ DICT_T = TypeVar("DICT_T", bound=Dict)  # pylint: disable=invalid-name
 _LOGGER = logging.getLogger(__name__)
 __SECRET_CACHE: Dict[str, JSON_TYPE] = {}
 
+# Files modified less than this many seconds before they are loaded are not
+# cached, as a later modification might not change their modification time.
+FILE_CACHE_MIN_AGE = 2
+
+# Parsed files by path: modification time and size of the file, modification
+# time of the other files the result depends on and the pickled result.
+_FILE_CACHE: Dict[str, Tuple[int, int, Dict[str, Optional[int]], bytes]] = {}
+
 
 def clear_secret_cache() -> None:
     """Clear the secret cache.
@@ -53,13 +73,108 @@ class SafeLineLoader(yaml.SafeLoader):
         return node
 
 
+if yaml.__with_libyaml__:
+
+    # pylint: disable=too-many-ancestors
+    class FastSafeLoader(yaml.CSafeLoader):  # type: ignore
+        """Loader class that parses with libyaml.
+
+        File references are added from the node marks by the constructors,
+        like with SafeLineLoader.
+        """
+
+        def __init__(self, stream: TextIO) -> None:
+            """Initialize the loader and set the attributes of the reader."""
+            super().__init__(stream)
+            self.name = getattr(stream, "name", "<file>")
+            self.stream = stream
+
+    DefaultLoader = FastSafeLoader
+else:
+    DefaultLoader = SafeLineLoader  # type: ignore
+
+
+def _file_mtime(fname: str) -> Optional[int]:
+    """Return the modification time of a file, None if it does not exist."""
+    try:
+        return os.stat(fname).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _get_cached(fname: str, stat: os.stat_result) -> Optional[JSON_TYPE]:
+    """Return the cached result of a file if it and its dependencies are unchanged."""
+    cached = _FILE_CACHE.get(fname)
+
+    if cached is None:
+        return None
+
+    mtime, size, dependencies, pickled = cached
+
+    if (
+        stat.st_mtime_ns != mtime
+        or stat.st_size != size
+        or any(_file_mtime(dep) != dep_mtime for dep, dep_mtime in dependencies.items())
+    ):
+        del _FILE_CACHE[fname]
+        return None
+
+    # Unpickle so every load returns new objects that can be modified
+    return pickle.loads(pickled)
+
+
+def _set_cached(
+    fname: str,
+    stat: os.stat_result,
+    dependencies: Dict[str, Optional[int]],
+    data: JSON_TYPE,
+) -> None:
+    """Cache the result of a file unless it or its dependencies just changed."""
+    min_mtime = (time.time() - FILE_CACHE_MIN_AGE) * 1e9
+
+    if stat.st_mtime_ns > min_mtime or any(
+        dep_mtime is not None and dep_mtime > min_mtime
+        for dep_mtime in dependencies.values()
+    ):
+        return
+
+    _FILE_CACHE[fname] = (
+        stat.st_mtime_ns,
+        stat.st_size,
+        dependencies,
+        pickle.dumps(data, pickle.HIGHEST_PROTOCOL),
+    )
+
+
 def load_yaml(fname: str) -> JSON_TYPE:
-    """Load a YAML file."""
+    """Load a YAML file.
+
+    Results of files that only use plain YAML and secrets from secrets.yaml
+    files are cached until the file or one of the secrets files changes.
+    """
     try:
         with open(fname, encoding="utf-8") as conf_file:
-            # If configuration file is empty YAML returns None
-            # We convert that to an empty dict
-            return yaml.load(conf_file, Loader=SafeLineLoader) or OrderedDict()
+            try:
+                stat: Optional[os.stat_result] = os.fstat(conf_file.fileno())
+            except (OSError, ValueError):
+                # Not a regular file
+                stat = None
+
+            if stat is not None:
+                cached = _get_cached(fname, stat)
+                if cached is not None:
+                    return cached
+
+            loader = DefaultLoader(conf_file)
+            loader.cacheable = True  # type: ignore
+            loader.dependencies = {}  # type: ignore
+
+            try:
+                # If configuration file is empty YAML returns None
+                # We convert that to an empty dict
+                data = loader.get_single_data() or OrderedDict()
+            finally:
+                loader.dispose()
     except yaml.YAMLError as exc:
         _LOGGER.error(str(exc))
         raise HomeAssistantError(exc)
@@ -67,6 +182,25 @@ def load_yaml(fname: str) -> JSON_TYPE:
         _LOGGER.error("Unable to read file %s: %s", fname, exc)
         raise HomeAssistantError(exc)
 
+    if stat is not None and loader.cacheable:
+        _set_cached(fname, stat, loader.dependencies, data)
+
+    return data
+
+
+def _not_cacheable(loader: SafeLineLoader) -> None:
+    """Mark that the result of the file being loaded can't be cached."""
+    loader.cacheable = False  # type: ignore
+
+
+def _add_dependency(loader: SafeLineLoader, fname: str) -> None:
+    """Add a file the result of the file being loaded depends on."""
+    # Loaders not created by load_yaml don't track dependencies
+    dependencies = getattr(loader, "dependencies", None)
+
+    if dependencies is not None and fname not in dependencies:
+        dependencies[fname] = _file_mtime(fname)
+
 
 # pylint: disable=pointless-statement
 @overload
@@ -113,6 +247,7 @@ def _include_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
         device_tracker: !include device_tracker.yaml
 
     """
+    _not_cacheable(loader)
     fname = os.path.join(os.path.dirname(loader.name), node.value)
     try:
         return _add_reference(load_yaml(fname), loader, node)
@@ -139,6 +274,7 @@ def _include_dir_named_yaml(
     loader: SafeLineLoader, node: yaml.nodes.Node
 ) -> OrderedDict:
     """Load multiple files from directory as a dictionary."""
+    _not_cacheable(loader)
     mapping: OrderedDict = OrderedDict()
     loc = os.path.join(os.path.dirname(loader.name), node.value)
     for fname in _find_files(loc, "*.yaml"):
@@ -153,6 +289,7 @@ def _include_dir_merge_named_yaml(
     loader: SafeLineLoader, node: yaml.nodes.Node
 ) -> OrderedDict:
     """Load multiple files from directory as a merged dictionary."""
+    _not_cacheable(loader)
     mapping: OrderedDict = OrderedDict()
     loc = os.path.join(os.path.dirname(loader.name), node.value)
     for fname in _find_files(loc, "*.yaml"):
@@ -168,6 +305,7 @@ def _include_dir_list_yaml(
     loader: SafeLineLoader, node: yaml.nodes.Node
 ) -> List[JSON_TYPE]:
     """Load multiple files from directory as a list."""
+    _not_cacheable(loader)
     loc = os.path.join(os.path.dirname(loader.name), node.value)
     return [
         load_yaml(f)
@@ -180,6 +318,7 @@ def _include_dir_merge_list_yaml(
     loader: SafeLineLoader, node: yaml.nodes.Node
 ) -> JSON_TYPE:
     """Load multiple files from directory as a merged list."""
+    _not_cacheable(loader)
     loc: str = os.path.join(os.path.dirname(loader.name), node.value)
     merged_list: List[JSON_TYPE] = []
     for fname in _find_files(loc, "*.yaml"):
@@ -231,6 +370,7 @@ def _construct_seq(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
 
 def _env_var_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
+    _not_cacheable(loader)
     args = node.value.split()
 
     # Check for a default value
@@ -274,6 +414,7 @@ def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
     secret_path = os.path.dirname(loader.name)
     while True:
         secrets = _load_secret_yaml(secret_path)
+        _add_dependency(loader, os.path.join(secret_path, SECRET_YAML))
 
         if node.value in secrets:
             _LOGGER.debug(
@@ -290,6 +431,9 @@ def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
         if not os.path.exists(secret_path) or len(secret_path) < 5:
             break  # Somehow we got past the .homeassistant config folder
 
+    # Secrets from keyring and credstash can change at any time
+    _not_cacheable(loader)
+
     if keyring:
         # do some keyring stuff
         pwd = keyring.get_password(_SECRET_NAMESPACE, node.value)
@@ -330,3 +474,7 @@ yaml.SafeLoader.add_constructor("!include_dir_named", _include_dir_named_yaml)
 yaml.SafeLoader.add_constructor(
     "!include_dir_merge_named", _include_dir_merge_named_yaml
 )
+
+if yaml.__with_libyaml__:
+    # Share the constructors, so constructors added later apply to both loaders
+    FastSafeLoader.yaml_constructors = yaml.SafeLoader.yaml_constructors
@@ -3,9 +3,27 @@ import pathlib
 import sys
 
 from .model import Integration, Config
-from . import codeowners, config_flow, dependencies, manifest, services, ssdp, zeroconf
-
-PLUGINS = [codeowners, config_flow, dependencies, manifest, services, ssdp, zeroconf]
+from . import (
+    codeowners,
+    config_flow,
+    dependencies,
+    manifest,
+    manifest_index,
+    services,
+    ssdp,
+    zeroconf,
+)
+
+PLUGINS = [
+    codeowners,
+    config_flow,
+    dependencies,
+    manifest,
+    manifest_index,
+    services,
+    ssdp,
+    zeroconf,
+]
 
 
 def get_config() -> Config:
@@ -0,0 +1,77 @@
+"""Generate manifest index file."""
+import json
+from typing import Dict
+
+from .model import Integration, Config
+
+BASE = """
+\"\"\"Automatically generated by hassfest.
+
+To update, run python3 -m script.hassfest
+\"\"\"
+
+# fmt: off
+
+MANIFESTS = {{
+{}
+}}
+""".strip()
+
+# Manifest keys used by the loader
+INDEX_KEYS = (
+    "domain",
+    "name",
+    "config_flow",
+    "requirements",
+    "dependencies",
+    "after_dependencies",
+)
+
+
+def generate_and_validate(integrations: Dict[str, Integration]):
+    """Validate and generate manifest index data."""
+    entries = []
+
+    for domain in sorted(integrations):
+        integration = integrations[domain]
+
+        if not integration.manifest:
+            continue
+
+        lines = [f"    {json.dumps(domain)}: {{"]
+
+        for key in INDEX_KEYS:
+            if key not in integration.manifest:
+                continue
+
+            value = integration.manifest[key]
+            # Booleans are the only values that are not valid JSON and Python
+            value = repr(value) if isinstance(value, bool) else json.dumps(value)
+            lines.append(f"        {json.dumps(key)}: {value},")
+
+        lines.append("    },")
+        entries.append("\n".join(lines))
+
+    return BASE.format("\n".join(entries))
+
+
+def validate(integrations: Dict[str, Integration], config: Config):
+    """Validate manifest index file."""
+    manifests_path = config.root / "homeassistant/generated/manifests.py"
+    config.cache["manifest_index"] = content = generate_and_validate(integrations)
+
+    with open(str(manifests_path), "r") as fp:
+        if fp.read().strip() != content:
+            config.add_error(
+                "manifest_index",
+                "File manifests.py is not up to date. Run python3 -m script.hassfest",
+                fixable=True,
+            )
+        return
+
+
+def generate(integrations: Dict[str, Integration], config: Config):
+    """Generate manifest index file."""
+    manifests_path = config.root / "homeassistant/generated/manifests.py"
+    with open(str(manifests_path), "w") as fp:
+        fp.write(config.cache["manifest_index"] + "\n")
@@ -1,7 +1,15 @@
 """Test report state."""
+import asyncio
+from datetime import timedelta
+from unittest.mock import patch
+
 from homeassistant.components.alexa import state_report
+from homeassistant.util.dt import utcnow
+
 from . import TEST_URL, DEFAULT_CONFIG
 
+from tests.common import async_fire_time_changed
+
 
 async def test_report_state(hass, aioclient_mock):
     """Test proactive state reports."""
@@ -23,6 +31,11 @@ async def test_report_state(hass, aioclient_mock):
 
     # To trigger event listener
     await hass.async_block_till_done()
+    assert len(aioclient_mock.mock_calls) == 0
+
+    # Changes are reported once the report window has passed
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
 
     assert len(aioclient_mock.mock_calls) == 1
     call = aioclient_mock.mock_calls
@@ -37,6 +50,65 @@ async def test_report_state(hass, aioclient_mock):
     assert call_json["event"]["endpoint"]["endpointId"] == "binary_sensor#test_contact"
 
 
+async def test_report_state_coalesced(hass, aioclient_mock):
+    """Test changes within the report window are reported once per entity."""
+    aioclient_mock.post(TEST_URL, text="", status=202)
+    attrs = {"friendly_name": "Test Contact Sensor", "device_class": "door"}
+
+    hass.states.async_set("binary_sensor.test_contact", "on", attrs)
+
+    await state_report.async_enable_proactive_mode(hass, DEFAULT_CONFIG)
+
+    hass.states.async_set("binary_sensor.test_contact", "off", attrs)
+    hass.states.async_set("binary_sensor.test_contact", "on", attrs)
+    hass.states.async_set("binary_sensor.test_contact", "off", attrs)
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+
+    assert len(aioclient_mock.mock_calls) == 1
+    call_json = aioclient_mock.mock_calls[0][2]
+    assert (
+        call_json["event"]["payload"]["change"]["properties"][0]["value"]
+        == "NOT_DETECTED"
+    )
+
+    # Properties that did not change since the last report are not reported
+    hass.states.async_set("binary_sensor.test_contact", "on", attrs)
+    hass.states.async_set("binary_sensor.test_contact", "off", attrs)
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+
+    assert len(aioclient_mock.mock_calls) == 1
+
+
+async def test_report_state_concurrently(hass):
+    """Test the changes of entities are reported concurrently."""
+    attrs = {"friendly_name": "Test Contact Sensor", "device_class": "door"}
+    reported = []
+    all_reporting = asyncio.Event()
+
+    async def send_report(hass, config, alexa_entity, **kwargs):
+        """Wait until all entities are being reported."""
+        reported.append(alexa_entity.entity_id)
+        if len(reported) == 2:
+            all_reporting.set()
+        await all_reporting.wait()
+
+    await state_report.async_enable_proactive_mode(hass, DEFAULT_CONFIG)
+
+    with patch.object(state_report, "async_send_changereport_message", send_report):
+        hass.states.async_set("binary_sensor.front_door", "on", attrs)
+        hass.states.async_set("binary_sensor.back_door", "on", attrs)
+        await hass.async_block_till_done()
+        async_fire_time_changed(hass, utcnow() + timedelta(seconds=1))
+        await asyncio.wait_for(all_reporting.wait(), 1)
+        await hass.async_block_till_done()
+
+    assert sorted(reported) == ["binary_sensor.back_door", "binary_sensor.front_door"]
+
+
 async def test_send_add_or_update_message(hass, aioclient_mock):
     """Test sending an AddOrUpdateReport message."""
     aioclient_mock.post(TEST_URL, text="")
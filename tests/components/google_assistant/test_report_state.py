@@ -1,4 +1,5 @@
 """Test Google report state."""
+from datetime import timedelta
 from unittest.mock import patch
 
 from homeassistant.components.google_assistant import report_state, error
@@ -40,11 +41,37 @@ async def test_report_state(hass, caplog):
         hass.states.async_set("light.kitchen", "on")
         await hass.async_block_till_done()
 
+        # State changes are reported once the report window has passed
+        assert len(mock_report.mock_calls) == 0
+        async_fire_time_changed(hass, utcnow() + timedelta(seconds=1))
+        await hass.async_block_till_done()
+
     assert len(mock_report.mock_calls) == 1
     assert mock_report.mock_calls[0][1][0] == {
         "devices": {"states": {"light.kitchen": {"on": True, "online": True}}}
     }
 
+    # Test that state changes within the report window are reported together
+    with patch.object(
+        BASIC_CONFIG, "async_report_state", side_effect=mock_coro
+    ) as mock_report:
+        hass.states.async_set("light.kitchen", "off")
+        hass.states.async_set("switch.ac", "off")
+        hass.states.async_set("light.kitchen", "on")
+        await hass.async_block_till_done()
+        async_fire_time_changed(hass, utcnow() + timedelta(seconds=1))
+        await hass.async_block_till_done()
+
+    assert len(mock_report.mock_calls) == 1
+    assert mock_report.mock_calls[0][1][0] == {
+        "devices": {
+            "states": {
+                "light.kitchen": {"on": True, "online": True},
+                "switch.ac": {"on": False, "online": True},
+            }
+        }
+    }
+
     # Test that state changes that change something that Google doesn't care about
     # do not trigger a state report.
     with patch.object(
@@ -54,6 +81,8 @@ async def test_report_state(hass, caplog):
             "light.kitchen", "on", {"irrelevant": "should_be_ignored"}
         )
         await hass.async_block_till_done()
+        async_fire_time_changed(hass, utcnow() + timedelta(seconds=1))
+        await hass.async_block_till_done()
 
     assert len(mock_report.mock_calls) == 0
 
@@ -66,6 +95,8 @@ async def test_report_state(hass, caplog):
     ):
         hass.states.async_set("light.kitchen", "off")
         await hass.async_block_till_done()
+        async_fire_time_changed(hass, utcnow() + timedelta(seconds=1))
+        await hass.async_block_till_done()
 
     assert "Not reporting state for light.kitchen: mock-error"
     assert len(mock_report.mock_calls) == 0
@@ -77,5 +108,7 @@ async def test_report_state(hass, caplog):
     ) as mock_report:
         hass.states.async_set("light.kitchen", "on")
         await hass.async_block_till_done()
+        async_fire_time_changed(hass, utcnow() + timedelta(seconds=1))
+        await hass.async_block_till_done()
 
     assert len(mock_report.mock_calls) == 0
@@ -17,6 +17,7 @@ from homeassistant.const import (
     STATE_NOT_HOME,
     ATTR_FRIENDLY_NAME,
 )
+from homeassistant.helpers.event import TRACK_STATE_CHANGE_CALLBACKS
 import homeassistant.components.group as group
 
 from tests.common import get_test_home_assistant, assert_setup_component
@@ -416,7 +417,13 @@ class TestComponentsGroup(unittest.TestCase):
             "group.second_group",
             "group.test_group",
         ]
-        assert self.hass.bus.listeners["state_changed"] == 3
+        assert set(self.hass.data[TRACK_STATE_CHANGE_CALLBACKS]) == {
+            "light.bowl",
+            "hello.world",
+            "sensor.happy",
+            "test.one",
+            "test.two",
+        }
 
         with patch(
             "homeassistant.config.load_yaml_config_file",
@@ -438,7 +445,11 @@ class TestComponentsGroup(unittest.TestCase):
             "group.all_tests",
             "group.hello",
         ]
-        assert self.hass.bus.listeners["state_changed"] == 2
+        assert set(self.hass.data[TRACK_STATE_CHANGE_CALLBACKS]) == {
+            "light.bowl",
+            "test.one",
+            "test.two",
+        }
 
     def test_changing_group_visibility(self):
         """Test that a group can be hidden and shown."""
@@ -550,3 +561,106 @@ def test_service_group_set_group_remove_group(hass):
 
     group_state = hass.states.get("group.user_test_group")
     assert group_state is None
+
+
+async def test_expand_entity_ids_cached(hass):
+    """Test expanded groups are cached until group members change."""
+    assert await async_setup_component(hass, "group", {"group": {}})
+
+    hass.states.async_set("group.inner", STATE_ON, {"entity_id": ["light.bowl"]})
+    hass.states.async_set(
+        "group.outer", STATE_ON, {"entity_id": ["group.inner", "light.ceiling"]}
+    )
+    await hass.async_block_till_done()
+
+    assert group.expand_entity_ids(hass, ["group.outer"]) == [
+        "light.bowl",
+        "light.ceiling",
+    ]
+    assert "group.outer" in hass.data[group.DATA_EXPANDED]
+
+    # The state of a group changing does not change its members
+    hass.states.async_set("group.inner", STATE_OFF, {"entity_id": ["light.bowl"]})
+    await hass.async_block_till_done()
+
+    assert "group.outer" in hass.data[group.DATA_EXPANDED]
+
+    hass.states.async_set(
+        "group.inner", STATE_OFF, {"entity_id": ["light.bowl", "light.kitchen"]}
+    )
+    await hass.async_block_till_done()
+
+    assert group.expand_entity_ids(hass, ["group.outer"]) == [
+        "light.bowl",
+        "light.kitchen",
+        "light.ceiling",
+    ]
+
+    hass.states.async_remove("group.inner")
+    await hass.async_block_till_done()
+
+    assert group.expand_entity_ids(hass, ["group.outer"]) == ["light.ceiling"]
+
+    # Changes are found before state changed listeners ran
+    hass.states.async_set("group.inner", STATE_ON, {"entity_id": ["light.bowl"]})
+    assert group.expand_entity_ids(hass, ["group.outer"]) == [
+        "light.bowl",
+        "light.ceiling",
+    ]
+    hass.states.async_set("group.outer", STATE_ON, {"entity_id": ["light.ceiling"]})
+    assert group.expand_entity_ids(hass, ["group.outer"]) == ["light.ceiling"]
+
+
+async def test_group_state_counts_members(hass):
+    """Test the group state follows its members as they change one by one."""
+    hass.states.async_set("light.bowl", STATE_OFF)
+    hass.states.async_set("light.ceiling", STATE_OFF)
+    hass.states.async_set("light.kitchen", STATE_ON, {ATTR_ASSUMED_STATE: True})
+
+    test_group = await group.Group.async_create_group(
+        hass, "all_lights", ["light.bowl", "light.ceiling", "light.kitchen"], mode=True
+    )
+    inner_group = await group.Group.async_create_group(
+        hass, "some_lights", ["light.bowl", "light.ceiling"]
+    )
+    outer_group = await group.Group.async_create_group(
+        hass, "room", [inner_group.entity_id]
+    )
+
+    assert hass.states.get(test_group.entity_id).state == STATE_OFF
+    assert not hass.states.get(test_group.entity_id).attributes.get(ATTR_ASSUMED_STATE)
+    assert hass.states.get(outer_group.entity_id).state == STATE_OFF
+
+    hass.states.async_set("light.bowl", STATE_ON)
+    await hass.async_block_till_done()
+
+    assert hass.states.get(test_group.entity_id).state == STATE_OFF
+    assert hass.states.get(outer_group.entity_id).state == STATE_ON
+
+    # Setting the same state again is not counted twice
+    hass.states.async_set("light.bowl", STATE_ON, {"brightness": 100})
+    hass.states.async_set("light.ceiling", STATE_ON)
+    await hass.async_block_till_done()
+
+    assert hass.states.get(test_group.entity_id).state == STATE_ON
+
+    hass.states.async_set("light.ceiling", "unavailable")
+    await hass.async_block_till_done()
+
+    assert hass.states.get(test_group.entity_id).state == STATE_OFF
+    assert hass.states.get(outer_group.entity_id).state == STATE_ON
+
+    # Removed members are no longer counted
+    hass.states.async_remove("light.ceiling")
+    hass.states.async_set("light.bowl", STATE_ON, {ATTR_ASSUMED_STATE: True})
+    await hass.async_block_till_done()
+
+    state = hass.states.get(test_group.entity_id)
+    assert state.state == STATE_ON
+    assert state.attributes.get(ATTR_ASSUMED_STATE)
+
+    hass.states.async_set("light.bowl", STATE_OFF)
+    await hass.async_block_till_done()
+
+    assert hass.states.get(test_group.entity_id).state == STATE_OFF
+    assert hass.states.get(outer_group.entity_id).state == STATE_OFF
@@ -650,3 +650,50 @@ async def test_fetch_period_api_with_include_order(hass, hass_client):
         params={"filter_entity_id": "non.existing,something.else"},
     )
     assert response.status == 200
+
+
+async def test_fetch_period_api_stream(hass, hass_client):
+    """Test streaming the history in pages."""
+    await hass.async_add_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    start = dt_util.utcnow()
+    for entity_id in ("light.kitchen", "sensor.one", "sensor.two"):
+        for state in ("1", "2"):
+            hass.states.async_set(entity_id, state)
+    await hass.async_block_till_done()
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    client = await hass_client()
+    url = "/api/history/period/{}".format(start.isoformat())
+
+    response = await client.get(url, params={"stream": ""})
+    assert response.status == 200
+    assert "Link" not in response.headers
+    result = await response.json()
+    assert [[state["state"] for state in states] for states in result] == [
+        ["1", "2"],
+        ["1", "2"],
+        ["1", "2"],
+    ]
+    assert result[1][0]["entity_id"] == "sensor.one"
+
+    response = await client.get(url, params={"stream": "", "limit": 3})
+    assert response.status == 200
+    result = await response.json()
+    assert [[state["state"] for state in states] for states in result] == [
+        ["1", "2"],
+        ["1"],
+    ]
+
+    response = await client.get(response.links["next"]["url"].relative())
+    assert response.status == 200
+    assert "Link" not in response.headers
+    result = await response.json()
+    assert [[state["entity_id"] for state in states] for states in result] == [
+        ["sensor.one"],
+        ["sensor.two", "sensor.two"],
+    ]
+
+    response = await client.get(url, params={"stream": "", "cursor": "abc"})
+    assert response.status == 400
+    response = await client.get(url, params={"stream": "", "limit": 0})
+    assert response.status == 400
@@ -1,5 +1,6 @@
 """The test for the History Statistics sensor platform."""
 # pylint: disable=protected-access
+import asyncio
 from datetime import datetime, timedelta
 import unittest
 from unittest.mock import patch
@@ -12,6 +13,7 @@ from homeassistant.components.history_stats.sensor import HistoryStatsSensor
 import homeassistant.core as ha
 from homeassistant.helpers.template import Template
 import homeassistant.util.dt as dt_util
+from homeassistant.util.async_ import run_callback_threadsafe
 
 from tests.common import init_recorder_component, get_test_home_assistant
 
@@ -69,9 +71,9 @@ class TestHistoryStatsSensor(unittest.TestCase):
                 self.hass, "test", "on", None, today, duration, "time", "test"
             )
 
-            sensor1.update_period()
+            run_callback_threadsafe(self.hass.loop, sensor1.update_period).result()
             sensor1_start, sensor1_end = sensor1._period
-            sensor2.update_period()
+            run_callback_threadsafe(self.hass.loop, sensor2.update_period).result()
             sensor2_start, sensor2_end = sensor2._period
 
         # Start = 00:00:00
@@ -135,21 +137,134 @@ class TestHistoryStatsSensor(unittest.TestCase):
         assert sensor3._type == "count"
         assert sensor4._type == "ratio"
 
+        for sensor in (sensor1, sensor2, sensor3, sensor4):
+            sensor.hass = self.hass
+
         with patch(
             "homeassistant.components.history." "state_changes_during_period",
             return_value=fake_states,
         ):
             with patch("homeassistant.components.history.get_state", return_value=None):
-                sensor1.update()
-                sensor2.update()
-                sensor3.update()
-                sensor4.update()
+                asyncio.run_coroutine_threadsafe(
+                    sensor1.async_update(), self.hass.loop
+                ).result()
+                asyncio.run_coroutine_threadsafe(
+                    sensor2.async_update(), self.hass.loop
+                ).result()
+                asyncio.run_coroutine_threadsafe(
+                    sensor3.async_update(), self.hass.loop
+                ).result()
+                asyncio.run_coroutine_threadsafe(
+                    sensor4.async_update(), self.hass.loop
+                ).result()
 
         assert sensor1.state == 0.5
         assert sensor2.state is None
         assert sensor3.state == 2
         assert sensor4.state == 50
 
+    def test_measure_tracked_changes(self):
+        """Test state changes are tracked instead of queried once started."""
+        t0 = dt_util.utcnow() - timedelta(minutes=40)
+
+        fake_states = {
+            "binary_sensor.test_id": [
+                ha.State("binary_sensor.test_id", "on", last_changed=t0)
+            ]
+        }
+
+        start = Template("{{ as_timestamp(now()) - 3600 }}", self.hass)
+        end = Template("{{ now() }}", self.hass)
+
+        self.hass.states.set("binary_sensor.test_id", "on")
+
+        sensor = HistoryStatsSensor(
+            self.hass, "binary_sensor.test_id", "on", start, end, None, "count", "Test"
+        )
+        sensor.hass = self.hass
+        sensor.entity_id = "sensor.test"
+
+        with patch(
+            "homeassistant.components.history.state_changes_during_period",
+            return_value=fake_states,
+        ) as mock_changes:
+            self.hass.start()
+            self.hass.block_till_done()
+
+            for state in ("off", "on", "off", "on"):
+                self.hass.states.set("binary_sensor.test_id", state)
+                self.hass.block_till_done()
+
+            asyncio.run_coroutine_threadsafe(
+                sensor.async_update(), self.hass.loop
+            ).result()
+
+        assert mock_changes.call_count == 1
+        assert sensor.state == 3
+
+    def test_measure_tracked_changes_period_ends_later(self):
+        """Test time after now is not measured when the period ends later."""
+        t0 = dt_util.utcnow() - timedelta(minutes=40)
+
+        fake_states = {
+            "binary_sensor.test_id": [
+                ha.State("binary_sensor.test_id", "off", last_changed=t0)
+            ]
+        }
+
+        self.hass.states.set("binary_sensor.test_id", "off")
+
+        sensor = HistoryStatsSensor(
+            self.hass, "binary_sensor.test_id", "on", None, None, None, "time", "Test"
+        )
+        sensor.hass = self.hass
+        sensor.entity_id = "sensor.test"
+        sensor._period = (
+            dt_util.utcnow() - timedelta(hours=1),
+            dt_util.utcnow() + timedelta(hours=12),
+        )
+
+        with patch(
+            "homeassistant.components.history.state_changes_during_period",
+            return_value=fake_states,
+        ), patch.object(sensor, "update_period"):
+            self.hass.start()
+            self.hass.block_till_done()
+
+            self.hass.states.set("binary_sensor.test_id", "on")
+            self.hass.block_till_done()
+
+            asyncio.run_coroutine_threadsafe(
+                sensor.async_update(), self.hass.loop
+            ).result()
+
+        assert sensor.state == 0
+
+    def test_trim_tracked_history(self):
+        """Test changes before the period start are folded into its state."""
+        sensor = HistoryStatsSensor(
+            self.hass, "binary_sensor.test_id", "on", None, None, None, "time", "Test"
+        )
+        sensor._history = [(0, True), (10, False), (20, True), (30, False)]
+        sensor._history_start = 0
+        sensor._process_history()
+        assert sensor._measure_history(40) == (20, 2)
+
+        sensor._trim_history(15)
+        assert sensor._history == [(15, False), (20, True), (30, False)]
+        assert sensor._measure_history(40) == (10, 1)
+
+        # All processed changes are before the start
+        sensor._trim_history(35)
+        assert sensor._history == [(35, False)]
+        assert sensor._measure_history(40) == (0, 0)
+
+        sensor._history.append((40, True))
+        sensor._process_history()
+        sensor._trim_history(45)
+        assert sensor._history == [(45, True)]
+        assert sensor._measure_history(50) == (5, 1)
+
     def test_wrong_date(self):
         """Test when start or end value is not a timestamp or a date."""
         good = Template("{{ now() }}", self.hass)
@@ -165,8 +280,8 @@ class TestHistoryStatsSensor(unittest.TestCase):
         before_update1 = sensor1._period
         before_update2 = sensor2._period
 
-        sensor1.update_period()
-        sensor2.update_period()
+        run_callback_threadsafe(self.hass.loop, sensor1.update_period).result()
+        run_callback_threadsafe(self.hass.loop, sensor2.update_period).result()
 
         assert before_update1 == sensor1._period
         assert before_update2 == sensor2._period
@@ -206,8 +321,8 @@ class TestHistoryStatsSensor(unittest.TestCase):
         before_update1 = sensor1._period
         before_update2 = sensor2._period
 
-        sensor1.update_period()
-        sensor2.update_period()
+        run_callback_threadsafe(self.hass.loop, sensor1.update_period).result()
+        run_callback_threadsafe(self.hass.loop, sensor2.update_period).result()
 
         assert before_update1 == sensor1._period
         assert before_update2 == sensor2._period
@@ -13,6 +13,7 @@ from homeassistant.components.http.view import (
     HomeAssistantView,
     request_handler_factory,
 )
+from homeassistant.core import current_integration
 from homeassistant.exceptions import ServiceNotFound, Unauthorized
 
 from tests.common import mock_coro_func
@@ -57,3 +58,25 @@ async def test_handling_service_not_found(mock_request):
             Mock(requires_auth=False),
             mock_coro_func(exception=ServiceNotFound("test", "test")),
         )(mock_request)
+
+
+async def test_handler_integration(mock_request):
+    """Test jobs of a view are attributed to the integration defining it."""
+
+    class HueView(HomeAssistantView):
+        """View of another integration."""
+
+        requires_auth = False
+
+        async def get(self, request):
+            """Return the current integration."""
+            return current_integration.get()
+
+    HueView.__module__ = "homeassistant.components.hue"
+    view = HueView()
+
+    token = current_integration.set("http")
+    response = await request_handler_factory(view, view.get)(mock_request)
+    assert response.body == b"hue"
+    assert current_integration.get() == "http"
+    current_integration.reset(token)
@@ -102,6 +102,52 @@ class TestComponentLogbook(unittest.TestCase):
         assert "switch" == last_call.data.get(logbook.ATTR_DOMAIN)
         assert "switch.test_switch" == last_call.data.get(logbook.ATTR_ENTITY_ID)
 
+    def test_get_events_slim_state_changes(self):
+        """Test slim state changes are rebuilt from the states table."""
+        entity_id = "binary_sensor.front_door"
+        attributes = {"friendly_name": "Front door", "device_class": "door"}
+        instance = self.hass.data[recorder.DATA_INSTANCE]
+        self.hass.states.set(entity_id, STATE_OFF, attributes)
+        self.hass.states.set(entity_id, STATE_ON, attributes)
+        self.hass.block_till_done()
+        instance.block_till_done()
+
+        # Events recorded before and after enabling slim state events
+        instance.slim_state_events = True
+        self.hass.states.set(entity_id, STATE_ON, {**attributes, "battery": 90})
+        self.hass.states.set(entity_id, STATE_OFF, attributes)
+        self.hass.block_till_done()
+        instance.block_till_done()
+
+        with recorder.session_scope(hass=self.hass) as session:
+            events = [
+                (event.event_data, event.slim)
+                for event in session.query(recorder.models.Events).filter_by(
+                    event_type=EVENT_STATE_CHANGED
+                )
+            ]
+        assert len(events) == 4
+        assert all(entity_id in data and not slim for data, slim in events[:2])
+        assert events[2:] == [("{}", True), ("{}", True)]
+
+        entries = list(
+            logbook._get_events(
+                self.hass,
+                {},
+                dt_util.utcnow() - timedelta(hours=1),
+                dt_util.utcnow() + timedelta(hours=1),
+            )
+        )
+
+        assert [
+            (entry["entity_id"], entry["name"], entry["message"])
+            for entry in entries
+            if entry["domain"] == "binary_sensor"
+        ] == [
+            (entity_id, "Front door", "is opened"),
+            (entity_id, "Front door", "is closed"),
+        ]
+
     def test_service_call_create_log_book_entry_no_message(self):
         """Test if service call create log book entry without message."""
         calls = []
@@ -631,6 +677,110 @@ class TestComponentLogbook(unittest.TestCase):
             entries[1], pointA, "bla", domain="switch", entity_id=entity_id
         )
 
+    def test_write_entries_grouped(self):
+        """Test sensor changes and restarts are grouped when written."""
+        entity_id = "sensor.text"
+        pointA = datetime(2019, 1, 1, 10, 1, tzinfo=dt_util.UTC)
+        pointB = pointA + timedelta(minutes=10)
+        pointC = pointA + timedelta(minutes=20)
+
+        def state_changed(point, state):
+            """Create a state changed event as the recorder gets it."""
+            return ha.Event(
+                EVENT_STATE_CHANGED,
+                {
+                    "entity_id": entity_id,
+                    "old_state": ha.State(entity_id, "old"),
+                    "new_state": ha.State(entity_id, state, {}, point, point),
+                },
+                time_fired=point,
+            )
+
+        # Every event is written in a batch of its own
+        for event in (
+            ha.Event(EVENT_HOMEASSISTANT_STOP, time_fired=pointA),
+            ha.Event(EVENT_HOMEASSISTANT_START, time_fired=pointA),
+            state_changed(pointA, "a"),
+            state_changed(pointB, "b"),
+            state_changed(pointC, "c"),
+        ):
+            with recorder.session_scope(hass=self.hass) as session:
+                logbook._write_entries(self.hass, session, [event])
+
+        with recorder.session_scope(hass=self.hass) as session:
+            entries = [
+                entry.to_native()
+                for entry in session.query(recorder.models.LogbookEntries)
+                .filter(recorder.models.LogbookEntries.time_fired >= pointA)
+                .order_by(recorder.models.LogbookEntries.time_fired)
+            ]
+
+        assert 3 == len(entries)
+        self.assert_entry(entries[0], pointA, "Home Assistant", "restarted", ha.DOMAIN)
+        self.assert_entry(
+            entries[1], pointB, "text", "changed to b", "sensor", entity_id
+        )
+        self.assert_entry(
+            entries[2], pointC, "text", "changed to c", "sensor", entity_id
+        )
+
+    def test_write_entries_grouped_in_batch(self):
+        """Test sensor changes of a batch replace entries of earlier batches."""
+        pointA = datetime(2019, 1, 1, 10, 1, tzinfo=dt_util.UTC)
+        pointB = pointA + timedelta(minutes=10)
+        pointC = pointA + timedelta(minutes=20)
+
+        def state_changed(entity_id, point, state):
+            """Create a state changed event as the recorder gets it."""
+            return ha.Event(
+                EVENT_STATE_CHANGED,
+                {
+                    "entity_id": entity_id,
+                    "old_state": ha.State(entity_id, "old"),
+                    "new_state": ha.State(entity_id, state, {}, point, point),
+                },
+                time_fired=point,
+            )
+
+        for batch in (
+            [
+                state_changed("sensor.first", pointA, "a"),
+                state_changed("sensor.second", pointA, "a"),
+            ],
+            [
+                state_changed("sensor.first", pointB, "b"),
+                state_changed("sensor.second", pointC, "c"),
+                state_changed("sensor.first", pointC, "c"),
+            ],
+        ):
+            with recorder.session_scope(hass=self.hass) as session:
+                logbook._write_entries(self.hass, session, batch)
+
+        with recorder.session_scope(hass=self.hass) as session:
+            entries = [
+                entry.to_native()
+                for entry in session.query(recorder.models.LogbookEntries)
+                .filter(recorder.models.LogbookEntries.time_fired >= pointA)
+                .order_by(
+                    recorder.models.LogbookEntries.entity_id,
+                    recorder.models.LogbookEntries.time_fired,
+                )
+            ]
+
+        assert 4 == len(entries)
+        self.assert_entry(
+            entries[0], pointB, "first", "changed to b", "sensor", "sensor.first"
+        )
+        self.assert_entry(
+            entries[1], pointC, "first", "changed to c", "sensor", "sensor.first"
+        )
+        self.assert_entry(
+            entries[2], pointA, "second", "changed to a", "sensor", "sensor.second"
+        )
+        self.assert_entry(
+            entries[3], pointC, "second", "changed to c", "sensor", "sensor.second"
+        )
+
     def test_entry_message_from_state_device(self):
         """Test if logbook message is correctly created for switches.
 
@@ -1336,6 +1486,63 @@ async def test_logbook_view_period_entity(hass, hass_client):
     assert json[0]["entity_id"] == entity_id_test
 
 
+async def test_logbook_view_entries(hass, hass_client):
+    """Test the logbook view pages through the recorded logbook entries."""
+    await hass.async_add_job(init_recorder_component, hass)
+    await async_setup_component(hass, "logbook", {})
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    # The logbook entries are recorded from now on
+    start = dt_util.utcnow()
+    for entity_id in ("switch.test", "switch.second"):
+        hass.states.async_set(entity_id, STATE_OFF)
+        hass.states.async_set(entity_id, STATE_ON)
+        hass.states.async_set(entity_id, STATE_OFF)
+    await hass.async_block_till_done()
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_client()
+    url = "/api/logbook/{}".format(start.isoformat())
+
+    response = await client.get(url)
+    assert response.status == 200
+    assert "Link" not in response.headers
+    assert [
+        (entry["entity_id"], entry["message"]) for entry in await response.json()
+    ] == [
+        ("switch.test", "turned on"),
+        ("switch.test", "turned off"),
+        ("switch.second", "turned on"),
+        ("switch.second", "turned off"),
+    ]
+
+    response = await client.get(url, params={"limit": 3})
+    assert response.status == 200
+    assert [entry["entity_id"] for entry in await response.json()] == [
+        "switch.test",
+        "switch.test",
+        "switch.second",
+    ]
+
+    response = await client.get(response.links["next"]["url"].relative())
+    assert response.status == 200
+    assert "Link" not in response.headers
+    assert [entry["message"] for entry in await response.json()] == ["turned off"]
+
+    response = await client.get(url, params={"entity": "switch.second"})
+    assert response.status == 200
+    assert [entry["entity_id"] for entry in await response.json()] == [
+        "switch.second",
+        "switch.second",
+    ]
+
+    response = await client.get(url, params={"cursor": "abc"})
+    assert response.status == 400
+
+    response = await client.get(url, params={"limit": 0})
+    assert response.status == 400
+
+
 async def test_humanify_alexa_event(hass):
     """Test humanifying Alexa event."""
     hass.states.async_set("light.kitchen", "on", {"friendly_name": "Kitchen Light"})
@@ -478,6 +478,43 @@ class TestMQTTCallbacks(unittest.TestCase):
         assert self.calls[0][0].topic == "$test-topic/subtree/some-topic"
         assert self.calls[0][0].payload == "test-payload"
 
+    def test_subscribe_topic_sys_root_no_root_wildcard_match(self):
+        """Test root wildcards don't match $ root topics."""
+        mqtt.subscribe(self.hass, "#", self.record_calls)
+        mqtt.subscribe(self.hass, "+/subtree", self.record_calls)
+
+        fire_mqtt_message(self.hass, "$test-topic/subtree", "test-payload")
+
+        self.hass.block_till_done()
+        assert len(self.calls) == 0
+
+    def test_subscribe_many_topics_only_matching_called(self):
+        """Test only the matching subscriptions receive a message."""
+        for idx in range(100):
+            mqtt.subscribe(self.hass, "node/{}/state".format(idx), self.record_calls)
+            mqtt.subscribe(self.hass, "node/{}/+/set".format(idx), self.record_calls)
+        mqtt.subscribe(self.hass, "node/#", self.record_calls)
+
+        fire_mqtt_message(self.hass, "node/42/state", "test-payload")
+        fire_mqtt_message(self.hass, "node/42/light/set", "test-payload")
+
+        self.hass.block_till_done()
+        assert len(self.calls) == 4
+        assert [call[0].topic for call in self.calls].count("node/42/state") == 2
+
+    def test_unsubscribe_wildcard_keeps_other_subscriptions(self):
+        """Test removing a wildcard subscription keeps the others on the topic."""
+        unsub = mqtt.subscribe(self.hass, "test-topic/+/on", self.record_calls)
+        mqtt.subscribe(self.hass, "test-topic/+/on", self.record_calls)
+        mqtt.subscribe(self.hass, "test-topic/+/on/#", self.record_calls)
+
+        unsub()
+        fire_mqtt_message(self.hass, "test-topic/bier/on", "test-payload")
+
+        self.hass.block_till_done()
+        assert len(self.calls) == 2
+        assert not self.hass.data["mqtt"]._mqttc.unsubscribe.called
+
     def test_subscribe_special_characters(self):
         """Test the subscription to topics with special characters."""
         topic = "/test-topic/$(.)[^]{-}"
@@ -11,7 +11,7 @@ from homeassistant.setup import async_setup_component
 from homeassistant.components.recorder import Recorder
 from homeassistant.components.recorder.const import DATA_INSTANCE
 from homeassistant.components.recorder.util import session_scope
-from homeassistant.components.recorder.models import States, Events
+from homeassistant.components.recorder.models import Events, StateAttributes, States
 
 from tests.common import get_test_home_assistant, init_recorder_component
 
@@ -198,7 +198,14 @@ def test_recorder_setup_failure():
     ):
         setup.side_effect = ImportError("driver not found")
         rec = Recorder(
-            hass, keep_days=7, purge_interval=2, uri="sqlite://", include={}, exclude={}
+            hass,
+            keep_days=7,
+            purge_interval=2,
+            commit_interval=1,
+            max_batch_size=1000,
+            uri="sqlite://",
+            include={},
+            exclude={},
         )
         rec.start()
         rec.join()
@@ -222,3 +229,118 @@ async def test_defaults_set(hass):
     assert recorder_config is not None
     assert recorder_config["purge_keep_days"] == 10
     assert recorder_config["purge_interval"] == 1
+    assert recorder_config["commit_interval"] == 1
+    assert recorder_config["max_batch_size"] == 1000
+    assert recorder_config["slim_state_events"] is False
+
+
+def test_saving_batch(hass_recorder):
+    """Test events queued together are saved in one batch."""
+    hass = hass_recorder({"commit_interval": 0.5, "max_batch_size": 5})
+    attributes = {"test_attr": 5}
+    for idx in range(12):
+        hass.states.set("test.batch_{}".format(idx), "on", attributes)
+    hass.block_till_done()
+    hass.data[DATA_INSTANCE].block_till_done()
+
+    with session_scope(hass=hass) as session:
+        db_states = list(session.query(States))
+        assert len(db_states) == 12
+        assert all(state.event_id > 0 for state in db_states)
+
+
+def test_saving_state_shares_attributes(hass_recorder):
+    """Test states with the same attributes share one attributes row."""
+    hass = hass_recorder()
+    attributes = {"source_list": ["Source {}".format(idx) for idx in range(50)]}
+    for idx in range(100):
+        hass.states.set("media_player.living_room", str(idx), attributes)
+    hass.states.set("media_player.living_room", "off", {"source_list": []})
+    hass.block_till_done()
+    hass.data[DATA_INSTANCE].block_till_done()
+    hass.states.set("media_player.kitchen", "on", attributes)
+    hass.block_till_done()
+    hass.data[DATA_INSTANCE].block_till_done()
+
+    with session_scope(hass=hass) as session:
+        db_states = list(session.query(States))
+        assert len(db_states) == 102
+        assert db_states[0].attributes is None
+        assert db_states[0].to_native().attributes == attributes
+        assert db_states[-1].attributes_id == db_states[0].attributes_id
+        db_attributes = list(session.query(StateAttributes))
+        assert len(db_attributes) == 2
+
+        stored_size = sum(len(attrs.shared_attrs) for attrs in db_attributes)
+        unshared_size = sum(
+            len(state.state_attributes.shared_attrs) for state in db_states
+        )
+        # Storing the JSON with every state used about 100 times the space
+        assert unshared_size > 50 * stored_size
+
+
+def test_saving_batch_with_bad_event(hass_recorder):
+    """Test a bad event does not prevent saving the rest of the batch."""
+    hass = hass_recorder({"commit_interval": 0.5})
+    hass.bus.fire("test_good_1")
+    hass.bus.fire("test_bad", {"value": object()})
+    hass.bus.fire("test_good_2")
+    hass.block_till_done()
+    hass.data[DATA_INSTANCE].block_till_done()
+
+    with session_scope(hass=hass) as session:
+        event_types = {event.event_type for event in session.query(Events)}
+
+    assert "test_good_1" in event_types
+    assert "test_good_2" in event_types
+    assert "test_bad" not in event_types
+
+
+def test_saving_slim_state_events(hass_recorder):
+    """Test changes of existing states are saved as slim events."""
+    hass = hass_recorder({"slim_state_events": True})
+    hass.states.set("light.kitchen", "off")
+    hass.states.set("light.kitchen", "on")
+    hass.states.remove("light.kitchen")
+    hass.block_till_done()
+    hass.data[DATA_INSTANCE].block_till_done()
+
+    with session_scope(hass=hass) as session:
+        db_events = list(session.query(Events).filter_by(event_type="state_changed"))
+        assert [event.slim for event in db_events] == [False, True, False]
+        assert db_events[1].event_data == "{}"
+        assert "light.kitchen" in db_events[0].event_data
+        assert "light.kitchen" in db_events[2].event_data
+
+        db_state = session.query(States).filter_by(state="on").one()
+        assert db_state.event_id == db_events[1].event_id
+
+
+def test_saving_batch_with_failing_writer(hass_recorder):
+    """Test a failing writer does not stop recording or lose the batch."""
+    hass = hass_recorder()
+    instance = hass.data[DATA_INSTANCE]
+    written = []
+
+    def failing_writer(session, events):
+        """Fail to write rows."""
+        raise AttributeError("Unexpected event")
+
+    instance.async_add_writer(failing_writer)
+    instance.async_add_writer(lambda session, events: written.extend(events))
+
+    for event_type in ("test_batch_1", "test_batch_2"):
+        hass.bus.fire(event_type)
+        hass.block_till_done()
+        instance.block_till_done()
+
+    assert instance.is_alive()
+    assert [
+        event.event_type for event in written if event.event_type.startswith("test_")
+    ] == ["test_batch_1", "test_batch_2"]
+
+    with session_scope(hass=hass) as session:
+        event_types = {event.event_type for event in session.query(Events)}
+
+    assert "test_batch_1" in event_types
+    assert "test_batch_2" in event_types
@@ -1,4 +1,5 @@
 """The tests for the Recorder component."""
+import json
 import unittest
 from datetime import datetime
 
@@ -8,7 +9,13 @@ from sqlalchemy.orm import scoped_session, sessionmaker
 import homeassistant.core as ha
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.util import dt
-from homeassistant.components.recorder.models import Base, Events, States, RecorderRuns
+from homeassistant.components.recorder.models import (
+    Base,
+    Events,
+    RecorderRuns,
+    StateAttributes,
+    States,
+)
 
 ENGINE = None
 SESSION = None
@@ -60,6 +67,25 @@ class TestStates(unittest.TestCase):
         )
         assert state == States.from_event(event).to_native()
 
+    def test_from_event_shared_attributes(self):
+        """Test converting event to db state with attributes."""
+        state = ha.State("sensor.temperature", "18", {"unit_of_measurement": "°C"})
+        event = ha.Event(
+            EVENT_STATE_CHANGED,
+            {"entity_id": "sensor.temperature", "old_state": None, "new_state": state},
+            context=state.context,
+        )
+        db_state = States.from_event(event)
+
+        assert db_state.attributes is None
+        assert db_state.state_attributes.shared_attrs == json.dumps(
+            {"unit_of_measurement": "°C"}
+        )
+        assert db_state.state_attributes.hash == StateAttributes.hash_shared_attrs(
+            db_state.state_attributes.shared_attrs
+        )
+        assert state == db_state.to_native()
+
     def test_from_event_to_delete_state(self):
         """Test converting deleting state event to db state."""
         event = ha.Event(
@@ -2,12 +2,15 @@
 import json
 from datetime import datetime, timedelta
 import unittest
-from unittest.mock import patch
+from unittest.mock import call, patch
+
+from sqlalchemy.exc import SQLAlchemyError
 
 from homeassistant.components import recorder
+from homeassistant.components.recorder import purge
 from homeassistant.components.recorder.const import DATA_INSTANCE
 from homeassistant.components.recorder.purge import purge_old_data
-from homeassistant.components.recorder.models import States, Events
+from homeassistant.components.recorder.models import Events, StateAttributes, States
 from homeassistant.components.recorder.util import session_scope
 from tests.common import get_test_home_assistant, init_recorder_component
 
@@ -106,6 +109,43 @@ class TestRecorderPurge(unittest.TestCase):
             # we should only have 2 states left after purging
             assert states.count() == 2
 
+    def test_purge_old_state_attributes(self):
+        """Test deleting attributes only used by old states."""
+        now = datetime.now()
+        eleven_days_ago = now - timedelta(days=11)
+        old_attributes = StateAttributes(hash=1, shared_attrs='{"old": true}')
+        shared_attributes = StateAttributes(hash=2, shared_attrs='{"shared": true}')
+
+        self.hass.block_till_done()
+        self.hass.data[DATA_INSTANCE].block_till_done()
+
+        with session_scope(hass=self.hass) as session:
+            for timestamp, attributes in (
+                (eleven_days_ago, old_attributes),
+                (eleven_days_ago, old_attributes),
+                (eleven_days_ago, shared_attributes),
+                (now, shared_attributes),
+            ):
+                session.add(
+                    States(
+                        entity_id="test.recorder2",
+                        domain="sensor",
+                        state="on",
+                        state_attributes=attributes,
+                        last_changed=timestamp,
+                        last_updated=timestamp,
+                        created=timestamp,
+                    )
+                )
+
+        purge_old_data(self.hass.data[DATA_INSTANCE], 4, repack=False)
+
+        with session_scope(hass=self.hass) as session:
+            assert session.query(States).count() == 1
+            assert [
+                attributes.shared_attrs for attributes in session.query(StateAttributes)
+            ] == ['{"shared": true}']
+
     def test_purge_old_events(self):
         """Test deleting old events."""
         self._add_test_events()
@@ -173,6 +213,75 @@ class TestRecorderPurge(unittest.TestCase):
                 self.hass.block_till_done()
                 self.hass.data[DATA_INSTANCE].block_till_done()
                 assert (
-                    mock_logger.debug.mock_calls[3][1][0]
-                    == "Vacuuming SQLite to free space"
+                    call("Vacuuming SQLite to free space")
+                    in mock_logger.debug.mock_calls
+                )
+
+    def test_purge_in_batches(self):
+        """Test old data is purged in batches."""
+        purged = []
+        self.hass.bus.listen(recorder.EVENT_RECORDER_PURGED, purged.append)
+        self._add_test_states()
+
+        with session_scope(hass=self.hass) as session:
+            states = session.query(States)
+            assert states.count() == 6
+
+            with patch("homeassistant.components.recorder.purge.PURGE_BATCH_SIZE", 1):
+                assert not purge_old_data(self.hass.data[DATA_INSTANCE], 4, False)
+                assert states.count() == 5
+
+                # The recorder purges the rest
+                self.hass.services.call(
+                    "recorder", "purge", service_data={"keep_days": 4}
                 )
+                self.hass.block_till_done()
+                self.hass.data[DATA_INSTANCE].block_till_done()
+                self.hass.block_till_done()
+
+            assert states.count() == 2
+
+        assert len(purged) == 1
+        assert purged[0].data["keep_days"] == 4
+        assert purged[0].data["batches"] == 4
+
+    def test_purge_error(self):
+        """Test a failed purge is not reported or counted by the next purge."""
+        purged = []
+        self.hass.bus.listen(recorder.EVENT_RECORDER_PURGED, purged.append)
+        self._add_test_states()
+
+        batch_filter = purge._batch_filter  # pylint: disable=protected-access
+        calls = []
+
+        def fail_second_batch(*args):
+            """Fail on the second batch of states."""
+            calls.append(args)
+            if len(calls) == 4:
+                raise SQLAlchemyError("Error")
+            return batch_filter(*args)
+
+        with patch(
+            "homeassistant.components.recorder.purge.PURGE_BATCH_SIZE", 1
+        ), patch(
+            "homeassistant.components.recorder.purge._batch_filter",
+            side_effect=fail_second_batch,
+        ):
+            self.hass.services.call("recorder", "purge", service_data={"keep_days": 4})
+            self.hass.block_till_done()
+            self.hass.data[DATA_INSTANCE].block_till_done()
+            self.hass.block_till_done()
+
+        assert len(calls) == 4
+        assert purged == []
+
+        self.hass.services.call("recorder", "purge", service_data={"keep_days": 4})
+        self.hass.block_till_done()
+        self.hass.data[DATA_INSTANCE].block_till_done()
+        self.hass.block_till_done()
+
+        with session_scope(hass=self.hass) as session:
+            assert session.query(States).count() == 2
+
+        assert len(purged) == 1
+        assert purged[0].data["batches"] == 2
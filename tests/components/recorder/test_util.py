@@ -60,3 +60,16 @@ def test_recorder_bad_execute(hass_recorder):
         util.execute((mck1,))
 
     assert e_mock.call_count == 2
+
+
+def test_after():
+    """Test the filter for rows after a sort key."""
+    from homeassistant.components.recorder.models import States
+
+    columns = (States.entity_id, States.state_id)
+    query = util.after(columns, ("light.kitchen", 3))
+
+    assert str(query.compile(compile_kwargs={"literal_binds": True})) == (
+        "states.entity_id > 'light.kitchen' OR "
+        "states.entity_id = 'light.kitchen' AND states.state_id > 3"
+    )
@@ -5,7 +5,10 @@ import statistics
 import pytest
 
 from homeassistant.setup import setup_component
-from homeassistant.components.statistics.sensor import StatisticsSensor
+from homeassistant.components.statistics.sensor import (
+    RollingStatistics,
+    StatisticsSensor,
+)
 from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT, TEMP_CELSIUS, STATE_UNKNOWN
 from homeassistant.util import dt as dt_util
 from tests.common import get_test_home_assistant
@@ -363,3 +366,32 @@ class TestStatisticsSensor(unittest.TestCase):
         assert mock_data["return_time"] == state.attributes.get("max_age") + timedelta(
             hours=1
         )
+
+
+def test_rolling_statistics():
+    """Test the rolling statistics match a recalculation over the window."""
+    values = [17, 20, 15.2, 5, 3.8, 9.2, 6.7, 14, 6, 6, -2.5, 30]
+    rolling = RollingStatistics()
+
+    for idx, value in enumerate(values):
+        rolling.add(value)
+        if idx >= 4:
+            rolling.remove_oldest()
+
+        window = values[max(idx - 3, 0) : idx + 1]
+        assert len(rolling) == len(window)
+        assert rolling.min == min(window)
+        assert rolling.max == max(window)
+        assert rolling.median == statistics.median(window)
+        assert rolling.total == pytest.approx(sum(window))
+        assert rolling.mean == pytest.approx(statistics.mean(window))
+        if len(window) > 1:
+            assert rolling.variance == pytest.approx(statistics.variance(window))
+
+    for _ in range(4):
+        rolling.remove_oldest()
+
+    assert len(rolling) == 0
+
+    rolling.add(3)
+    assert rolling.min == rolling.max == rolling.median == rolling.mean == 3
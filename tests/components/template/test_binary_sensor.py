@@ -4,7 +4,6 @@ import unittest
 from unittest import mock
 
 from homeassistant.const import (
-    MATCH_ALL,
     EVENT_HOMEASSISTANT_START,
     STATE_UNAVAILABLE,
     STATE_ON,
@@ -209,7 +208,7 @@ class TestBinarySensorTemplate(unittest.TestCase):
         "BinarySensorTemplate._async_render"
     )
     def test_match_all(self, _async_render):
-        """Test MATCH_ALL in template."""
+        """Test template using no states is rate limited."""
         with assert_setup_component(1):
             assert setup.setup_component(
                 self.hass,
@@ -232,6 +231,12 @@ class TestBinarySensorTemplate(unittest.TestCase):
         self.hass.block_till_done()
         assert len(_async_render.mock_calls) == init_calls
 
+        self.hass.states.set("sensor.any_state", "update again")
+        future = dt_util.utcnow() + timedelta(minutes=1)
+        async_fire_time_changed(self.hass, future)
+        self.hass.block_till_done()
+        assert len(_async_render.mock_calls) == init_calls + 1
+
     def test_attributes(self):
         """Test the attributes."""
         vs = run_callback_threadsafe(
@@ -245,7 +250,7 @@ class TestBinarySensorTemplate(unittest.TestCase):
             None,
             None,
             None,
-            MATCH_ALL,
+            None,
             None,
             None,
             None,
@@ -306,7 +311,7 @@ class TestBinarySensorTemplate(unittest.TestCase):
             None,
             None,
             None,
-            MATCH_ALL,
+            None,
             None,
             None,
             None,
@@ -545,8 +550,8 @@ async def test_invalid_availability_template_keeps_component_available(hass, cap
     assert ("UndefinedError: 'x' is undefined") in caplog.text
 
 
-async def test_no_update_template_match_all(hass, caplog):
-    """Test that we do not update sensors that match on all."""
+async def test_update_template_used_states(hass):
+    """Test that we update sensors on changes of the states they use."""
     hass.states.async_set("binary_sensor.test_sensor", "true")
 
     await setup.async_setup_component(
@@ -575,26 +580,6 @@ async def test_no_update_template_match_all(hass, caplog):
     )
     await hass.async_block_till_done()
     assert len(hass.states.async_all()) == 5
-    assert (
-        "Template binary sensor all_state has no entity ids "
-        "configured to track nor were we able to extract the entities to "
-        "track from the value template"
-    ) in caplog.text
-    assert (
-        "Template binary sensor all_icon has no entity ids "
-        "configured to track nor were we able to extract the entities to "
-        "track from the icon template"
-    ) in caplog.text
-    assert (
-        "Template binary sensor all_entity_picture has no entity ids "
-        "configured to track nor were we able to extract the entities to "
-        "track from the entity_picture template"
-    ) in caplog.text
-    assert (
-        "Template binary sensor all_attribute has no entity ids "
-        "configured to track nor were we able to extract the entities to "
-        "track from the test_attribute template"
-    ) in caplog.text
 
     assert hass.states.get("binary_sensor.all_state").state == "off"
     assert hass.states.get("binary_sensor.all_icon").state == "off"
@@ -612,20 +597,6 @@ async def test_no_update_template_match_all(hass, caplog):
     hass.states.async_set("binary_sensor.test_sensor", "false")
     await hass.async_block_till_done()
 
-    assert hass.states.get("binary_sensor.all_state").state == "on"
-    assert hass.states.get("binary_sensor.all_icon").state == "on"
-    assert hass.states.get("binary_sensor.all_entity_picture").state == "on"
-    assert hass.states.get("binary_sensor.all_attribute").state == "on"
-
-    await hass.helpers.entity_component.async_update_entity("binary_sensor.all_state")
-    await hass.helpers.entity_component.async_update_entity("binary_sensor.all_icon")
-    await hass.helpers.entity_component.async_update_entity(
-        "binary_sensor.all_entity_picture"
-    )
-    await hass.helpers.entity_component.async_update_entity(
-        "binary_sensor.all_attribute"
-    )
-
     assert hass.states.get("binary_sensor.all_state").state == "on"
     assert hass.states.get("binary_sensor.all_icon").state == "off"
     assert hass.states.get("binary_sensor.all_entity_picture").state == "off"
@@ -225,8 +225,8 @@ class TestTemplateLock:
 
         assert self.hass.states.all() == []
 
-    def test_no_template_match_all(self, caplog):
-        """Test that we do not allow locks that match on all."""
+    def test_template_no_states(self):
+        """Test locks with templates that use no states."""
         with assert_setup_component(1, "lock"):
             assert setup.setup_component(
                 self.hass,
@@ -253,13 +253,6 @@ class TestTemplateLock:
         state = self.hass.states.get("lock.template_lock")
         assert state.state == lock.STATE_UNLOCKED
 
-        assert (
-            "Template lock 'Template Lock' has no entity ids configured "
-            "to track nor were we able to extract the entities to track "
-            "from the 'value_template' template. This entity will only "
-            "be able to be updated manually."
-        ) in caplog.text
-
         self.hass.states.set("lock.template_lock", lock.STATE_LOCKED)
         self.hass.block_till_done()
         state = self.hass.states.get("lock.template_lock")
@@ -9,8 +9,10 @@ from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH_REQUIRED,
 )
 from homeassistant.components.websocket_api import const
+from homeassistant.core import LoopMonitor, current_integration
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.setup import async_setup_component
+from homeassistant.helpers.entity_platform import DATA_POLL_STATISTICS, PollStatistics
+from homeassistant.setup import DATA_STARTUP_REPORT, async_setup_component
 
 from tests.common import async_mock_service
 
@@ -185,6 +187,28 @@ async def test_subscribe_unsubscribe_events(hass, websocket_client):
     assert sum(hass.bus.async_listeners().values()) == init_count
 
 
+async def test_subscribe_events_multiple_subscriptions(hass, websocket_client):
+    """Test an event is sent to each subscription with its own id."""
+    for iden in (5, 6):
+        await websocket_client.send_json(
+            {"id": iden, "type": "subscribe_events", "event_type": "test_event"}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == iden
+        assert msg["success"]
+
+    hass.bus.async_fire("test_event", {"id": "__IDEN__"})
+
+    for iden in (5, 6):
+        with timeout(3):
+            msg = await websocket_client.receive_json()
+
+        assert msg["id"] == iden
+        assert msg["type"] == "event"
+        assert msg["event"]["event_type"] == "test_event"
+        assert msg["event"]["data"] == {"id": "__IDEN__"}
+
+
 async def test_get_states(hass, websocket_client):
     """Test get_states command."""
     hass.states.async_set("greeting.hello", "world")
@@ -467,3 +491,132 @@ async def test_render_template_returns_with_match_all(
     assert msg["id"] == 5
     assert msg["type"] == const.TYPE_RESULT
     assert msg["success"]
+
+
+async def test_startup_report(hass, websocket_client, hass_admin_user):
+    """Test startup_report command."""
+    await websocket_client.send_json({"id": 5, "type": "startup_report"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == const.TYPE_RESULT
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_NOT_FOUND
+
+    report = {
+        "total": 1.5,
+        "phases": {"block_till_done": 0.5},
+        "integrations": {"group": {"start": 0.2, "end": 0.8, "phases": {"setup": 0.6}}},
+        "critical_path": ["group"],
+    }
+    hass.data[DATA_STARTUP_REPORT] = report
+
+    await websocket_client.send_json({"id": 6, "type": "startup_report"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == report
+
+    hass_admin_user.groups = []
+
+    await websocket_client.send_json({"id": 7, "type": "startup_report"})
+
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
+async def test_poll_statistics(hass, websocket_client, hass_admin_user):
+    """Test poll_statistics command."""
+    stats = PollStatistics()
+    stats.async_add_poll(0.5, 1.5)
+    hass.data[DATA_POLL_STATISTICS] = {"light.hue": stats}
+
+    await websocket_client.send_json({"id": 5, "type": "poll_statistics"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == {
+        "light.hue": {
+            "polls": 1,
+            "skipped": 0,
+            "duration": {"last": 0.5, "max": 0.5, "average": 0.5},
+            "lag": {"last": 1.5, "max": 1.5, "average": 1.5},
+        }
+    }
+
+    hass_admin_user.groups = []
+
+    await websocket_client.send_json({"id": 6, "type": "poll_statistics"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert msg["type"] == const.TYPE_RESULT
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
+async def test_executor_statistics(hass, websocket_client, hass_admin_user):
+    """Test executor_statistics command."""
+    hass.executors.async_configure({"slow": 2})
+    token = current_integration.set("slow")
+    await hass.async_add_executor_job(lambda: None)
+    current_integration.reset(token)
+
+    await websocket_client.send_json({"id": 5, "type": "executor_statistics"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"]["slow"]["jobs"] == 1
+    assert msg["result"]["slow"]["queued"] == 0
+    assert msg["result"]["slow"]["running"] == 0
+    assert msg["result"]["slow"]["max_workers"] == 2
+
+    hass_admin_user.groups = []
+
+    await websocket_client.send_json({"id": 6, "type": "executor_statistics"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert msg["type"] == const.TYPE_RESULT
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
+async def test_loop_monitor_report(hass, websocket_client, hass_admin_user):
+    """Test loop_monitor_report command."""
+    await websocket_client.send_json({"id": 5, "type": "loop_monitor_report"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == const.TYPE_RESULT
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_NOT_FOUND
+
+    hass.loop_monitor = LoopMonitor(hass)
+    hass.bus.async_fire("test_event")
+
+    await websocket_client.send_json({"id": 6, "type": "loop_monitor_report", "top": 1})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"]["lag"] == {"last": 0, "max": 0, "average": 0}
+    assert len(msg["result"]["jobs"]) == 1
+
+    hass_admin_user.groups = []
+
+    await websocket_client.send_json({"id": 7, "type": "loop_monitor_report"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
@@ -244,3 +244,67 @@ async def test_core_config_update(hass):
     assert home_updated.name == "Updated Name"
     assert home_updated.attributes["latitude"] == 10
     assert home_updated.attributes["longitude"] == 20
+
+
+async def test_active_zone_uses_index(hass):
+    """Test the active zone is found in the zone index."""
+    hass.config.latitude = 52.3731
+    hass.config.longitude = 4.8922
+    assert await setup.async_setup_component(
+        hass,
+        "zone",
+        {
+            "zone": [
+                {"name": "Store", "latitude": 52.3600, "longitude": 4.8852},
+                {
+                    "name": "Country",
+                    "latitude": 52.1326,
+                    "longitude": 5.2913,
+                    "radius": 150000,
+                },
+                {
+                    "name": "North Pole",
+                    "latitude": 89.9,
+                    "longitude": 0,
+                    "radius": 50000,
+                },
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+
+    assert zone.async_active_zone(hass, 52.3731, 4.8922).entity_id == "zone.home"
+    assert zone.async_active_zone(hass, 52.3601, 4.8852).entity_id == "zone.store"
+    # Store is within the accuracy of the location
+    active = zone.async_active_zone(hass, 52.3610, 4.8852, 200)
+    assert active.entity_id == "zone.store"
+    assert zone.async_active_zone(hass, 52.0, 5.5).entity_id == "zone.country"
+    assert zone.async_active_zone(hass, 89.9, 120).entity_id == "zone.north_pole"
+    assert zone.async_active_zone(hass, 40.0, 5.5) is None
+
+    # Moved zones are indexed again
+    hass.states.async_set(
+        "zone.store", "zoning", {"latitude": 40.0, "longitude": 5.5, "radius": 100}
+    )
+    await hass.async_block_till_done()
+
+    assert zone.async_active_zone(hass, 40.0, 5.5).entity_id == "zone.store"
+    assert zone.async_active_zone(hass, 52.3601, 4.8852).entity_id == "zone.country"
+
+    # Changes are found before the state changed listener ran
+    hass.states.async_set("zone.store", "zoning", {"passive": True})
+    assert zone.async_active_zone(hass, 40.0, 5.5) is None
+
+    # A zone moved away within the same tick is no longer found
+    hass.states.async_set(
+        "zone.store", "zoning", {"latitude": 40.0, "longitude": 5.5, "radius": 100}
+    )
+    await hass.async_block_till_done()
+    assert zone.async_active_zone(hass, 40.0, 5.5).entity_id == "zone.store"
+
+    hass.states.async_set(
+        "zone.store", "zoning", {"latitude": 41.0, "longitude": 5.5, "radius": 100}
+    )
+    assert zone.async_active_zone(hass, 40.0, 5.5) is None
+    await hass.async_block_till_done()
+    assert zone.async_active_zone(hass, 41.0, 5.5).entity_id == "zone.store"
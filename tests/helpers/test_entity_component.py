@@ -138,7 +138,9 @@ async def test_setup_does_discovery(mock_setup_component, mock_setup, hass):
     assert ("platform_test", {}, {"msg": "discovery_info"}) == mock_setup.call_args[0]
 
 
-@asynctest.patch("homeassistant.helpers.entity_platform." "async_track_time_interval")
+@asynctest.patch(
+    "homeassistant.helpers.entity_platform." "async_track_point_in_utc_time"
+)
 async def test_set_scan_interval_via_config(mock_track, hass):
     """Test the setting of the scan interval via configuration."""
 
@@ -150,13 +152,19 @@ async def test_set_scan_interval_via_config(mock_track, hass):
 
     component = EntityComponent(_LOGGER, DOMAIN, hass)
 
-    component.setup(
-        {DOMAIN: {"platform": "platform", "scan_interval": timedelta(seconds=30)}}
-    )
+    utcnow = dt_util.utcnow()
+
+    with patch("homeassistant.util.dt.utcnow", return_value=utcnow), patch(
+        "homeassistant.helpers.entity_platform.random.random", return_value=0.5
+    ):
+        component.setup(
+            {DOMAIN: {"platform": "platform", "scan_interval": timedelta(seconds=30)}}
+        )
+
+        await hass.async_block_till_done()
 
-    await hass.async_block_till_done()
     assert mock_track.called
-    assert timedelta(seconds=30) == mock_track.call_args[0][2]
+    assert utcnow + timedelta(seconds=15) == mock_track.call_args[0][2]
 
 
 async def test_set_entity_namespace_via_config(hass):
@@ -90,6 +90,85 @@ async def test_polling_updates_entities_with_exception(hass):
     assert len(update_err) == 1
 
 
+async def test_polling_spreads_entities_over_scan_interval(hass):
+    """Test entities are polled at their own offset in the scan interval."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+
+    ent1 = MockEntity(should_poll=True)
+    ent1.async_update = Mock()
+    ent2 = MockEntity(should_poll=True)
+    ent2.async_update = Mock()
+
+    utcnow = dt_util.utcnow()
+
+    with patch("homeassistant.util.dt.utcnow", return_value=utcnow), patch.object(
+        entity_platform.random, "random", side_effect=[0, 0.5]
+    ):
+        await component.async_add_entities([ent1, ent2])
+
+    async_fire_time_changed(hass, utcnow + timedelta(seconds=5))
+    await hass.async_block_till_done()
+
+    assert len(ent1.async_update.mock_calls) == 1
+    assert len(ent2.async_update.mock_calls) == 0
+
+    async_fire_time_changed(hass, utcnow + timedelta(seconds=10))
+    await hass.async_block_till_done()
+
+    assert len(ent1.async_update.mock_calls) == 1
+    assert len(ent2.async_update.mock_calls) == 1
+
+    async_fire_time_changed(hass, utcnow + timedelta(seconds=20))
+    await hass.async_block_till_done()
+
+    assert len(ent1.async_update.mock_calls) == 2
+    assert len(ent2.async_update.mock_calls) == 1
+
+    stats = hass.data[entity_platform.DATA_POLL_STATISTICS]["test_domain.test_domain"]
+    assert stats.polls == 3
+    assert stats.skipped == 0
+    assert stats.as_dict()["lag"]["max"] >= 5
+
+
+async def test_polling_skips_entities_still_updating(hass, caplog):
+    """Test only entities whose previous poll is still running are skipped."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+
+    updating = asyncio.Event()
+    slow_updates = []
+
+    async def slow_update():
+        """Mock an update that waits for the test."""
+        slow_updates.append(None)
+        await updating.wait()
+
+    slow_ent = MockEntity(should_poll=True)
+    slow_ent.async_update = slow_update
+    ent = MockEntity(should_poll=True)
+    ent.async_update = Mock()
+
+    with patch.object(entity_platform.random, "random", return_value=0):
+        await component.async_add_entities([slow_ent, ent])
+
+    utcnow = dt_util.utcnow()
+
+    async_fire_time_changed(hass, utcnow + timedelta(seconds=20))
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    async_fire_time_changed(hass, utcnow + timedelta(seconds=40))
+    updating.set()
+    await hass.async_block_till_done()
+
+    assert len(slow_updates) == 1
+    assert len(ent.async_update.mock_calls) == 2
+    assert "took longer than the scheduled update interval" in caplog.text
+
+    stats = hass.data[entity_platform.DATA_POLL_STATISTICS]["test_domain.test_domain"]
+    assert stats.polls == 3
+    assert stats.skipped == 1
+
+
 async def test_update_state_adds_entities(hass):
     """Test if updating poll entities cause an entity to be added works."""
     component = EntityComponent(_LOGGER, DOMAIN, hass)
@@ -135,7 +214,9 @@ async def test_update_state_adds_entities_with_update_before_add_false(hass):
     assert not ent.update.called
 
 
-@asynctest.patch("homeassistant.helpers.entity_platform." "async_track_time_interval")
+@asynctest.patch(
+    "homeassistant.helpers.entity_platform." "async_track_point_in_utc_time"
+)
 async def test_set_scan_interval_via_platform(mock_track, hass):
     """Test the setting of the scan interval via platform."""
 
@@ -150,11 +231,17 @@ async def test_set_scan_interval_via_platform(mock_track, hass):
 
     component = EntityComponent(_LOGGER, DOMAIN, hass)
 
-    component.setup({DOMAIN: {"platform": "platform"}})
+    utcnow = dt_util.utcnow()
+
+    with patch("homeassistant.util.dt.utcnow", return_value=utcnow), patch.object(
+        entity_platform.random, "random", return_value=0.5
+    ):
+        component.setup({DOMAIN: {"platform": "platform"}})
+
+        await hass.async_block_till_done()
 
-    await hass.async_block_till_done()
     assert mock_track.called
-    assert timedelta(seconds=30) == mock_track.call_args[0][2]
+    assert utcnow + timedelta(seconds=15) == mock_track.call_args[0][2]
 
 
 async def test_adding_entities_with_generator_and_thread_callback(hass):
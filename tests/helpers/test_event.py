@@ -17,9 +17,12 @@ from homeassistant.helpers.event import (
     async_track_point_in_utc_time,
     async_track_same_state,
     async_track_state_change,
+    async_track_state_change_domain_event,
+    async_track_state_change_event,
     async_track_sunrise,
     async_track_sunset,
     async_track_template,
+    async_track_template_renders,
     async_track_time_change,
     async_track_time_interval,
     async_track_utc_time_change,
@@ -165,6 +168,101 @@ async def test_track_state_change(hass):
     assert len(wildercard_runs) == 6
 
 
+async def test_track_state_change_event(hass):
+    """Test async_track_state_change_event only wakes matching listeners."""
+    single_events = []
+    multiple_events = []
+
+    @ha.callback
+    def single_run_callback(event):
+        single_events.append(event)
+
+    @ha.callback
+    def multiple_run_callback(event):
+        multiple_events.append(event)
+
+    unsub_single = async_track_state_change_event(
+        hass, ["light.Bowl"], single_run_callback
+    )
+    unsub_multiple = async_track_state_change_event(
+        hass, ["light.bowl", "switch.kitchen"], multiple_run_callback
+    )
+
+    hass.states.async_set("light.Bowl", "on")
+    hass.states.async_set("switch.kitchen", "on")
+    hass.states.async_set("switch.other", "on")
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in single_events] == ["light.bowl"]
+    assert [event.data["entity_id"] for event in multiple_events] == [
+        "light.bowl",
+        "switch.kitchen",
+    ]
+    assert hass.bus.async_listeners()["state_changed"] == 1
+
+    unsub_single()
+    hass.states.async_set("light.Bowl", "off")
+    await hass.async_block_till_done()
+
+    assert len(single_events) == 1
+    assert len(multiple_events) == 3
+
+    unsub_multiple()
+    assert "state_changed" not in hass.bus.async_listeners()
+
+    # Removing twice is harmless
+    unsub_multiple()
+
+
+async def test_track_state_change_event_exception(hass, caplog):
+    """Test an exception in one listener does not prevent calling the others."""
+    events = []
+
+    @ha.callback
+    def bad_callback(event):
+        raise ValueError("bad")
+
+    @ha.callback
+    def run_callback(event):
+        events.append(event)
+
+    async_track_state_change_event(hass, "light.bowl", bad_callback)
+    async_track_state_change_event(hass, "light.bowl", run_callback)
+
+    hass.states.async_set("light.bowl", "on")
+    await hass.async_block_till_done()
+
+    assert len(events) == 1
+    assert "Error while processing state change of light.bowl" in caplog.text
+
+
+async def test_track_state_change_domain_event(hass):
+    """Test async_track_state_change_domain_event."""
+    events = []
+
+    @ha.callback
+    def run_callback(event):
+        events.append(event)
+
+    unsub = async_track_state_change_domain_event(hass, "light", run_callback)
+
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("switch.kitchen", "on")
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in events] == [
+        "light.bowl",
+        "light.kitchen",
+    ]
+
+    unsub()
+    hass.states.async_set("light.bowl", "off")
+    await hass.async_block_till_done()
+
+    assert len(events) == 2
+
+
 async def test_track_template(hass):
     """Test tracking template."""
     specific_runs = []
@@ -233,6 +331,106 @@ async def test_track_template(hass):
     assert len(wildercard_runs) == 2
 
 
+async def test_track_template_renders(hass):
+    """Test tracking the states used by the last render."""
+    events = []
+
+    @ha.callback
+    def run_callback(event):
+        events.append(event.data["entity_id"])
+
+    tracker = async_track_template_renders(hass, run_callback)
+    template = Template(
+        "{% if is_state('switch.test', 'on') %}"
+        "{{ states.light | count }}"
+        "{% endif %}",
+        hass,
+    )
+
+    hass.states.async_set("switch.test", "off")
+    with tracker.async_collect() as info:
+        template.async_render()
+
+    assert info.entities == {"switch.test"}
+    assert info.domains == set()
+
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("switch.test", "on")
+    await hass.async_block_till_done()
+
+    assert events == ["switch.test"]
+
+    with tracker.async_collect() as info:
+        template.async_render()
+
+    assert info.domains == {"light"}
+
+    # Only entities added to or removed from the domain are tracked
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_remove("light.kitchen")
+    await hass.async_block_till_done()
+
+    assert events == ["switch.test", "light.kitchen", "light.kitchen"]
+
+    tracker.async_remove()
+    hass.states.async_set("switch.test", "off")
+    await hass.async_block_till_done()
+
+    assert len(events) == 3
+
+
+async def test_track_template_renders_entity_ids(hass):
+    """Test tracking given entities instead of the states used."""
+    events = []
+
+    @ha.callback
+    def run_callback(event):
+        events.append(event.data["entity_id"])
+
+    tracker = async_track_template_renders(
+        hass, run_callback, entity_ids=["sensor.manual"]
+    )
+    with tracker.async_collect():
+        Template("{{ states('sensor.used') }}", hass).async_render()
+
+    hass.states.async_set("sensor.used", "1")
+    hass.states.async_set("sensor.manual", "1")
+    await hass.async_block_till_done()
+
+    assert events == ["sensor.manual"]
+
+
+async def test_track_template_renders_rate_limit(hass):
+    """Test renders using all states are rate limited."""
+    events = []
+
+    @ha.callback
+    def run_callback(event):
+        events.append(event.data["new_state"].state)
+
+    tracker = async_track_template_renders(
+        hass, run_callback, rate_limit=timedelta(seconds=10)
+    )
+    with tracker.async_collect() as info:
+        Template("{{ states | count }}", hass).async_render()
+
+    assert info.all_states
+
+    hass.states.async_set("sensor.test", "1")
+    hass.states.async_set("sensor.test", "2")
+    await hass.async_block_till_done()
+
+    assert events == []
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+    await hass.async_block_till_done()
+
+    assert events == ["2"]
+
+    tracker.async_remove()
+
+
 async def test_track_same_state_simple_trigger(hass):
     """Test track_same_change with trigger simple."""
     thread_runs = []
@@ -435,6 +435,22 @@ async def test_call_no_context_target_specific(
     assert entities == [mock_entities["light.kitchen"]]
 
 
+async def test_call_skips_platforms_without_targets(
+    hass, mock_service_platform_call, mock_entities
+):
+    """Check platforms without targeted entities are not called."""
+    await service.entity_service_call(
+        hass,
+        [Mock(entities={}), Mock(entities=mock_entities)],
+        Mock(),
+        ha.ServiceCall("test_domain", "test_service", {"entity_id": "light.kitchen"}),
+    )
+
+    assert len(mock_service_platform_call.mock_calls) == 1
+    entities = mock_service_platform_call.mock_calls[0][1][2]
+    assert entities == [mock_entities["light.kitchen"]]
+
+
 async def test_call_with_match_all(
     hass, mock_service_platform_call, mock_entities, caplog
 ):
@@ -101,6 +101,36 @@ def test_invalid_template(hass):
         tmpl.async_render()
 
 
+def test_compile_cache(hass):
+    """Test identical sources are compiled once."""
+    cache = template.CompileCache(2)
+
+    with patch.object(template, "_COMPILE_CACHE", cache):
+        template.Template("{{ 1 + 1 }}", hass).ensure_valid()
+        tmpl = template.Template("{{ 1 + 1 }}", hass)
+        tmpl.ensure_valid()
+        assert tmpl.async_render() == "2"
+        assert template.compile_cache_info() == {
+            "hits": 1,
+            "misses": 1,
+            "size": 1,
+            "maxsize": 2,
+        }
+
+        # Without hass the environment has fewer functions
+        template.Template("{{ 1 + 1 }}").ensure_valid()
+        assert cache.misses == 2
+
+        # The least recently used source is evicted
+        template.Template("{{ 2 + 2 }}", hass).ensure_valid()
+        template.Template("{{ 1 + 1 }}", hass).ensure_valid()
+        assert cache.misses == 4
+
+        with pytest.raises(TemplateError):
+            template.Template("{{", hass).ensure_valid()
+        assert template.compile_cache_info()["size"] == 2
+
+
 def test_referring_states_by_entity_id(hass):
     """Test referring states by entity id."""
     hass.states.async_set("test.object", "happy")
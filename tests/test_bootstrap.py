@@ -6,7 +6,7 @@ from unittest.mock import Mock, patch
 import logging
 
 import homeassistant.config as config_util
-from homeassistant import bootstrap
+from homeassistant import bootstrap, setup
 import homeassistant.util.dt as dt_util
 
 from tests.common import (
@@ -119,6 +119,25 @@ async def test_setting_up_config(hass, caplog):
     assert "group" in hass.config.components
 
 
+async def test_profile_startup(hass):
+    """Test a report is written when profiling startup."""
+    with patch("homeassistant.bootstrap.save_json") as mock_save:
+        assert await bootstrap.async_from_config_dict(
+            {"group": {}}, hass, enable_log=False, profile_startup=True
+        )
+
+    assert setup.DATA_STARTUP_PROFILE not in hass.data
+    report = hass.data[setup.DATA_STARTUP_REPORT]
+    assert len(mock_save.mock_calls) == 1
+    assert mock_save.mock_calls[0][1] == (
+        hass.config.path(bootstrap.STARTUP_REPORT_FILENAME),
+        report,
+    )
+    assert "setup" in report["integrations"]["group"]["phases"]
+    assert "block_till_done" in report["phases"]
+    assert report["critical_path"]
+
+
 async def test_setup_after_deps_all_present(hass, caplog):
     """Test after_dependencies when all present."""
     caplog.set_level(logging.DEBUG)
@@ -436,6 +436,8 @@ async def test_loading_configuration(hass):
             CONF_UNIT_SYSTEM: CONF_UNIT_SYSTEM_IMPERIAL,
             "time_zone": "America/New_York",
             "whitelist_external_dirs": "/tmp",
+            "executor_pools": {"rest": 2},
+            "loop_monitor": True,
         },
     )
 
@@ -448,6 +450,12 @@ async def test_loading_configuration(hass):
     assert len(hass.config.whitelist_external_dirs) == 2
     assert "/tmp" in hass.config.whitelist_external_dirs
     assert hass.config.config_source == config_util.SOURCE_YAML
+    assert hass.executors.pools.keys() == {"rest"}
+    assert hass.loop_monitor is not None
+
+    await config_util.async_process_ha_core_config(hass, {})
+    assert hass.executors.pools == {}
+    assert hass.loop_monitor is None
 
 
 async def test_loading_configuration_temperature_unit(hass):
@@ -4,6 +4,7 @@ import asyncio
 import functools
 import logging
 import os
+import threading
 import unittest
 from unittest.mock import patch, MagicMock
 from datetime import datetime, timedelta
@@ -324,6 +325,22 @@ class TestEvent(unittest.TestCase):
         }
         assert expected == event.as_dict()
 
+    def test_cached(self):
+        """Test values are cached per key."""
+        event = ha.Event("some_type")
+        calls = []
+
+        def factory(evt):
+            """Return a value for the event."""
+            calls.append(evt)
+            return len(calls)
+
+        assert event.cached("key", factory) == 1
+        assert event.cached("key", factory) == 1
+        assert event.cached("other_key", factory) == 2
+        assert calls == [event, event]
+        assert ha.Event("some_type").cached("key", factory) == 3
+
 
 class TestEventBus(unittest.TestCase):
     """Test EventBus methods."""
@@ -1181,3 +1198,300 @@ def test_context():
     assert c.user_id == 23
     assert c.parent_id == 100
     assert c.id is not None
+
+
+async def test_scheduler_simulated_time(hass):
+    """Test the scheduler runs jobs on time changed events before it starts."""
+    runs = []
+    point_in_time = datetime(2018, 12, 31, 3, 4, 5, tzinfo=dt_util.UTC)
+
+    unsub = hass.scheduler.async_schedule(
+        point_in_time, ha.callback(lambda now: runs.append(now))
+    )
+    assert hass.bus.async_listeners()[EVENT_TIME_CHANGED] == 1
+
+    hass.bus.async_fire(EVENT_TIME_CHANGED, {ATTR_NOW: point_in_time - timedelta(1)})
+    await hass.async_block_till_done()
+    assert runs == []
+
+    hass.bus.async_fire(EVENT_TIME_CHANGED, {ATTR_NOW: point_in_time})
+    await hass.async_block_till_done()
+    assert runs == [point_in_time]
+    assert EVENT_TIME_CHANGED not in hass.bus.async_listeners()
+
+    # Cancelling after the job ran is harmless
+    unsub()
+
+
+async def test_scheduler_repeating_job_rolled_back(hass):
+    """Test repeating jobs are recalculated when simulated time rolls back."""
+    runs = []
+
+    def calculate_next(now):
+        """Return the next full minute."""
+        return now.replace(second=0) + timedelta(minutes=1)
+
+    unsub = hass.scheduler.async_schedule(
+        datetime(2030, 1, 1, tzinfo=dt_util.UTC),
+        ha.callback(lambda now: runs.append(now)),
+        calculate_next,
+    )
+
+    start = datetime(2018, 12, 31, 3, 4, 5, tzinfo=dt_util.UTC)
+    for seconds in (0, 55, 60, 0, 55):
+        hass.bus.async_fire(
+            EVENT_TIME_CHANGED, {ATTR_NOW: start + timedelta(seconds=seconds)}
+        )
+    await hass.async_block_till_done()
+    assert runs == [
+        datetime(2018, 12, 31, 3, 5, 0, tzinfo=dt_util.UTC),
+        datetime(2018, 12, 31, 3, 5, 0, tzinfo=dt_util.UTC),
+    ]
+
+    # A job added while time is simulated starts from the simulated time
+    later_runs = []
+    hass.scheduler.async_schedule(
+        datetime(2030, 1, 1, tzinfo=dt_util.UTC),
+        ha.callback(lambda now: later_runs.append(now)),
+        calculate_next,
+    )
+    hass.bus.async_fire(EVENT_TIME_CHANGED, {ATTR_NOW: start + timedelta(seconds=56)})
+    hass.bus.async_fire(EVENT_TIME_CHANGED, {ATTR_NOW: start + timedelta(seconds=115)})
+    await hass.async_block_till_done()
+    assert later_runs == [datetime(2018, 12, 31, 3, 6, 0, tzinfo=dt_util.UTC)]
+    assert len(runs) == 3
+
+    unsub()
+    assert hass.bus.async_listeners()[EVENT_TIME_CHANGED] == 1
+
+
+async def test_scheduler_started(hass):
+    """Test the started scheduler runs jobs using the event loop clock."""
+    runs = []
+
+    hass.scheduler.async_start()
+    now = dt_util.utcnow()
+    hass.scheduler.async_schedule(
+        now + timedelta(seconds=0.1), ha.callback(lambda now: runs.append(1))
+    )
+    unsub = hass.scheduler.async_schedule(
+        now + timedelta(seconds=0.05), ha.callback(lambda now: runs.append(2))
+    )
+    unsub()
+    hass.scheduler.async_schedule(
+        now - timedelta(seconds=1), ha.callback(lambda now: runs.append(3))
+    )
+    assert EVENT_TIME_CHANGED not in hass.bus.async_listeners()
+
+    await asyncio.sleep(0.01)
+    assert runs == [3]
+
+    await asyncio.sleep(0.2)
+    assert runs == [3, 1]
+
+    hass.scheduler.async_stop()
+
+
+async def test_scheduler_started_clock_rolled_back(hass):
+    """Test repeating jobs are recalculated when the system time jumps back."""
+    runs = []
+
+    def calculate_next(now):
+        """Return the next full minute."""
+        return now.replace(second=0, microsecond=0) + timedelta(minutes=1)
+
+    start = datetime(2018, 12, 31, 3, 4, 5, tzinfo=dt_util.UTC)
+
+    with patch("homeassistant.util.dt.utcnow", return_value=start):
+        hass.scheduler.async_start()
+        hass.scheduler.async_schedule(
+            calculate_next(start),
+            ha.callback(lambda now: runs.append(now)),
+            calculate_next,
+        )
+        # pylint: disable=protected-access
+        hass.scheduler._async_timer_fired()
+
+    # The clock is set back an hour
+    for seconds in (-3600, -3545):
+        with patch(
+            "homeassistant.util.dt.utcnow",
+            return_value=start + timedelta(seconds=seconds),
+        ):
+            hass.scheduler._async_timer_fired()
+
+    assert runs == [datetime(2018, 12, 31, 2, 5, 0, tzinfo=dt_util.UTC)]
+
+    hass.scheduler.async_stop()
+
+
+async def test_scheduler_runs_job_in_scheduling_context(hass):
+    """Test scheduled jobs run in the context they were scheduled from."""
+    runs = []
+    point_in_time = datetime(2018, 12, 31, 3, 4, 5, tzinfo=dt_util.UTC)
+
+    async def schedule():
+        """Schedule a job while an integration is running."""
+        ha.current_integration.set("slow")
+        hass.scheduler.async_schedule(
+            point_in_time,
+            ha.callback(lambda now: runs.append(ha.current_integration.get())),
+        )
+
+    await hass.async_create_task(schedule())
+    assert ha.current_integration.get() is None
+
+    hass.bus.async_fire(EVENT_TIME_CHANGED, {ATTR_NOW: point_in_time})
+    await hass.async_block_till_done()
+    assert runs == ["slow"]
+
+
+async def test_executor_pools(hass):
+    """Test executor jobs run in the pool of their integration."""
+    hass.executors.async_configure({"slow": 1})
+
+    def thread_name():
+        """Return the name of the worker thread."""
+        return threading.current_thread().name
+
+    assert (await hass.async_add_executor_job(thread_name)).startswith("SyncWorker")
+
+    token = ha.current_integration.set("slow")
+    names = await asyncio.gather(
+        hass.async_add_executor_job(thread_name), hass.async_add_job(thread_name)
+    )
+    ha.current_integration.reset(token)
+    assert all(name.startswith("SyncWorker_slow") for name in names)
+
+    token = ha.current_integration.set("other")
+    name = await hass.async_add_executor_job(thread_name)
+    ha.current_integration.reset(token)
+    assert not name.startswith("SyncWorker_slow")
+
+    stats = hass.executors.async_statistics()
+    assert stats.keys() == {"slow", "other"}
+    assert stats["slow"]["jobs"] == 2
+    assert stats["slow"]["queued"] == 0
+    assert stats["slow"]["running"] == 0
+    assert stats["slow"]["max_workers"] == 1
+    assert stats["other"]["jobs"] == 1
+    assert stats["other"]["max_workers"] is None
+
+    slow_pool = hass.executors.pools["slow"]
+    hass.executors.async_configure({"slow": 1})
+    assert hass.executors.pools["slow"] is slow_pool
+
+    hass.executors.async_configure({})
+    assert hass.executors.pools == {}
+
+
+async def test_event_listener_executor_pool(hass):
+    """Test listeners run in the pool of the integration that added them."""
+    hass.executors.async_configure({"slow": 1})
+    names = {}
+
+    def record(key):
+        """Return a listener recording its worker thread."""
+
+        def listener(event):
+            """Record the worker thread."""
+            names[key] = threading.current_thread().name
+
+        return listener
+
+    token = ha.current_integration.set("slow")
+    hass.bus.async_listen("test_event", record("slow"))
+    ha.current_integration.reset(token)
+    hass.bus.async_listen("test_event", record("default"))
+
+    token = ha.current_integration.set("other")
+    hass.bus.async_fire("test_event")
+    ha.current_integration.reset(token)
+    await hass.async_block_till_done()
+
+    assert names["slow"].startswith("SyncWorker_slow")
+    assert not names["default"].startswith("SyncWorker_slow")
+    assert "other" not in hass.executors.async_statistics()
+
+
+def test_module_integration():
+    """Test finding the integration of a module."""
+    assert ha.module_integration("homeassistant.components.hue.light") == "hue"
+    assert ha.module_integration("homeassistant.components.hue") == "hue"
+    assert ha.module_integration("custom_components.mine.sensor") == "mine"
+    assert ha.module_integration("homeassistant.helpers.event") == "homeassistant"
+    assert ha.module_integration("") == "homeassistant"
+
+
+async def test_loop_monitor(hass, caplog):
+    """Test the loop monitor times jobs and measures the loop lag."""
+    hass.loop_monitor = ha.LoopMonitor(hass)
+
+    @ha.callback
+    def callback_listener(event):
+        """Handle an event in the event loop."""
+
+    async def coroutine_listener(event):
+        """Handle an event in a task."""
+        await asyncio.sleep(0)
+
+    hass.bus.async_listen("test_event", callback_listener)
+    hass.bus.async_listen("test_event", coroutine_listener)
+
+    hass.bus.async_fire("test_event")
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+
+    jobs = {job["name"]: job for job in hass.loop_monitor.async_report()["jobs"]}
+    callback_name = f"{__name__}.test_loop_monitor.<locals>.callback_listener"
+    coroutine_name = f"{__name__}.test_loop_monitor.<locals>.coroutine_listener"
+    assert jobs[callback_name]["runs"] == 2
+    assert jobs[callback_name]["integration"] == "homeassistant"
+    # Each listener runs in two steps
+    assert jobs[coroutine_name]["runs"] == 4
+    assert jobs[coroutine_name]["max"] <= jobs[coroutine_name]["total"]
+
+    with patch.object(ha, "LOOP_MONITOR_SLOW_JOB", 0):
+        hass.async_run_job(callback_listener, None)
+    assert f"Job {callback_name} of homeassistant blocked the event loop" in (
+        caplog.text
+    )
+
+    hass.loop_monitor._async_measure_lag(hass.loop.time() - 0.5)
+    hass.loop_monitor.async_stop()
+    report = hass.loop_monitor.async_report(top=1)
+    assert report["lag"]["last"] >= 0.5
+    assert report["lag"]["max"] >= 0.5
+    assert len(report["jobs"]) == 1
+    assert list(report["integrations"]) == ["homeassistant"]
+
+    caplog.set_level(logging.INFO)
+    hass.loop_monitor._async_log_summary()
+    hass.loop_monitor.async_stop()
+    assert "most time spent in" in caplog.text
+    assert callback_name in caplog.text
+
+
+async def test_loop_monitor_closures(hass):
+    """Test closures of one function share their statistics."""
+    hass.loop_monitor = ha.LoopMonitor(hass)
+
+    def make_listener(index):
+        """Return a listener for an index."""
+
+        @ha.callback
+        def listener(event):
+            """Handle an event in the event loop."""
+
+        return listener
+
+    for index in range(1000):
+        hass.async_run_job(make_listener(index), None)
+
+    assert len(hass.loop_monitor.jobs) == 1
+    job = hass.loop_monitor.async_report()["jobs"][0]
+    assert job["name"] == (
+        f"{__name__}.test_loop_monitor_closures.<locals>.make_listener"
+        ".<locals>.listener"
+    )
+    assert job["runs"] == 1000
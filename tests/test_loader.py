@@ -1,4 +1,6 @@
 """Test to verify that we can load components."""
+import pathlib
+
 from asynctest.mock import ANY, patch
 import pytest
 
@@ -126,6 +128,19 @@ async def test_get_integration(hass):
     assert hue_light == integration.get_platform("light")
 
 
+async def test_get_integration_from_index(hass):
+    """Test built-in integrations are resolved without reading manifests."""
+    with patch.object(
+        loader.Integration, "resolve_from_root", side_effect=AssertionError
+    ):
+        integration = await loader.async_get_integration(hass, "hue")
+
+    assert integration.domain == "hue"
+    assert integration.config_flow
+    assert integration.file_path == pathlib.Path(hue.__file__).parent
+    assert hue == integration.get_component()
+
+
 async def test_get_integration_legacy(hass):
     """Test resolving integration."""
     integration = await loader.async_get_integration(hass, "test_embedded")
@@ -527,3 +527,31 @@ async def test_when_setup_already_loaded(hass):
     setup.async_when_setup(hass, "test", mock_callback)
     await hass.async_block_till_done()
     assert calls == ["test", "test"]
+
+
+async def test_startup_profile(hass):
+    """Test the time of setup phases is recorded when profiling startup."""
+    profile = hass.data[setup.DATA_STARTUP_PROFILE] = setup.StartupProfile()
+    mock_integration(hass, MockModule("comp_a"))
+    mock_integration(hass, MockModule("comp_b", dependencies=["comp_a"]))
+    mock_integration(hass, MockModule("comp_c"))
+
+    assert await setup.async_setup_component(hass, "comp_c", {})
+    assert await setup.async_setup_component(hass, "comp_b", {})
+
+    assert set(profile.integrations) == {"comp_a", "comp_b", "comp_c"}
+    assert set(profile.integrations["comp_b"]["phases"]) == {
+        "dependencies",
+        "config",
+        "import",
+        "setup",
+        "config_entries",
+    }
+    assert (
+        profile.integrations["comp_a"]["end"] <= profile.integrations["comp_b"]["end"]
+    )
+    assert profile.async_critical_path() == ["comp_a", "comp_b"]
+
+    report = profile.async_report()
+    assert report["critical_path"] == ["comp_a", "comp_b"]
+    assert report["integrations"] is profile.integrations
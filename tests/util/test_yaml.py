@@ -460,3 +460,60 @@ def test_duplicate_key(caplog):
     with patch_yaml_files(files):
         load_yaml_config_file(YAML_CONFIG_FILE)
     assert "contains duplicate key" in caplog.text
+
+
+def _write_old_file(path, content):
+    """Write a file with a modification time old enough to be cached."""
+    path.write_text(content)
+    mtime = path.stat().st_mtime - 60
+    os.utime(str(path), (mtime, mtime))
+
+
+def test_load_yaml_cache(tmp_path):
+    """Test parsed files are cached until they or their secrets change."""
+    conf_path = tmp_path / YAML_CONFIG_FILE
+    secrets_path = tmp_path / yaml.SECRET_YAML
+    _write_old_file(conf_path, "http:\n  api_password: !secret http_pw\n")
+    _write_old_file(secrets_path, "http_pw: pwhttp\n")
+
+    with patch.dict(yaml_loader._FILE_CACHE, clear=True):
+        data = yaml.load_yaml(str(conf_path))
+        assert data["http"]["api_password"] == "pwhttp"
+        assert data["http"].__config_file__ == str(conf_path)
+        assert data["http"].__line__ == 1
+        assert str(conf_path) in yaml_loader._FILE_CACHE
+
+        data["http"]["api_password"] = "changed"
+        yaml.clear_secret_cache()
+
+        with patch.object(yaml_loader, "DefaultLoader") as mock_loader:
+            cached = yaml.load_yaml(str(conf_path))
+        assert not mock_loader.called
+        assert cached["http"]["api_password"] == "pwhttp"
+
+        _write_old_file(secrets_path, "http_pw: new_pwhttp\n")
+        yaml.clear_secret_cache()
+        assert yaml.load_yaml(str(conf_path))["http"]["api_password"] == "new_pwhttp"
+
+        _write_old_file(conf_path, "http:\n  api_password: plain\n")
+        assert yaml.load_yaml(str(conf_path))["http"]["api_password"] == "plain"
+
+        # Recently modified files are not cached
+        conf_path.write_text("http:\n  api_password: new\n")
+        assert yaml.load_yaml(str(conf_path))["http"]["api_password"] == "new"
+        assert str(conf_path) not in yaml_loader._FILE_CACHE
+
+    yaml.clear_secret_cache()
+
+
+def test_load_yaml_cache_includes(tmp_path):
+    """Test files including other files are not cached, the included files are."""
+    conf_path = tmp_path / YAML_CONFIG_FILE
+    include_path = tmp_path / "included.yaml"
+    _write_old_file(conf_path, "key: !include included.yaml\n")
+    _write_old_file(include_path, "value\n")
+
+    with patch.dict(yaml_loader._FILE_CACHE, clear=True):
+        assert yaml.load_yaml(str(conf_path)) == {"key": "value"}
+        assert str(conf_path) not in yaml_loader._FILE_CACHE
+        assert str(include_path) in yaml_loader._FILE_CACHE